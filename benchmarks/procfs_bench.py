@@ -0,0 +1,228 @@
+"""
+@file procfs_bench.py
+@brief Microbenchmarks of the ProcFS reader against the psutil and path-based /proc reads.
+@project Linux Health Monitor Pro
+@license MIT
+
+Usage:
+    python benchmarks/procfs_bench.py [--repeat N] [--threads N] [--json]
+
+Each case runs the same work three ways, 'repeat' times, and reports the
+median wall time per pass and per process (or thread / fd):
+    sweep    every process: name, state, ppid, CPU times, start time, RSS,
+             fd count and I/O bytes (the Process Monitor sweep)
+    stat     every /proc/<pid>/stat only (kernel thread and spawn scans)
+    threads  every /proc/<pid>/task/<tid>/stat of one process with
+             '--threads' threads (the thread drill-down)
+    fds      readlink() of every fd of one process (socket attribution)
+Baselines are psutil (as the sensors used it) and open() of full paths with
+str decoding. The host's process count drives the sweep/stat numbers.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import psutil
+from src.core.procfs import (ProcFS, STAT_STATE, STAT_PPID, STAT_UTIME, STAT_STIME,
+                             STAT_STARTTIME, STAT_RSS)
+
+SWEEP_ATTRS = ['pid', 'name', 'cpu_percent', 'memory_info', 'create_time', 'ppid',
+               'io_counters', 'num_fds', 'status']
+SWEEP_COLUMNS = (STAT_STATE, STAT_PPID, STAT_UTIME, STAT_STIME, STAT_STARTTIME, STAT_RSS)
+
+
+def sweep_psutil(_):
+    return sum(1 for _ in psutil.process_iter(SWEEP_ATTRS))
+
+
+def sweep_paths(_):
+    count = 0
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                f.read().rpartition(")")[2].split()
+            count += 1
+        except OSError:
+            continue
+        try:
+            len(os.listdir(f"/proc/{pid}/fd"))
+        except OSError:
+            pass
+        try:
+            with open(f"/proc/{pid}/io") as f:
+                f.read().split()
+        except OSError:
+            pass
+    return count
+
+
+def sweep_procfs(reader):
+    pids = reader.pids()
+    names = []
+    reader.stat_batch(pids, SWEEP_COLUMNS, names=names)
+    for pid, name in zip(pids, names):
+        if name is None:
+            continue
+        try:
+            len(reader.listdir(f"{pid}/fd"))
+        except OSError:
+            pass
+        try:
+            reader.read(f"{pid}/io").split()
+        except OSError:
+            pass
+    return len(pids)
+
+
+def stat_paths(_):
+    count = 0
+    for pid in os.listdir("/proc"):
+        if pid.isdigit():
+            try:
+                with open(f"/proc/{pid}/stat") as f:
+                    raw = f.read()
+                head, _, tail = raw.rpartition(")")
+                fields = tail.split()
+                int(fields[1]), int(fields[11]) + int(fields[12]), fields[19]
+                count += 1
+            except OSError:
+                continue
+    return count
+
+
+def stat_procfs(reader):
+    pids = reader.pids()
+    reader.stat_batch(pids, SWEEP_COLUMNS)
+    return len(pids)
+
+
+def stat_psutil(_):
+    return sum(1 for _ in psutil.process_iter(['ppid', 'cpu_times', 'create_time']))
+
+
+def threads_psutil(pid):
+    return len(psutil.Process(pid).threads())
+
+
+def threads_paths(pid):
+    task_dir = f"/proc/{pid}/task"
+    tids = os.listdir(task_dir)
+    for tid in tids:
+        with open(f"{task_dir}/{tid}/stat") as f:
+            fields = f.read().rpartition(")")[2].split()
+        fields[0], int(fields[11]) + int(fields[12])
+    return len(tids)
+
+
+def threads_procfs(pid, reader):
+    task_dir = reader.open_dir(f"{pid}/task")
+    try:
+        tids = os.listdir(task_dir)
+        reader.stat_batch(tids, (STAT_STATE, STAT_UTIME, STAT_STIME), dir_fd=task_dir, names=[])
+    finally:
+        os.close(task_dir)
+    return len(tids)
+
+
+def fds_psutil(pid):
+    return len(psutil.Process(pid).open_files())
+
+
+def fds_paths(pid):
+    fd_dir = b"/proc/%d/fd" % pid
+    count = 0
+    with os.scandir(fd_dir) as entries:
+        for entry in entries:
+            try:
+                os.readlink(entry.path)
+                count += 1
+            except OSError:
+                continue
+    return count
+
+
+def fds_procfs(pid, reader):
+    fd_dir = reader.open_dir(f"{pid}/fd")
+    count = 0
+    try:
+        for name in os.listdir(fd_dir):
+            try:
+                os.readlink(name, dir_fd=fd_dir)
+                count += 1
+            except OSError:
+                continue
+    finally:
+        os.close(fd_dir)
+    return count
+
+
+def measure(func, repeat: int):
+    """
+    @brief Runs a variant once to warm up, then 'repeat' timed passes.
+    @return (median seconds per pass, items per pass).
+    """
+    items = func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--threads", type=int, default=256, help="threads of the drill-down target")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per case")
+    args = parser.parse_args()
+
+    # Drill-down and fd targets: this process, with idle threads and open fds
+    stop = threading.Event()
+    for _ in range(args.threads - 1):
+        threading.Thread(target=stop.wait, daemon=True).start()
+    held = [open(__file__) for _ in range(128)]   # Regular files, so psutil.open_files() lists them
+    pid = os.getpid()
+    reader = ProcFS()
+
+    cases = {
+        "sweep": [("psutil", lambda: sweep_psutil(None)), ("paths", lambda: sweep_paths(None)),
+                  ("procfs", lambda: sweep_procfs(reader))],
+        "stat": [("psutil", lambda: stat_psutil(None)), ("paths", lambda: stat_paths(None)),
+                 ("procfs", lambda: stat_procfs(reader))],
+        "threads": [("psutil", lambda: threads_psutil(pid)), ("paths", lambda: threads_paths(pid)),
+                    ("procfs", lambda: threads_procfs(pid, reader))],
+        "fds": [("psutil", lambda: fds_psutil(pid)), ("paths", lambda: fds_paths(pid)),
+                ("procfs", lambda: fds_procfs(pid, reader))],
+    }
+    for case, variants in cases.items():
+        results = {name: measure(func, args.repeat) for name, func in variants}
+        baseline = results["psutil"][0]
+        if args.json:
+            print(json.dumps({"case": case, **{name: {"ms": seconds * 1000, "items": items}
+                                               for name, (seconds, items) in results.items()}}))
+            continue
+        print(f"{case}:")
+        for name, (seconds, items) in results.items():
+            per_item = seconds / max(items, 1) * 1e6
+            print(f"  {name:<7} {seconds * 1000:8.2f} ms/pass  {per_item:7.1f} us/item"
+                  f"  x{baseline / seconds:5.1f} vs psutil  ({items} items)")
+
+    stop.set()
+    for handle in held:
+        handle.close()
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
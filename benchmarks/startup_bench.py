@@ -0,0 +1,94 @@
+"""
+@file startup_bench.py
+@brief Measures time to first frame and resident memory at startup.
+@project Linux Health Monitor Pro
+@license MIT
+
+Usage:
+    python benchmarks/startup_bench.py [--runs N] [--eager]
+
+Each run starts a fresh interpreter (so import costs are included), builds
+the MainWindow, and records the time until the first frame has been painted
+and VmRSS at that moment. '--eager' also constructs every deferred tab
+before the first frame, for comparison with the lazy default.
+Set QT_QPA_PLATFORM=offscreen to run headless. Config override files are
+ignored (built-in defaults) unless LINUXHEALTH_CONFIG names one.
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executed in the child interpreter; prints one JSON line
+CHILD = r"""
+import time
+t0 = time.perf_counter()
+import sys, json
+sys.path.insert(0, sys.argv[1])
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QEvent, QTimer
+app = QApplication(sys.argv[:1])
+import main
+
+class FirstPaint(QObject):
+    # Records the moment the first paint event reaches the window
+    done = False
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and not self.done:
+            self.done = True
+            elapsed = time.perf_counter() - t0
+            with open("/proc/self/status") as f:
+                rss = next(int(l.split()[1]) for l in f if l.startswith("VmRSS:"))
+            print(json.dumps({"frame_ms": elapsed * 1000, "rss_mb": rss / 1024}), flush=True)
+            QTimer.singleShot(0, window.close)
+            QTimer.singleShot(0, app.quit)
+        return False
+
+window = main.MainWindow()
+if sys.argv[2] == "eager":
+    window.build_all_tabs()
+probe = FirstPaint()
+window.installEventFilter(probe)
+window.show()
+app.exec()
+"""
+
+
+def run_once(eager: bool) -> dict:
+    """
+    @brief Starts one child interpreter and returns its measurements.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, ROOT, "eager" if eager else "lazy"],
+        capture_output=True, text=True, timeout=120,
+        env=dict(os.environ, LINUXHEALTH_CONFIG=os.environ.get("LINUXHEALTH_CONFIG", ""))
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError(f"Benchmark child failed:\n{result.stderr}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--eager", action="store_true", help="build every tab before the first frame")
+    args = parser.parse_args()
+
+    samples = [run_once(args.eager) for _ in range(args.runs)]
+    frame = [s["frame_ms"] for s in samples]
+    rss = [s["rss_mb"] for s in samples]
+    mode = "eager" if args.eager else "lazy"
+    print(f"{mode}: first frame median {statistics.median(frame):.0f} ms "
+          f"(min {min(frame):.0f}, max {max(frame):.0f}) | "
+          f"RSS median {statistics.median(rss):.1f} MB over {args.runs} runs")
+
+
+if __name__ == "__main__":
+    main()
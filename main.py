@@ -8,13 +8,29 @@
 
 import sys
 import logging
-from PyQt6.QtWidgets import QApplication, QMainWindow, QTabWidget
+import argparse
+import importlib
+from PyQt6.QtWidgets import QApplication, QMainWindow, QTabWidget, QWidget, QLabel
 from PyQt6.QtGui import QIcon
 
 from src.ui.dashboard_tab import DashboardTab
-from src.ui.kernel_tab import KernelTab
-from src.ui.process_tab import ProcessTab
 from src.core.worker import GlobalWorker
+from src.core.burst import BurstSampler
+from src.core.render_scheduler import RenderScheduler, HISTORY_PLOT_MODULE
+from src.core.settings_watcher import SettingsWatcher
+from src.config import SPAWN_LOG_SIZE, RENDER_MAX_FPS, REMOTE_COLLECTORS
+
+# Tabs built on first show: (title, module, class, MainWindow attribute)
+DEFERRED_TABS = (
+    ("Process Monitor", "src.ui.process_tab", "ProcessTab", "process_monitor"),
+    ("Kernel Threads", "src.ui.kernel_tab", "KernelTab", "kernel_tab"),
+    ("Process Events", "src.ui.events_tab", "EventsTab", "events_tab"),
+    ("Interrupts", "src.ui.interrupts_tab", "InterruptsTab", "interrupts_tab"),
+    ("Alerts", "src.ui.alerts_tab", "AlertsTab", "alerts_tab"),
+)
+
+# Only present when remote collectors are configured
+HOSTS_TAB = ("Hosts", "src.ui.hosts_tab", "HostsTab", "hosts_tab")
 
 class MainWindow(QMainWindow):
     """
@@ -22,11 +38,20 @@ class MainWindow(QMainWindow):
     @brief The primary window for the Linux Health Monitor Pro.
     @details Manages the lifecycle of the background telemetry worker and 
              coordinates data distribution between the worker and UI tabs.
+             Only the Dashboard is built at startup. Every other tab starts
+             as an empty placeholder; its module, widgets, helper workers and
+             worker-side sensors are imported and created the first time the
+             tab is shown (see DEFERRED_TABS). Producer signals never touch
+             widgets directly: they are submitted to a RenderScheduler that
+             applies one batched, frame-paced update (see render_scheduler.py).
+             Edits to the layered config files are applied live to the worker
+             and the widgets (see settings.py).
     """
 
-    def __init__(self):
+    def __init__(self, collectors=()):
         """
-        @brief Initializes the main window, UI components, and worker thread.
+        @brief Initializes the main window, the Dashboard, and the worker thread.
+        @param collectors Remote collector addresses shown in the Hosts tab.
         """
         super().__init__()
         
@@ -38,25 +63,110 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
 
-        # UI Component Initialization
+        # UI Component Initialization: only the visible tab is built now
         self.dashboard = DashboardTab()
-        self.kernel_tab = KernelTab()
-        self.process_monitor = ProcessTab()
-        
-        # Add production-ready tabs
         self.tabs.addTab(self.dashboard, "Dashboard")
-        self.tabs.addTab(self.process_monitor, "Process Monitor")
-        self.tabs.addTab(self.kernel_tab, "Kernel Threads")
+
+        # Deferred tabs: placeholder now, real widget on first show
+        self.process_monitor = None
+        self.kernel_tab = None
+        self.events_tab = None
+        self.interrupts_tab = None
+        self.alerts_tab = None
+        self.hosts_tab = None
+        self.thread_worker = None
+        self.spawn_worker = None
+        self.remote_worker = None
+        self.diff_query = None
+        self.collectors = list(collectors)
+        self.deferred_tabs = DEFERRED_TABS + ((HOSTS_TAB,) if self.collectors else ())
+        for title, _, _, attribute in self.deferred_tabs:
+            index = self.tabs.addTab(QWidget(), title)
+            if attribute == "alerts_tab":
+                self.alerts_index = index
+        self.alerts_title = "Alerts"
+        self.tabs.currentChanged.connect(self.build_tab)
+
+        # Sampling governor status: current rate, collector cost and budget
+        self.governor_label = QLabel("Sampling: starting...")
+        self.statusBar().addWidget(self.governor_label)
+        self.export_label = QLabel()
+        self.statusBar().addPermanentWidget(self.export_label)
 
         # Telemetry Worker Lifecycle Management
         self.worker = GlobalWorker()
         
         # --- Signal-Slot Connections ---
         
-        # 1. Routing worker data to the distributor
-        self.worker.data_received.connect(self.update_all_tabs)
+        # 1. Routing worker data through the frame-paced render scheduler
+        self.renderer = RenderScheduler(RENDER_MAX_FPS, self)
+        self.worker.data_received.connect(lambda data: self.renderer.submit("telemetry", data))
+        self.renderer.register("telemetry", self._record_dashboard, RenderScheduler.EVERY)
+        self.renderer.register("telemetry", self._render_dashboard,
+                               RenderScheduler.LATEST, self.dashboard)
+        self.renderer.register("telemetry", self._render_alert_title, RenderScheduler.LATEST)
+        self.renderer.register("telemetry", self._render_governor, RenderScheduler.LATEST)
+        self.tabs.currentChanged.connect(self.renderer.request_frame)
+        
+        # 2. On-demand burst capture: only decimated envelopes reach the GUI thread
+        self.burst = BurstSampler()
+        self.dashboard.panels_ready.connect(self._connect_burst)
         
-        # 2. Connecting Process sorting buttons to Worker logic
+        # 3. Hot reload of the layered config files (inotify, no polling)
+        self.settings = SettingsWatcher(self)
+        self.settings.changed.connect(self.worker.apply_settings)
+        self.settings.changed.connect(self._apply_settings)
+
+        self.worker.start()
+
+    def _connect_burst(self):
+        """
+        @brief Wires the burst capture panel once the Dashboard has built it.
+        """
+        self.dashboard.burst_w.capture_requested.connect(self.burst.start_capture)
+        self.burst.envelope_ready.connect(self.dashboard.burst_w.update_display)
+        self.burst.capture_finished.connect(self.dashboard.burst_w.finish_capture)
+
+    def build_tab(self, index: int):
+        """
+        @brief Replaces a placeholder with its real tab the first time it is shown.
+        @param index Tab index that just became current.
+        """
+        if index < 1 or index > len(self.deferred_tabs):
+            return
+        title, module, class_name, attribute = self.deferred_tabs[index - 1]
+        if getattr(self, attribute) is not None:
+            return
+
+        tab = getattr(importlib.import_module(module), class_name)()
+        setattr(self, attribute, tab)
+
+        # Swap without re-entering this slot through currentChanged
+        self.tabs.blockSignals(True)
+        placeholder = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, self.alerts_title if attribute == "alerts_tab" else title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+        getattr(self, f"_connect_{attribute}")()
+
+    def build_all_tabs(self):
+        """
+        @brief Builds every deferred tab now (used by the startup benchmark).
+        """
+        self.dashboard.build_panels()
+        current = self.tabs.currentIndex()
+        for index in range(1, len(self.deferred_tabs) + 1):
+            self.build_tab(index)
+        self.tabs.setCurrentIndex(current)
+
+    def _connect_process_monitor(self):
+        """
+        @brief Wires the Process Monitor: sorting, search, tree and thread drill-down.
+        """
+        # Connecting Process sorting buttons to Worker logic
         # These lambda functions tell the worker which sorting mode to use
         self.process_monitor.btn_sort_cpu.clicked.connect(
             lambda: self.worker.set_process_sort_mode("cpu")
@@ -64,28 +174,212 @@ class MainWindow(QMainWindow):
         self.process_monitor.btn_sort_ram.clicked.connect(
             lambda: self.worker.set_process_sort_mode("ram")
         )
-        
-        self.worker.start()
+        self.process_monitor.btn_sort_fds.clicked.connect(
+            lambda: self.worker.set_process_sort_mode("fds")
+        )
+        self.process_monitor.btn_sort_wait.clicked.connect(
+            lambda: self.worker.set_process_sort_mode("wait")
+        )
+
+        # Search filter: matched through the worker's process index each tick
+        self.process_monitor.search_box.textChanged.connect(self.worker.set_process_filter)
+
+        # Per-thread drill-down: only the selected PID's threads are sampled
+        from src.core.thread_worker import ThreadWorker
+        self.thread_worker = ThreadWorker()
+        self.process_monitor.process_widget.process_selected.connect(self.thread_worker.set_pid)
+        self.process_monitor.tree_widget.process_selected.connect(self.thread_worker.set_pid)
+        self.thread_worker.data_received.connect(lambda data: self.renderer.submit("threads", data))
+        self.renderer.register("threads", self.process_monitor.update_threads,
+                               RenderScheduler.LATEST, self.process_monitor)
+        self.renderer.register("telemetry", self._render_processes,
+                               RenderScheduler.LATEST, self.process_monitor)
+        self.thread_worker.start()
+
+        # Tree expansion: fill the node at once, then keep it in every packet
+        tree_view = self.process_monitor.tree_widget
+        tree_view.expansion_changed.connect(self.worker.set_expanded_processes)
+        tree_view.expand_requested.connect(
+            lambda key: tree_view.show_children(
+                key, self.worker.user_processes.tree.children_rows(key, self.worker.tree_child_limit)
+            )
+        )
 
-    def update_all_tabs(self, data: dict):
-        """
-        @brief Global data distributor (Signal Handler).
-        @param data The telemetry packet received from GlobalWorker.
-        """
-        try:
-            # Update hardware sensors (CPU, RAM, Net, Disk)
-            self.dashboard.update_ui(data)
-            
-            # Update the User Process list
-            if 'user_processes' in data:
-                self.process_monitor.update_ui(data['user_processes'])
-            
-            # Update the Kernel thread list
-            if 'kernel' in data:
-                self.kernel_tab.update_ui(data['kernel'])
-                
-        except Exception as e:
-            logging.error(f"UI Update Distribution Error: {e}")
+    def _connect_kernel_tab(self):
+        """
+        @brief Starts kernel thread sampling on the worker.
+        """
+        self.worker.enable_sensor("kernel")
+        self.renderer.register("telemetry", self._render_kernel,
+                               RenderScheduler.LATEST, self.kernel_tab)
+
+    def _connect_events_tab(self):
+        """
+        @brief Starts the spawn scanner and back-fills the lifecycle log.
+        """
+        # Short-lived process capture: 20Hz PID-set diff, 1Hz summaries
+        from src.core.spawn_worker import SpawnWorker
+        self.spawn_worker = SpawnWorker()
+        self.spawn_worker.data_received.connect(lambda data: self.renderer.submit("spawns", data))
+        self.renderer.register("spawns", self.events_tab.update_spawns, RenderScheduler.EVERY)
+        self.spawn_worker.start()
+
+        # Lifecycle diffs are answered from the worker's event log off the GUI
+        # thread: older ranges are read from the on-disk archive
+        from src.core.diff_query import DiffQuery
+        self.diff_query = DiffQuery(self)
+        self.diff_query.result_ready.connect(self.events_tab.show_diff)
+        self.events_tab.diff_requested.connect(self.show_process_diff)
+        if self.worker.user_processes is not None:
+            history = self.worker.user_processes.event_log.since(0.0)
+            self.events_tab.update_lifecycle(history[-SPAWN_LOG_SIZE:])
+        self.renderer.register("telemetry", self._render_lifecycle, RenderScheduler.EVERY)
+
+    def _connect_interrupts_tab(self):
+        """
+        @brief Starts IRQ/softirq sampling on the worker.
+        """
+        self.worker.enable_sensor("interrupts")
+        self.renderer.register("telemetry", self._render_interrupts,
+                               RenderScheduler.LATEST, self.interrupts_tab)
+
+    def _connect_alerts_tab(self):
+        """
+        @brief Subscribes the Alerts view; the latest packet carries the full alert state.
+        """
+        self.renderer.register("telemetry", self._render_alerts,
+                               RenderScheduler.LATEST, self.alerts_tab)
+
+    def _connect_hosts_tab(self):
+        """
+        @brief Connects to the remote collectors and feeds the Hosts tab.
+        """
+        from src.core.remote_worker import RemoteWorker
+        self.remote_worker = RemoteWorker(self.collectors)
+        for address in self.collectors:
+            self.hosts_tab.grid.add_host(address)
+        self.remote_worker.data_received.connect(lambda data: self.renderer.submit("hosts", data))
+        self.renderer.register("hosts", self.hosts_tab.update_host, RenderScheduler.EVERY)
+        # Local ticks age the live/stale markers even when no collector reports
+        self.renderer.register("telemetry", lambda data: self.hosts_tab.refresh_status(),
+                               RenderScheduler.LATEST, self.hosts_tab)
+        self.remote_worker.start()
+
+    def _record_dashboard(self, data: dict):
+        """
+        @brief Appends one telemetry packet to the Dashboard graphs (every packet: graphs need each sample).
+        """
+        self.dashboard.record(data)
+
+    def _render_dashboard(self, data: dict):
+        """
+        @brief Updates the Dashboard labels from the newest packet (visible only).
+        """
+        self.dashboard.update_ui(data)
+
+    def _render_processes(self, data: dict):
+        """
+        @brief Updates the Process Monitor from the newest packet (visible only).
+        """
+        if 'user_processes' in data:
+            self.process_monitor.update_ui(data['user_processes'], data.get('process_matches'))
+        if data.get('sockets'):
+            self.process_monitor.update_sockets(data['sockets'])
+        if data.get('sched'):
+            self.process_monitor.update_sched(data['sched'])
+        if data.get('process_tree'):
+            self.process_monitor.update_tree(data['process_tree'])
+
+    def _render_kernel(self, data: dict):
+        """
+        @brief Updates the Kernel thread list from the newest packet (visible only).
+        """
+        if 'kernel' in data:
+            self.kernel_tab.update_ui(data['kernel'])
+
+    def _render_lifecycle(self, data: dict):
+        """
+        @brief Appends new lifecycle events (every packet, so none are lost).
+        """
+        if data.get('process_events'):
+            self.events_tab.update_lifecycle(data['process_events'])
+
+    def _render_interrupts(self, data: dict):
+        """
+        @brief Updates the IRQ / softirq heatmaps from the newest packet (visible only).
+        """
+        if 'interrupts' in data:
+            self.interrupts_tab.update_ui(data['interrupts'])
+
+    def _render_alert_title(self, data: dict):
+        """
+        @brief Surfaces the firing count in the tab title (even before the tab is built).
+        """
+        if 'alerts' in data:
+            firing = len(data['alerts']['active'])
+            self.alerts_title = f"Alerts ({firing})" if firing else "Alerts"
+            self.tabs.setTabText(self.alerts_index, self.alerts_title)
+
+    def _render_governor(self, data: dict):
+        """
+        @brief Shows the sampling rate, CPU cost, budget and export counters in the status bar.
+        """
+        status = data.get('governor')
+        if not status:
+            return
+        text = (f"Sampling {status['rate']:.2f} Hz (every {status['interval']:.1f} s)"
+                f"  ·  Collector {status['usage'] * 100:.2f}% of a core"
+                f" (budget {status['budget'] * 100:.1f}%)")
+        if status['shed']:
+            text += f"  ·  Paused: {', '.join(status['shed'])}"
+        self.governor_label.setText(text)
+        export = data.get('export')
+        if export:
+            self.export_label.setText(
+                f"Export ({export['format']}): {export['written']} rows"
+                f", {export['queued']} queued, {export['dropped']} dropped"
+            )
+            self.export_label.setToolTip(export['path'] or "")
+        sections = sorted(status['sections'].items(), key=lambda item: item[1], reverse=True)
+        self.governor_label.setToolTip(
+            f"CPU per cycle: {status['cycle_ms']:.1f} ms\n"
+            + "\n".join(f"{name}: {ms:.1f} ms" for name, ms in sections)
+        )
+
+    def _render_alerts(self, data: dict):
+        """
+        @brief Updates the Alerts view from the newest packet (visible only).
+        """
+        if 'alerts' in data:
+            self.alerts_tab.update_ui(data['alerts'])
+
+    def _apply_settings(self, changes: dict):
+        """
+        @brief Applies reloaded GUI-side settings (the worker applies its own).
+        @param changes {NAME: value} from SettingsWatcher.changed.
+        """
+        if "RENDER_MAX_FPS" in changes:
+            self.renderer.interval = 1.0 / changes["RENDER_MAX_FPS"]
+        if "LIVE_WINDOW_SECONDS" in changes:
+            # Reached lazily: pyqtgraph is only loaded once a graph is created
+            history_plot = importlib.import_module(HISTORY_PLOT_MODULE)
+            history_plot.HistoryPlot.live_window = changes["LIVE_WINDOW_SECONDS"]
+        if "THREAD_SAMPLING_INTERVAL_MS" in changes and self.thread_worker is not None:
+            self.thread_worker.interval_ms = changes["THREAD_SAMPLING_INTERVAL_MS"]
+        if "MAX_PROCESSES" in changes and self.process_monitor is not None:
+            self.process_monitor.process_widget.max_rows = changes["MAX_PROCESSES"]
+
+    def show_process_diff(self, t0: float, t1: float):
+        """
+        @brief Queues a lifecycle diff query from the Process Events tab.
+        @details The result reaches EventsTab.show_diff through DiffQuery.result_ready.
+        @param t0 Range start (seconds since epoch).
+        @param t1 Range end (seconds since epoch).
+        """
+        if self.worker.user_processes is None:
+            logging.warning("Process diff query ignored: process sensor not started yet")
+            return
+        self.diff_query.request(self.worker.user_processes.event_log, t0, t1)
 
     def closeEvent(self, event):
         """
@@ -93,6 +387,10 @@ class MainWindow(QMainWindow):
         """
         logging.info("Shutting down telemetry worker...")
         self.worker.stop() 
+        self.burst.stop()
+        for helper in (self.thread_worker, self.spawn_worker, self.remote_worker, self.diff_query):
+            if helper is not None:
+                helper.stop()
         event.accept()
 
 if __name__ == "__main__":
@@ -101,7 +399,12 @@ if __name__ == "__main__":
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
     
-    app = QApplication(sys.argv)
-    window = MainWindow()
+    parser = argparse.ArgumentParser(description="Linux Health Monitor Pro")
+    parser.add_argument("--connect", action="append", default=[], metavar="ADDRESS",
+                        help="remote collector (unix:/path or host:port); repeatable")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = MainWindow(REMOTE_COLLECTORS + args.connect)
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+@file activity_sensor.py
+@brief Telemetry engine for kernel activity counters (scheduler, faults, swap).
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+import time
+import logging
+
+# /proc/vmstat counters converted to per-second rates
+VMSTAT_RATES = ("pgfault", "pgmajfault", "pswpin", "pswpout")
+
+class ActivitySensor:
+    """
+    @class ActivitySensor
+    @brief Samples context switches, forks, page faults, swap, reclaim and load.
+    @details Reads /proc/stat, /proc/vmstat and /proc/loadavg exactly once each
+             per tick through descriptors opened at construction (pread at
+             offset 0), and converts cumulative counters into per-second rates.
+    """
+
+    def __init__(self):
+        """
+        @brief Opens the counter files and establishes the initial baseline.
+        """
+        self.fds = {}
+        self.last = None
+        self.last_time = None
+        try:
+            for key, path in (("stat", "/proc/stat"), ("vmstat", "/proc/vmstat"),
+                              ("loadavg", "/proc/loadavg")):
+                self.fds[key] = os.open(path, os.O_RDONLY)
+            self.last = self._read_counters()
+            self.last_time = time.monotonic()
+        except Exception as e:
+            logging.error(f"Failed to initialize ActivitySensor: {e}")
+
+    def _read(self, key: str) -> bytes:
+        """
+        @brief Reads a whole procfs file through its cached descriptor.
+        """
+        fd = self.fds[key]
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(fd, 65536, offset)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            offset += len(chunk)
+        return b"".join(chunks)
+
+    def _read_counters(self) -> dict:
+        """
+        @brief Reads raw counters and gauges from all three files.
+        """
+        values = {}
+        for line in self._read("stat").splitlines():
+            key, _, rest = line.partition(b" ")
+            if key in (b"ctxt", b"processes", b"procs_running", b"procs_blocked"):
+                values[key.decode()] = int(rest)
+
+        pgscan = 0
+        for line in self._read("vmstat").splitlines():
+            key, _, rest = line.partition(b" ")
+            if key.startswith(b"pgscan_"):
+                # pgscan_kswapd, pgscan_direct, pgscan_khugepaged, ...
+                pgscan += int(rest)
+            elif key in (b"pgfault", b"pgmajfault", b"pswpin", b"pswpout", b"oom_kill"):
+                values[key.decode()] = int(rest)
+        values["pgscan"] = pgscan
+
+        load = self._read("loadavg").split()
+        values["load1"], values["load5"], values["load15"] = (float(v) for v in load[:3])
+        return values
+
+    def fetch_data(self) -> dict:
+        """
+        @brief Samples the counters and calculates per-second rates.
+        @return A dictionary containing:
+            - 'ctxt', 'forks' (float): Context switches and process creations per second.
+            - 'pgfault', 'pgmajfault' (float): Minor+major and major page faults per second.
+            - 'pswpin', 'pswpout' (float): Pages swapped in/out per second.
+            - 'pgscan' (float): Pages scanned by reclaim per second.
+            - 'oom_kill' (int): OOM kills since the previous sample.
+            - 'running', 'blocked' (int): Runnable and D-state tasks right now.
+            - 'load1', 'load5', 'load15' (float): Load averages.
+        """
+        empty = {key: 0.0 for key in ("ctxt", "forks", "pgscan", "load1", "load5", "load15")
+                 + VMSTAT_RATES}
+        empty.update({"oom_kill": 0, "running": 0, "blocked": 0})
+        try:
+            now = time.monotonic()
+            curr = self._read_counters()
+
+            elapsed = now - self.last_time if self.last_time else 0.0
+            if elapsed <= 0 or self.last is None:
+                self.last, self.last_time = curr, now
+                return empty
+
+            prev = self.last
+
+            def rate(key):
+                return round((curr.get(key, 0) - prev.get(key, 0)) / elapsed, 1)
+
+            data = {
+                "ctxt": rate("ctxt"),
+                "forks": rate("processes"),
+                "pgscan": rate("pgscan"),
+                "oom_kill": curr.get("oom_kill", 0) - prev.get("oom_kill", 0),
+                "running": curr.get("procs_running", 0),
+                "blocked": curr.get("procs_blocked", 0),
+                "load1": curr["load1"],
+                "load5": curr["load5"],
+                "load15": curr["load15"],
+            }
+            for key in VMSTAT_RATES:
+                data[key] = rate(key)
+
+            # Update internal state for the next sampling cycle
+            self.last, self.last_time = curr, now
+            return data
+        except Exception as e:
+            logging.warning(f"Error sampling kernel activity counters: {e}")
+            return empty
@@ -0,0 +1,86 @@
+"""
+@file activity_widget.py
+@brief UI component for visualizing kernel activity counters.
+@project Linux Health Monitor Pro
+@dependencies pyqtgraph, PyQt6
+"""
+
+import time
+import pyqtgraph as pg
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from src.components.common.history_plot import HistoryPlot
+
+class ActivityWidget(QWidget):
+    """
+    @class ActivityWidget
+    @brief Four zoomable graphs covering scheduler, fault, swap and run-queue activity.
+    @details These are the first signals to check during a thrash incident:
+             rising major faults, swap traffic and reclaim scanning together
+             with blocked tasks point at memory pressure rather than CPU.
+    """
+
+    # Graph title -> list of (packet key, colour, legend)
+    GRAPHS = {
+        "Scheduler (/s)": [("ctxt", '#2ECC71', "ctx switches"), ("forks", '#F1C40F', "forks")],
+        "Page Faults (/s)": [("pgfault", '#3498DB', "all"), ("pgmajfault", '#E74C3C', "major")],
+        "Swap & Reclaim (pages/s)": [("pswpin", '#9B59B6', "swap in"), ("pswpout", '#E67E22', "swap out"),
+                                      ("pgscan", '#95A5A6', "scanned")],
+        "Run Queue": [("running", '#00FF00', "running"), ("blocked", '#FF3B30', "blocked"),
+                      ("load1", '#00FFFF', "load1")],
+    }
+
+    def __init__(self):
+        """
+        @brief Initializes the summary label and the four history plots.
+        """
+        super().__init__()
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 5, 0, 5)
+
+        self.label = QLabel("Kernel Activity: Loading...")
+        self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
+        self.layout.addWidget(self.label)
+
+        self.plots = []
+        for title, series in self.GRAPHS.items():
+            plot = HistoryPlot(rows=len(series))
+            plot.graph.setBackground('k')
+            plot.graph.setFixedHeight(120)
+            plot.graph.setTitle(title)
+            plot.graph.enableAutoRange(axis='y', enable=True)
+            plot.graph.setAutoVisible(y=True)
+            plot.graph.hideButtons()
+            plot.graph.addLegend(offset=(-10, 5))
+            for row, (key, color, name) in enumerate(series):
+                plot.add_curve(row, pen=pg.mkPen(color=color, width=1.5), name=name)
+            self.plots.append((plot, [key for key, _, _ in series]))
+            self.layout.addWidget(plot.graph)
+
+    def update_display(self, activity: dict, timestamp: float = None):
+        """
+        @brief Refreshes the label and appends one sample to every graph.
+        @param activity Dictionary produced by ActivitySensor.fetch_data.
+        @param timestamp Sample time (defaults to now).
+        """
+        self.update_labels(activity)
+        self.record(activity, timestamp)
+
+    def update_labels(self, activity: dict):
+        """
+        @brief Refreshes the summary line only (newest sample, visible widget).
+        """
+        oom = f" | OOM kills: {activity['oom_kill']}" if activity['oom_kill'] else ""
+        self.label.setText(
+            f"Kernel: {activity['ctxt']:>9,.0f} cs/s | {activity['forks']:>6,.0f} forks/s | "
+            f"majflt {activity['pgmajfault']:>6,.0f}/s | "
+            f"run {activity['running']} blk {activity['blocked']} | "
+            f"load {activity['load1']:.2f} {activity['load5']:.2f} {activity['load15']:.2f}{oom}"
+        )
+
+    def record(self, activity: dict, timestamp: float = None):
+        """
+        @brief Appends one sample to every graph (drawn on the next flush).
+        """
+        now = timestamp or time.time()
+        for plot, keys in self.plots:
+            plot.append(now, [activity[key] for key in keys])
@@ -0,0 +1,96 @@
+"""
+@file alert_widget.py
+@brief UI component listing firing alerts and recent alert transitions.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+import time
+from collections import deque
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget
+from PyQt6.QtGui import QColor
+from src.config import ALERT_HISTORY_SIZE
+
+class AlertWidget(QWidget):
+    """
+    @class AlertWidget
+    @brief Displays the alert engine state produced by the GlobalWorker.
+    @details The upper list mirrors the currently firing alerts, the lower list
+             keeps a bounded history of firing/resolved transitions.
+    """
+
+    # Severity colour coding shared by both lists
+    SEVERITY_COLORS = {"critical": "#E74C3C", "warning": "#F39C12"}
+
+    def __init__(self):
+        """
+        @brief Initializes both list views and the bounded history buffer.
+        """
+        super().__init__()
+        layout = QVBoxLayout(self)
+
+        # Internal state: bounded transition history (newest first)
+        self.history = deque(maxlen=ALERT_HISTORY_SIZE)
+
+        self.active_label = QLabel("Firing Alerts")
+        self.active_label.setStyleSheet("font-weight: bold; color: #E74C3C; margin-bottom: 5px;")
+        self.active_list = QListWidget()
+
+        self.history_label = QLabel("Recent Transitions")
+        self.history_label.setStyleSheet("font-weight: bold; color: #3498db; margin-bottom: 5px;")
+        self.history_list = QListWidget()
+
+        for view in (self.active_list, self.history_list):
+            view.setStyleSheet("""
+                QListWidget {
+                    background-color: #121212;
+                    border: 1px solid #333;
+                    font-family: 'Monospace';
+                    font-size: 12px;
+                }
+            """)
+
+        layout.addWidget(self.active_label)
+        layout.addWidget(self.active_list)
+        layout.addWidget(self.history_label)
+        layout.addWidget(self.history_list)
+
+    def update_display(self, alerts: dict):
+        """
+        @brief Synchronizes both lists with the latest alert state.
+        @param alerts Dictionary with 'active' and 'events' lists from AlertEngine.
+        """
+        self.active_list.clear()
+        active = alerts.get("active", [])
+        if not active:
+            self.active_list.addItem("No alerts firing.")
+        for alert in active:
+            since = time.strftime("%H:%M:%S", time.localtime(alert["time"]))
+            self._add_line(
+                self.active_list,
+                f"{alert['name']}: {alert['condition']} (now {alert['value']}, since {since})",
+                alert["severity"],
+            )
+
+        # Only transitions touch the history list, so idle ticks stay cheap
+        events = alerts.get("events", [])
+        if not events:
+            return
+        self.history.extendleft(events)
+        self.history_list.clear()
+        for event in self.history:
+            stamp = time.strftime("%H:%M:%S", time.localtime(event["time"]))
+            severity = event["severity"] if event["state"] == "firing" else "resolved"
+            self._add_line(
+                self.history_list,
+                f"{stamp} {event['state'].upper():<8} {event['name']} (value={event['value']})",
+                severity,
+            )
+
+    def _add_line(self, view: QListWidget, text: str, severity: str):
+        """
+        @brief Appends a colour-coded row to a list view.
+        """
+        view.addItem(text)
+        color = self.SEVERITY_COLORS.get(severity, "#2ECC71")
+        view.item(view.count() - 1).setForeground(QColor(color))
@@ -0,0 +1,139 @@
+"""
+@file burst_widget.py
+@brief UI component for triggering and displaying high-frequency burst captures.
+@project Linux Health Monitor Pro
+@dependencies pyqtgraph, PyQt6
+"""
+
+import pyqtgraph as pg
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                             QPushButton, QSpinBox)
+from src.config import BURST_MIN_RATE, BURST_MAX_RATE, BURST_MAX_SECONDS
+
+class BurstWidget(QWidget):
+    """
+    @class BurstWidget
+    @brief Displays decimated min/max/mean envelopes of a burst capture.
+    @details Each series is drawn as a translucent band between its per-pixel
+             minimum and maximum with the mean as a solid line, so sub-second
+             spikes remain visible without plotting every raw sample.
+    """
+
+    # Emitted when the user starts a capture: (rate_hz, seconds, plot_width_px)
+    capture_requested = pyqtSignal(int, float, int)
+
+    # Series key -> (plot key, colour)
+    SERIES = {
+        "cpu": ("cpu", '#00FF00'),
+        "disk_read": ("disk", '#F1C40F'),
+        "disk_write": ("disk", '#E67E22'),
+        "net_down": ("net", '#FF00FF'),
+        "net_up": ("net", '#00FFFF'),
+    }
+
+    def __init__(self):
+        """
+        @brief Initializes the capture controls and the three envelope graphs.
+        """
+        super().__init__()
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 5, 0, 5)
+
+        # --- Capture Controls ---
+        controls = QHBoxLayout()
+        self.label = QLabel("Burst: idle")
+        self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
+
+        self.rate_box = QSpinBox()
+        self.rate_box.setRange(BURST_MIN_RATE, BURST_MAX_RATE)
+        self.rate_box.setValue(100)
+        self.rate_box.setSuffix(" Hz")
+
+        self.seconds_box = QSpinBox()
+        self.seconds_box.setRange(1, BURST_MAX_SECONDS)
+        self.seconds_box.setValue(5)
+        self.seconds_box.setSuffix(" s")
+
+        self.btn_start = QPushButton("Capture Burst")
+        self.btn_start.setStyleSheet(
+            "padding: 5px 15px; background-color: #2c3e50; color: white; border-radius: 4px;"
+        )
+        self.btn_start.clicked.connect(self._request_capture)
+
+        controls.addWidget(self.label)
+        controls.addStretch()
+        controls.addWidget(self.rate_box)
+        controls.addWidget(self.seconds_box)
+        controls.addWidget(self.btn_start)
+        self.layout.addLayout(controls)
+
+        # --- Envelope Graphs ---
+        self.graphs = {}
+        for key, title in (("cpu", "CPU %"), ("disk", "Disk MB/s"), ("net", "Net KB/s")):
+            graph = pg.PlotWidget(title=title)
+            self._configure_graph(graph)
+            self.graphs[key] = graph
+            self.layout.addWidget(graph)
+
+        self.bands = {}
+        for name, (graph_key, color) in self.SERIES.items():
+            graph = self.graphs[graph_key]
+            qcolor = pg.mkColor(color)
+            upper = graph.plot(pen=pg.mkPen(color=color, width=0.5))
+            lower = graph.plot(pen=pg.mkPen(color=color, width=0.5))
+            qcolor.setAlpha(60)
+            fill = pg.FillBetweenItem(upper, lower, brush=qcolor)
+            graph.addItem(fill)
+            mean = graph.plot(pen=pg.mkPen(color=color, width=1.5))
+            self.bands[name] = (upper, lower, mean)
+
+    def _configure_graph(self, graph: pg.PlotWidget):
+        """
+        @brief Internal helper to style an envelope PlotWidget.
+        """
+        graph.setBackground('k')
+        graph.setFixedHeight(110)
+        graph.enableAutoRange(axis='y', enable=True)
+        graph.getViewBox().setMouseEnabled(x=False, y=False)
+        graph.hideButtons()
+
+    def _request_capture(self):
+        """
+        @brief Emits the capture request sized to the current plot width.
+        """
+        width = self.graphs["cpu"].getViewBox().width()
+        self.capture_requested.emit(
+            self.rate_box.value(), float(self.seconds_box.value()), max(1, int(width))
+        )
+        self.btn_start.setEnabled(False)
+
+    def update_display(self, envelope: dict):
+        """
+        @brief Draws the latest decimated envelope.
+        @param envelope Snapshot emitted by BurstSampler.envelope_ready.
+        """
+        state = "done" if envelope["done"] else "capturing"
+        self.label.setText(
+            f"Burst: {state} @ {envelope['rate']} Hz ({envelope['elapsed']:.1f} s, "
+            f"{len(envelope['t'])} px)"
+        )
+        t = envelope["t"]
+        for name, (upper, lower, mean) in self.bands.items():
+            series = envelope[name]
+            upper.setData(t, series["max"])
+            lower.setData(t, series["min"])
+            mean.setData(t, series["mean"])
+
+    def finish_capture(self, status: str):
+        """
+        @brief Re-enables the capture button once the sampler is done with a request.
+        @param status How the capture ended (see BurstSampler.capture_finished).
+        """
+        self.btn_start.setEnabled(True)
+        if status == "failed":
+            self.label.setText("Burst: capture failed (see log)")
+        elif status == "aborted":
+            self.label.setText("Burst: aborted")
+        elif status == "busy":
+            self.label.setText("Burst: a capture is already running")
@@ -0,0 +1,141 @@
+"""
+@file history_plot.py
+@brief Zoomable time-series plot backed by a min/max pyramid.
+@project Linux Health Monitor Pro
+@dependencies pyqtgraph, numpy
+"""
+
+import time
+import numpy as np
+import pyqtgraph as pg
+from src.core.pyramid import MinMaxPyramid
+from src.config import LIVE_WINDOW_SECONDS, HISTORY_RETENTION_SAMPLES
+
+class HistoryPlot:
+    """
+    @class HistoryPlot
+    @brief Owns a PlotWidget whose curves are served from a MinMaxPyramid.
+    @details By default the view follows the newest 'live_window' seconds.
+             Dragging or wheel-zooming along the time axis detaches the view
+             and lets the user browse the whole retention window;
+             double-clicking returns to the live view. Every redraw queries
+             roughly one bucket per horizontal pixel, whatever the range.
+             append() only records the sample and marks the plot dirty; the
+             RenderScheduler calls flush() once per frame, which redraws the
+             dirty plots that are currently visible.
+    """
+
+    # Plots with samples not yet drawn (shared by all instances)
+    dirty = set()
+
+    # Visible span while following live data (updated on config reload, applied on the next sample)
+    live_window = LIVE_WINDOW_SECONDS
+
+    def __init__(self, rows: int):
+        """
+        @brief Creates the graph and the backing pyramid.
+        @param rows Number of series (base curves and overlays) sharing the time axis.
+        """
+        self.graph = pg.PlotWidget(axisItems={'bottom': pg.DateAxisItem(orientation='bottom')})
+        self.pyramid = MinMaxPyramid(rows, HISTORY_RETENTION_SAMPLES)
+        self.curves = []
+        self.follow = True
+        self.latest = None
+        self.drawn = 0.0   # Newest timestamp already rendered
+
+        view = self.graph.getViewBox()
+        view.setMouseEnabled(x=True, y=False)
+        view.sigXRangeChanged.connect(self._redraw)
+        view.sigResized.connect(self._redraw)
+        view.sigRangeChangedManually.connect(self._detach)
+        self.graph.scene().sigMouseClicked.connect(self._on_click)
+
+        now = time.time()
+        self.graph.setXRange(now - self.live_window, now, padding=0)
+
+    def add_curve(self, row: int, sparse: bool = False, **plot_kwargs):
+        """
+        @brief Binds a curve to a pyramid row.
+        @param row Pyramid row drawn by this curve.
+        @param sparse True for mostly-NaN rows (anomaly marks), which are drawn
+               with connect='finite' and cleared when nothing is visible.
+        @return The created PlotDataItem.
+        """
+        curve = self.graph.plot(**plot_kwargs)
+        self.curves.append((row, curve, sparse))
+        return curve
+
+    def append(self, timestamp: float, values):
+        """
+        @brief Records one sample per row; drawing is deferred to flush().
+        @param timestamp Sample time (seconds since epoch).
+        @param values One value per pyramid row (NaN for 'no data').
+        """
+        self.pyramid.append(timestamp, values)
+        self.latest = timestamp
+        HistoryPlot.dirty.add(self)
+
+    @classmethod
+    def flush(cls):
+        """
+        @brief Redraws every dirty plot whose graph is visible.
+        @details Hidden plots stay dirty and are drawn once they are shown.
+        """
+        for plot in list(cls.dirty):
+            if plot.graph.isVisible():
+                cls.dirty.discard(plot)
+                plot._render()
+
+    def _render(self):
+        """
+        @brief Moves the live window to the newest sample, or redraws a detached view.
+        """
+        timestamp = self.latest
+        if self.follow:
+            # Moving the range triggers sigXRangeChanged, which redraws
+            self.graph.setXRange(timestamp - self.live_window, timestamp, padding=0)
+        elif self.graph.getViewBox().viewRange()[0][1] >= self.drawn:
+            # Some of the samples since the last draw fall inside the detached view
+            self._redraw()
+        self.drawn = timestamp
+
+    def _redraw(self, *args):
+        """
+        @brief Re-queries the pyramid for the visible range.
+        """
+        view = self.graph.getViewBox()
+        (x0, x1), _ = view.viewRange()
+        x, y = self.pyramid.query(x0, x1, view.width())
+        for row, curve, sparse in self.curves:
+            if sparse:
+                if not np.isfinite(y[row]).any():
+                    curve.clear()
+                    continue
+                curve.setData(x, y[row], connect='finite')
+            else:
+                curve.setData(x, y[row])
+
+    def _detach(self, *args):
+        """
+        @brief Leaves live mode after a manual pan or zoom.
+        """
+        self.follow = False
+
+    def _on_click(self, event):
+        """
+        @brief Double-click returns to the live view.
+        """
+        if event.double():
+            self.follow = True
+            if self.latest is not None:
+                self.graph.setXRange(self.latest - self.live_window, self.latest, padding=0)
+
+    @staticmethod
+    def anomaly_pen() -> dict:
+        """
+        @brief Plot keyword arguments shared by all anomaly overlay curves.
+        """
+        return {
+            "pen": pg.mkPen(color='#FF3B30', width=3),
+            "symbol": 'o', "symbolSize": 4, "symbolBrush": '#FF3B30', "symbolPen": None,
+        }
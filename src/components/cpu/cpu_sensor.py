@@ -24,6 +24,7 @@ class CPUSensor:
         """
         try:
             psutil.cpu_percent(interval=None)
+            psutil.cpu_percent(interval=None, percpu=True)
         except Exception as e:
             logging.error(f"Failed to initialize CPUSensor: {e}")
 
@@ -33,11 +34,13 @@ class CPUSensor:
         @return A dictionary containing:
             - 'usage' (float): Total CPU utilization as a percentage.
             - 'speed' (float): Current clock speed in GHz.
+            - 'per_core' (list): Utilization percentage of each logical core.
         @note Clock speed is converted from MHz to GHz for dashboard readability.
         """
         try:
             # Non-blocking call returns the utilization since the last call
             usage = psutil.cpu_percent(interval=None)
+            per_core = psutil.cpu_percent(interval=None, percpu=True)
             
             # Fetch frequency; may return None on certain virtualized environments
             freq = psutil.cpu_freq()
@@ -47,8 +50,9 @@ class CPUSensor:
             
             return {
                 "usage": usage,
-                "speed": speed_ghz
+                "speed": speed_ghz,
+                "per_core": per_core
             }
         except Exception as e:
             logging.warning(f"Error sampling CPU metrics: {e}")
-            return {"usage": 0.0, "speed": 0.0}
\ No newline at end of file
+            return {"usage": 0.0, "speed": 0.0, "per_core": []}
\ No newline at end of file
@@ -5,8 +5,10 @@
 @dependencies pyqtgraph, PyQt6
 """
 
+import time
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from src.components.common.history_plot import HistoryPlot
 
 class CPUWidget(QWidget):
     """
@@ -19,11 +21,10 @@ class CPUWidget(QWidget):
     def __init__(self):
         """
         @brief Initializes UI components and graph settings.
-        @details Sets up a 60-point sliding window history for the utilization graph.
+        @details Utilization history is kept in a zoomable pyramid-backed plot
+                 (row 0: usage, row 1: anomaly marks).
         """
         super().__init__()
-        # Internal state: 60-second sliding window of utilization data
-        self.history = [0] * 60
         
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 5, 0, 5)
@@ -33,12 +34,14 @@ class CPUWidget(QWidget):
         self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
         
         # Graph Configuration
-        self.graph = pg.PlotWidget()
+        self.plot = HistoryPlot(rows=2)
+        self.graph = self.plot.graph
         self._configure_graph()
         
         # Data Curve Initialization
         pen = pg.mkPen(color=(0, 255, 0), width=2)
-        self.curve = self.graph.plot(self.history, pen=pen)
+        self.curve = self.plot.add_curve(0, pen=pen)
+        self.anomaly_curve = self.plot.add_curve(1, sparse=True, **HistoryPlot.anomaly_pen())
         
         self.layout.addWidget(self.label)
         self.layout.addWidget(self.graph)
@@ -46,29 +49,39 @@ class CPUWidget(QWidget):
     def _configure_graph(self):
         """
         @brief Internal helper to style the pyqtgraph PlotWidget.
-        @details Disables user interaction and hides axes to maintain 
-                 a clean dashboard aesthetic.
+        @details Only the time axis is interactive (pan/zoom); the Y axis
+                 stays locked to the 0-100% scale.
         """
         self.graph.setBackground('k')  # Black background
         self.graph.setFixedHeight(150)
         self.graph.setYRange(0, 100)
-        self.graph.getAxis('bottom').hide()
-        self.graph.getViewBox().setMouseEnabled(x=False, y=False)
         self.graph.hideButtons()
 
-    def update_display(self, usage: float, speed: float):
+    def update_display(self, usage: float, speed: float, anomalous: bool = False,
+                       timestamp: float = None):
         """
         @brief Updates the visual state of the widget.
         @param usage Current CPU load as a percentage (0.0 - 100.0).
         @param speed Current CPU clock speed in GHz.
-        @details Shifts the history buffer and redraws the graph curve.
+        @param anomalous True when the anomaly detector flagged this sample.
+        @param timestamp Sample time (defaults to now).
+        @details Appends to the history pyramid, which redraws the visible range.
+        """
+        self.update_labels(usage, speed)
+        self.record(usage, anomalous, timestamp)
+
+    def update_labels(self, usage: float, speed: float):
+        """
+        @brief Refreshes the text overlay only (newest sample, visible widget).
         """
-        # Update textual information
         self.label.setText(f"CPU: {usage}% @ {speed:.2f} GHz")
-        
-        # Maintain sliding window history
-        self.history.pop(0)
-        self.history.append(usage)
-        
-        # Atomic update of the graph data
-        self.curve.setData(self.history)
\ No newline at end of file
+
+    def record(self, usage: float, anomalous: bool = False, timestamp: float = None):
+        """
+        @brief Appends one sample to the history pyramid (drawn on the next flush).
+        """
+        # Anomaly marks are NaN unless flagged
+        self.plot.append(
+            timestamp or time.time(),
+            (usage, usage if anomalous else float('nan'))
+        )
@@ -8,6 +8,8 @@
 import psutil
 import time
 import logging
+from src.core.settings import device_selected
+from src.config import DISK_DEVICES
 
 class DiskSensor:
     """
@@ -17,18 +19,22 @@ class DiskSensor:
              system-wide disk I/O counters over a specific time interval.
     """
 
-    def __init__(self):
+    def __init__(self, devices=DISK_DEVICES):
         """
         @brief Establishes the initial baseline for disk I/O counters.
         @details Captures current bytes read/written and the current 
                  unix timestamp to enable the first delta calculation.
+        @param devices Device filter (see settings.device_selected); empty keeps all.
         """
+        self.devices = list(devices)
         try:
             self.last_io = psutil.disk_io_counters()
+            self.last_per_disk = psutil.disk_io_counters(perdisk=True)
             self.last_time = time.time()
         except Exception as e:
             logging.error(f"Failed to initialize DiskSensor: {e}")
             self.last_io = None
+            self.last_per_disk = {}
             self.last_time = time.time()
 
     def fetch_data(self) -> dict:
@@ -37,31 +43,54 @@ class DiskSensor:
         @return A dictionary containing:
             - 'read'  (float): Read speed in MB/s.
             - 'write' (float): Write speed in MB/s.
+            - 'devices' (dict): Per-device {'read', 'write'} speeds in MB/s.
+        @note With a device filter, only matching devices are listed and the
+              totals are their sum instead of the system-wide counters.
         @note Rates are calculated as: (Current_Bytes - Previous_Bytes) / Elapsed_Time.
         """
         try:
             now = time.time()
             curr_io = psutil.disk_io_counters()
+            curr_per_disk = psutil.disk_io_counters(perdisk=True)
             
             # Prevent division by zero or errors if counters are inaccessible
             elapsed = now - self.last_time
             if elapsed <= 0 or self.last_io is None:
-                return {"read": 0.0, "write": 0.0}
+                return {"read": 0.0, "write": 0.0, "devices": {}}
 
             # Calculate raw bytes per second
             read_bps = (curr_io.read_bytes - self.last_io.read_bytes) / elapsed
             write_bps = (curr_io.write_bytes - self.last_io.write_bytes) / elapsed
 
+            # Per-device rates (devices that appeared since the last cycle are skipped)
+            devices = {}
+            for name, io in curr_per_disk.items():
+                prev = self.last_per_disk.get(name)
+                if prev is None or not device_selected(name, self.devices):
+                    continue
+                devices[name] = {
+                    "read": round((io.read_bytes - prev.read_bytes) / elapsed / (1024 * 1024), 2),
+                    "write": round((io.write_bytes - prev.write_bytes) / elapsed / (1024 * 1024), 2)
+                }
+
+            if self.devices:
+                read_bps = sum(curr_per_disk[name].read_bytes - self.last_per_disk[name].read_bytes
+                               for name in devices) / elapsed
+                write_bps = sum(curr_per_disk[name].write_bytes - self.last_per_disk[name].write_bytes
+                                for name in devices) / elapsed
+
             # Update internal state for the next sampling cycle
             self.last_io = curr_io
+            self.last_per_disk = curr_per_disk
             self.last_time = now
 
             # Convert Bytes/s to Megabytes/s (MB/s)
             # Standard conversion: Bytes / 1024^2
             return {
                 "read": round(read_bps / (1024 * 1024), 2),
-                "write": round(write_bps / (1024 * 1024), 2)
+                "write": round(write_bps / (1024 * 1024), 2),
+                "devices": devices
             }
         except Exception as e:
             logging.warning(f"Error sampling disk I/O metrics: {e}")
-            return {"read": 0.0, "write": 0.0}
\ No newline at end of file
+            return {"read": 0.0, "write": 0.0, "devices": {}}
\ No newline at end of file
@@ -5,8 +5,10 @@
 @dependencies pyqtgraph, PyQt6
 """
 
+import time
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from src.components.common.history_plot import HistoryPlot
 
 class DiskWidget(QWidget):
     """
@@ -18,14 +20,11 @@ class DiskWidget(QWidget):
 
     def __init__(self):
         """
-        @brief Initializes UI components and 60-point history buffers.
+        @brief Initializes UI components and the pyramid-backed history plot.
+        @details Pyramid rows: 0 read, 1 write, 2 read anomalies, 3 write anomalies.
         """
         super().__init__()
         
-        # Internal state: Tracking history for the last 60 samples
-        self.read_history = [0.0] * 60
-        self.write_history = [0.0] * 60
-        
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 5, 0, 5)
 
@@ -33,24 +32,29 @@ class DiskWidget(QWidget):
         self.label = QLabel("Disk: R: 0.00 MB/s | W: 0.00 MB/s")
         self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
         
-        self.graph = pg.PlotWidget()
+        self.plot = HistoryPlot(rows=4)
+        self.graph = self.plot.graph
         self._configure_graph()
         
         # --- Visual Encoding Strategy ---
         
         # Read Throughput: Gold/Yellow curve with subtle area fill
-        self.read_curve = self.graph.plot(
-            self.read_history, 
+        self.read_curve = self.plot.add_curve(
+            0,
             pen=pg.mkPen(color='#F1C40F', width=2),
             fillLevel=0,
             brush=(241, 196, 15, 30)  # Alpha 30 for depth
         )
         
         # Write Throughput: Orange curve, distinct and sharp
-        self.write_curve = self.graph.plot(
-            self.write_history, 
+        self.write_curve = self.plot.add_curve(
+            1,
             pen=pg.mkPen(color='#E67E22', width=1.5)
         )
+
+        # Anomalous spans are overlaid in red on whichever stream was flagged
+        self.read_anomaly = self.plot.add_curve(2, sparse=True, **HistoryPlot.anomaly_pen())
+        self.write_anomaly = self.plot.add_curve(3, sparse=True, **HistoryPlot.anomaly_pen())
         
         self.layout.addWidget(self.label)
         self.layout.addWidget(self.graph)
@@ -62,15 +66,26 @@ class DiskWidget(QWidget):
         self.graph.setBackground('k')
         self.graph.setFixedHeight(150)
         self.graph.enableAutoRange(axis='y', enable=True)
-        self.graph.getAxis('bottom').hide()
-        self.graph.getViewBox().setMouseEnabled(x=False, y=False)
+        self.graph.setAutoVisible(y=True)  # Fit Y to the visible time range only
         self.graph.hideButtons()
 
-    def update_display(self, read: float, write: float):
+    def update_display(self, read: float, write: float,
+                       read_anomalous: bool = False, write_anomalous: bool = False,
+                       timestamp: float = None):
         """
         @brief Refreshes the widget with the latest Disk I/O samples.
         @param read Current read rate in MB/s.
         @param write Current write rate in MB/s.
+        @param read_anomalous True when the read sample was flagged as anomalous.
+        @param write_anomalous True when the write sample was flagged as anomalous.
+        @param timestamp Sample time (defaults to now).
+        """
+        self.update_labels(read, write)
+        self.record(read, write, read_anomalous, write_anomalous, timestamp)
+
+    def update_labels(self, read: float, write: float):
+        """
+        @brief Refreshes the rate label only (newest sample, visible widget).
         """
         # Update text with color-coded spans to match the curves
         # Note: Using :>7.2f to handle decimal precision for MB/s
@@ -78,14 +93,17 @@ class DiskWidget(QWidget):
             f'Disk: <span style="color:#F1C40F;">R: {read:>7.2f} MB/s</span> | '
             f'<span style="color:#E67E22;">W: {write:>7.2f} MB/s</span>'
         )
-        
-        # Shift sliding windows
-        self.read_history.pop(0)
-        self.read_history.append(read)
-        
-        self.write_history.pop(0)
-        self.write_history.append(write)
-        
-        # Update GPU-bound curves
-        self.read_curve.setData(self.read_history)
-        self.write_curve.setData(self.write_history)
\ No newline at end of file
+
+    def record(self, read: float, write: float,
+               read_anomalous: bool = False, write_anomalous: bool = False,
+               timestamp: float = None):
+        """
+        @brief Appends one sample of both streams to the history pyramid (drawn on the next flush).
+        """
+        # Record both streams; anomaly marks are NaN unless flagged
+        nan = float('nan')
+        self.plot.append(timestamp or time.time(), (
+            read, write,
+            read if read_anomalous else nan,
+            write if write_anomalous else nan
+        ))
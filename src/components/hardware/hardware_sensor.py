@@ -0,0 +1,180 @@
+"""
+@file hardware_sensor.py
+@brief Telemetry engine for temperatures, fans and power (hwmon, thermal, RAPL).
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+import re
+import errno
+import glob
+import time
+import logging
+
+# hwmon input prefixes -> (packet section, divisor to display units)
+HWMON_INPUTS = {
+    "temp": ("temps", 1000.0),     # millidegree Celsius -> °C
+    "fan": ("fans", 1.0),          # RPM
+    "power": ("power", 1e6),       # microwatt -> W
+}
+
+_HWMON_FILE = re.compile(r"^(temp|fan|power)(\d+)_input$")
+
+
+class HardwareSensor:
+    """
+    @class HardwareSensor
+    @brief Reads every discovered hardware input in one batched pass per tick.
+    @details Discovery walks /sys/class/hwmon, /sys/class/thermal and
+             /sys/class/powercap exactly once, at construction. Each usable
+             input is opened once and kept open; a tick is then a sequence of
+             pread(fd, 0) calls, which makes sysfs regenerate the value
+             without any path lookup or open/close. RAPL energy counters
+             (microjoules, wrapping at max_energy_range_uj) are turned into
+             watts from deltas. Inputs whose device disappears (hot-unplug)
+             are closed and dropped; nothing is re-discovered.
+    """
+
+    def __init__(self, sysfs: str = "/sys"):
+        """
+        @brief Discovers and opens all inputs.
+        @param sysfs Root of the sysfs mount (overridable for testing).
+        """
+        self.inputs = []     # (section, label, fd, divisor)
+        self.energy = []     # [label, fd, max_range_uj, last_uj, top_level]
+        self.last_time = None
+        try:
+            self._discover_hwmon(sysfs)
+            self._discover_thermal(sysfs)
+            self._discover_rapl(sysfs)
+        except Exception as e:
+            logging.error(f"Failed to initialize HardwareSensor: {e}")
+        logging.info(f"HardwareSensor: {len(self.inputs)} inputs, {len(self.energy)} RAPL domains")
+
+    @staticmethod
+    def _read_text(path: str, default: str = "") -> str:
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except OSError:
+            return default
+
+    @staticmethod
+    def _open(path: str):
+        """
+        @brief Opens an input and checks it is readable, returning the fd or None.
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            int(os.pread(fd, 32, 0))
+            return fd
+        except (OSError, ValueError):
+            # Present but unreadable (e.g. sensor asleep, energy_uj root-only)
+            os.close(fd)
+            return None
+
+    def _discover_hwmon(self, sysfs: str):
+        """
+        @brief Registers temp/fan/power inputs of every hwmon chip.
+        """
+        for chip in sorted(glob.glob(os.path.join(sysfs, "class/hwmon/hwmon*"))):
+            chip_name = self._read_text(os.path.join(chip, "name"), os.path.basename(chip))
+            try:
+                files = sorted(os.listdir(chip))
+            except OSError:
+                continue
+            for entry in files:
+                match = _HWMON_FILE.match(entry)
+                if not match:
+                    continue
+                kind, index = match.groups()
+                fd = self._open(os.path.join(chip, entry))
+                if fd is None:
+                    continue
+                label = self._read_text(os.path.join(chip, f"{kind}{index}_label"), f"{kind}{index}")
+                section, divisor = HWMON_INPUTS[kind]
+                self.inputs.append((section, f"{chip_name}/{label}", fd, divisor))
+
+    def _discover_thermal(self, sysfs: str):
+        """
+        @brief Registers every thermal zone temperature.
+        """
+        for zone in sorted(glob.glob(os.path.join(sysfs, "class/thermal/thermal_zone*"))):
+            fd = self._open(os.path.join(zone, "temp"))
+            if fd is None:
+                continue
+            kind = self._read_text(os.path.join(zone, "type"), os.path.basename(zone))
+            self.inputs.append(("temps", f"{kind} ({os.path.basename(zone)})", fd, 1000.0))
+
+    def _discover_rapl(self, sysfs: str):
+        """
+        @brief Registers readable RAPL energy counters (package, core, uncore, dram).
+        """
+        pattern = os.path.join(sysfs, "class/powercap/intel-rapl:*")
+        for domain in sorted(glob.glob(pattern) + glob.glob(os.path.join(pattern, "intel-rapl:*"))):
+            fd = self._open(os.path.join(domain, "energy_uj"))
+            if fd is None:
+                continue
+            name = self._read_text(os.path.join(domain, "name"), os.path.basename(domain))
+            max_range = int(self._read_text(os.path.join(domain, "max_energy_range_uj"), "0") or 0)
+            # Sub-domains (core, uncore, dram: intel-rapl:N:M) are part of their package
+            top_level = os.path.basename(domain).count(":") == 1
+            self.energy.append([f"rapl/{name} ({os.path.basename(domain)})", fd, max_range, None,
+                                top_level])
+
+    def fetch_data(self) -> dict:
+        """
+        @brief Reads every input once.
+        @return A dictionary containing:
+            - 'temps' (dict): Label -> °C.
+            - 'fans' (dict): Label -> RPM.
+            - 'power' (dict): Label -> W (hwmon power inputs and RAPL domains).
+            - 'total_power' (float): hwmon power plus top-level RAPL packages
+              (sub-domains are not added twice).
+            - 'max_temp' (float or None): Hottest reading.
+        @note RAPL domains report 0 W on the first sample.
+        """
+        data = {"temps": {}, "fans": {}, "power": {}, "total_power": 0.0, "max_temp": None}
+        failed = []
+        for item in self.inputs:
+            section, label, fd, divisor = item
+            try:
+                data[section][label] = round(int(os.pread(fd, 32, 0)) / divisor, 1)
+            except (OSError, ValueError) as e:
+                # A sleeping sensor (ENODATA/EAGAIN) is retried; a removed device is dropped
+                logging.debug(f"Hardware input {label} failed: {e}")
+                if getattr(e, "errno", None) in (errno.ENODEV, errno.ENXIO, errno.ENOENT):
+                    failed.append(item)
+
+        now = time.monotonic()
+        elapsed = (now - self.last_time) if self.last_time else 0.0
+        self.last_time = now
+        total = sum(data["power"].values())
+        for domain in self.energy:
+            label, fd, max_range, last, top_level = domain
+            try:
+                energy = int(os.pread(fd, 32, 0))
+            except (OSError, ValueError) as e:
+                logging.debug(f"RAPL counter {label} failed: {e}")
+                continue
+            delta = 0 if last is None else energy - last
+            if delta < 0:
+                delta += max_range   # Counter wrapped
+            domain[3] = energy
+            data["power"][label] = round(delta / 1e6 / elapsed, 1) if elapsed > 0 else 0.0
+            if top_level:
+                total += data["power"][label]
+        data["total_power"] = round(total, 1)
+
+        # Drop inputs that disappeared; discovery is never repeated
+        for item in failed:
+            self.inputs.remove(item)
+            os.close(item[2])
+
+        if data["temps"]:
+            data["max_temp"] = max(data["temps"].values())
+        return data
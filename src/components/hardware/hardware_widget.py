@@ -0,0 +1,101 @@
+"""
+@file hardware_widget.py
+@brief UI component for temperatures, fan speeds and power draw.
+@project Linux Health Monitor Pro
+@dependencies pyqtgraph, PyQt6
+"""
+
+import time
+import pyqtgraph as pg
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from src.components.common.history_plot import HistoryPlot
+from src.config import HARDWARE_PLOT_SERIES
+
+# Curve colours, cycled per input
+PALETTE = ('#E74C3C', '#F1C40F', '#2ECC71', '#3498DB', '#9B59B6', '#E67E22', '#1ABC9C', '#ECF0F1')
+
+class HardwareWidget(QWidget):
+    """
+    @class HardwareWidget
+    @brief Summary line plus temperature and power graphs.
+    @details The set of inputs is fixed by the sensor's one-time discovery, so
+             the graphs are built from the first sample. At most
+             HARDWARE_PLOT_SERIES inputs are drawn per graph; every reading
+             is still listed in the detail label.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the labels; graphs are created on the first sample.
+        """
+        super().__init__()
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 5, 0, 5)
+
+        self.label = QLabel("Hardware: Loading...")
+        self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
+        self.detail = QLabel("")
+        self.detail.setStyleSheet("font-family: 'Monospace'; color: #95A5A6;")
+        self.detail.setWordWrap(True)
+        self.layout.addWidget(self.label)
+        self.layout.addWidget(self.detail)
+
+        self.plots = {}   # section -> (HistoryPlot, labels)
+
+    def _build(self, section: str, title: str, labels: list):
+        """
+        @brief Creates one graph for the first HARDWARE_PLOT_SERIES labels of a section.
+        """
+        labels = labels[:HARDWARE_PLOT_SERIES]
+        plot = HistoryPlot(rows=len(labels))
+        plot.graph.setBackground('k')
+        plot.graph.setFixedHeight(140)
+        plot.graph.setTitle(title)
+        plot.graph.enableAutoRange(axis='y', enable=True)
+        plot.graph.setAutoVisible(y=True)
+        plot.graph.hideButtons()
+        plot.graph.addLegend(offset=(-10, 5))
+        for row, label in enumerate(labels):
+            plot.add_curve(row, pen=pg.mkPen(color=PALETTE[row % len(PALETTE)], width=1.5), name=label)
+        self.plots[section] = (plot, labels)
+        self.layout.addWidget(plot.graph)
+
+    def update_display(self, data: dict, timestamp: float = None):
+        """
+        @brief Refreshes the labels and appends one sample to each graph.
+        @param data Dictionary produced by HardwareSensor.fetch_data.
+        @param timestamp Sample time (defaults to now).
+        """
+        self.update_labels(data)
+        self.record(data, timestamp)
+
+    def update_labels(self, data: dict):
+        """
+        @brief Refreshes the summary and detail lines only (newest sample, visible widget).
+        """
+        temps, fans, power = data['temps'], data['fans'], data['power']
+        if not (temps or fans or power):
+            self.label.setText("Hardware: no readable hwmon/thermal/RAPL inputs")
+            return
+
+        hottest = f"{data['max_temp']:.1f}°C" if data['max_temp'] is not None else "n/a"
+        self.label.setText(
+            f"Hardware: hottest {hottest} | power {data['total_power']:.1f} W | fans {len(fans)}"
+        )
+        self.detail.setText(" | ".join(
+            [f"{k} {v:.0f}°C" for k, v in temps.items()]
+            + [f"{k} {v:.0f} rpm" for k, v in fans.items()]
+            + [f"{k} {v:.1f} W" for k, v in power.items()]
+        ))
+
+    def record(self, data: dict, timestamp: float = None):
+        """
+        @brief Appends one sample to each graph, creating the graphs from the first one.
+        """
+        temps, power = data['temps'], data['power']
+        for section, title, values in (("temps", "Temperature (°C)", temps), ("power", "Power (W)", power)):
+            if section not in self.plots and values:
+                self._build(section, title, list(values))
+            if section in self.plots:
+                plot, labels = self.plots[section]
+                plot.append(timestamp or time.time(), [values.get(label, float('nan')) for label in labels])
@@ -0,0 +1,135 @@
+"""
+@file interrupt_sensor.py
+@brief Telemetry engine for per-CPU hardware interrupt and softirq rates.
+@project Linux Health Monitor Pro
+@dependencies numpy
+"""
+
+import time
+import logging
+import numpy as np
+
+class CounterMatrix:
+    """
+    @class CounterMatrix
+    @brief Parses a (source x CPU) counter table such as /proc/interrupts.
+    @details Both /proc/interrupts and /proc/softirqs start with a 'CPUn'
+             header followed by one row per source. Each file is read as bytes
+             in one call, the count columns of every row are joined into a
+             single buffer and converted with one numpy call, which keeps
+             parsing fast on 256-CPU hosts where each row has 256 columns.
+             Rates are then one vectorized subtraction against the previous
+             matrix.
+    """
+
+    def __init__(self, path: str):
+        """
+        @param path Counter file to parse.
+        """
+        self.path = path
+        self.labels = ()
+        self.last_counts = None
+        self.last_time = None
+
+    def _parse(self):
+        """
+        @brief Reads the file into (labels, descriptions, counts matrix, cpu count).
+        @details The kernel prints every counter as ' %10u', so the count block
+                 of a row is a fixed 11*CPUs byte slice after the label's ':'.
+                 Slicing avoids tokenising 256 columns per row; rows whose
+                 layout does not match (counter wider than 10 digits) fall back
+                 to whitespace splitting.
+        """
+        with open(self.path, "rb") as f:
+            lines = f.read().splitlines()
+
+        cpus = len(lines[0].split())
+        width = 11 * cpus
+        labels = []
+        descriptions = []
+        columns = []
+        for line in lines[1:]:
+            colon = line.find(b":")
+            if colon < 0:
+                continue
+            end = colon + 1 + width
+            if len(line) >= end and (len(line) == end or line[end] == 0x20):
+                counts, description = line[colon + 1:end], line[end:]
+            else:
+                tokens = line[colon + 1:].split()
+                # Summary rows such as 'ERR:' or 'MIS:' carry a single total; skip them
+                if len(tokens) < cpus:
+                    continue
+                counts, description = b" ".join(tokens[:cpus]), b" ".join(tokens[cpus:])
+            labels.append(line[:colon].strip().decode())
+            descriptions.append(b" ".join(description.split()).decode())
+            columns.append(counts)
+
+        counts = np.fromstring(b" ".join(columns), dtype=np.int64, sep=" ")
+        return tuple(labels), descriptions, counts.reshape(len(labels), cpus), cpus
+
+    def sample(self) -> dict:
+        """
+        @brief Samples the counters and converts them to per-second rates.
+        @return A dictionary containing:
+            - 'labels' (list): Source identifiers (IRQ number, 'NMI', 'NET_RX', ...).
+            - 'descriptions' (list): Controller/device text of each source.
+            - 'rates' (np.ndarray): (source x CPU) events per second.
+        """
+        now = time.monotonic()
+        labels, descriptions, counts, cpus = self._parse()
+        rates = np.zeros(counts.shape)
+
+        if self.last_counts is not None and now > self.last_time:
+            elapsed = now - self.last_time
+            if labels == self.labels and counts.shape == self.last_counts.shape:
+                # Fast path: identical layout, one vectorized delta
+                rates = (counts - self.last_counts) / elapsed
+            else:
+                # Sources or CPUs changed (hotplug, new IRQ): align by label
+                previous = {label: row for row, label in enumerate(self.labels)}
+                width = min(cpus, self.last_counts.shape[1])
+                for row, label in enumerate(labels):
+                    old = previous.get(label)
+                    if old is not None:
+                        rates[row, :width] = (counts[row, :width] - self.last_counts[old, :width]) / elapsed
+            # Counters never decrease unless a source was re-registered
+            np.maximum(rates, 0, out=rates)
+
+        self.labels = labels
+        self.last_counts = counts
+        self.last_time = now
+        return {"labels": list(labels), "descriptions": descriptions, "rates": rates}
+
+class InterruptSensor:
+    """
+    @class InterruptSensor
+    @brief Samples hardware interrupts and softirqs as (source x CPU) rate matrices.
+    """
+
+    def __init__(self):
+        """
+        @brief Establishes the initial counter baselines.
+        """
+        self.irq = CounterMatrix("/proc/interrupts")
+        self.softirq = CounterMatrix("/proc/softirqs")
+        try:
+            self.irq.sample()
+            self.softirq.sample()
+        except Exception as e:
+            logging.error(f"Failed to initialize InterruptSensor: {e}")
+
+    def fetch_data(self) -> dict:
+        """
+        @brief Samples both counter files.
+        @return {'irq': {...}, 'softirq': {...}} as produced by CounterMatrix.sample,
+                or empty dicts when a file is unreadable.
+        """
+        data = {}
+        for key, matrix in (("irq", self.irq), ("softirq", self.softirq)):
+            try:
+                data[key] = matrix.sample()
+            except Exception as e:
+                logging.warning(f"Error sampling {matrix.path}: {e}")
+                data[key] = {}
+        return data
@@ -0,0 +1,72 @@
+"""
+@file interrupt_widget.py
+@brief UI component rendering per-CPU interrupt and softirq rates as heatmaps.
+@project Linux Health Monitor Pro
+@dependencies pyqtgraph, numpy, PyQt6
+"""
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+
+class InterruptWidget(QWidget):
+    """
+    @class InterruptWidget
+    @brief Two (source x CPU) heatmaps: hardware IRQs and softirqs.
+    @details Colour encodes log10(1 + events/s) so that a single saturated
+             queue does not wash out the rest of the matrix. Uneven rows
+             reveal IRQ affinity problems (e.g. all NIC queues on CPU 0).
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the summary label and both heatmaps.
+        """
+        super().__init__()
+        self.layout = QVBoxLayout(self)
+
+        self.label = QLabel("Interrupts: Loading...")
+        self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
+        self.layout.addWidget(self.label)
+
+        self.heatmaps = {}
+        for key, title in (("irq", "Hardware IRQs / s"), ("softirq", "Softirqs / s")):
+            graph = pg.PlotWidget(title=title)
+            graph.setBackground('k')
+            graph.getViewBox().invertY(True)
+            graph.getAxis('bottom').setLabel("CPU")
+            graph.hideButtons()
+            image = pg.ImageItem(axisOrder='row-major')
+            image.setColorMap(pg.colormap.get('inferno'))
+            graph.addItem(image)
+            self.layout.addWidget(graph, stretch=3 if key == "irq" else 1)
+            self.heatmaps[key] = (graph, image, [None])
+
+    def update_display(self, data: dict):
+        """
+        @brief Redraws both heatmaps from the latest rate matrices.
+        @param data {'irq': {...}, 'softirq': {...}} from InterruptSensor.fetch_data.
+        """
+        hottest = []
+        for key, (graph, image, last_labels) in self.heatmaps.items():
+            matrix = data.get(key, {})
+            rates = matrix.get("rates")
+            if rates is None or rates.size == 0:
+                continue
+
+            image.setImage(np.log10(1.0 + rates), autoLevels=True)
+
+            # Relabel the source axis only when the set of sources changes
+            labels = matrix["labels"]
+            if labels != last_labels[0]:
+                last_labels[0] = labels
+                ticks = [(row + 0.5, label) for row, label in enumerate(labels)]
+                graph.getAxis('left').setTicks([ticks])
+                graph.setLimits(xMin=0, xMax=rates.shape[1], yMin=0, yMax=rates.shape[0])
+                graph.setRange(xRange=(0, rates.shape[1]), yRange=(0, rates.shape[0]), padding=0)
+
+            row, cpu = np.unravel_index(int(np.argmax(rates)), rates.shape)
+            hottest.append(f"{key} {labels[row]} @ CPU{cpu}: {rates[row, cpu]:,.0f}/s")
+
+        if hottest:
+            self.label.setText("Hottest: " + " | ".join(hottest))
@@ -8,6 +8,8 @@
 import psutil
 import time
 import logging
+from src.core.settings import device_selected
+from src.config import NET_INTERFACES
 
 class NetworkSensor:
     """
@@ -17,18 +19,22 @@ class NetworkSensor:
              system-wide I/O counters over a specific time interval.
     """
 
-    def __init__(self):
+    def __init__(self, interfaces=NET_INTERFACES):
         """
         @brief Establishes the initial baseline for I/O counters.
         @details Captures current bytes sent/received and the current 
                  unix timestamp to enable the first delta calculation.
+        @param interfaces Interface filter (see settings.device_selected); empty keeps all.
         """
+        self.interfaces = list(interfaces)
         try:
             self.last_net = psutil.net_io_counters()
+            self.last_per_nic = psutil.net_io_counters(pernic=True)
             self.last_time = time.time()
         except Exception as e:
             logging.error(f"Failed to initialize NetworkSensor: {e}")
             self.last_net = None
+            self.last_per_nic = {}
             self.last_time = time.time()
 
     def fetch_data(self) -> dict:
@@ -37,30 +43,53 @@ class NetworkSensor:
         @return A dictionary containing:
             - 'down' (float): Download speed in KB/s.
             - 'up'   (float): Upload speed in KB/s.
+            - 'interfaces' (dict): Per-interface {'down', 'up'} speeds in KB/s.
+        @note With an interface filter, only matching interfaces are listed and
+              the totals are their sum instead of the system-wide counters.
         @note Rates are calculated as: (Current_Bytes - Previous_Bytes) / Elapsed_Time.
         """
         try:
             now = time.time()
             curr_net = psutil.net_io_counters()
+            curr_per_nic = psutil.net_io_counters(pernic=True)
             
             # Prevent division by zero if calls happen too rapidly
             elapsed = now - self.last_time
             if elapsed <= 0 or self.last_net is None:
-                return {"down": 0.0, "up": 0.0}
+                return {"down": 0.0, "up": 0.0, "interfaces": {}}
 
             # Calculate raw bytes per second
             down_bps = (curr_net.bytes_recv - self.last_net.bytes_recv) / elapsed
             up_bps = (curr_net.bytes_sent - self.last_net.bytes_sent) / elapsed
 
+            # Per-interface rates (interfaces that appeared since the last cycle are skipped)
+            interfaces = {}
+            for name, io in curr_per_nic.items():
+                prev = self.last_per_nic.get(name)
+                if prev is None or not device_selected(name, self.interfaces):
+                    continue
+                interfaces[name] = {
+                    "down": round((io.bytes_recv - prev.bytes_recv) / elapsed / 1024, 1),
+                    "up": round((io.bytes_sent - prev.bytes_sent) / elapsed / 1024, 1)
+                }
+
+            if self.interfaces:
+                down_bps = sum(curr_per_nic[name].bytes_recv - self.last_per_nic[name].bytes_recv
+                               for name in interfaces) / elapsed
+                up_bps = sum(curr_per_nic[name].bytes_sent - self.last_per_nic[name].bytes_sent
+                             for name in interfaces) / elapsed
+
             # Update internal state for the next sampling cycle
             self.last_net = curr_net
+            self.last_per_nic = curr_per_nic
             self.last_time = now
 
             # Convert Bytes/s to Kilobytes/s (KB/s)
             return {
                 "down": round(down_bps / 1024, 1),
-                "up": round(up_bps / 1024, 1)
+                "up": round(up_bps / 1024, 1),
+                "interfaces": interfaces
             }
         except Exception as e:
             logging.warning(f"Error sampling network metrics: {e}")
-            return {"down": 0.0, "up": 0.0}
\ No newline at end of file
+            return {"down": 0.0, "up": 0.0, "interfaces": {}}
\ No newline at end of file
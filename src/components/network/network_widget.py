@@ -5,9 +5,11 @@
 @dependencies pyqtgraph, PyQt6
 """
 
+import time
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtGui import QColor
+from src.components.common.history_plot import HistoryPlot
 
 class NetworkWidget(QWidget):
     """
@@ -20,14 +22,11 @@ class NetworkWidget(QWidget):
     def __init__(self):
         """
         @brief Initializes UI components and history buffers.
-        @details Sets up two 60-point sliding window buffers to track network activity.
+        @details Both streams share one pyramid-backed history plot.
+                 Rows: 0 down, 1 up, 2 down anomalies, 3 up anomalies.
         """
         super().__init__()
         
-        # Internal state: Separate buffers for Inbound and Outbound data
-        self.down_history = [0.0] * 60
-        self.up_history = [0.0] * 60
-        
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 5, 0, 5)
 
@@ -35,24 +34,29 @@ class NetworkWidget(QWidget):
         self.label = QLabel("Net: ⇩ 0.0 KB/s | ⇧ 0.0 KB/s")
         self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
         
-        self.graph = pg.PlotWidget()
+        self.plot = HistoryPlot(rows=4)
+        self.graph = self.plot.graph
         self._configure_graph()
         
         # --- Visual Encoding Strategy ---
         
         # Download (Ingress): Magenta curve with semi-transparent area fill
-        self.down_curve = self.graph.plot(
-            self.down_history, 
+        self.down_curve = self.plot.add_curve(
+            0,
             pen=pg.mkPen(color='#FF00FF', width=2),
             fillLevel=0,
             brush=(255, 0, 255, 30)  # Alpha 30 for subtle contrast
         )
         
         # Upload (Egress): Cyan curve, sharp and distinct
-        self.up_curve = self.graph.plot(
-            self.up_history, 
+        self.up_curve = self.plot.add_curve(
+            1,
             pen=pg.mkPen(color='#00FFFF', width=1.5)
         )
+
+        # Anomalous spans are overlaid in red on whichever stream was flagged
+        self.down_anomaly = self.plot.add_curve(2, sparse=True, **HistoryPlot.anomaly_pen())
+        self.up_anomaly = self.plot.add_curve(3, sparse=True, **HistoryPlot.anomaly_pen())
         
         self.layout.addWidget(self.label)
         self.layout.addWidget(self.graph)
@@ -66,31 +70,45 @@ class NetworkWidget(QWidget):
         self.graph.setBackground('k')
         self.graph.setFixedHeight(150)
         self.graph.enableAutoRange(axis='y', enable=True)
-        self.graph.getAxis('bottom').hide()
-        self.graph.getViewBox().setMouseEnabled(x=False, y=False)
+        self.graph.setAutoVisible(y=True)  # Fit Y to the visible time range only
         self.graph.hideButtons()
 
-    def update_display(self, down: float, up: float):
+    def update_display(self, down: float, up: float,
+                       down_anomalous: bool = False, up_anomalous: bool = False,
+                       timestamp: float = None):
         """
         @brief Refreshes the widget with the latest network samples.
         @param down Current download rate in KB/s.
         @param up Current upload rate in KB/s.
-        @details Updates the HTML-formatted label and shifts history buffers
-                 for both data streams simultaneously.
+        @param down_anomalous True when the download sample was flagged as anomalous.
+        @param up_anomalous True when the upload sample was flagged as anomalous.
+        @param timestamp Sample time (defaults to now).
+        @details Updates the HTML-formatted label and appends both data
+                 streams to the history pyramid in one step.
+        """
+        self.update_labels(down, up)
+        self.record(down, up, down_anomalous, up_anomalous, timestamp)
+
+    def update_labels(self, down: float, up: float):
+        """
+        @brief Refreshes the rate label only (newest sample, visible widget).
         """
         # Update text with color clues to match the graph curves
         self.label.setText(
             f'Net: <span style="color:#FF00FF;">⇩ {down:>6.1f} KB/s</span> | '
             f'<span style="color:#00FFFF;">⇧ {up:>6.1f} KB/s</span>'
         )
-        
-        # Shift sliding windows
-        self.down_history.pop(0)
-        self.down_history.append(down)
-        
-        self.up_history.pop(0)
-        self.up_history.append(up)
-        
-        # Push new data to the GPU via pyqtgraph
-        self.down_curve.setData(self.down_history)
-        self.up_curve.setData(self.up_history)
\ No newline at end of file
+
+    def record(self, down: float, up: float,
+               down_anomalous: bool = False, up_anomalous: bool = False,
+               timestamp: float = None):
+        """
+        @brief Appends one sample of both streams to the history pyramid (drawn on the next flush).
+        """
+        # Record both streams; anomaly marks are NaN unless flagged
+        nan = float('nan')
+        self.plot.append(timestamp or time.time(), (
+            down, up,
+            down if down_anomalous else nan,
+            up if up_anomalous else nan
+        ))
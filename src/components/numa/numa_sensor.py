@@ -0,0 +1,130 @@
+"""
+@file numa_sensor.py
+@brief Telemetry engine for per-NUMA-node memory, allocation locality and CPU.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+import re
+import time
+import logging
+
+NODE_ROOT = "/sys/devices/system/node"
+
+# numastat counters converted to per-second rates
+NUMASTAT_RATES = (b"numa_hit", b"numa_miss", b"numa_foreign")
+
+# Per-node meminfo fields reported (kB in sysfs, GB in the packet)
+NODE_MEMINFO_FIELDS = (b"MemTotal:", b"MemFree:", b"FilePages:")
+
+
+def parse_cpulist(text: str) -> list:
+    """
+    @brief Expands a sysfs CPU list ('0-3,8-11') into CPU indices.
+    """
+    cpus = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+class NumaSensor:
+    """
+    @class NumaSensor
+    @brief Samples every NUMA node's meminfo and numastat in one pass per tick.
+    @details Nodes, their CPU lists and their meminfo/numastat descriptors are
+             discovered once; each tick is two pread() calls per node. A
+             machine without NUMA still exposes node0, so the sensor works
+             (and stays cheap) everywhere.
+    """
+
+    def __init__(self):
+        """
+        @brief Discovers nodes and opens their counter files.
+        """
+        self.nodes = []       # [{'node', 'cpus', 'meminfo_fd', 'numastat_fd'}]
+        self.last = {}
+        self.last_time = None
+        try:
+            names = sorted((entry for entry in os.listdir(NODE_ROOT)
+                            if re.fullmatch(r"node\d+", entry)), key=lambda n: int(n[4:]))
+            for name in names:
+                path = os.path.join(NODE_ROOT, name)
+                with open(os.path.join(path, "cpulist")) as f:
+                    cpus = parse_cpulist(f.read())
+                self.nodes.append({
+                    "node": int(name[4:]),
+                    "cpus": cpus,
+                    "meminfo_fd": os.open(os.path.join(path, "meminfo"), os.O_RDONLY),
+                    "numastat_fd": os.open(os.path.join(path, "numastat"), os.O_RDONLY)
+                })
+        except Exception as e:
+            logging.error(f"Failed to initialize NumaSensor: {e}")
+
+    @staticmethod
+    def _read(fd: int) -> bytes:
+        """
+        @brief Reads a whole sysfs file through its cached descriptor.
+        """
+        return os.pread(fd, 65536, 0)
+
+    def fetch_data(self, per_core: list = None) -> dict:
+        """
+        @brief Samples all nodes.
+        @param per_core Per-core CPU usage from CPUSensor, grouped here by node.
+        @return A dictionary containing:
+            - 'nodes' (list): One dict per node with 'node', 'total', 'free',
+              'file' (GB), 'percent' (used %), 'cpu' (mean usage of its cores,
+              None without per-core data), 'cpus' (core indices) and
+              'numa_hit', 'numa_miss', 'numa_foreign' (pages/s).
+        @note Rates are 0 on the first sample.
+        """
+        now = time.monotonic()
+        elapsed = (now - self.last_time) if self.last_time else 0.0
+        per_core = per_core or []
+
+        nodes = []
+        counters = {}
+        for node in self.nodes:
+            try:
+                meminfo = {}
+                for line in self._read(node["meminfo_fd"]).splitlines():
+                    # 'Node 0 MemTotal:        4947704 kB'
+                    fields = line.split()
+                    if len(fields) >= 4 and fields[2] in NODE_MEMINFO_FIELDS:
+                        meminfo[fields[2]] = int(fields[3])
+                stats = {}
+                for line in self._read(node["numastat_fd"]).splitlines():
+                    key, _, value = line.partition(b" ")
+                    if key in NUMASTAT_RATES:
+                        stats[key] = int(value)
+            except (OSError, ValueError) as e:
+                logging.debug(f"NUMA node {node['node']} unreadable: {e}")
+                continue
+
+            counters[node["node"]] = stats
+            prev = self.last.get(node["node"], {})
+            total = meminfo.get(b"MemTotal:", 0)
+            free = meminfo.get(b"MemFree:", 0)
+            cores = [per_core[cpu] for cpu in node["cpus"] if cpu < len(per_core)]
+            entry = {
+                "node": node["node"],
+                "cpus": node["cpus"],
+                "total": round(total / 1024 ** 2, 2),
+                "free": round(free / 1024 ** 2, 2),
+                "file": round(meminfo.get(b"FilePages:", 0) / 1024 ** 2, 2),
+                "percent": round((total - free) / total * 100, 1) if total else 0.0,
+                "cpu": round(sum(cores) / len(cores), 1) if cores else None
+            }
+            for key in NUMASTAT_RATES:
+                delta = stats.get(key, 0) - prev.get(key, stats.get(key, 0))
+                entry[key.decode()] = round(delta / elapsed, 1) if elapsed > 0 else 0.0
+            nodes.append(entry)
+
+        self.last = counters
+        self.last_time = now
+        return {"nodes": nodes}
@@ -0,0 +1,93 @@
+"""
+@file numa_widget.py
+@brief UI component for per-NUMA-node memory, locality and CPU.
+@project Linux Health Monitor Pro
+@dependencies pyqtgraph, PyQt6
+"""
+
+import time
+import pyqtgraph as pg
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from src.components.common.history_plot import HistoryPlot
+
+# Curve colours, cycled per node
+NODE_COLOURS = ('#3498DB', '#E67E22', '#2ECC71', '#9B59B6', '#F1C40F', '#1ABC9C', '#E74C3C', '#ECF0F1')
+
+class NumaWidget(QWidget):
+    """
+    @class NumaWidget
+    @brief One summary line per node plus a per-node memory usage graph.
+    @details A full node next to an idle one is invisible in the global RAM
+             percentage; this view shows them side by side together with
+             remote allocations (numa_miss/numa_foreign).
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the labels; the graph is created on the first sample.
+        """
+        super().__init__()
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 5, 0, 5)
+
+        self.label = QLabel("NUMA: Loading...")
+        self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
+        self.layout.addWidget(self.label)
+        self.plot = None
+
+    def _build(self, nodes: list):
+        """
+        @brief Creates the per-node memory graph once the node set is known.
+        """
+        self.plot = HistoryPlot(rows=len(nodes))
+        graph = self.plot.graph
+        graph.setBackground('k')
+        graph.setFixedHeight(120)
+        graph.setTitle("Memory Used per Node (%)")
+        graph.setYRange(0, 100)
+        graph.hideButtons()
+        graph.addLegend(offset=(-10, 5))
+        for row, node in enumerate(nodes):
+            self.plot.add_curve(row, pen=pg.mkPen(color=NODE_COLOURS[row % len(NODE_COLOURS)], width=2),
+                                name=f"node{node['node']}")
+        self.layout.addWidget(graph)
+
+    def update_display(self, data: dict, timestamp: float = None):
+        """
+        @brief Refreshes the per-node lines and appends one sample to the graph.
+        @param data Dictionary produced by NumaSensor.fetch_data.
+        @param timestamp Sample time (defaults to now).
+        """
+        self.update_labels(data)
+        self.record(data, timestamp)
+
+    def update_labels(self, data: dict):
+        """
+        @brief Refreshes the per-node summary lines only (newest sample, visible widget).
+        """
+        nodes = data.get('nodes', [])
+        if not nodes:
+            self.label.setText("NUMA: no node information")
+            return
+
+        lines = []
+        for node in nodes:
+            cpu = "n/a" if node['cpu'] is None else f"{node['cpu']:.1f}%"
+            lines.append(
+                f"node{node['node']}: {node['total'] - node['free']:.1f}/{node['total']:.1f} GB "
+                f"({node['percent']:.1f}%) file {node['file']:.1f} GB | CPU {cpu} "
+                f"({len(node['cpus'])} cores) | hit {node['numa_hit']:,.0f}/s "
+                f"miss {node['numa_miss']:,.0f}/s foreign {node['numa_foreign']:,.0f}/s"
+            )
+        self.label.setText("\n".join(lines))
+
+    def record(self, data: dict, timestamp: float = None):
+        """
+        @brief Appends one sample to the per-node graph, creating it on the first one.
+        """
+        nodes = data.get('nodes', [])
+        if not nodes:
+            return
+        if self.plot is None:
+            self._build(nodes)
+        self.plot.append(timestamp or time.time(), [node['percent'] for node in nodes])
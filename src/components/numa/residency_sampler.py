@@ -0,0 +1,89 @@
+"""
+@file residency_sampler.py
+@brief Rate-limited per-process NUMA node residency from /proc/<pid>/numa_maps.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+import re
+import time
+import logging
+from src.core.procfs import procfs
+
+_NODE_PAGES = re.compile(rb" N(\d+)=(\d+)")
+_PAGE_SIZE = re.compile(rb" kernelpagesize_kB=(\d+)")
+
+
+class ResidencySampler:
+    """
+    @class ResidencySampler
+    @brief Annotates top-N processes with resident MB per NUMA node.
+    @details numa_maps makes the kernel walk every mapping, so it follows the
+             same rationing as PSS sampling: cached per (pid, create_time), at
+             most 'budget' reads per tick, refreshed after 'interval' seconds.
+             On single-node machines nothing is read at all.
+    """
+
+    def __init__(self, budget: int, interval: float, ttl: float = 60.0):
+        """
+        @param budget Maximum numa_maps reads per call to annotate().
+        @param interval Minimum age in seconds before a cached value is refreshed.
+        @param ttl Seconds after which an entry not seen in the top-N is evicted.
+        """
+        self.budget = budget
+        self.interval = interval
+        self.ttl = ttl
+        self.cache = {}   # key -> {'numa', 'sampled', 'seen'}
+        self.enabled = os.path.isdir("/sys/devices/system/node/node1")
+
+    @staticmethod
+    def _read_numa_maps(pid: int) -> dict:
+        """
+        @brief Returns {node: resident MB} for one process.
+        """
+        pages_kb = {}
+        for line in procfs().read(f"{pid}/numa_maps").split(b"\n"):
+            size = _PAGE_SIZE.search(line)
+            page_kb = int(size.group(1)) if size else 4
+            for node, pages in _NODE_PAGES.findall(line):
+                node = int(node)
+                pages_kb[node] = pages_kb.get(node, 0) + int(pages) * page_kb
+        return {node: round(kb / 1024, 1) for node, kb in sorted(pages_kb.items())}
+
+    def annotate(self, processes: list):
+        """
+        @brief Adds 'numa' ({node: MB}, or None if never sampled) to each row.
+        @param processes Top-N rows carrying 'pid' and 'create_time'.
+        """
+        if not self.enabled:
+            for proc in processes:
+                proc["numa"] = None
+            return
+
+        now = time.monotonic()
+        keys = [(proc['pid'], proc.get('create_time')) for proc in processes]
+
+        stale = []
+        for key in keys:
+            entry = self.cache.setdefault(key, {"numa": None, "sampled": None})
+            entry["seen"] = now
+            if entry["sampled"] is None or now - entry["sampled"] >= self.interval:
+                stale.append((entry["sampled"] or 0.0, key))
+        stale.sort()
+
+        for _, key in stale[:self.budget]:
+            entry = self.cache[key]
+            try:
+                entry["numa"] = self._read_numa_maps(key[0])
+            except (FileNotFoundError, ProcessLookupError, PermissionError):
+                pass
+            except OSError as e:
+                logging.debug(f"numa_maps unreadable for PID {key[0]}: {e}")
+            entry["sampled"] = now
+
+        for proc, key in zip(processes, keys):
+            proc["numa"] = self.cache[key]["numa"]
+
+        for key in [k for k, e in self.cache.items() if now - e["seen"] > self.ttl]:
+            del self.cache[key]
@@ -5,53 +5,135 @@
 @license MIT
 """
 
-import psutil
+import time
 import logging
+from src.components.processes.threads.thread_sensor import CLOCK_TICKS, THREAD_STATES
+from src.core.procfs import procfs, STAT_STATE, STAT_PPID, STAT_UTIME, STAT_STIME, STAT_STARTTIME
+
+# stat fields read for every PID in one stat_batch() pass
+KERNEL_COLUMNS = (STAT_STATE, STAT_PPID, STAT_UTIME, STAT_STIME, STAT_STARTTIME)
 
 class KernelSensor:
     """
     @class KernelSensor
     @brief Scans and filters the system process tree for kernel-space threads.
     @details On Linux systems, kernel threads are typically spawned by 'kthreadd' (PID 2).
-             This class identifies such processes to provide visibility into 
-             low-level system operations.
+             This class identifies such processes to provide visibility into
+             low-level system operations, reports their CPU usage from
+             utime+stime deltas, and groups them by family (kworker, ksoftirqd,
+             migration, rcu, irq, ...).
     """
 
-    def fetch_data(self) -> list:
+    def __init__(self):
+        """
+        @brief Initializes the identity cache.
+        @details Every PID seen in /proc is classified once and remembered as
+                 pid -> (starttime, name) for kernel threads or
+                 pid -> (starttime, None) for user processes. Every tick reads
+                 all stat files in one stat_batch() pass; a PID is only
+                 classified again when its starttime changes, i.e. when it was
+                 reused (e.g. a user process exited and a kworker took its PID).
+        """
+        self.identity = {}
+        self.last_ticks = {}   # pid -> utime + stime at the previous tick
+        self.last_time = None
+
+    @staticmethod
+    def family_of(name: str) -> str:
         """
-        @brief Performs a point-in-time scan of the process table.
-        @return A list of dictionaries, each containing:
-            - 'pid' (int): The Process ID.
-            - 'name' (str): The kernel thread identifier (e.g., kworker, migration).
-            - 'status' (str): Current execution state (running, sleeping, etc.).
-        @note Requires access to /proc; some threads may be omitted if 
-              permissions are insufficient, though PID 2 check is generally robust.
+        @brief Maps a kernel thread name to its family.
+        @details 'kworker/3:1H' -> 'kworker', 'ksoftirqd/7' -> 'ksoftirqd',
+                 'irq/45-nvme0q1' -> 'irq', 'rcu_preempt' -> 'rcu'.
         """
-        threads = []
-        
-        # We iterate over the process table requesting only specific attributes
-        # to minimize overhead during high-frequency sampling.
-        attrs = ['pid', 'name', 'status', 'ppid']
-        
-        for proc in psutil.process_iter(attrs):
-            try:
-                # Industry Logic:
-                # In the Linux process hierarchy, PID 2 is kthreadd.
-                # Any process whose Parent PID (ppid) is 2 is a kernel thread.
-                # We also include PID 2 itself as the root of the kernel tree.
-                if proc.info['ppid'] == 2 or proc.info['pid'] == 2:
-                    threads.append({
-                        "pid": proc.info['pid'],
-                        "name": proc.info['name'],
-                        "status": proc.info['status']
-                    })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                # Processes can terminate between the iterator and access call.
-                # AccessDenied is handled gracefully for non-root users.
+        if name.startswith("rcu"):
+            return "rcu"
+        return name.split("/", 1)[0]
+
+    def fetch_data(self) -> dict:
+        """
+        @brief Samples all kernel threads and aggregates them per family.
+        @return A dictionary containing:
+            - 'count' (int): Number of kernel threads.
+            - 'cpu' (float): Total kernel thread CPU usage in percent of one core.
+            - 'groups' (list): One dict per family with 'family', 'count',
+              'cpu' and 'threads' (each thread: 'pid', 'name', 'status', 'cpu'),
+              sorted by CPU usage, highest first.
+        @note Requires access to /proc. The first sample reports 0% CPU.
+        """
+        now = time.monotonic()
+        elapsed = (now - self.last_time) if self.last_time else 0.0
+
+        reader = procfs()
+        try:
+            pids = reader.pids()
+        except OSError as e:
+            logging.error(f"Unable to list /proc in KernelSensor: {e}")
+            return {"count": 0, "cpu": 0.0, "groups": []}
+
+        # Forget PIDs that disappeared so the cache stays bounded
+        alive = set(pids)
+        for pid in list(self.identity):
+            if pid not in alive:
+                del self.identity[pid]
+
+        # One pass over every stat file, relative to the /proc descriptor (see procfs.py)
+        comms = []
+        values = reader.stat_batch(pids, KERNEL_COLUMNS, names=comms)
+
+        groups = {}
+        ticks = {}
+        for row, pid in enumerate(pids):
+            comm = comms[row]
+            if comm is None:
+                # Exited since the listing, or unreadable
                 continue
-            except Exception as e:
-                logging.error(f"Unexpected error in KernelSensor: {e}")
+            state, ppid, utime, stime, starttime = values[row].tolist()
+
+            identity = self.identity.get(pid)
+            if identity is None or identity[0] != starttime:
+                # New PID (or reused PID): classify it once.
+                # PID 2 is kthreadd; its children are kernel threads.
+                is_kthread = pid == "2" or ppid == 2
+                identity = (starttime, comm.decode(errors="replace") if is_kthread else None)
+                self.identity[pid] = identity
+                self.last_ticks.pop(pid, None)
+            name = identity[1]
+            if name is None:
+                # User process
                 continue
 
-        # Sort by PID to ensure UI consistency and prevent 'flicker' during updates.
-        return sorted(threads, key=lambda x: x['pid'])
+            cpu_ticks = utime + stime
+            ticks[pid] = cpu_ticks
+            cpu = 0.0
+            prev = self.last_ticks.get(pid)
+            if prev is not None and elapsed > 0:
+                cpu = (cpu_ticks - prev) / CLOCK_TICKS / elapsed * 100
+
+            state = chr(state)
+            family = self.family_of(name)
+            group = groups.get(family)
+            if group is None:
+                group = groups[family] = {"family": family, "count": 0, "cpu": 0.0, "threads": []}
+            group["count"] += 1
+            group["cpu"] += cpu
+            group["threads"].append({
+                "pid": int(pid),
+                "name": name,
+                "status": THREAD_STATES.get(state, state),
+                "cpu": round(cpu, 1)
+            })
+
+        self.last_ticks = ticks
+        self.last_time = now
+
+        ordered = sorted(groups.values(), key=lambda g: (-g["cpu"], g["family"]))
+        for group in ordered:
+            group["cpu"] = round(group["cpu"], 1)
+            # Sort by PID to ensure UI consistency and prevent 'flicker' during updates.
+            group["threads"].sort(key=lambda x: x['pid'])
+
+        return {
+            "count": sum(g["count"] for g in ordered),
+            "cpu": round(sum(g["cpu"] for g in ordered), 1),
+            "groups": ordered
+        }
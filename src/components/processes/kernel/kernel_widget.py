@@ -1,81 +1,139 @@
 """
 @file kernel_widget.py
-@brief UI component for listing active Linux kernel threads.
+@brief UI component listing active Linux kernel threads grouped by family.
 @project Linux Health Monitor Pro
 @dependencies PyQt6
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTreeWidget,
+                             QTreeWidgetItem, QHeaderView)
 from PyQt6.QtCore import Qt
 
 class KernelWidget(QWidget):
     """
     @class KernelWidget
-    @brief A dedicated list view for kernel-space processes.
-    @details Displays a scrollable list of kernel threads with formatted 
-             PID alignment and status indicators, styled with a high-contrast 
-             terminal aesthetic.
+    @brief A dedicated tree view for kernel-space processes.
+    @details Displays one collapsible row per thread family (kworker, ksoftirqd,
+             migration, rcu, irq, ...) with its thread count and aggregated CPU,
+             styled with a high-contrast terminal aesthetic. Groups start
+             collapsed; children are only materialised for expanded groups.
     """
 
     def __init__(self):
         """
         @brief Initializes the widget layout and static UI elements.
-        @details Applies a global dark-mode stylesheet to the list container.
+        @details Applies a global dark-mode stylesheet to the tree container.
         """
         super().__init__()
         layout = QVBoxLayout(self)
-        
+
         # Header Label for the list section
         self.label = QLabel("Active Kernel Threads")
         self.label.setStyleSheet("font-weight: bold; color: #00FF00; margin-bottom: 5px;")
-        
-        # List Container with monospace formatting for tabular alignment
-        self.list_widget = QListWidget()
+
+        # Tree Container with monospace formatting for tabular alignment
+        self.tree = QTreeWidget()
+        self.tree.setColumnCount(3)
+        self.tree.setHeaderLabels(["Family / Thread", "Threads / PID", "CPU %"])
+        self.tree.setUniformRowHeights(True)
+        header = self.tree.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        self.tree.itemExpanded.connect(self._on_expanded)
         self._apply_styles()
-        
+
+        # Internal state: family -> top-level item, and the last sample per family
+        self.group_items = {}
+        self.groups = {}
+
         layout.addWidget(self.label)
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.tree)
 
     def _apply_styles(self):
         """
         @brief Internal helper to encapsulate CSS-like styling.
         @details Sets a dark background (#121212) and terminal green text (#00FF00).
         """
-        self.list_widget.setStyleSheet("""
-            QListWidget {
+        self.tree.setStyleSheet("""
+            QTreeWidget {
                 background-color: #121212;
                 border: 1px solid #333;
                 color: #00FF00;
                 font-family: 'Monospace';
                 font-size: 12px;
             }
-            QListWidget::item:selected {
+            QTreeWidget::item:selected {
                 background: #333; /* Visual feedback on selection */
             }
         """)
 
-    def update_display(self, threads: list):
+    def update_display(self, data: dict):
         """
-        @brief Synchronizes the UI list with current system thread data.
-        @param threads A list of dictionaries containing 'pid', 'name', and 'status'.
-        @details Implementation uses a 'Clear-and-Rebuild' strategy to ensure 
-                 the UI accurately reflects the transient nature of kernel threads.
+        @brief Synchronizes the tree with the current kernel thread groups.
+        @param data Dictionary with 'count', 'cpu' and 'groups' from KernelSensor.
+        @details Group rows are updated in place so expansion state survives
+                 between ticks; only expanded groups rebuild their children.
         """
-        # Atomically clear the previous sampling period's data
-        self.list_widget.clear()
-        
-        if not threads:
-            self.list_widget.addItem("Searching for kernel threads...")
+        groups = data.get("groups", [])
+        if not groups:
+            self.label.setText("Searching for kernel threads...")
             return
 
-        for thread in threads:
-            # PID Alignment Logic:
-            # We rjust to 5 characters to ensure columns line up regardless of PID magnitude.
-            # Example: [   2] vs [12345]
-            formatted_pid = str(thread['pid']).rjust(5)
-            line = f"[{formatted_pid}]  {thread['name']} ({thread['status']})"
-            
-            self.list_widget.addItem(line)
+        self.label.setText(
+            f"Active Kernel Threads: {data['count']} ({data['cpu']:.1f}% CPU)"
+        )
+        self.groups = {group["family"]: group for group in groups}
+
+        # Remove families that no longer have threads
+        for family in list(self.group_items):
+            if family not in self.groups:
+                item = self.group_items.pop(family)
+                self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
 
+        for position, group in enumerate(groups):
+            item = self.group_items.get(group["family"])
+            if item is None:
+                item = QTreeWidgetItem([group["family"]])
+                item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+                item.setTextAlignment(1, Qt.AlignmentFlag.AlignRight)
+                item.setTextAlignment(2, Qt.AlignmentFlag.AlignRight)
+                self.group_items[group["family"]] = item
+                self.tree.insertTopLevelItem(position, item)
+            elif self.tree.indexOfTopLevelItem(item) != position:
+                # Keep the CPU ordering without recreating the item
+                expanded = item.isExpanded()
+                self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+                self.tree.insertTopLevelItem(position, item)
+                item.setExpanded(expanded)
 
+            item.setText(1, str(group["count"]))
+            item.setText(2, f"{group['cpu']:.1f}")
+            if item.isExpanded():
+                self._populate(item, group)
 
+    def _on_expanded(self, item: QTreeWidgetItem):
+        """
+        @brief Lazily fills a group's children when the user expands it.
+        """
+        group = self.groups.get(item.text(0))
+        if group:
+            self._populate(item, group)
+
+    def _populate(self, item: QTreeWidgetItem, group: dict):
+        """
+        @brief Rewrites the thread rows of one family, reusing existing items.
+        """
+        threads = group["threads"]
+        while item.childCount() > len(threads):
+            item.removeChild(item.child(item.childCount() - 1))
+        for index, thread in enumerate(threads):
+            child = item.child(index)
+            if child is None:
+                child = QTreeWidgetItem()
+                child.setTextAlignment(1, Qt.AlignmentFlag.AlignRight)
+                child.setTextAlignment(2, Qt.AlignmentFlag.AlignRight)
+                item.addChild(child)
+            child.setText(0, f"{thread['name']} ({thread['status']})")
+            child.setText(1, str(thread['pid']))
+            child.setText(2, f"{thread['cpu']:.1f}")
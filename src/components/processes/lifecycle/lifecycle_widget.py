@@ -0,0 +1,155 @@
+"""
+@file lifecycle_widget.py
+@brief UI component for the process lifecycle log and time-range diffs.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+import time
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QListWidget,
+                             QTreeWidget, QTreeWidgetItem, QDateTimeEdit, QPushButton)
+from PyQt6.QtCore import pyqtSignal, QDateTime
+from src.config import SPAWN_LOG_SIZE
+
+# Diff categories in display order
+DIFF_SECTIONS = (
+    ("started", "Started"),
+    ("exited", "Exited"),
+    ("transient", "Started and exited"),
+    ("renamed", "Renamed"),
+    ("changed", "Large resource change"),
+)
+
+
+class LifecycleWidget(QWidget):
+    """
+    @class LifecycleWidget
+    @brief Scrolling lifecycle log plus a "what changed between T1 and T2" query.
+    @details The widget never computes diffs itself: pressing "Diff" emits
+             diff_requested with the selected range and the answer comes back
+             through show_diff.
+    """
+
+    # Emitted with (t0, t1) in seconds since epoch
+    diff_requested = pyqtSignal(float, float)
+
+    def __init__(self):
+        """
+        @brief Initializes the event list, the range selectors and the diff tree.
+        """
+        super().__init__()
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 5, 0, 5)
+
+        self.label = QLabel("Lifecycle: waiting for the first sweep...")
+        self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
+
+        style = """
+            background-color: #121212;
+            border: 1px solid #333;
+            color: #00FF00;
+            font-family: 'Monospace';
+            font-size: 12px;
+        """
+        self.log = QListWidget()
+        self.log.setStyleSheet(f"QListWidget {{{style}}}")
+
+        # Range selection, defaulting to the last five minutes
+        controls = QHBoxLayout()
+        now = QDateTime.currentDateTime()
+        self.from_edit = QDateTimeEdit(now.addSecs(-300))
+        self.to_edit = QDateTimeEdit(now)
+        for edit in (self.from_edit, self.to_edit):
+            edit.setDisplayFormat("yyyy-MM-dd HH:mm:ss")
+            edit.setCalendarPopup(True)
+        self.btn_diff = QPushButton("Diff")
+        self.btn_diff.clicked.connect(self._on_diff)
+        controls.addWidget(QLabel("From"))
+        controls.addWidget(self.from_edit)
+        controls.addWidget(QLabel("To"))
+        controls.addWidget(self.to_edit)
+        controls.addWidget(self.btn_diff)
+        controls.addStretch()
+
+        self.diff_label = QLabel("")
+        self.diff_tree = QTreeWidget()
+        self.diff_tree.setColumnCount(4)
+        self.diff_tree.setHeaderLabels(["Process", "PID", "Detail", "Time"])
+        self.diff_tree.setUniformRowHeights(True)
+        self.diff_tree.setStyleSheet(f"QTreeWidget {{{style}}}")
+
+        self.layout.addWidget(self.label)
+        self.layout.addWidget(self.log, 1)
+        self.layout.addLayout(controls)
+        self.layout.addWidget(self.diff_label)
+        self.layout.addWidget(self.diff_tree, 1)
+
+    @staticmethod
+    def _describe(event: dict) -> str:
+        """
+        @brief Formats the detail column of one event.
+        """
+        kind = event['kind']
+        if kind == "rename":
+            return f"{event['old_name']} -> {event['name']}"
+        if kind == "change":
+            return (f"CPU {event['old_cpu']:.1f}% -> {event['cpu']:.1f}%, "
+                    f"RAM {event['old_ram']:.0f} -> {event['ram']:.0f} MB")
+        if kind == "transient" and "exit_time" in event:
+            return f"lived {event['exit_time'] - event['time']:.0f}s"
+        if "cpu" in event:
+            return f"CPU {event['cpu']:.1f}%, RAM {event['ram']:.0f} MB"
+        return ""
+
+    def update_display(self, events: list):
+        """
+        @brief Prepends the events produced by the latest process sweep.
+        @param events Event dictionaries from ProcessSensor.last_events.
+        """
+        for event in events:
+            stamp = time.strftime("%H:%M:%S", time.localtime(event['time']))
+            self.log.insertItem(
+                0, f"{stamp} {event['kind'].upper():<6} [{event['pid']:>7}] "
+                   f"{event['name']}  {self._describe(event)}"
+            )
+        while self.log.count() > SPAWN_LOG_SIZE:
+            self.log.takeItem(self.log.count() - 1)
+        self.label.setText(f"Lifecycle: {len(events)} event(s) in the last sweep")
+
+        # Keep the default "to" bound at the present until the user edits it
+        if not self.to_edit.hasFocus():
+            self.to_edit.setDateTime(QDateTime.currentDateTime())
+
+    def _on_diff(self):
+        """
+        @brief Emits the selected range.
+        """
+        t0 = self.from_edit.dateTime().toSecsSinceEpoch()
+        t1 = self.to_edit.dateTime().toSecsSinceEpoch()
+        if t1 < t0:
+            t0, t1 = t1, t0
+        self.diff_requested.emit(float(t0), float(t1))
+
+    def show_diff(self, diff: dict):
+        """
+        @brief Renders a diff returned by ProcessEventLog.diff.
+        @param diff Dictionary of categorised event lists plus the 'exact' flag.
+        """
+        self.diff_tree.clear()
+        counts = []
+        for key, title in DIFF_SECTIONS:
+            events = diff.get(key, [])
+            counts.append(f"{len(events)} {key}")
+            section = QTreeWidgetItem([f"{title} ({len(events)})"])
+            self.diff_tree.addTopLevelItem(section)
+            for event in events:
+                section.addChild(QTreeWidgetItem([
+                    event['name'],
+                    str(event['pid']),
+                    self._describe(event),
+                    time.strftime("%H:%M:%S", time.localtime(event['time']))
+                ]))
+            section.setExpanded(0 < len(events) <= 50)
+
+        note = "" if diff.get("exact", True) else " (approximate: range starts in compacted history)"
+        self.diff_label.setText("Diff: " + ", ".join(counts) + note)
@@ -0,0 +1,155 @@
+"""
+@file spawn_sensor.py
+@brief Lightweight PID-set scanner capturing short-lived processes.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import time
+import logging
+from collections import deque
+from src.components.processes.threads.thread_sensor import CLOCK_TICKS
+from src.core.procfs import procfs, STAT_PPID, STAT_UTIME, STAT_STIME
+
+class SpawnSensor:
+    """
+    @class SpawnSensor
+    @brief Detects process births and exits by diffing the /proc PID set.
+    @details Each scan only lists /proc (no attribute walk). A PID that was not
+             present in the previous scan gets a single stat read to capture
+             comm, ppid, start time and CPU ticks. PIDs younger than
+             'track_seconds' are re-read on every scan, so when they exit the
+             last observed CPU time is known ("exit-time CPU"). Older processes
+             cost nothing beyond the directory listing. Reads go through the
+             thread's ProcFS (openat() relative to /proc, one reused buffer);
+             the young set is re-read as one stat_batch().
+    """
+
+    def __init__(self, track_seconds: float, track_limit: int, log_size: int):
+        """
+        @param track_seconds Age under which a process's CPU time is followed every scan.
+        @param track_limit Maximum number of young processes followed at once.
+        @param log_size Number of birth/exit events retained.
+        """
+        self.track_seconds = track_seconds
+        self.track_limit = track_limit
+        self.events = deque(maxlen=log_size)
+        self.pids = self._list_pids()
+        self.young = {}   # pid -> {'name', 'ppid', 'born', 'cpu_ms'}
+
+        # Counters folded into the next summary()
+        self.births = 0
+        self.exits = 0
+        self.short_lived = 0
+        self.pending_events = []
+        self.last_summary = time.monotonic()
+        self.last_forks = self._read_forks()
+
+    @staticmethod
+    def _list_pids() -> set:
+        """
+        @brief Returns the current set of numeric /proc entries.
+        """
+        return set(procfs().pids())
+
+    @staticmethod
+    def _read_forks() -> int:
+        """
+        @brief Returns the kernel's cumulative fork/clone counter from /proc/stat.
+        """
+        for line in procfs().read("stat").split(b"\n"):
+            if line.startswith(b"processes "):
+                return int(line.split()[1])
+        return 0
+
+    @staticmethod
+    def _read_stat(pid: str):
+        """
+        @brief Returns (comm, ppid, cpu_ms) from /proc/<pid>/stat.
+        """
+        comm, fields = procfs().stat(f"{pid}/stat")
+        cpu_ticks = int(fields[STAT_UTIME]) + int(fields[STAT_STIME])
+        return comm.decode(errors="replace"), int(fields[STAT_PPID]), cpu_ticks * 1000 // CLOCK_TICKS
+
+    def scan(self):
+        """
+        @brief Performs one PID-set diff and records births and exits.
+        """
+        now = time.time()
+        current = self._list_pids()
+
+        for pid in current - self.pids:
+            try:
+                name, ppid, cpu_ms = self._read_stat(pid)
+            except (FileNotFoundError, ProcessLookupError):
+                # Exited before we could read it: counted as a birth without details
+                self.births += 1
+                continue
+            except (OSError, ValueError, IndexError) as e:
+                logging.debug(f"Unreadable stat for new PID {pid}: {e}")
+                continue
+            self.births += 1
+            event = {"time": now, "kind": "start", "pid": int(pid), "ppid": ppid, "name": name}
+            self.events.append(event)
+            self.pending_events.append(event)
+            if len(self.young) < self.track_limit:
+                self.young[pid] = {"name": name, "ppid": ppid, "born": now, "cpu_ms": cpu_ms}
+
+        for pid in self.pids - current:
+            self.exits += 1
+            info = self.young.pop(pid, None)
+            if info is None:
+                continue
+            lifetime = now - info["born"]
+            if lifetime < 1.0:
+                self.short_lived += 1
+            event = {"time": now, "kind": "exit", "pid": int(pid), "ppid": info["ppid"],
+                     "name": info["name"], "lifetime": round(lifetime, 2),
+                     "cpu_ms": info["cpu_ms"]}
+            self.events.append(event)
+            self.pending_events.append(event)
+
+        # Follow young processes' CPU time; stop once they are old enough
+        for pid, info in list(self.young.items()):
+            if now - info["born"] > self.track_seconds:
+                del self.young[pid]
+        young = list(self.young)
+        names = []
+        ticks = procfs().stat_batch(young, (STAT_UTIME, STAT_STIME), names=names).tolist()
+        for pid, (utime, stime), comm in zip(young, ticks, names):
+            if comm is None:
+                continue   # Exited (its exit is seen by the next scan) or unreadable
+            info = self.young[pid]
+            # comm is re-read too: a fork captured before exec() still
+            # carries its parent's name
+            info["name"] = comm.decode(errors="replace")
+            info["cpu_ms"] = (utime + stime) * 1000 // CLOCK_TICKS
+
+        self.pids = current
+
+    def summary(self) -> dict:
+        """
+        @brief Returns rates since the previous summary and the new events.
+        @return A dictionary containing:
+            - 'births', 'exits' (float): Observed process starts/exits per second.
+            - 'short_lived' (int): Processes that lived < 1s in this interval.
+            - 'unseen' (float): Clones per second not observed by the scan
+              (threads, or processes living shorter than one scan period).
+            - 'events' (list): Birth/exit events recorded since the last summary.
+        """
+        now = time.monotonic()
+        elapsed = max(now - self.last_summary, 1e-6)
+        forks = self._read_forks()
+
+        data = {
+            "births": round(self.births / elapsed, 1),
+            "exits": round(self.exits / elapsed, 1),
+            "short_lived": self.short_lived,
+            "unseen": round(max(0, forks - self.last_forks - self.births) / elapsed, 1),
+            "events": self.pending_events,
+        }
+        self.births = self.exits = self.short_lived = 0
+        self.pending_events = []
+        self.last_forks = forks
+        self.last_summary = now
+        return data
@@ -0,0 +1,80 @@
+"""
+@file spawn_widget.py
+@brief UI component for process spawn rates and the birth/exit event log.
+@project Linux Health Monitor Pro
+@dependencies pyqtgraph, PyQt6
+"""
+
+import time
+import pyqtgraph as pg
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget
+from src.components.common.history_plot import HistoryPlot
+from src.config import SPAWN_LOG_SIZE
+
+class SpawnWidget(QWidget):
+    """
+    @class SpawnWidget
+    @brief Shows spawn/exit rates over time and a scrolling event log.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the rate label, rate graph and event list.
+        """
+        super().__init__()
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 5, 0, 5)
+
+        self.label = QLabel("Spawns: Loading...")
+        self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
+
+        # Rows: 0 births/s, 1 exits/s, 2 unseen clones/s
+        self.plot = HistoryPlot(rows=3)
+        self.graph = self.plot.graph
+        self.graph.setBackground('k')
+        self.graph.setFixedHeight(130)
+        self.graph.enableAutoRange(axis='y', enable=True)
+        self.graph.setAutoVisible(y=True)
+        self.graph.hideButtons()
+        self.graph.addLegend(offset=(-10, 5))
+        self.plot.add_curve(0, pen=pg.mkPen(color='#2ECC71', width=2), name="starts/s")
+        self.plot.add_curve(1, pen=pg.mkPen(color='#E74C3C', width=1.5), name="exits/s")
+        self.plot.add_curve(2, pen=pg.mkPen(color='#95A5A6', width=1), name="unseen clones/s")
+
+        self.log = QListWidget()
+        self.log.setStyleSheet("""
+            QListWidget {
+                background-color: #121212;
+                border: 1px solid #333;
+                color: #00FF00;
+                font-family: 'Monospace';
+                font-size: 12px;
+            }
+        """)
+
+        self.layout.addWidget(self.label)
+        self.layout.addWidget(self.graph)
+        self.layout.addWidget(self.log)
+
+    def update_display(self, data: dict):
+        """
+        @brief Appends the latest 1Hz summary from the SpawnWorker.
+        @param data Summary dictionary from SpawnSensor.summary.
+        """
+        self.label.setText(
+            f"Spawns: {data['births']:>6.1f}/s | Exits: {data['exits']:>6.1f}/s | "
+            f"<1s lifetimes: {data['short_lived']:>4} | unseen clones: {data['unseen']:>6.1f}/s"
+        )
+        self.plot.append(time.time(), (data['births'], data['exits'], data['unseen']))
+
+        # Newest first; trim the tail to keep the list bounded
+        for event in data['events']:
+            stamp = time.strftime("%H:%M:%S", time.localtime(event['time']))
+            if event['kind'] == "start":
+                line = f"{stamp} START [{event['pid']:>7}] {event['name']} (ppid {event['ppid']})"
+            else:
+                line = (f"{stamp} EXIT  [{event['pid']:>7}] {event['name']} "
+                        f"lived {event['lifetime']:.2f}s, cpu {event['cpu_ms']} ms")
+            self.log.insertItem(0, line)
+        while self.log.count() > SPAWN_LOG_SIZE:
+            self.log.takeItem(self.log.count() - 1)
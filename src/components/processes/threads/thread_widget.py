@@ -0,0 +1,97 @@
+"""
+@file thread_widget.py
+@brief UI component listing the threads of the selected process.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+
+class ThreadWidget(QWidget):
+    """
+    @class ThreadWidget
+    @brief Table of per-thread CPU usage, state and name for one process.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the table structure and styling.
+        """
+        super().__init__()
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+
+        self.title = QLabel("Threads: select a process above")
+        self.title.setStyleSheet("font-weight: bold; font-size: 14px; color: #3498db;")
+        self.layout.addWidget(self.title)
+
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(["TID", "Thread Name", "State", "CPU %"])
+        self._configure_table()
+        self.layout.addWidget(self.table)
+
+    def _configure_table(self):
+        """
+        @brief Applies the same styling as the process table.
+        """
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
+        self.table.setColumnWidth(2, 100)
+        self.table.setColumnWidth(3, 80)
+
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setShowGrid(False)
+        self.table.setStyleSheet("""
+            QTableWidget {
+                background-color: transparent;
+                border: none;
+            }
+            QHeaderView::section {
+                background-color: #2c3e50;
+                color: white;
+                padding: 4px;
+                border: 1px solid #1a252f;
+            }
+        """)
+
+    def update_display(self, data: dict):
+        """
+        @brief Refreshes the table with the latest drill-down sample.
+        @param data {'pid': int, 'threads': list} from the ThreadWorker.
+        """
+        threads = data.get("threads", [])
+        if not threads:
+            self.title.setText(f"Threads: PID {data.get('pid')} is not accessible")
+            self.table.setRowCount(0)
+            return
+
+        self.title.setText(f"Threads of PID {data['pid']} ({len(threads)})")
+        self.table.setRowCount(len(threads))
+        for row, thread in enumerate(threads):
+            self._set_item(row, 0, str(thread['tid']), Qt.AlignmentFlag.AlignCenter)
+            self._set_item(row, 1, thread['name'])
+            self._set_item(row, 2, thread['state'])
+            self._set_item(row, 3, f"{thread['cpu']}%", Qt.AlignmentFlag.AlignRight)
+
+    def _set_item(self, row, col, text, alignment=None):
+        """
+        @brief Helper to create or update a table item efficiently.
+        """
+        item = self.table.item(row, col)
+        if not item:
+            item = QTableWidgetItem()
+            item.setFont(QFont("Monospace", 9))
+            self.table.setItem(row, col, item)
+
+        item.setText(text)
+        if alignment:
+            item.setTextAlignment(alignment)
+        return item
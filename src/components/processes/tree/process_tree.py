@@ -0,0 +1,219 @@
+"""
+@file process_tree.py
+@brief ppid-linked process tree with incrementally maintained subtree totals.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import threading
+
+# Per-node metrics aggregated over subtrees: CPU %, RSS (MB), I/O (MB/s)
+TREE_METRICS = ("cpu", "ram", "io")
+
+
+class ProcessTree:
+    """
+    @class ProcessTree
+    @brief Forest of processes keyed by (pid, create_time) with subtree totals.
+    @details Every node stores its own metrics and the totals of its subtree.
+             A start, exit, reparent or metric change only walks the node's
+             ancestor chain, adding or subtracting the delta, so a tick costs
+             O(changed nodes x depth) and the tree is never rebuilt.
+             Children whose parent has not been seen yet (out-of-order first
+             sweep) wait in an orphan table and are adopted when it appears.
+             Reads from the GUI thread (lazy expansion) and writes from the
+             worker thread are serialised by a lock.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes an empty forest.
+        """
+        self.nodes = {}        # key -> node dict
+        self.by_pid = {}       # pid -> key of the live process holding that PID
+        self.roots = set()     # keys without a known parent
+        self.orphans = {}      # ppid -> set of keys waiting for that parent
+        self._lock = threading.Lock()
+
+    # --- Aggregate maintenance -------------------------------------------------
+
+    def _propagate(self, key, delta):
+        """
+        @brief Adds 'delta' (cpu, ram, io, count) to every ancestor of 'key'.
+        """
+        parent = self.nodes[key]["parent"]
+        while parent is not None:
+            node = self.nodes[parent]
+            total = node["total"]
+            for i in range(4):
+                total[i] += delta[i]
+            parent = node["parent"]
+
+    def _attach(self, key, parent):
+        """
+        @brief Links 'key' under 'parent' (or as a root) and credits its subtree upwards.
+        """
+        node = self.nodes[key]
+        node["parent"] = parent
+        if parent is None:
+            self.roots.add(key)
+            return
+        self.nodes[parent]["children"].add(key)
+        self._propagate(key, node["total"])
+
+    def _detach(self, key):
+        """
+        @brief Unlinks 'key' from its parent and debits its subtree upwards.
+        """
+        node = self.nodes[key]
+        parent = node["parent"]
+        if parent is None:
+            self.roots.discard(key)
+            return
+        self._propagate(key, [-v for v in node["total"]])
+        self.nodes[parent]["children"].discard(key)
+        node["parent"] = None
+
+    # --- Mutations (worker thread) ---------------------------------------------
+
+    def update(self, key: tuple, ppid: int, name: str, cpu: float, ram: float, io: float):
+        """
+        @brief Inserts a process or applies its latest metrics.
+        @param key (pid, create_time) of the process.
+        @param ppid Parent PID as reported this sweep.
+        @param name Process name.
+        @param cpu CPU usage in percent.
+        @param ram RSS in MB.
+        @param io Read + write throughput in MB/s.
+        """
+        with self._lock:
+            node = self.nodes.get(key)
+            if node is None:
+                self._insert(key, ppid, name, (cpu, ram, io))
+                return
+
+            node["name"] = name
+            own = node["own"]
+            delta = [cpu - own[0], ram - own[1], io - own[2], 0]
+            if delta[0] or delta[1] or delta[2]:
+                own[:] = (cpu, ram, io)
+                total = node["total"]
+                for i in range(3):
+                    total[i] += delta[i]
+                self._propagate(key, delta)
+
+            if ppid != node["ppid"]:
+                # Reparented (e.g. to a subreaper after its parent exited)
+                waiting = self.orphans.get(node["ppid"])
+                if waiting:
+                    waiting.discard(key)
+                node["ppid"] = ppid
+                self._detach(key)
+                self._attach(key, self._resolve_parent(key, ppid))
+
+    def _resolve_parent(self, key, ppid):
+        """
+        @brief Returns the parent key for 'ppid', queueing 'key' as an orphan if unknown.
+        """
+        parent = self.by_pid.get(ppid)
+        if parent is None or parent == key:
+            if ppid > 0:
+                self.orphans.setdefault(ppid, set()).add(key)
+            return None
+        return parent
+
+    def _insert(self, key, ppid, name, metrics):
+        """
+        @brief Adds a new node, links it, and adopts any children waiting for it.
+        @note Caller holds the lock.
+        """
+        pid = key[0]
+        self.nodes[key] = {
+            "key": key, "pid": pid, "ppid": ppid, "name": name,
+            "own": list(metrics),
+            "total": [metrics[0], metrics[1], metrics[2], 1],
+            "parent": None, "children": set()
+        }
+        self.by_pid[pid] = key
+        self._attach(key, self._resolve_parent(key, ppid))
+
+        for child in self.orphans.pop(pid, ()):
+            if child in self.nodes and self.nodes[child]["parent"] is None:
+                self.roots.discard(child)
+                self._attach(child, key)
+
+    def remove(self, key: tuple):
+        """
+        @brief Removes an exited process; its children become roots until reparented.
+        """
+        with self._lock:
+            node = self.nodes.get(key)
+            if node is None:
+                return
+            for child in list(node["children"]):
+                self._detach(child)
+                self._attach(child, None)
+            self._detach(key)
+            del self.nodes[key]
+            if self.by_pid.get(node["pid"]) == key:
+                del self.by_pid[node["pid"]]
+            waiting = self.orphans.get(node["ppid"])
+            if waiting:
+                waiting.discard(key)
+
+    # --- Queries (any thread) --------------------------------------------------
+
+    @staticmethod
+    def _row(node) -> dict:
+        """
+        @brief Flattens a node into a display row.
+        """
+        own, total = node["own"], node["total"]
+        return {
+            "key": node["key"], "pid": node["pid"], "name": node["name"],
+            "cpu": own[0], "ram": own[1], "io": own[2],
+            "total_cpu": max(0.0, round(total[0], 1)),
+            "total_ram": max(0.0, round(total[1], 1)),
+            "total_io": max(0.0, round(total[2], 2)),
+            "count": total[3],
+            "children": len(node["children"])
+        }
+
+    def _rows(self, keys, limit: int) -> list:
+        """
+        @brief Rows for 'keys', heaviest subtree first, folding the tail into one row.
+        @note Caller holds the lock.
+        """
+        nodes = sorted((self.nodes[k] for k in keys),
+                       key=lambda n: (-n["total"][0], -n["total"][1], n["pid"]))
+        rows = [self._row(n) for n in nodes[:limit]]
+        rest = nodes[limit:]
+        if rest:
+            rows.append({
+                "key": None, "pid": None, "name": f"... {len(rest)} more",
+                "cpu": 0.0, "ram": 0.0, "io": 0.0,
+                "total_cpu": round(sum(n["total"][0] for n in rest), 1),
+                "total_ram": round(sum(n["total"][1] for n in rest), 1),
+                "total_io": round(sum(n["total"][2] for n in rest), 2),
+                "count": sum(n["total"][3] for n in rest),
+                "children": 0
+            })
+        return rows
+
+    def roots_rows(self, limit: int) -> list:
+        """
+        @brief Returns the top-level rows.
+        """
+        with self._lock:
+            return self._rows(self.roots, limit)
+
+    def children_rows(self, key: tuple, limit: int) -> list:
+        """
+        @brief Returns the direct children of 'key' ([] once it has exited).
+        """
+        with self._lock:
+            node = self.nodes.get(key)
+            return self._rows(node["children"], limit) if node else []
+
+    def __len__(self):
+        return len(self.nodes)
@@ -0,0 +1,188 @@
+"""
+@file tree_widget.py
+@brief UI component showing processes as a ppid tree with subtree totals.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTreeWidget,
+                             QTreeWidgetItem, QHeaderView)
+from PyQt6.QtCore import Qt, pyqtSignal
+
+# Column layout: (header, row field, format)
+TREE_COLUMNS = (
+    ("Process", "name", "{}"),
+    ("PID", "pid", "{}"),
+    ("Self CPU %", "cpu", "{:.1f}"),
+    ("Tree CPU %", "total_cpu", "{:.1f}"),
+    ("Tree RSS (MB)", "total_ram", "{:.1f}"),
+    ("Tree I/O (MB/s)", "total_io", "{:.2f}"),
+    ("Procs", "count", "{}"),
+)
+
+
+class ProcessTreeWidget(QWidget):
+    """
+    @class ProcessTreeWidget
+    @brief Lazily expanded tree of processes ordered by subtree CPU.
+    @details Only top-level nodes and the children of expanded nodes exist as
+             items, so tens of thousands of processes cost nothing until the
+             user drills down. Items are matched by (pid, create_time) and
+             updated in place, keeping expansion and selection across ticks.
+    """
+
+    # Emitted with the PID of the selected node (drives the thread drill-down)
+    process_selected = pyqtSignal(int)
+    # Emitted with a node key when it is expanded, so its children can be fetched at once
+    expand_requested = pyqtSignal(object)
+    # Emitted with the full set of expanded keys whenever it changes
+    expansion_changed = pyqtSignal(object)
+
+    def __init__(self):
+        """
+        @brief Initializes the tree and its styling.
+        """
+        super().__init__()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.label = QLabel("Process Tree: Loading...")
+        self.label.setStyleSheet("font-weight: bold; font-size: 14px; color: #3498db;")
+
+        self.tree = QTreeWidget()
+        self.tree.setColumnCount(len(TREE_COLUMNS))
+        self.tree.setHeaderLabels([column[0] for column in TREE_COLUMNS])
+        self.tree.setUniformRowHeights(True)
+        header = self.tree.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for col in range(1, len(TREE_COLUMNS)):
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        self.tree.setStyleSheet("""
+            QTreeWidget {
+                background-color: transparent;
+                border: none;
+                font-family: 'Monospace';
+                font-size: 12px;
+            }
+            QHeaderView::section {
+                background-color: #2c3e50;
+                color: white;
+                padding: 4px;
+                border: 1px solid #1a252f;
+            }
+        """)
+        self.tree.itemExpanded.connect(self._on_expanded)
+        self.tree.itemCollapsed.connect(self._on_collapsed)
+        self.tree.itemSelectionChanged.connect(self._on_selection_changed)
+
+        self.expanded = set()
+
+        layout.addWidget(self.label)
+        layout.addWidget(self.tree)
+
+    def update_display(self, data: dict):
+        """
+        @brief Applies the roots and expanded levels of the latest sweep.
+        @param data Dictionary with 'count', 'roots' and 'children' from ProcessSensor.tree_snapshot.
+        """
+        self.label.setText(f"Process Tree: {data.get('count', 0)} processes")
+        self._sync(self.tree.invisibleRootItem(), data.get("roots", []))
+
+        children = data.get("children", {})
+        for key in list(self.expanded):
+            item = self._find(key)
+            if item is None:
+                # Exited, or its parent was collapsed away
+                self.expanded.discard(key)
+            elif key in children:
+                self._sync(item, children[key])
+
+    def show_children(self, key, rows: list):
+        """
+        @brief Fills one node immediately after expansion.
+        """
+        item = self._find(key)
+        if item is not None:
+            self._sync(item, rows)
+
+    def _find(self, key):
+        """
+        @brief Locates the item of an expanded key by walking expanded levels only.
+        """
+        stack = [self.tree.invisibleRootItem()]
+        while stack:
+            parent = stack.pop()
+            for index in range(parent.childCount()):
+                child = parent.child(index)
+                child_key = child.data(0, Qt.ItemDataRole.UserRole)
+                if child_key == key:
+                    return child
+                if child.isExpanded():
+                    stack.append(child)
+        return None
+
+    def _sync(self, parent: QTreeWidgetItem, rows: list):
+        """
+        @brief Makes 'parent's children match 'rows', reusing items by key.
+        """
+        existing = {}
+        for index in range(parent.childCount()):
+            child = parent.child(index)
+            existing[child.data(0, Qt.ItemDataRole.UserRole)] = child
+
+        wanted = {row["key"] for row in rows}
+        for key, child in existing.items():
+            if key not in wanted:
+                parent.removeChild(child)
+
+        for position, row in enumerate(rows):
+            item = existing.get(row["key"])
+            if item is None:
+                item = QTreeWidgetItem()
+                item.setData(0, Qt.ItemDataRole.UserRole, row["key"])
+                for col in range(1, len(TREE_COLUMNS)):
+                    item.setTextAlignment(col, Qt.AlignmentFlag.AlignRight)
+                parent.insertChild(position, item)
+            elif parent.indexOfChild(item) != position:
+                expanded = item.isExpanded()
+                parent.takeChild(parent.indexOfChild(item))
+                parent.insertChild(position, item)
+                item.setExpanded(expanded)
+
+            item.setChildIndicatorPolicy(
+                QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator if row["children"]
+                else QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicator
+            )
+            for col, (_, field, fmt) in enumerate(TREE_COLUMNS):
+                value = row[field]
+                item.setText(col, "" if value is None else fmt.format(value))
+
+    def _on_expanded(self, item: QTreeWidgetItem):
+        """
+        @brief Requests the children of a newly expanded node.
+        """
+        key = item.data(0, Qt.ItemDataRole.UserRole)
+        if key is None:
+            return
+        self.expanded.add(key)
+        self.expand_requested.emit(key)
+        self.expansion_changed.emit(set(self.expanded))
+
+    def _on_collapsed(self, item: QTreeWidgetItem):
+        """
+        @brief Drops the children of a collapsed node so only visible levels stay alive.
+        """
+        key = item.data(0, Qt.ItemDataRole.UserRole)
+        self.expanded.discard(key)
+        item.takeChildren()
+        self.expansion_changed.emit(set(self.expanded))
+
+    def _on_selection_changed(self):
+        """
+        @brief Emits the PID of the newly selected node.
+        """
+        items = self.tree.selectedItems()
+        if items:
+            key = items[0].data(0, Qt.ItemDataRole.UserRole)
+            if key is not None:
+                self.process_selected.emit(key[0])
@@ -0,0 +1,151 @@
+"""
+@file process_index.py
+@brief Incremental trigram index over process names, command lines and users.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import bisect
+import threading
+
+# Command lines longer than this are truncated before indexing
+CMDLINE_INDEX_CHARS = 512
+
+
+class ProcessIndex:
+    """
+    @class ProcessIndex
+    @brief Maps search terms to process keys without scanning every process.
+    @details Each process (keyed by (pid, create_time)) contributes one
+             lowercase document "name\\ncmdline\\nuser". Every trigram of the
+             document points back to the key, so a term of three or more
+             characters is answered by intersecting posting sets (smallest
+             first) and verifying the few candidates. Shorter terms fall back
+             to a scan of the documents. PID prefixes are answered by bisecting
+             a sorted list of PID strings. Entries are added and removed as the
+             ProcessSensor registry changes, never rebuilt.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes empty postings.
+        """
+        self.docs = {}       # key -> (name, document)
+        self.grams = {}      # trigram -> set of keys
+        self.pids = []       # sorted list of (pid string, key)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _trigrams(text: str) -> set:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def indexed_name(self, key: tuple):
+        """
+        @brief Returns the name a key was indexed under (None if unknown).
+        @details Lets the sampler fetch the command line and user only for
+                 new or renamed processes.
+        """
+        entry = self.docs.get(key)
+        return entry[0] if entry else None
+
+    def add(self, key: tuple, name: str, cmdline: str, user: str):
+        """
+        @brief Indexes (or re-indexes) one process.
+        """
+        document = "\n".join((name, cmdline[:CMDLINE_INDEX_CHARS], user)).lower()
+        with self._lock:
+            if key in self.docs:
+                self._remove(key)
+            self.docs[key] = (name, document)
+            for gram in self._trigrams(document):
+                postings = self.grams.get(gram)
+                if postings is None:
+                    postings = self.grams[gram] = set()
+                postings.add(key)
+            bisect.insort(self.pids, (str(key[0]), key))
+
+    def remove(self, key: tuple):
+        """
+        @brief Drops an exited process from the index.
+        """
+        with self._lock:
+            if key in self.docs:
+                self._remove(key)
+
+    def _remove(self, key):
+        """
+        @note Caller holds the lock.
+        """
+        _, document = self.docs.pop(key)
+        for gram in self._trigrams(document):
+            postings = self.grams.get(gram)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self.grams[gram]
+        entry = (str(key[0]), key)
+        position = bisect.bisect_left(self.pids, entry)
+        if position < len(self.pids) and self.pids[position] == entry:
+            del self.pids[position]
+
+    def _match_term(self, term: str) -> set:
+        """
+        @brief Keys matching one lowercase term.
+        @note Caller holds the lock.
+        """
+        matches = set()
+        if term.isdigit():
+            lo = bisect.bisect_left(self.pids, (term,))
+            hi = bisect.bisect_left(self.pids, (term + "\x7f",))
+            matches.update(key for _, key in self.pids[lo:hi])
+
+        if len(term) < 3:
+            matches.update(key for key, (_, doc) in self.docs.items() if term in doc)
+            return matches
+
+        postings = [self.grams.get(gram) for gram in self._trigrams(term)]
+        if any(p is None for p in postings):
+            return matches
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        matches.update(key for key in candidates if term in self.docs[key][1])
+        return matches
+
+    def _selectivity(self, term: str) -> int:
+        """
+        @brief Upper bound on the matches of 'term' (smallest posting size).
+        @note Caller holds the lock. Short terms are assumed to match everything.
+        """
+        if len(term) < 3:
+            return len(self.docs)
+        return min(len(self.grams.get(gram, ())) for gram in self._trigrams(term))
+
+    def _verify(self, key, term: str) -> bool:
+        """
+        @brief Checks one candidate against one term.
+        """
+        if term.isdigit() and str(key[0]).startswith(term):
+            return True
+        return term in self.docs[key][1]
+
+    def search(self, query: str) -> set:
+        """
+        @brief Returns the keys matching every whitespace-separated term.
+        @param query Case-insensitive terms; digits also match PID prefixes.
+        @details Only the most selective term hits the index; the remaining
+                 terms are checked against its (small) result set.
+        """
+        terms = query.lower().split()
+        if not terms:
+            return set()
+        with self._lock:
+            terms.sort(key=self._selectivity)
+            result = self._match_term(terms[0])
+            for term in terms[1:]:
+                if not result:
+                    break
+                result = {key for key in result if self._verify(key, term)}
+        return result
+
+    def __len__(self):
+        return len(self.docs)
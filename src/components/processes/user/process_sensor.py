@@ -5,9 +5,33 @@
 @license MIT
 """
 
+import os
+import pwd
+import time
 import psutil
 import logging
-from src.config import MAX_PROCESSES
+from src.config import (MAX_PROCESSES, PSS_REFRESH_BUDGET, PSS_REFRESH_INTERVAL,
+                        SOCKET_SCAN_BUDGET, SOCKET_SCAN_INTERVAL, NUMA_RESIDENCY_BUDGET,
+                        NUMA_RESIDENCY_INTERVAL, PROCESS_EVENT_LOG_SIZE, PROCESS_EVENT_CPU_DELTA,
+                        PROCESS_EVENT_RAM_DELTA_MB)
+from src.components.processes.user.pss_sampler import PSSSampler
+from src.components.processes.user.socket_sampler import SocketSampler
+from src.components.processes.user.sched_sampler import SchedSampler
+from src.components.numa.residency_sampler import ResidencySampler
+from src.components.processes.tree.process_tree import ProcessTree
+from src.components.processes.user.process_index import ProcessIndex
+from src.core.event_log import ProcessEventLog
+from src.core.procfs import (procfs, STAT_STATE, STAT_PPID, STAT_UTIME, STAT_STIME,
+                             STAT_STARTTIME, STAT_RSS)
+from src.components.processes.threads.thread_sensor import CLOCK_TICKS, THREAD_STATES
+
+# stat fields read for every process in the sweep
+SWEEP_COLUMNS = (STAT_STATE, STAT_PPID, STAT_UTIME, STAT_STIME, STAT_STARTTIME, STAT_RSS)
+
+# comm is truncated to 15 bytes; longer names are recovered from the command line
+COMM_LENGTH = 15
+
+PAGE_MB = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
 
 class ProcessSensor:
     """
@@ -20,58 +44,293 @@ class ProcessSensor:
     def __init__(self):
         """
         @brief Initializes the sensor.
-        @details No baseline needed here as psutil.process_iter handles 
-                 stat persistence for cpu_percent calculations internally.
+        @details Each sweep reads every /proc/<pid>/stat in one ProcFS
+                 stat_batch() (openat() relative to /proc, numeric fields
+                 parsed into a reused array), then 'io' and the 'fd' listing.
+                 The values match what psutil reports (cpu_percent from tick
+                 deltas, create_time = boot time + starttime, RSS, full
+                 names for truncated comms) at a fraction of the opens.
+                 PSS/swap of the top consumers is sampled under a read budget.
+                 A registry of every process, keyed by (pid, create_time), is
+                 diffed against each sweep to feed the lifecycle event log
+                 and the incrementally aggregated process tree. A trigram index
+                 over name, command line and user is maintained alongside it.
+        """
+        self.pss = PSSSampler(PSS_REFRESH_BUDGET, PSS_REFRESH_INTERVAL)
+        self.sockets = SocketSampler(SOCKET_SCAN_BUDGET, SOCKET_SCAN_INTERVAL)
+        self.sched = SchedSampler()
+        self.residency = ResidencySampler(NUMA_RESIDENCY_BUDGET, NUMA_RESIDENCY_INTERVAL)
+        self.limit = MAX_PROCESSES   # Rows returned per sweep
+        self.details = True          # PSS/socket/residency columns (sheddable)
+        self.detail_seconds = 0.0    # Thread CPU time the details took last sweep
+        self.sweep = []              # Every row of the last sweep (before filtering)
+
+        # Lifecycle tracking: key -> last *reported* {'name', 'cpu', 'ram'}
+        self.registry = {}
+        self.event_log = ProcessEventLog(PROCESS_EVENT_LOG_SIZE)
+        self.last_events = []
+        self._primed = False
+
+        # ppid-linked tree with subtree totals; I/O rates from byte deltas
+        self.tree = ProcessTree()
+        self.io_last = {}      # key -> read + write bytes at the previous sweep
+        self.ticks_last = {}   # key -> utime + stime at the previous sweep
+        self.long_names = {}   # key -> (comm, full name) for 15-byte comms
+        self.users = {}        # uid -> user name
+        self.boot_time = psutil.boot_time()
+        self.last_sweep = None
+
+        # Search index; command line and user are read once per new/renamed process
+        self.index = ProcessIndex()
+        self.match_count = 0
+
+    def _record_events(self, now: float, seen: dict, skipped: set):
+        """
+        @brief Diffs the current sweep against the registry and logs events.
+        @param now Sweep timestamp.
+        @param seen Mapping of (pid, create_time) -> process row for this sweep.
+        @param skipped PIDs that could not be read this sweep (kept as alive).
+        @details Resource changes are measured against the last reported value,
+                 so slow drifts are still reported once they add up.
         """
-        pass
+        log = self.event_log
+        events = []
+
+        if not self._primed:
+            # The first sweep is the baseline, not a burst of 'start' events
+            self._primed = True
+            for key, proc in seen.items():
+                self.registry[key] = {"name": proc['name'], "cpu": proc['cpu'], "ram": proc['ram']}
+            self.last_events = []
+            return
+
+        for key, proc in seen.items():
+            ref = self.registry.get(key)
+            if ref is None:
+                self.registry[key] = {"name": proc['name'], "cpu": proc['cpu'], "ram": proc['ram']}
+                events.append(log.record(now, "start", key, name=proc['name'],
+                                         cpu=proc['cpu'], ram=proc['ram']))
+                continue
+
+            if proc['name'] != ref['name']:
+                events.append(log.record(now, "rename", key, name=proc['name'],
+                                         old_name=ref['name']))
+                ref['name'] = proc['name']
+
+            ram_threshold = max(PROCESS_EVENT_RAM_DELTA_MB, 0.5 * ref['ram'])
+            if (abs(proc['cpu'] - ref['cpu']) >= PROCESS_EVENT_CPU_DELTA
+                    or abs(proc['ram'] - ref['ram']) >= ram_threshold):
+                events.append(log.record(now, "change", key, name=proc['name'],
+                                         cpu=proc['cpu'], ram=proc['ram'],
+                                         old_cpu=ref['cpu'], old_ram=ref['ram']))
+                ref['cpu'], ref['ram'] = proc['cpu'], proc['ram']
+
+        for key in [k for k in self.registry if k not in seen and k[0] not in skipped]:
+            ref = self.registry.pop(key)
+            self.tree.remove(key)
+            self.index.remove(key)
+            self.long_names.pop(key, None)
+            self.sched.forget(key)
+            events.append(log.record(now, "exit", key, name=ref['name'],
+                                     cpu=ref['cpu'], ram=ref['ram']))
+
+        self.last_events = events
+
+    def tree_snapshot(self, expanded, limit: int) -> dict:
+        """
+        @brief Returns the rows the tree view needs: roots plus expanded nodes.
+        @param expanded Iterable of node keys currently expanded in the GUI.
+        @param limit Maximum rows per level (the rest is folded into one row).
+        @return {'count', 'roots', 'children': {key: rows}}.
+        """
+        return {
+            "count": len(self.tree),
+            "roots": self.tree.roots_rows(limit),
+            "children": {key: self.tree.children_rows(key, limit) for key in expanded}
+        }
+
+    def _index_process(self, pid: str, key: tuple, name: str):
+        """
+        @brief Adds a new or renamed process to the search index.
+        """
+        if self.index.indexed_name(key) == name:
+            return
+        reader = procfs()
+        try:
+            cmdline = reader.read(f"{pid}/cmdline").replace(b"\0", b" ").strip()
+            cmdline = cmdline.decode(errors="replace")
+        except OSError:
+            cmdline = ""
+        try:
+            user = self._user(reader.read(f"{pid}/status"))
+        except (OSError, ValueError, IndexError):
+            user = ""
+        self.index.add(key, name, cmdline, user)
 
-    def fetch_data(self, sort_by='cpu') -> list:
+    def _user(self, status: bytes) -> str:
+        """
+        @brief Returns the name of the real user in a /proc/<pid>/status content.
+        """
+        start = status.index(b"\nUid:")
+        uid = int(status[start + 5:status.index(b"\n", start + 1)].split()[0])
+        user = self.users.get(uid)
+        if user is None:
+            try:
+                user = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                user = str(uid)
+            self.users[uid] = user
+        return user
+
+    def _name(self, pid: str, key: tuple, comm: bytes) -> str:
+        """
+        @brief Returns the process name, completing a truncated comm from argv[0].
+        @details Same rule as psutil: a 15-byte comm is replaced by the base
+                 name of argv[0] when that starts with it. Cached per key.
+        """
+        name = comm.decode(errors="replace")
+        if len(comm) < COMM_LENGTH:
+            return name
+        cached = self.long_names.get(key)
+        if cached is not None and cached[0] == comm:
+            return cached[1]
+        full = name
+        try:
+            argv0 = procfs().read(f"{pid}/cmdline").split(b"\0", 1)[0]
+            extended = os.path.basename(argv0.decode(errors="replace"))
+            if extended.startswith(name):
+                full = extended
+        except OSError:
+            pass
+        self.long_names[key] = (comm, full)
+        return full
+
+    def fetch_data(self, sort_by='cpu', query: str = "") -> list:
         """
         @brief Retrieves a sorted list of top-consuming processes.
-        @param sort_by (str): The metric to sort by ('cpu' or 'ram').
-        @return A list of dictionaries containing PID, Name, CPU %, and RAM (MB).
+        @param sort_by (str): The metric to sort by ('cpu', 'ram', 'fds' or 'wait').
+        @param query (str): Optional search terms; only matching processes are
+               sorted and returned (see ProcessIndex.search).
+        @return A list of dictionaries containing PID, Name, CPU %, RAM (MB, RSS),
+                PSS and Swap (MB, None until first sampled), open fds and
+                TCP/UDP/Unix socket counts (None when unreadable) and run-queue
+                wait (ms/s) with timeslices/s, and NUMA node residency
+                ({node: MB}, None on single-node machines or until sampled).
         @note Returns a maximum of 15 processes to optimize UI rendering performance.
         """
         processes = []
+        skipped = set()
+        now = time.time()
+        elapsed = (now - self.last_sweep) if self.last_sweep else 0.0
+        io_now = {}
+        ticks_now = {}
+        reader = procfs()
         try:
-            # We iterate through all processes, requesting only specific attributes
-            # to minimize context switching between Python and the Kernel.
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
-                try:
-                    info = proc.info
-                    
-                    # Process identification and resource metrics
-                    pid = info['pid']
-                    name = info['name'] or "Unknown"
-                    cpu = info['cpu_percent'] or 0.0
-                    
-                    # RSS (Resident Set Size) represents actual physical memory used
-                    ram_mb = 0.0
-                    if info['memory_info']:
-                        ram_mb = info['memory_info'].rss / (1024 * 1024)
-
-                    processes.append({
-                        "pid": pid,
-                        "name": name,
-                        "cpu": round(cpu, 1),
-                        "ram": round(ram_mb, 1)
-                    })
-                    
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    # These exceptions are common on Linux as processes cycle frequently.
-                    # We silently skip them to maintain telemetry stability.
+            # One pass over every /proc/<pid>/stat, numeric fields straight into an array
+            pids = reader.pids()
+            comms = []
+            stats = reader.stat_batch(pids, SWEEP_COLUMNS, names=comms).tolist()
+            for pid, (state, ppid, utime, stime, starttime, rss), comm in zip(pids, stats, comms):
+                if comm is None:
+                    # Exited between the listing and the read: kept alive until the next sweep
+                    skipped.add(int(pid))
                     continue
 
+                # Process identification (same create_time as psutil) and resource metrics
+                create_time = self.boot_time + starttime / CLOCK_TICKS
+                key = (int(pid), create_time)
+                name = self._name(pid, key, comm) or "Unknown"
+                cpu = 0.0
+                cpu_ticks = utime + stime
+                ticks_now[key] = cpu_ticks
+                prev = self.ticks_last.get(key)
+                if prev is not None and elapsed > 0:
+                    cpu = (cpu_ticks - prev) / CLOCK_TICKS / elapsed * 100
+
+                # RSS (Resident Set Size) represents actual physical memory used
+                ram_mb = rss * PAGE_MB
+
+                # Open fds and read + write throughput (unreadable for other users' processes)
+                try:
+                    fds = len(reader.listdir(f"{pid}/fd"))
+                except OSError:
+                    fds = None
+                io_mb = 0.0
+                try:
+                    io = reader.read(f"{pid}/io").split()
+                    io_bytes = int(io[9]) + int(io[11])   # read_bytes + write_bytes
+                    io_now[key] = io_bytes
+                    prev = self.io_last.get(key)
+                    if prev is not None and elapsed > 0:
+                        io_mb = max(0.0, (io_bytes - prev) / elapsed / (1024 * 1024))
+                except (OSError, ValueError, IndexError):
+                    pass
+
+                status = chr(state)
+                processes.append({
+                    "pid": key[0],
+                    "name": name,
+                    "cpu": round(cpu, 1),
+                    "ram": round(ram_mb, 1),
+                    "create_time": create_time,
+                    "fds": fds,
+                    "status": THREAD_STATES.get(status, status)
+                })
+                self.tree.update(key, ppid, name, round(cpu, 1), round(ram_mb, 1), round(io_mb, 2))
+                self._index_process(pid, key, name)
+
+            self.ticks_last = ticks_now
+            self.io_last = io_now
+            self.last_sweep = now
+
+            # Lifecycle events (starts, exits, renames, large changes)
+            self._record_events(
+                now,
+                {(p['pid'], p['create_time']): p for p in processes},
+                skipped
+            )
+
+            # Scheduler latency, read only for processes runnable last sweep
+            self.sched.annotate(processes, now)
+            self.sweep = processes
+
+            # --- Filtering Logic (index lookup, no per-process string scan) ---
+            if query.strip():
+                matches = self.index.search(query)
+                processes = [p for p in processes if (p['pid'], p['create_time']) in matches]
+            self.match_count = len(processes)
+
             # --- Sorting Logic ---
             # We perform sorting on the background thread to keep the UI responsive.
             # Lambda key allows for dynamic switching between CPU and RAM priorities.
             if sort_by == 'ram':
                 processes.sort(key=lambda x: x['ram'], reverse=True)
+            elif sort_by == 'fds':
+                processes.sort(key=lambda x: x['fds'] or 0, reverse=True)
+            elif sort_by == 'wait':
+                processes.sort(key=lambda x: x['wait'], reverse=True)
             else:
                 processes.sort(key=lambda x: x['cpu'], reverse=True)
 
             # Return the "Top 15" consumers (Industry standard for dashboarding)
-            return processes[:MAX_PROCESSES]
+            top = processes[:self.limit]
+
+            # Optional per-row details; the sampling governor may switch them off
+            if not self.details:
+                self.detail_seconds = 0.0
+                return top
+            start = time.thread_time()
+
+            # Shared-page aware memory for the displayed rows only
+            self.pss.annotate(top)
+
+            # Socket counts from the cached fd -> inode map (also refreshes TCP states)
+            self.sockets.annotate(top)
+
+            # Per-node residency on a slower cadence (multi-node machines only)
+            self.residency.annotate(top)
+            self.detail_seconds = time.thread_time() - start
+            return top
 
         except Exception as e:
             logging.error(f"Critical error in ProcessSensor: {e}")
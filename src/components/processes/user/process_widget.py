@@ -7,7 +7,7 @@
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTableWidget, 
                              QTableWidgetItem, QHeaderView, QAbstractItemView)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QColor, QFont
 from src.config import MAX_PROCESSES
 
@@ -19,6 +19,9 @@ class ProcessWidget(QWidget):
              real-time CPU and RAM usage for user-space applications.
     """
 
+    # Emitted with the PID of the row the user selects (drives the thread drill-down)
+    process_selected = pyqtSignal(int)
+
     def __init__(self):
         """
         @brief Initializes the table structure and styling.
@@ -33,9 +36,14 @@ class ProcessWidget(QWidget):
         self.layout.addWidget(self.title)
 
         # Table Setup
-        self.table = QTableWidget(MAX_PROCESSES, 4)  # MAX_PROCESSES rows, 4 columns
-        self.table.setHorizontalHeaderLabels(["PID", "Process Name", "CPU %", "RAM (MB)"])
+        self.max_rows = MAX_PROCESSES
+        self.table = QTableWidget(self.max_rows, 12)  # max_rows rows, 12 columns
+        self.table.setHorizontalHeaderLabels(
+            ["PID", "Process Name", "CPU %", "RSS (MB)", "PSS (MB)", "Swap (MB)",
+             "FDs", "TCP", "UDP", "Unix", "Wait ms/s", "NUMA Nodes"]
+        )
         self._configure_table()
+        self.table.itemSelectionChanged.connect(self._on_selection_changed)
         
         self.layout.addWidget(self.table)
 
@@ -49,8 +57,18 @@ class ProcessWidget(QWidget):
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
+        for col in range(6, 10):
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.Fixed)
+            self.table.setColumnWidth(col, 60)
+        header.setSectionResizeMode(10, QHeaderView.ResizeMode.Fixed)
+        self.table.setColumnWidth(10, 80)
+        header.setSectionResizeMode(11, QHeaderView.ResizeMode.ResizeToContents)
         self.table.setColumnWidth(2, 80)
         self.table.setColumnWidth(3, 100)
+        self.table.setColumnWidth(4, 100)
+        self.table.setColumnWidth(5, 90)
 
         # General Table Styling
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -75,11 +93,14 @@ class ProcessWidget(QWidget):
     def update_display(self, process_list: list):
         """
         @brief Refreshes the table content with new telemetry data.
-        @param process_list List of dicts containing pid, name, cpu, and ram.
+        @param process_list List of dicts containing pid, name, cpu, ram, pss, swap, fds, socket counts, wait and numa.
         """
+        # Shrink/grow to the result size (a search filter may match fewer rows)
+        self.table.setRowCount(min(len(process_list), self.max_rows))
+
         # Iterate through the list and update rows
         for row, proc in enumerate(process_list):
-            if row >= MAX_PROCESSES: break # Safety break
+            if row >= self.max_rows: break # Safety break
 
             # PID (Centered)
             self._set_item(row, 0, str(proc['pid']), alignment=Qt.AlignmentFlag.AlignCenter)
@@ -93,6 +114,41 @@ class ProcessWidget(QWidget):
             # RAM MB (With color clue)
             ram_item = self._set_item(row, 3, f"{proc['ram']:.1f}", alignment=Qt.AlignmentFlag.AlignRight)
 
+            # PSS / Swap (sampled under a budget; '-' until the first read)
+            for col, key in ((4, 'pss'), (5, 'swap')):
+                value = proc.get(key)
+                text = "-" if value is None else f"{value:.1f}"
+                self._set_item(row, col, text, alignment=Qt.AlignmentFlag.AlignRight)
+
+            # Open fds and sockets by type ('-' when the fd table is not readable)
+            for col, key in ((6, 'fds'), (7, 'tcp'), (8, 'udp'), (9, 'unix')):
+                value = proc.get(key)
+                text = "-" if value is None else str(value)
+                self._set_item(row, col, text, alignment=Qt.AlignmentFlag.AlignRight)
+
+            # Run-queue wait (time runnable but not running), with timeslices in the tooltip
+            wait_item = self._set_item(row, 10, f"{proc.get('wait', 0.0):.1f}",
+                                       alignment=Qt.AlignmentFlag.AlignRight)
+            wait_item.setToolTip(f"{proc.get('slices', 0.0):.0f} timeslices/s")
+
+            # Share of resident memory per NUMA node (e.g. '0:72% 1:28%')
+            numa = proc.get('numa')
+            total = sum(numa.values()) if numa else 0
+            text = " ".join(f"{n}:{mb / total:.0%}" for n, mb in numa.items()) if total else "-"
+            numa_item = self._set_item(row, 11, text)
+            numa_item.setToolTip(" | ".join(f"node{n}: {mb:.1f} MB" for n, mb in numa.items()) if numa else "")
+
+    def _on_selection_changed(self):
+        """
+        @brief Emits the PID of the newly selected row.
+        """
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
+            return
+        item = self.table.item(rows[0].row(), 0)
+        if item and item.text().isdigit():
+            self.process_selected.emit(int(item.text()))
+
     def _set_item(self, row, col, text, alignment=None):
         """
         @brief Helper to create or update a table item efficiently.
@@ -0,0 +1,84 @@
+"""
+@file pss_sampler.py
+@brief Rate-limited proportional set size (PSS) sampling for top processes.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import time
+import logging
+from src.core.procfs import procfs
+
+class PSSSampler:
+    """
+    @class PSSSampler
+    @brief Annotates top-N processes with PSS and swap from /proc/<pid>/smaps_rollup.
+    @details RSS double-counts pages shared between forked workers; PSS divides
+             each shared page among its users. smaps_rollup makes the kernel
+             walk the whole address space, so reads are rationed:
+             - results are cached per (pid, create_time), so PID reuse never
+               returns another process's numbers;
+             - at most 'budget' files are read per tick, stalest first;
+             - an entry is only refreshed once it is older than 'interval' s.
+    """
+
+    def __init__(self, budget: int, interval: float, ttl: float = 60.0):
+        """
+        @param budget Maximum smaps_rollup reads per call to annotate().
+        @param interval Minimum age in seconds before a cached value is refreshed.
+        @param ttl Seconds after which an entry not seen in the top-N is evicted.
+        """
+        self.budget = budget
+        self.interval = interval
+        self.ttl = ttl
+        self.cache = {}   # (pid, create_time) -> {'pss', 'swap', 'sampled', 'seen'}
+
+    @staticmethod
+    def _read_rollup(pid: int):
+        """
+        @brief Returns (pss_mb, swap_mb) for one process.
+        """
+        pss = swap = 0
+        for line in procfs().read(f"{pid}/smaps_rollup").split(b"\n"):
+            if line.startswith(b"Pss:"):
+                pss = int(line.split()[1])
+            elif line.startswith(b"Swap:"):
+                swap = int(line.split()[1])
+        return round(pss / 1024, 1), round(swap / 1024, 1)
+
+    def annotate(self, processes: list):
+        """
+        @brief Adds 'pss' and 'swap' (MB, or None if never sampled) to each row.
+        @param processes Top-N rows carrying 'pid' and 'create_time'.
+        """
+        now = time.monotonic()
+        keys = [(proc['pid'], proc.get('create_time')) for proc in processes]
+
+        # Stalest (or never sampled) entries are refreshed first, within budget
+        stale = []
+        for key in keys:
+            entry = self.cache.setdefault(key, {"pss": None, "swap": None, "sampled": None})
+            entry["seen"] = now
+            if entry["sampled"] is None or now - entry["sampled"] >= self.interval:
+                stale.append((entry["sampled"] or 0.0, key))
+        stale.sort()
+
+        for _, key in stale[:self.budget]:
+            entry = self.cache[key]
+            try:
+                entry["pss"], entry["swap"] = self._read_rollup(key[0])
+            except (FileNotFoundError, ProcessLookupError, PermissionError):
+                # Exited, or owned by another user: don't retry until the interval lapses
+                pass
+            except OSError as e:
+                logging.debug(f"smaps_rollup unreadable for PID {key[0]}: {e}")
+            entry["sampled"] = now
+
+        for proc, key in zip(processes, keys):
+            entry = self.cache[key]
+            proc["pss"] = entry["pss"]
+            proc["swap"] = entry["swap"]
+
+        # Evict processes that left the top-N a while ago
+        for key in [k for k, e in self.cache.items() if now - e["seen"] > self.ttl]:
+            del self.cache[key]
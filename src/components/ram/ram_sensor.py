@@ -16,6 +16,47 @@ class RAMSensor:
              both percentage-based load and absolute volumetric data.
     """
 
+    # /proc/meminfo fields reported in the breakdown (key -> packet name)
+    MEMINFO_FIELDS = {
+        "MemAvailable": "available",
+        "Cached": "cached",
+        "Buffers": "buffers",
+        "Slab": "slab",
+        "SReclaimable": "slab_reclaimable",
+        "SUnreclaim": "slab_unreclaimable",
+        "Shmem": "shmem",
+        "AnonPages": "anon",
+        "Dirty": "dirty",
+        "Writeback": "writeback",
+        "Committed_AS": "committed",
+        "CommitLimit": "commit_limit",
+        "SwapTotal": "swap_total",
+        "SwapFree": "swap_free",
+    }
+
+    def _read_meminfo(self) -> dict:
+        """
+        @brief Parses /proc/meminfo into a GB breakdown.
+        @return The fields listed in MEMINFO_FIELDS plus 'hugepages_total' and
+                'hugepages_free' (in GB, i.e. pages multiplied by Hugepagesize).
+        """
+        raw = {}
+        with open("/proc/meminfo", "rb") as f:
+            for line in f:
+                key, _, rest = line.partition(b":")
+                raw[key.decode()] = int(rest.split()[0])
+
+        # Values are reported in kB, except HugePages_* which are page counts
+        kb_to_gb = 1024**2
+        breakdown = {
+            name: round(raw.get(key, 0) / kb_to_gb, 2)
+            for key, name in self.MEMINFO_FIELDS.items()
+        }
+        page_kb = raw.get("Hugepagesize", 0)
+        breakdown["hugepages_total"] = round(raw.get("HugePages_Total", 0) * page_kb / kb_to_gb, 2)
+        breakdown["hugepages_free"] = round(raw.get("HugePages_Free", 0) * page_kb / kb_to_gb, 2)
+        return breakdown
+
     def fetch_data(self) -> dict:
         """
         @brief Samples current system memory usage.
@@ -23,6 +64,8 @@ class RAMSensor:
             - 'percent' (float): Total memory utilization as a percentage.
             - 'used' (float): Currently occupied RAM in Gigabytes (GB).
             - 'total' (float): Total installed physical RAM in Gigabytes (GB).
+            - 'breakdown' (dict): /proc/meminfo detail in GB (cached, buffers, slab,
+              shmem, hugepages, dirty/writeback, committed, swap, ...).
         @note Volume calculation uses (1024^3) to convert raw bytes to GiB/GB.
         """
         try:
@@ -35,9 +78,10 @@ class RAMSensor:
             return {
                 "percent": vm.percent,
                 "used": round(vm.used / bytes_to_gb, 1),
-                "total": round(vm.total / bytes_to_gb, 1)
+                "total": round(vm.total / bytes_to_gb, 1),
+                "breakdown": self._read_meminfo()
             }
         except Exception as e:
             logging.error(f"Critical error in RAMSensor sampling: {e}")
             # Return safe default values to prevent UI crash
-            return {"percent": 0.0, "used": 0.0, "total": 0.0}
\ No newline at end of file
+            return {"percent": 0.0, "used": 0.0, "total": 0.0, "breakdown": {}}
\ No newline at end of file
@@ -5,8 +5,10 @@
 @dependencies pyqtgraph, PyQt6
 """
 
+import time
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from src.components.common.history_plot import HistoryPlot
 
 class RAMWidget(QWidget):
     """
@@ -19,30 +21,35 @@ class RAMWidget(QWidget):
     def __init__(self):
         """
         @brief Initializes UI components and history buffers.
-        @details Sets up a 60-second sliding window for memory percentage tracking.
+        @details Memory percentage history is kept in a zoomable pyramid-backed
+                 plot (row 0: percent, row 1: anomaly marks).
         """
         super().__init__()
         
-        # Internal state: Sliding window buffer for utilization percentage
-        self.history = [0.0] * 60
-        
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 5, 0, 5)
 
         # Telemetry Text Overlay
         self.label = QLabel("RAM: Loading...")
         self.label.setStyleSheet("font-family: 'Monospace'; font-weight: bold;")
+
+        # /proc/meminfo breakdown line
+        self.detail = QLabel("")
+        self.detail.setStyleSheet("font-family: 'Monospace'; color: #7FB3D5;")
         
         # Graph Configuration
-        self.graph = pg.PlotWidget()
+        self.plot = HistoryPlot(rows=2)
+        self.graph = self.plot.graph
         self._configure_graph()
         
         # Visual Encoding: Blue line for RAM utilization
         # (0, 150, 255) provides a distinct contrast to CPU (Green) and Net (Magenta/Cyan)
         pen = pg.mkPen(color=(0, 150, 255), width=2)
-        self.curve = self.graph.plot(self.history, pen=pen)
+        self.curve = self.plot.add_curve(0, pen=pen)
+        self.anomaly_curve = self.plot.add_curve(1, sparse=True, **HistoryPlot.anomaly_pen())
         
         self.layout.addWidget(self.label)
+        self.layout.addWidget(self.detail)
         self.layout.addWidget(self.graph)
 
     def _configure_graph(self):
@@ -53,25 +60,47 @@ class RAMWidget(QWidget):
         self.graph.setBackground('k')
         self.graph.setFixedHeight(150)
         self.graph.setYRange(0, 100)
-        self.graph.getAxis('bottom').hide()
-        self.graph.getViewBox().setMouseEnabled(x=False, y=False)
         self.graph.hideButtons()
 
-    def update_display(self, percent: float, used: float, total: float):
+    def update_display(self, percent: float, used: float, total: float,
+                       anomalous: bool = False, timestamp: float = None,
+                       breakdown: dict = None):
         """
         @brief Updates the visual state with the latest memory samples.
         @param percent Current memory load as a percentage (0.0 - 100.0).
         @param used Current memory consumption in Gigabytes (GB).
         @param total Total system memory capacity in Gigabytes (GB).
-        @details Updates the text label and shifts the history buffer 
-                 before redrawing the utilization curve.
+        @param anomalous True when the anomaly detector flagged this sample.
+        @param timestamp Sample time (defaults to now).
+        @param breakdown Optional /proc/meminfo detail (GB) from RAMSensor.
+        @details Updates the text label and appends to the history pyramid,
+                 which redraws the visible range.
+        """
+        self.update_labels(used, total, percent, breakdown)
+        self.record(percent, anomalous, timestamp)
+
+    def update_labels(self, used: float, total: float, percent: float, breakdown: dict = None):
+        """
+        @brief Refreshes the usage and /proc/meminfo lines only (newest sample, visible widget).
         """
         # Professional formatting: Ensures fixed-width appearance for stability
         self.label.setText(f"RAM: {used:>4.1f} / {total:>4.1f} GB ({percent:>5.1f}%)")
-        
-        # Maintain time-series history
-        self.history.pop(0)
-        self.history.append(percent)
-        
-        # Refresh the graph curve data
-        self.curve.setData(self.history)
\ No newline at end of file
+        if breakdown:
+            b = breakdown
+            huge = (f" | huge {b['hugepages_total'] - b['hugepages_free']:.1f}/{b['hugepages_total']:.1f}"
+                    if b['hugepages_total'] else "")
+            self.detail.setText(
+                f"avail {b['available']:.1f} | cache {b['cached']:.1f} | buf {b['buffers']:.2f} | "
+                f"slab {b['slab']:.2f} | shmem {b['shmem']:.2f} | dirty {b['dirty']:.2f} | "
+                f"wb {b['writeback']:.2f} | commit {b['committed']:.1f}/{b['commit_limit']:.1f}{huge} GB"
+            )
+
+    def record(self, percent: float, anomalous: bool = False, timestamp: float = None):
+        """
+        @brief Appends one sample to the history pyramid (drawn on the next flush).
+        """
+        # Maintain time-series history (anomaly marks are NaN unless flagged)
+        self.plot.append(
+            timestamp or time.time(),
+            (percent, percent if anomalous else float('nan'))
+        )
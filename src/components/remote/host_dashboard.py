@@ -0,0 +1,56 @@
+"""
+@file host_dashboard.py
+@brief Per-host dashboard rebuilt from a remote collector's series.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea
+from src.components.cpu.cpu_widget import CPUWidget
+from src.components.ram.ram_widget import RAMWidget
+from src.components.disk.disk_widget import DiskWidget
+from src.components.network.network_widget import NetworkWidget
+
+
+class HostDashboard(QWidget):
+    """
+    @class HostDashboard
+    @brief CPU, RAM, Disk and Network graphs of one remote host.
+    @details Uses the same widgets as the local Dashboard; the values come
+             from the flat series decoded from the collector stream.
+    """
+
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QScrollArea.Shape.NoFrame)
+        content = QWidget()
+        content_layout = QVBoxLayout(content)
+
+        self.cpu_w = CPUWidget()
+        self.ram_w = RAMWidget()
+        self.disk_w = DiskWidget()
+        self.net_w = NetworkWidget()
+        for widget in (self.cpu_w, self.ram_w, self.disk_w, self.net_w):
+            content_layout.addWidget(widget)
+
+        scroll.setWidget(content)
+        layout.addWidget(scroll)
+
+    def update_display(self, timestamp: float, series: dict):
+        """
+        @brief Appends one remote sample to the graphs.
+        @param timestamp Sample time on the remote host.
+        @param series Decoded flat series (missing names are shown as 0).
+        """
+        value = lambda name: series.get(name, 0.0)
+        self.cpu_w.update_display(round(value("cpu.usage"), 1), value("cpu.speed"),
+                                  timestamp=timestamp)
+        self.ram_w.update_display(round(value("ram.percent"), 1), value("ram.used"),
+                                  value("ram.total"), timestamp=timestamp)
+        self.disk_w.update_display(value("disk.read"), value("disk.write"), timestamp=timestamp)
+        self.net_w.update_display(value("net.down"), value("net.up"), timestamp=timestamp)
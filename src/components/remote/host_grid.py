@@ -0,0 +1,141 @@
+"""
+@file host_grid.py
+@brief Summary grid with one row per remote collector.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+import time
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QColor
+
+# (header, series name, format) for the metric columns
+GRID_COLUMNS = (
+    ("CPU %", "cpu.usage", "{:.1f}"),
+    ("RAM %", "ram.percent", "{:.1f}"),
+    ("Disk R MB/s", "disk.read", "{:.2f}"),
+    ("Disk W MB/s", "disk.write", "{:.2f}"),
+    ("Net ⇩ KB/s", "net.down", "{:.1f}"),
+    ("Net ⇧ KB/s", "net.up", "{:.1f}"),
+    ("Max °C", "hardware.max_temp", "{:.0f}"),
+    ("Alerts", "alerts.firing", "{:.0f}"),
+)
+
+# Samples older than this mark the host as stale
+STALE_SECONDS = 5.0
+
+
+class HostGridWidget(QWidget):
+    """
+    @class HostGridWidget
+    @brief One row per collector: link state, headline metrics and link bandwidth.
+    @details Rows are added the first time an address reports; selecting a row
+             asks the Hosts tab to show that host's dashboard.
+    """
+
+    # @param str Collector address of the selected row
+    host_selected = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.title = QLabel("Hosts")
+        self.title.setStyleSheet("font-weight: bold; font-size: 14px; color: #3498db;")
+        layout.addWidget(self.title)
+
+        headers = ["Host", "Status"] + [column[0] for column in GRID_COLUMNS] + ["Link B/s"]
+        self.table = QTableWidget(0, len(headers))
+        self.table.setHorizontalHeaderLabels(headers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        layout.addWidget(self.table)
+
+        self.rows = {}        # address -> row index
+        self.last_seen = {}   # address -> monotonic time of the last sample
+
+    def update_host(self, packet: dict):
+        """
+        @brief Refreshes the row of the collector that sent 'packet'.
+        @param packet Packet from RemoteWorker.
+        """
+        address = packet["address"]
+        row = self.add_host(address)
+        self._set(row, 0, packet["host"], Qt.AlignmentFlag.AlignLeft)
+
+        if packet["connected"]:
+            self.last_seen[address] = time.monotonic()
+            series = packet["series"]
+            for column, (_, name, fmt) in enumerate(GRID_COLUMNS, start=2):
+                value = series.get(name)
+                self._set(row, column, "—" if value is None else fmt.format(value))
+            firing = series.get("alerts.firing", 0)
+            self.table.item(row, 2 + len(GRID_COLUMNS) - 1).setForeground(
+                QColor("#E74C3C" if firing else "#DDDDDD"))
+            bandwidth = packet["bandwidth"]
+            self._set(row, 2 + len(GRID_COLUMNS), f"{bandwidth:.0f}" if bandwidth else "—")
+        self.refresh_status()
+
+    def add_host(self, address: str) -> int:
+        """
+        @brief Adds a row for a collector (shown offline until it reports).
+        @return The row index.
+        """
+        row = self.rows.get(address)
+        if row is None:
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            self.rows[address] = row
+            self._set(row, 0, address, Qt.AlignmentFlag.AlignLeft).setToolTip(address)
+            self.refresh_status()
+        return row
+
+    def refresh_status(self):
+        """
+        @brief Recomputes the Status column (live / stale / offline).
+        """
+        now = time.monotonic()
+        for address, row in self.rows.items():
+            seen = self.last_seen.get(address)
+            if seen is None:
+                text, color = "offline", "#E74C3C"
+            elif now - seen > STALE_SECONDS:
+                text, color = f"stale {now - seen:.0f}s", "#F39C12"
+            else:
+                text, color = "live", "#2ECC71"
+            self._set(row, 1, text).setForeground(QColor(color))
+
+    def mark_offline(self, address: str):
+        """
+        @brief Flags a collector whose link dropped.
+        """
+        self.last_seen.pop(address, None)
+        self.refresh_status()
+
+    def _set(self, row: int, column: int, text: str,
+             alignment=Qt.AlignmentFlag.AlignRight) -> QTableWidgetItem:
+        """
+        @brief Updates a cell in place (items are created once).
+        """
+        item = self.table.item(row, column)
+        if item is None:
+            item = QTableWidgetItem()
+            item.setTextAlignment(alignment | Qt.AlignmentFlag.AlignVCenter)
+            self.table.setItem(row, column, item)
+        item.setText(text)
+        return item
+
+    def _on_selection_changed(self):
+        """
+        @brief Emits the address of the selected host.
+        """
+        items = self.table.selectedItems()
+        if items:
+            self.host_selected.emit(self.table.item(items[0].row(), 0).toolTip())
@@ -5,3 +5,116 @@
 
 # Telemetry Settings
 MAX_PROCESSES = 20  # Total rows in the Process Monitor
+
+# Alerting Engine
+# Each rule is compiled once by src/core/alerts.py and evaluated on every packet.
+#   metric : dotted packet path ('cpu.usage', 'disk.write', 'user_processes.max.cpu')
+#   kind   : 'threshold' (raw value), 'ewma' (smoothed, uses 'alpha') or 'rate' (units/s)
+#   op     : '>', '>=', '<' or '<='
+#   value  : firing level; 'clear' is the hysteresis level to resolve (defaults to 'value',
+#            must not lie on the firing side of it)
+#   for    : hold duration in seconds before the alert fires
+ALERT_RULES = [
+    {"name": "CPU saturated", "metric": "cpu.usage", "op": ">", "value": 90.0,
+     "clear": 80.0, "for": 30, "severity": "critical"},
+    {"name": "RAM pressure", "metric": "ram.percent", "kind": "ewma", "alpha": 0.2,
+     "op": ">", "value": 90.0, "clear": 85.0, "for": 10},
+    {"name": "Disk write burst", "metric": "disk.write", "op": ">", "value": 500.0,
+     "clear": 400.0},
+    {"name": "Network ingress surge", "metric": "net.down", "kind": "ewma", "alpha": 0.3,
+     "op": ">", "value": 50000.0, "clear": 25000.0, "for": 10},
+    {"name": "Runaway process", "metric": "user_processes.max.cpu", "op": ">",
+     "value": 95.0, "clear": 80.0, "for": 60},
+]
+ALERT_LOG_PATH = "~/.local/state/linuxhealth/alerts.log"  # None disables the file sink
+ALERT_SOCKET_PATH = None  # e.g. "/run/user/1000/linuxhealth-alerts.sock" (AF_UNIX datagram)
+ALERT_HISTORY_SIZE = 200  # Transitions retained in the Alerts tab
+
+# Anomaly Detection (see src/core/anomaly.py)
+HISTORY_CAPACITY = 600           # Samples kept per series for rolling baselines
+ANOMALY_WINDOW = 120             # Rolling baseline length in samples
+ANOMALY_METHOD = "mad"           # 'mad' (robust) or 'zscore'
+ANOMALY_THRESHOLD = 5.0          # Score above which a sample is anomalous
+ANOMALY_MIN_SCALE = 1.0          # Spread noise floor in metric units (%, MB/s, KB/s)
+ANOMALY_SEASONAL_PERIOD = 86400  # Seasonal baseline period in seconds (daily)
+ANOMALY_SEASONAL_BINS = 96       # 15-minute time-of-day bins
+
+# Burst Sampling (see src/core/burst.py)
+BURST_MIN_RATE = 50        # Hz
+BURST_MAX_RATE = 200       # Hz
+BURST_MAX_SECONDS = 30     # Upper bound on a single capture window
+
+# History Graphs (see src/components/common/history_plot.py)
+LIVE_WINDOW_SECONDS = 60               # Visible span while following live data
+HISTORY_RETENTION_SAMPLES = 7 * 86400  # One week of 1Hz samples per graph (allocated as it fills)
+
+# Thread Drill-down (see src/core/thread_worker.py)
+THREAD_SAMPLING_INTERVAL_MS = 250  # Refresh period for the selected process's threads
+
+# PSS Sampling (see src/components/processes/user/pss_sampler.py)
+PSS_REFRESH_BUDGET = 5      # Max smaps_rollup reads per sampling cycle
+PSS_REFRESH_INTERVAL = 10   # Seconds before a process's PSS is re-read
+
+# Short-lived Process Capture (see src/core/spawn_worker.py)
+SPAWN_SCAN_HZ = 20          # PID-set scans per second
+SPAWN_TRACK_SECONDS = 5     # Young processes whose CPU time is followed every scan
+SPAWN_TRACK_LIMIT = 512     # Upper bound on followed young processes
+SPAWN_LOG_SIZE = 2000       # Birth/exit events kept by the scanner and the UI
+
+# Process Lifecycle Log (see src/core/event_log.py)
+PROCESS_EVENT_LOG_SIZE = 50000     # Events kept before the oldest half is compacted
+PROCESS_EVENT_CPU_DELTA = 25.0     # CPU % swing reported as a 'change' event
+PROCESS_EVENT_RAM_DELTA_MB = 100   # RSS swing (MB, or 50% if larger) reported as 'change'
+
+# Process Tree (see src/components/processes/tree/)
+PROCESS_TREE_CHILD_LIMIT = 500     # Rows per level before the tail is folded into "... N more"
+
+# Socket Attribution (see src/components/processes/user/socket_sampler.py)
+SOCKET_SCAN_BUDGET = 10      # Max /proc/<pid>/fd walks per sampling cycle
+SOCKET_SCAN_INTERVAL = 30    # Seconds before an unchanged process's fds are re-walked
+
+# Hardware Sensors (see src/components/hardware/)
+HARDWARE_PLOT_SERIES = 8     # Temperature / power inputs drawn per graph (the rest are listed only)
+
+# NUMA Residency (see src/components/numa/residency_sampler.py)
+NUMA_RESIDENCY_BUDGET = 3      # Max numa_maps reads per sampling cycle
+NUMA_RESIDENCY_INTERVAL = 30   # Seconds before a process's node residency is re-read
+
+# Rendering (see src/core/render_scheduler.py)
+RENDER_MAX_FPS = 30          # Upper bound on batched GUI updates per second
+
+# Sampling Governor (see src/core/governor.py)
+GOVERNOR_CPU_BUDGET = 0.01     # Collector CPU time per second (0.01 = 1% of one core)
+GOVERNOR_MIN_INTERVAL = 1.0    # Seconds; shortest interval (sample-count windows assume ~1Hz)
+GOVERNOR_MAX_INTERVAL = 5.0    # Seconds; beyond this, sheddable sensors are dropped
+GOVERNOR_SHEDDABLE = ("process_details", "interrupts", "kernel", "numa", "hardware", "activity")
+
+# Telemetry Export (see src/core/exporter.py)
+EXPORT_FORMAT = None           # None disables; 'csv', 'parquet' or 'arrow' (pyarrow needed for the last two)
+EXPORT_DIRECTORY = "~/.local/state/linuxhealth/export"
+EXPORT_BATCH_ROWS = 60         # Samples per write (CSV block / Parquet row group / Arrow batch)
+EXPORT_FLUSH_SECONDS = 10      # Maximum age of a partial batch before it is written
+EXPORT_ROTATE_ROWS = 3600      # Rows per file (one hour at 1Hz)
+EXPORT_KEEP_FILES = 48         # Newest files kept (0 keeps all)
+EXPORT_QUEUE_SIZE = 600        # Samples buffered while the disk is slow
+EXPORT_BACKPRESSURE = "drop_oldest"  # Full queue: 'drop_oldest' or 'drop_newest'
+
+# Multi-host Aggregation (see src/core/collector.py and src/core/remote_worker.py)
+REMOTE_COLLECTORS = []            # e.g. ["unix:/tmp/lhm-a.sock", "db01:7300"]; --connect adds more
+REMOTE_RECONNECT_SECONDS = 5      # Delay before retrying an unreachable collector
+REMOTE_CLIENT_BUFFER_BYTES = 1 << 20  # Unsent bytes after which a collector drops a slow GUI
+
+# History Store & Queries (see src/core/store.py and src/core/query.py)
+STORE_DIRECTORY = None         # e.g. "~/.local/state/linuxhealth/store"; None disables
+STORE_PROCESS_ROWS = 10        # Busiest processes kept per sample (by CPU and by RSS)
+STORE_RETENTION_DAYS = 14      # Day partitions kept (0 keeps all)
+
+# Sensor Selection (see src/core/worker.py)
+SENSOR_INTERVALS = {}          # Minimum seconds between reads per section, e.g. {"hardware": 5}; reused in between
+DISABLED_SENSORS = []          # Sections never read; same names as GOVERNOR_SHEDDABLE
+DISK_DEVICES = []              # fnmatch patterns ('!' excludes), e.g. ["sd?", "nvme?n1"]; [] = all
+NET_INTERFACES = []            # e.g. ["!lo", "!veth*"]; totals become the sum of the selected devices
+
+# Layered Overrides (see src/core/settings.py): TOML files re-applied live on change
+from src.core.settings import apply_layers as _apply_layers
+_apply_layers(globals())
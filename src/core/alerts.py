@@ -0,0 +1,289 @@
+"""
+@file alerts.py
+@brief Incremental rule engine evaluating alerts against the telemetry stream.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+import json
+import socket
+import logging
+import operator
+
+# Comparison operators accepted in rule definitions
+_OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+# Clear comparison for each operator: the exact complement of the firing condition
+_CLEAR_OPERATORS = {
+    ">": operator.le,
+    ">=": operator.lt,
+    "<": operator.ge,
+    "<=": operator.gt,
+}
+
+# Reducers for list-valued packet fields (e.g. 'user_processes.max.cpu')
+_REDUCERS = {
+    "max": max,
+    "min": min,
+    "sum": sum,
+}
+
+
+def compile_metric(path: str):
+    """
+    @brief Compiles a dotted metric path into a packet accessor.
+    @param path Dotted path such as 'cpu.usage' or 'user_processes.max.cpu'.
+    @return A callable mapping a telemetry packet to a float (or None).
+    @details Paths are resolved once at rule load time so that evaluation
+             does not re-parse strings on every sample. A reducer segment
+             ('max', 'min', 'sum') folds a list of records on the next field.
+    """
+    parts = path.split(".")
+    if len(parts) == 3 and parts[1] in _REDUCERS:
+        section, reducer_name, field = parts
+        reducer = _REDUCERS[reducer_name]
+
+        def getter(packet):
+            rows = packet.get(section) or []
+            values = [row[field] for row in rows if field in row]
+            return float(reducer(values)) if values else None
+        return getter
+
+    if len(parts) == 2:
+        section, field = parts
+
+        def getter(packet):
+            value = packet.get(section, {}).get(field)
+            return None if value is None else float(value)
+        return getter
+
+    raise ValueError(f"Unsupported metric path: '{path}'")
+
+
+class AlertRule:
+    """
+    @class AlertRule
+    @brief A single compiled alert rule with its own streaming state.
+    @details Supports three signal kinds, all evaluated in O(1) per sample:
+             - 'threshold': the raw metric value.
+             - 'ewma':      an exponentially weighted moving average.
+             - 'rate':      the rate of change in units per second.
+             Hysteresis is provided by a separate 'clear' level and a hold
+             duration ('for', in seconds) the condition must persist for.
+    """
+
+    def __init__(self, spec: dict):
+        """
+        @brief Compiles a rule definition from the configuration.
+        @param spec Rule dictionary (see ALERT_RULES in src/config.py).
+        """
+        self.name = spec["name"]
+        self.metric = spec["metric"]
+        self.kind = spec.get("kind", "threshold")
+        self.severity = spec.get("severity", "warning")
+        self.threshold = float(spec["value"])
+        self.clear_level = float(spec.get("clear", self.threshold))
+        self.hold = float(spec.get("for", 0))
+        self.alpha = float(spec.get("alpha", 0.3))
+
+        op = spec.get("op", ">")
+        if op not in _OPERATORS:
+            raise ValueError(f"Unsupported operator '{op}' in rule '{self.name}'")
+        if self.kind not in ("threshold", "ewma", "rate"):
+            raise ValueError(f"Unsupported rule kind '{self.kind}' in rule '{self.name}'")
+        # A clear level on the firing side would resolve on the very condition that fires
+        if op.startswith(">"):
+            overlaps = self.clear_level > self.threshold
+        else:
+            overlaps = self.clear_level < self.threshold
+        if overlaps:
+            raise ValueError(f"Clear level {self.clear_level:g} is on the firing side of "
+                             f"'{op} {self.threshold:g}' in rule '{self.name}'")
+        self.op = op
+        self._fire_cmp = _OPERATORS[op]
+        # The clear condition is the inverse comparison against the clear level
+        self._clear_cmp = _CLEAR_OPERATORS[op]
+        self._get = compile_metric(self.metric)
+
+        # Streaming state
+        self._ewma = None
+        self._last_value = None
+        self._last_time = None
+        self._pending_since = None
+        self.firing = False
+        self.fired_at = None
+        self.signal = None
+
+    def _signal(self, value: float, now: float):
+        """
+        @brief Derives the monitored signal from the raw metric value.
+        @return The signal value, or None while the rule is still warming up.
+        """
+        if self.kind == "ewma":
+            if self._ewma is None:
+                self._ewma = value
+            else:
+                self._ewma += self.alpha * (value - self._ewma)
+            return self._ewma
+
+        if self.kind == "rate":
+            prev_value, prev_time = self._last_value, self._last_time
+            self._last_value, self._last_time = value, now
+            if prev_time is None or now <= prev_time:
+                return None
+            return (value - prev_value) / (now - prev_time)
+
+        return value
+
+    def evaluate(self, packet: dict, now: float):
+        """
+        @brief Advances the rule state machine by one sample.
+        @param packet The telemetry packet emitted by GlobalWorker.
+        @param now Sample timestamp (seconds since epoch).
+        @return 'firing' or 'resolved' on a state transition, otherwise None.
+        """
+        value = self._get(packet)
+        if value is None:
+            return None
+
+        signal = self._signal(value, now)
+        if signal is None:
+            return None
+        self.signal = signal
+
+        if not self.firing:
+            if self._fire_cmp(signal, self.threshold):
+                if self._pending_since is None:
+                    self._pending_since = now
+                if now - self._pending_since >= self.hold:
+                    self.firing = True
+                    self.fired_at = now
+                    return "firing"
+            else:
+                self._pending_since = None
+            return None
+
+        if self._clear_cmp(signal, self.clear_level):
+            self.firing = False
+            self._pending_since = None
+            return "resolved"
+        return None
+
+    def describe(self) -> str:
+        """
+        @brief Human readable condition, e.g. 'cpu.usage > 90.0 for 30s'.
+        """
+        prefix = {"ewma": "ewma(", "rate": "rate("}.get(self.kind, "")
+        suffix = ")" if prefix else ""
+        text = f"{prefix}{self.metric}{suffix} {self.op} {self.threshold:g}"
+        if self.hold:
+            text += f" for {self.hold:g}s"
+        return text
+
+
+class AlertEngine:
+    """
+    @class AlertEngine
+    @brief Evaluates all compiled rules against each telemetry packet.
+    @details Rules keep constant-size state (last value, EWMA, pending time),
+             so each packet costs O(rules) and never rescans history.
+             Transitions are forwarded to the configured log and socket sinks.
+    """
+
+    def __init__(self, rules: list, log_path: str = None, socket_path: str = None):
+        """
+        @brief Compiles the rule set and opens the notification sinks.
+        @param rules List of rule dictionaries.
+        @param log_path Optional file path receiving one line per transition.
+        @param socket_path Optional Unix datagram socket receiving JSON events.
+        """
+        self.rules = []
+        for spec in rules:
+            try:
+                self.rules.append(AlertRule(spec))
+            except (KeyError, ValueError) as e:
+                logging.error(f"Skipping invalid alert rule {spec!r}: {e}")
+
+        self._logger = logging.getLogger("linuxhealth.alerts")
+        if log_path:
+            try:
+                path = os.path.expanduser(log_path)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                handler = logging.FileHandler(path)
+                handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+                self._logger.addHandler(handler)
+            except OSError as e:
+                logging.warning(f"Alert log unavailable ({log_path}): {e}")
+
+        self._socket = None
+        self._socket_path = socket_path
+        if socket_path:
+            try:
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._socket.setblocking(False)
+            except OSError as e:
+                logging.warning(f"Alert socket unavailable ({socket_path}): {e}")
+
+    def evaluate(self, packet: dict) -> dict:
+        """
+        @brief Runs every rule against a telemetry packet.
+        @param packet The telemetry packet (must carry a 'timestamp' key).
+        @return A dictionary containing:
+            - 'active' (list): Currently firing alerts.
+            - 'events' (list): Transitions produced by this sample.
+        """
+        now = packet.get("timestamp", 0.0)
+        events = []
+        active = []
+
+        for rule in self.rules:
+            try:
+                transition = rule.evaluate(packet, now)
+            except Exception as e:
+                logging.warning(f"Alert rule '{rule.name}' failed: {e}")
+                continue
+
+            if transition:
+                event = self._make_record(rule, now)
+                event["state"] = transition
+                events.append(event)
+                self._notify(event)
+
+            if rule.firing:
+                active.append(self._make_record(rule, rule.fired_at))
+
+        return {"active": active, "events": events}
+
+    def _make_record(self, rule: AlertRule, when: float) -> dict:
+        """
+        @brief Serialises the rule state into a plain dictionary.
+        """
+        return {
+            "name": rule.name,
+            "severity": rule.severity,
+            "condition": rule.describe(),
+            "value": round(rule.signal, 2) if rule.signal is not None else None,
+            "time": when,
+        }
+
+    def _notify(self, event: dict):
+        """
+        @brief Sends a transition to the log and socket sinks.
+        @note Socket delivery is best effort: a missing listener never
+              stalls the sampling thread.
+        """
+        self._logger.warning(
+            f"[{event['state'].upper()}] {event['name']}: "
+            f"{event['condition']} (value={event['value']})"
+        )
+        if self._socket is not None:
+            try:
+                self._socket.sendto(json.dumps(event).encode(), self._socket_path)
+            except OSError:
+                pass
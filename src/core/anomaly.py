@@ -0,0 +1,139 @@
+"""
+@file anomaly.py
+@brief Vectorized rolling and seasonal anomaly scoring over metric history.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import time
+import warnings
+import numpy as np
+from src.core.history import MetricHistory
+
+# Consistency constant turning the median absolute deviation into a sigma estimate
+MAD_TO_SIGMA = 1.4826
+
+
+class AnomalyDetector:
+    """
+    @class AnomalyDetector
+    @brief Scores the newest sample of every series against its recent past.
+    @details Two baselines are maintained, both as whole-matrix numpy operations
+             so that cost grows with the number of series, not with Python loops:
+             - Rolling: z-score (mean/std) or robust MAD score over the last
+               'window' samples of every series in a MetricHistory.
+             - Seasonal: per time-of-period bins holding an exponentially
+               weighted mean/variance, so that recurring patterns (nightly
+               backups, cron bursts) are not reported as anomalies.
+             A sample is anomalous when its rolling score exceeds the threshold
+             and, once the seasonal bin is warm, its seasonal score does too.
+    """
+
+    def __init__(self, history: MetricHistory, window: int, threshold: float,
+                 method: str = "mad", min_scale: float = 1.0,
+                 period: float = 86400, bins: int = 96,
+                 seasonal_alpha: float = 0.001, seasonal_min_count: int = 1800):
+        """
+        @brief Configures the detector.
+        @param history Shared history buffer the worker records into.
+        @param window Number of past samples forming the rolling baseline.
+        @param threshold Score above which a sample is considered anomalous.
+        @param method 'zscore' or 'mad'.
+        @param min_scale Noise floor (in metric units) for the spread estimate,
+               preventing idle series (0 MB/s disk) from flagging tiny blips.
+        @param period Seasonal period in seconds.
+        @param bins Number of seasonal bins per period.
+        @param seasonal_alpha EWMA weight of a new sample in its seasonal bin.
+        @param seasonal_min_count Samples a bin needs before it is trusted.
+        """
+        if method not in ("zscore", "mad"):
+            raise ValueError(f"Unsupported anomaly method '{method}'")
+        self.history = history
+        self.window = window
+        self.threshold = threshold
+        self.method = method
+        self.min_scale = min_scale
+        self.period = period
+        self.bins = bins
+        self.seasonal_alpha = seasonal_alpha
+        self.seasonal_min_count = seasonal_min_count
+
+        # Seasonal state: one row per series, one column per bin
+        self._s_mean = np.zeros((0, bins))
+        self._s_var = np.zeros((0, bins))
+        self._s_count = np.zeros((0, bins), dtype=np.int64)
+
+    def _rolling_scores(self, baseline: np.ndarray, latest: np.ndarray) -> np.ndarray:
+        """
+        @brief Scores the latest column against the preceding window.
+        @return Absolute scores per series (NaN where the baseline is empty).
+        """
+        with warnings.catch_warnings():
+            # All-NaN rows (series that just appeared) legitimately yield NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            if self.method == "zscore":
+                center = np.nanmean(baseline, axis=1)
+                spread = np.nanstd(baseline, axis=1)
+            else:
+                center = np.nanmedian(baseline, axis=1)
+                spread = MAD_TO_SIGMA * np.nanmedian(
+                    np.abs(baseline - center[:, None]), axis=1
+                )
+        spread = np.maximum(spread, self.min_scale)
+        return np.abs(latest - center) / spread
+
+    def _seasonal_scores(self, latest: np.ndarray, now: float) -> np.ndarray:
+        """
+        @brief Scores the latest column against its seasonal bin, then updates the bin.
+        @return Absolute scores per series (NaN while a bin is still warming up).
+        """
+        rows = latest.shape[0]
+        if rows > self._s_mean.shape[0]:
+            grow = rows - self._s_mean.shape[0]
+            self._s_mean = np.vstack((self._s_mean, np.zeros((grow, self.bins))))
+            self._s_var = np.vstack((self._s_var, np.zeros((grow, self.bins))))
+            self._s_count = np.vstack((self._s_count, np.zeros((grow, self.bins), dtype=np.int64)))
+
+        column = int((now % self.period) / self.period * self.bins)
+        mean = self._s_mean[:rows, column]
+        var = self._s_var[:rows, column]
+        count = self._s_count[:rows, column]
+
+        spread = np.maximum(np.sqrt(var), self.min_scale)
+        scores = np.abs(latest - mean) / spread
+        scores[count < self.seasonal_min_count] = np.nan
+
+        # Exponentially weighted update of the bin (first sample seeds the mean);
+        # a series missing from this sample leaves its bin untouched
+        valid = ~np.isnan(latest)
+        alpha = np.where(valid, np.where(count == 0, 1.0, self.seasonal_alpha), 0.0)
+        delta = np.where(valid, latest - mean, 0.0)
+        mean += alpha * delta
+        var[:] = (1 - alpha) * (var + alpha * delta * delta)
+        count += valid
+        return scores
+
+    def evaluate(self, now: float = None) -> dict:
+        """
+        @brief Scores the most recently recorded sample of every series.
+        @param now Sample timestamp used to select the seasonal bin.
+        @return Mapping of anomalous series name to its rolling score.
+        """
+        now = time.time() if now is None else now
+        matrix = self.history.window(self.window + 1)
+        if matrix.shape[1] < 2:
+            return {}
+
+        baseline, latest = matrix[:, :-1], matrix[:, -1]
+        rolling = self._rolling_scores(baseline, latest)
+        seasonal = self._seasonal_scores(latest, now)
+
+        # Require enough rolling context before trusting the score
+        enough = np.count_nonzero(~np.isnan(baseline), axis=1) >= min(self.window, 10)
+        flagged = enough & (rolling > self.threshold)
+        flagged &= np.isnan(seasonal) | (seasonal > self.threshold)
+
+        return {
+            self.history.names[row]: round(float(rolling[row]), 1)
+            for row in np.flatnonzero(flagged)
+        }
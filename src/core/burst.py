@@ -0,0 +1,265 @@
+"""
+@file burst.py
+@brief On-demand high-frequency sampler with per-pixel envelope decimation.
+@project Linux Health Monitor Pro
+@dependencies PyQt6, numpy
+"""
+
+import os
+import time
+import logging
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+from src.config import BURST_MIN_RATE, BURST_MAX_RATE, BURST_MAX_SECONDS
+
+# Sector size used by /proc/diskstats regardless of the device's physical sector size
+SECTOR_BYTES = 512
+
+# Series produced by every burst sample (order matches the raw sample vector)
+BURST_SERIES = ("cpu", "disk_read", "disk_write", "net_down", "net_up")
+
+
+class EnvelopeDecimator:
+    """
+    @class EnvelopeDecimator
+    @brief Folds a raw sample stream into fixed-size min/max/mean buckets.
+    @details The bucket size is chosen so that the whole capture maps onto
+             'pixels' buckets. Each incoming sample only updates running
+             accumulators (O(1)); a bucket is materialised when it is full.
+    """
+
+    def __init__(self, series: int, total_samples: int, pixels: int):
+        """
+        @param series Number of parallel series per sample.
+        @param total_samples Expected number of samples in the capture.
+        @param pixels Number of display columns the capture will be drawn on.
+        """
+        self.per_bucket = max(1, int(np.ceil(total_samples / max(1, pixels))))
+        buckets = int(np.ceil(total_samples / self.per_bucket))
+        self.mins = np.zeros((series, buckets))
+        self.maxs = np.zeros((series, buckets))
+        self.means = np.zeros((series, buckets))
+        self.times = np.zeros(buckets)
+        self.filled = 0
+
+        self._min = np.full(series, np.inf)
+        self._max = np.full(series, -np.inf)
+        self._sum = np.zeros(series)
+        self._count = 0
+
+    def push(self, t: float, sample: np.ndarray):
+        """
+        @brief Accumulates one raw sample into the current bucket.
+        """
+        np.minimum(self._min, sample, out=self._min)
+        np.maximum(self._max, sample, out=self._max)
+        self._sum += sample
+        self._count += 1
+        if self._count >= self.per_bucket:
+            self.flush(t)
+
+    def flush(self, t: float):
+        """
+        @brief Closes the current (possibly partial) bucket.
+        """
+        if self._count == 0 or self.filled >= self.times.size:
+            return
+        column = self.filled
+        self.mins[:, column] = self._min
+        self.maxs[:, column] = self._max
+        self.means[:, column] = self._sum / self._count
+        self.times[column] = t
+        self.filled += 1
+
+        self._min.fill(np.inf)
+        self._max.fill(-np.inf)
+        self._sum.fill(0.0)
+        self._count = 0
+
+    def snapshot(self) -> dict:
+        """
+        @brief Copies the completed buckets into a GUI-safe dictionary.
+        @return {'t': [...], '<series>': {'min', 'max', 'mean'}} per BURST_SERIES.
+        """
+        n = self.filled
+        envelope = {"t": self.times[:n].copy()}
+        for row, name in enumerate(BURST_SERIES):
+            envelope[name] = {
+                "min": self.mins[row, :n].copy(),
+                "max": self.maxs[row, :n].copy(),
+                "mean": self.means[row, :n].copy(),
+            }
+        return envelope
+
+
+class BurstSampler(QThread):
+    """
+    @class BurstSampler
+    @brief Samples CPU, disk and network counters at 50-200Hz for a bounded window.
+    @details Counters are read straight from /proc through file descriptors
+             opened once per capture, and converted into rates against the
+             previous sample. The raw stream never leaves this thread: only
+             decimated envelopes are emitted, at most ~10 times per second.
+    """
+
+    # Emitted with the decimated envelope (see EnvelopeDecimator.snapshot)
+    # plus 'rate', 'elapsed' and 'done' keys.
+    envelope_ready = pyqtSignal(dict)
+
+    # Emitted once per capture request with how it ended: 'done', 'aborted',
+    # 'failed' (see the log), or 'busy' when a capture was already running
+    capture_finished = pyqtSignal(str)
+
+    # Minimum delay between two progress emissions to the GUI thread
+    EMIT_INTERVAL = 0.1
+
+    def __init__(self):
+        super().__init__()
+        self.rate = BURST_MIN_RATE
+        self.seconds = 5.0
+        self.pixels = 600
+        self._abort = False
+
+        # Whole block devices only; partitions would double count traffic
+        try:
+            self._disks = {
+                name.encode() for name in os.listdir("/sys/block")
+                if not name.startswith(("loop", "ram", "zram"))
+            }
+        except OSError:
+            self._disks = set()
+
+    def start_capture(self, rate: int, seconds: float, pixels: int):
+        """
+        @brief Launches a capture unless one is already in progress.
+        @param rate Requested sampling rate in Hz (clamped to the configured bounds).
+        @param seconds Capture length (clamped to BURST_MAX_SECONDS).
+        @param pixels Width in pixels of the plot the envelope will be drawn on.
+        """
+        if self.isRunning():
+            self.capture_finished.emit("busy")
+            return
+        self.rate = min(max(int(rate), BURST_MIN_RATE), BURST_MAX_RATE)
+        self.seconds = min(max(float(seconds), 0.5), BURST_MAX_SECONDS)
+        self.pixels = max(1, int(pixels))
+        self._abort = False
+        self.start()
+
+    def stop(self):
+        """
+        @brief Aborts a running capture and waits for the thread to exit.
+        """
+        self._abort = True
+        self.wait()
+
+    @staticmethod
+    def _read(fd: int) -> bytes:
+        """
+        @brief Reads a whole procfs file from offset 0 through an open descriptor.
+        """
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(fd, 65536, offset)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            offset += len(chunk)
+        return b"".join(chunks)
+
+    def _read_counters(self, fds: dict) -> np.ndarray:
+        """
+        @brief Reads the raw cumulative counters.
+        @return [cpu_busy_ticks, cpu_total_ticks, read_bytes, write_bytes, rx_bytes, tx_bytes]
+        """
+        # First line of /proc/stat: "cpu user nice system idle iowait irq softirq steal ..."
+        stat = os.pread(fds["stat"], 512, 0)
+        fields = stat.split(b"\n", 1)[0].split()[1:9]
+        ticks = [int(v) for v in fields]
+        total = sum(ticks)
+        busy = total - ticks[3] - ticks[4]
+
+        read_bytes = write_bytes = 0
+        for line in self._read(fds["diskstats"]).splitlines():
+            parts = line.split()
+            if len(parts) > 9 and parts[2] in self._disks:
+                read_bytes += int(parts[5]) * SECTOR_BYTES
+                write_bytes += int(parts[9]) * SECTOR_BYTES
+
+        rx = tx = 0
+        for line in self._read(fds["net"]).splitlines()[2:]:
+            _, _, data = line.partition(b":")
+            parts = data.split()
+            if len(parts) >= 9:
+                rx += int(parts[0])
+                tx += int(parts[8])
+
+        return np.array([busy, total, read_bytes, write_bytes, rx, tx], dtype=np.float64)
+
+    def run(self):
+        """
+        @brief Capture loop: sample on a fixed deadline grid, decimate, emit envelopes.
+        """
+        paths = {"stat": "/proc/stat", "diskstats": "/proc/diskstats", "net": "/proc/net/dev"}
+        fds = {}
+        status = "failed"
+        try:
+            for key, path in paths.items():
+                fds[key] = os.open(path, os.O_RDONLY)
+
+            period = 1.0 / self.rate
+            total_samples = int(self.rate * self.seconds)
+            decimator = EnvelopeDecimator(len(BURST_SERIES), total_samples, self.pixels)
+            sample = np.zeros(len(BURST_SERIES))
+
+            start = time.perf_counter()
+            prev_t = start
+            prev = self._read_counters(fds)
+            last_emit = start
+
+            for index in range(1, total_samples + 1):
+                if self._abort:
+                    break
+                # Deadline-based scheduling avoids drift from read/processing time
+                delay = start + index * period - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                now = time.perf_counter()
+                curr = self._read_counters(fds)
+                dt = now - prev_t
+                delta = curr - prev
+                prev, prev_t = curr, now
+                if dt <= 0:
+                    continue
+
+                sample[0] = 100.0 * delta[0] / delta[1] if delta[1] > 0 else 0.0
+                sample[1] = delta[2] / dt / (1024 * 1024)   # MB/s
+                sample[2] = delta[3] / dt / (1024 * 1024)   # MB/s
+                sample[3] = delta[4] / dt / 1024            # KB/s
+                sample[4] = delta[5] / dt / 1024            # KB/s
+                decimator.push(now - start, sample)
+
+                if now - last_emit >= self.EMIT_INTERVAL:
+                    last_emit = now
+                    self._emit(decimator, now - start, done=False)
+
+            decimator.flush(time.perf_counter() - start)
+            self._emit(decimator, time.perf_counter() - start, done=True)
+            status = "aborted" if self._abort else "done"
+
+        except Exception as e:
+            logging.error(f"Burst sampling failed: {e}")
+        finally:
+            for fd in fds.values():
+                os.close(fd)
+            # Always tell the GUI the capture is over, so its controls are released
+            self.capture_finished.emit(status)
+
+    def _emit(self, decimator: EnvelopeDecimator, elapsed: float, done: bool):
+        """
+        @brief Sends the current envelope snapshot to the GUI thread.
+        """
+        envelope = decimator.snapshot()
+        envelope.update({"rate": self.rate, "elapsed": round(elapsed, 2), "done": done})
+        self.envelope_ready.emit(envelope)
@@ -0,0 +1,289 @@
+"""
+@file collector.py
+@brief Headless collector streaming telemetry to remote GUIs over Unix or TCP sockets.
+@project Linux Health Monitor Pro
+@dependencies PyQt6, psutil (live mode only)
+
+Usage:
+    python -m src.core.collector --listen unix:/tmp/lhm-a.sock
+    python -m src.core.collector --listen 0.0.0.0:7300 --name db01
+    python -m src.core.collector --listen unix:/tmp/lhm-b.sock --synthetic --name fake-b
+    python -m src.core.collector --listen unix:/tmp/lhm-c.sock --replay export.csv --speed 10
+"""
+
+import os
+import sys
+import csv
+import math
+import time
+import random
+import signal
+import socket
+import logging
+import argparse
+import selectors
+import threading
+from src.core.history import flatten_packet
+from src.core.remote_protocol import FrameEncoder, parse_address
+from src.config import REMOTE_CLIENT_BUFFER_BYTES
+
+
+def remote_series(packet: dict) -> dict:
+    """
+    @brief Extends the dashboard series with what a remote host view needs.
+    @param packet The telemetry packet emitted by GlobalWorker.
+    @return flatten_packet() plus 'cpu.speed', 'ram.used', 'ram.total' and 'alerts.firing'.
+    """
+    series = flatten_packet(packet)
+    cpu = packet.get("cpu", {})
+    if "speed" in cpu:
+        series["cpu.speed"] = cpu["speed"]
+    ram = packet.get("ram", {})
+    for field in ("used", "total"):
+        if field in ram:
+            series[f"ram.{field}"] = ram[field]
+    if "alerts" in packet:
+        series["alerts.firing"] = len(packet["alerts"].get("active", []))
+    return series
+
+
+class CollectorServer:
+    """
+    @class CollectorServer
+    @brief Accepts GUI connections and fans the encoded stream out to them.
+    @details publish() encodes each sample once (FrameEncoder) and appends
+             the bytes to every client's outgoing buffer; a selector thread
+             does the non-blocking sends. A client whose buffer grows past
+             'buffer_limit' (stalled or too slow) is disconnected rather than
+             slowing the collector down; it resynchronises from a snapshot
+             when it reconnects.
+    """
+
+    def __init__(self, address: str, host: str, buffer_limit: int = REMOTE_CLIENT_BUFFER_BYTES):
+        """
+        @param address Listen address ('unix:/path' or 'host:port').
+        @param host Host name announced to clients.
+        @param buffer_limit Maximum unsent bytes per client.
+        """
+        family, target = parse_address(address)
+        if family == socket.AF_UNIX and os.path.exists(target):
+            os.unlink(target)   # Stale socket from a previous run
+        self.listener = socket.socket(family, socket.SOCK_STREAM)
+        if family != socket.AF_UNIX:
+            self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(target)
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.path = target if family == socket.AF_UNIX else None
+
+        self.encoder = FrameEncoder(host)
+        self.buffer_limit = buffer_limit
+        self.clients = {}       # socket -> bytearray of unsent bytes
+        self.sent = 0
+        self._lock = threading.Lock()
+        self._running = True
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ)
+        # Self-pipe so publish() can wake the selector when there is data to send
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self.selector.register(self._wake_r, selectors.EVENT_READ)
+
+        self._thread = threading.Thread(target=self._run, name="CollectorServer", daemon=True)
+        self._thread.start()
+        logging.info(f"Collector '{host}' listening on {address}")
+
+    def publish(self, timestamp: float, series: dict):
+        """
+        @brief Encodes one sample and queues it for every connected client.
+        """
+        with self._lock:
+            data = self.encoder.encode(timestamp, series)
+            for client, pending in list(self.clients.items()):
+                if len(pending) + len(data) > self.buffer_limit:
+                    logging.warning("Collector: dropping a client that stopped reading")
+                    self._drop(client)
+                else:
+                    pending += data
+        try:
+            os.write(self._wake_w, b"x")
+        except BlockingIOError:
+            pass   # Already signalled
+
+    def _run(self):
+        """
+        @brief Selector loop: accepts clients and flushes their buffers.
+        """
+        while self._running:
+            for key, _ in self.selector.select(timeout=1.0):
+                if key.fileobj is self.listener:
+                    self._accept()
+                elif key.fileobj == self._wake_r:
+                    try:
+                        os.read(self._wake_r, 4096)
+                    except BlockingIOError:
+                        pass
+            self._flush()
+
+    def _accept(self):
+        """
+        @brief Accepts a client and sends it the current state.
+        """
+        try:
+            client, _ = self.listener.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        client.setblocking(False)
+        with self._lock:
+            self.clients[client] = bytearray(self.encoder.snapshot())
+        logging.info(f"Collector: client connected ({len(self.clients)} total)")
+
+    def _flush(self):
+        """
+        @brief Sends as much of every client's buffer as the socket accepts.
+        """
+        with self._lock:
+            for client, pending in list(self.clients.items()):
+                if not pending:
+                    continue
+                try:
+                    written = client.send(pending)
+                    del pending[:written]
+                    self.sent += written
+                except (BlockingIOError, InterruptedError):
+                    continue
+                except OSError:
+                    self._drop(client)
+
+    def _drop(self, client):
+        """
+        @brief Closes a client connection.
+        @note Caller holds the lock.
+        """
+        self.clients.pop(client, None)
+        try:
+            client.close()
+        except OSError:
+            pass
+
+    def close(self):
+        """
+        @brief Stops the selector thread and closes every socket.
+        """
+        self._running = False
+        os.write(self._wake_w, b"x")
+        self._thread.join(2.0)
+        with self._lock:
+            for client in list(self.clients):
+                self._drop(client)
+        self.listener.close()
+        if self.path and os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def synthetic_series(t: float, seed: int) -> dict:
+    """
+    @brief Generates a plausible sample (for testing the aggregation view).
+    @param t Seconds since the feed started.
+    @param seed Per-host seed so several fake hosts differ.
+    """
+    rng = random.Random(seed * 1000003 + int(t))
+    phase = seed * 0.7
+    cpu = 35 + 30 * math.sin(t / 20 + phase) + rng.uniform(-5, 5)
+    return {
+        "cpu.usage": round(min(100.0, max(0.0, cpu)), 1),
+        "cpu.speed": round(2.4 + 0.8 * max(0.0, math.sin(t / 20 + phase)), 2),
+        "ram.percent": round(40 + 10 * math.sin(t / 90 + phase), 1),
+        "ram.used": round(6.4 + 1.6 * math.sin(t / 90 + phase), 2),
+        "ram.total": 16.0,
+        "disk.read": round(max(0.0, 20 * math.sin(t / 7 + phase) + rng.uniform(0, 4)), 2),
+        "disk.write": round(max(0.0, 12 * math.cos(t / 11 + phase) + rng.uniform(0, 2)), 2),
+        "net.down": round(max(0.0, 300 + 250 * math.sin(t / 13 + phase)), 1),
+        "net.up": round(max(0.0, 80 + 60 * math.cos(t / 17 + phase)), 1),
+        "hardware.max_temp": round(45 + cpu / 4, 1),
+        "alerts.firing": 1 if cpu > 80 else 0,
+    }
+
+
+def replay_rows(path: str):
+    """
+    @brief Reads a CSV written by the telemetry exporter.
+    @return A list of (timestamp, series) in file order (empty cells skipped).
+    """
+    rows = []
+    with open(os.path.expanduser(path), newline="") as handle:
+        for record in csv.DictReader(handle):
+            timestamp = float(record.pop("timestamp"))
+            rows.append((timestamp, {name: float(value) for name, value in record.items() if value}))
+    return rows
+
+
+def main(argv=None):
+    """
+    @brief Runs a collector: live sampling, synthetic data or a CSV replay.
+    """
+    parser = argparse.ArgumentParser(description="Linux Health Monitor Pro collector")
+    parser.add_argument("--listen", required=True, help="unix:/path or host:port")
+    parser.add_argument("--name", default=socket.gethostname(), help="host name shown in the GUI")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--synthetic", action="store_true", help="generate fake samples")
+    source.add_argument("--replay", metavar="CSV", help="replay an exported CSV file")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed-up factor")
+    parser.add_argument("--seed", type=int, default=None, help="synthetic data seed")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    server = CollectorServer(args.listen, args.name)
+    try:
+        if args.synthetic:
+            seed = args.seed if args.seed is not None else sum(map(ord, args.name))
+            start = time.time()
+            while True:
+                now = time.time()
+                server.publish(now, synthetic_series(now - start, seed))
+                time.sleep(1.0)
+        elif args.replay:
+            rows = replay_rows(args.replay)
+            if not rows:
+                logging.error(f"Nothing to replay in {args.replay}")
+                return 1
+            # Shift the recording to the present, keeping its pacing
+            offset = time.time() - rows[0][0]
+            previous = rows[0][0]
+            for timestamp, series in rows:
+                time.sleep(max(0.0, (timestamp - previous) / args.speed))
+                previous = timestamp
+                server.publish(timestamp + offset, series)
+        else:
+            from PyQt6.QtCore import QCoreApplication, QTimer, Qt
+            from src.core.worker import GlobalWorker
+            app = QCoreApplication(sys.argv[:1])
+            # Let Ctrl-C reach Python while the Qt loop runs
+            signal.signal(signal.SIGINT, lambda *_: app.quit())
+            ticker = QTimer()
+            ticker.timeout.connect(lambda: None)
+            ticker.start(500)
+            from src.core.settings_watcher import SettingsWatcher
+            worker = GlobalWorker()
+            settings = SettingsWatcher()
+            settings.changed.connect(worker.apply_settings)
+            worker.data_received.connect(
+                lambda packet: server.publish(packet["timestamp"], remote_series(packet)),
+                Qt.ConnectionType.DirectConnection
+            )
+            worker.start()
+            try:
+                return app.exec()
+            finally:
+                worker.stop()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
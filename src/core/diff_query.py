@@ -0,0 +1,69 @@
+"""
+@file diff_query.py
+@brief Runs lifecycle diff queries off the GUI thread.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+import logging
+import threading
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+
+class DiffQuery(QObject):
+    """
+    @class DiffQuery
+    @brief Answers ProcessEventLog.diff requests on a private one-thread pool.
+    @details Ranges older than the in-memory ring are read from the ColumnStore
+             archive, so the query may block on disk I/O. Requests run one at a
+             time in submission order; only the result of the newest request
+             is delivered, older ones are dropped as superseded.
+    """
+
+    # @param dict Result of ProcessEventLog.diff for the newest request
+    result_ready = pyqtSignal(dict)
+
+    def __init__(self, parent: QObject = None):
+        """
+        @brief Initializes the pool and the request counter.
+        """
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def request(self, event_log, t0: float, t1: float):
+        """
+        @brief Queues a diff of (t0, t1] on 'event_log' (thread-safe).
+        @param event_log ProcessEventLog to query.
+        @param t0 Range start (seconds since epoch).
+        @param t1 Range end (seconds since epoch).
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        self.pool.start(lambda: self._run(event_log, t0, t1, generation))
+
+    def _run(self, event_log, t0: float, t1: float, generation: int):
+        """
+        @brief Pool task: runs the query and emits it unless a newer one was queued.
+        """
+        if generation != self._generation:
+            return
+        try:
+            diff = event_log.diff(t0, t1)
+        except Exception as e:
+            logging.error(f"Process diff query failed: {e}")
+            return
+        if generation == self._generation:
+            # Queued to the receiver's thread by the signal connection
+            self.result_ready.emit(diff)
+
+    def stop(self):
+        """
+        @brief Drops queued requests and waits for the running one.
+        """
+        with self._lock:
+            self._generation += 1
+        self.pool.clear()
+        self.pool.waitForDone()
@@ -0,0 +1,168 @@
+"""
+@file event_log.py
+@brief Bounded, compacting log of process lifecycle events with time-range diffs.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import math
+import bisect
+import threading
+
+# Event kinds recorded by the process sampler
+EVENT_KINDS = ("start", "exit", "rename", "change")
+
+
+class ProcessEventLog:
+    """
+    @class ProcessEventLog
+    @brief Time-ordered log of (time, kind, key, details) process events.
+    @details Events are keyed by (pid, create_time) so PID reuse never merges
+             two processes. Storage is two parallel lists (timestamps, events)
+             so a time range is located with bisect and a diff only touches
+             the events inside that range, never intermediate snapshots.
+             When the log reaches 'capacity', its oldest half is compacted:
+             per process, a start+exit pair becomes one 'transient' event and
+             repeated renames/changes collapse into the last one. Diffs that
+             begin inside the compacted span are flagged as approximate,
+             unless an 'archive' (the history store, which keeps every raw
+             event across restarts) is attached: the part of a range that
+             lies before this log's exact span is then read back from it.
+             All methods are thread-safe (the sampler writes on the worker
+             thread while the GUI queries diffs).
+    """
+
+    def __init__(self, capacity: int, archive=None):
+        """
+        @param capacity Maximum number of events retained.
+        @param archive Optional HistoryQuery over the store the events are persisted to.
+        """
+        self.capacity = capacity
+        self.archive = archive
+        self.times = []
+        self.events = []
+        self.compacted_until = 0.0   # Diffs starting before this are approximate
+        self._lock = threading.Lock()
+
+    def record(self, timestamp: float, kind: str, key: tuple, **details) -> dict:
+        """
+        @brief Appends one event.
+        @param timestamp Event time (seconds since epoch, non-decreasing).
+        @param kind One of EVENT_KINDS.
+        @param key (pid, create_time) of the process.
+        @param details Event payload ('name', 'cpu', 'ram', 'old_name', ...).
+        @return The stored event dictionary.
+        """
+        event = {"time": timestamp, "kind": kind, "pid": key[0], "key": key}
+        event.update(details)
+        with self._lock:
+            self.times.append(timestamp)
+            self.events.append(event)
+            if len(self.events) > self.capacity:
+                self._compact()
+        return event
+
+    def _compact(self):
+        """
+        @brief Coalesces the oldest half of the log per process.
+        @note Caller holds the lock.
+        """
+        half = len(self.events) // 2
+        old = self.events[:half]
+
+        merged = {}   # key -> coalesced event (insertion order = first appearance)
+        for event in old:
+            key = event["key"]
+            previous = merged.get(key)
+            if previous is None:
+                merged[key] = dict(event)
+            elif event["kind"] == "exit" and previous["kind"] in ("start", "transient"):
+                # Born and gone inside the compacted span
+                previous.update(kind="transient", exit_time=event["time"])
+            elif previous["kind"] in ("start", "transient"):
+                # Keep the start, fold in the latest attributes
+                previous.update({k: v for k, v in event.items() if k not in ("kind", "time")})
+            else:
+                # Later rename/change/exit supersedes, but the original name survives
+                coalesced = dict(event)
+                if "old_name" in previous:
+                    coalesced["old_name"] = previous["old_name"]
+                merged[key] = coalesced
+
+        compacted = sorted(merged.values(), key=lambda e: e["time"])
+        # If coalescing was not enough, drop the oldest events outright
+        overflow = len(compacted) + len(self.events) - half - int(self.capacity * 0.75)
+        if overflow > 0:
+            compacted = compacted[overflow:]
+
+        self.compacted_until = old[-1]["time"]
+        self.events = compacted + self.events[half:]
+        self.times = [event["time"] for event in self.events]
+
+    def since(self, timestamp: float) -> list:
+        """
+        @brief Returns events recorded strictly after 'timestamp'.
+        """
+        with self._lock:
+            start = bisect.bisect_right(self.times, timestamp)
+            return self.events[start:]
+
+    def diff(self, t0: float, t1: float) -> dict:
+        """
+        @brief Summarises what changed between two points in time.
+        @param t0 Start of the range (exclusive).
+        @param t1 End of the range (inclusive).
+        @return A dictionary containing:
+            - 'started' (list): Processes started in the range and still alive at t1.
+            - 'exited' (list): Processes alive at t0 that exited by t1.
+            - 'transient' (list): Processes that both started and exited in the range.
+            - 'renamed' (list): Processes whose name differs between t0 and t1.
+            - 'changed' (list): Processes with large resource changes (latest value).
+            - 'exact' (bool): False when t0 falls inside the compacted span
+              and no archive answers it.
+        """
+        with self._lock:
+            # In memory, events are raw after the compacted span (or from the first one on)
+            compacted = self.compacted_until > 0
+            split = self.compacted_until if compacted else (self.times[0] if self.times else math.inf)
+            archived = self.archive is not None and t0 < split
+            lo = bisect.bisect_right(self.times, split if archived and compacted else t0)
+            hi = bisect.bisect_right(self.times, t1)
+            window = self.events[lo:hi]
+            exact = archived or t0 >= self.compacted_until
+
+        if archived:
+            # The archive covers (t0, split] (or (t0, split) when nothing was compacted)
+            end = min(t1, split)
+            end = math.nextafter(end, math.inf) if end < split or compacted else end
+            window = self.archive.events(math.nextafter(t0, math.inf), end) + window
+
+        first = {}
+        last = {}
+        changed = set()
+        for event in window:
+            first.setdefault(event["key"], event)
+            last[event["key"]] = event
+            if event["kind"] == "change":
+                changed.add(event["key"])
+
+        result = {"started": [], "exited": [], "transient": [], "renamed": [],
+                  "changed": [], "exact": exact}
+        for key, head in first.items():
+            tail = last[key]
+            born_here = head["kind"] in ("start", "transient")
+            gone = tail["kind"] in ("exit", "transient")
+            if born_here and gone:
+                result["transient"].append(tail)
+            elif born_here:
+                result["started"].append(tail)
+            elif gone:
+                result["exited"].append(tail)
+            else:
+                # Alive across the whole range: report renames and big changes
+                old_name = head.get("old_name", head.get("name"))
+                if old_name is not None and old_name != tail.get("name"):
+                    result["renamed"].append(dict(tail, old_name=old_name))
+                if key in changed:
+                    result["changed"].append(tail)
+        return result
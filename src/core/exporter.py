@@ -0,0 +1,262 @@
+"""
+@file exporter.py
+@brief Streaming export of dashboard series to rotating CSV, Parquet or Arrow files
+       (or to the long-term column store).
+@project Linux Health Monitor Pro
+@dependencies pyarrow (optional, for 'parquet' and 'arrow')
+"""
+
+import os
+import csv
+import glob
+import time
+import logging
+import threading
+from collections import deque
+from src.core.store import ColumnStore
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:   # CSV export works without it
+    pa = None
+    pq = None
+
+# Export format -> file extension ('store' writes a ColumnStore directory instead)
+EXPORT_EXTENSIONS = {"csv": "csv", "parquet": "parquet", "arrow": "arrows", "store": None}
+
+# What submit() does when the queue is full
+BACKPRESSURE_POLICIES = ("drop_oldest", "drop_newest")
+
+
+class TelemetryExporter:
+    """
+    @class TelemetryExporter
+    @brief Bounded hand-off from the sampling thread to a dedicated writer thread.
+    @details submit() only appends (timestamp, series) to a bounded deque under
+             a lock: O(1), never touching the disk, so a stalled filesystem
+             cannot slow down sampling or the GUI. When the queue is full the
+             backpressure policy drops either the oldest queued sample or the
+             new one, and the drop is counted.
+             The writer thread wakes when a batch is full or 'flush_seconds'
+             have passed, swaps the queue out and writes it as one batch (one
+             CSV block, one Parquet row group or one Arrow record batch).
+             Files rotate every 'rotate_rows' rows, and whenever a series that
+             is not in the current file appears (hot-plugged disk, new NIC),
+             since CSV headers and columnar schemas are fixed per file. Only
+             the newest 'keep_files' files are kept.
+             With fmt='store' the same queue and thread feed a ColumnStore
+             (which partitions by day itself), and the process rows passed
+             and lifecycle events passed to submit() are kept too.
+    """
+
+    def __init__(self, directory: str, fmt: str = "csv", batch_rows: int = 60,
+                 flush_seconds: float = 10.0, rotate_rows: int = 3600,
+                 keep_files: int = 24, queue_size: int = 600,
+                 policy: str = "drop_oldest", process_rows: int = 10,
+                 retention_days: int = 14):
+        """
+        @param directory Output directory ('~' is expanded, created if missing).
+        @param fmt 'csv', 'parquet' or 'arrow' (Arrow IPC stream).
+        @param batch_rows Samples per written batch / row group.
+        @param flush_seconds Maximum age of a partial batch before it is written.
+        @param rotate_rows Rows per file before rotating.
+        @param keep_files Number of export files retained (0 keeps all).
+        @param queue_size Maximum samples waiting for the writer.
+        @param policy One of BACKPRESSURE_POLICIES.
+        @param process_rows 'store' only: busiest processes kept per sample.
+        @param retention_days 'store' only: day partitions kept.
+        """
+        if fmt not in EXPORT_EXTENSIONS:
+            raise ValueError(f"Unknown export format '{fmt}'")
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}'")
+        if fmt in ("parquet", "arrow") and pa is None:
+            logging.warning(f"pyarrow is not installed: exporting CSV instead of {fmt}")
+            fmt = "csv"
+
+        self.directory = os.path.expanduser(directory)
+        self.fmt = fmt
+        self.batch_rows = batch_rows
+        self.flush_seconds = flush_seconds
+        self.rotate_rows = rotate_rows
+        self.keep_files = keep_files
+        self.queue_size = queue_size
+        self.policy = policy
+
+        self.queue = deque()
+        self.dropped = 0
+        self.written = 0
+        self.path = None
+        self._cond = threading.Condition()
+        self._running = True
+
+        # Writer-thread state
+        self._columns = None
+        self._schema = None
+        self._rows_in_file = 0
+        self._file = None
+        self._csv = None
+        self._writer = None
+        self._store = None
+        if fmt == "store":
+            self._store = ColumnStore(self.directory, process_rows, retention_days)
+            self.path = self.directory
+
+        self._thread = threading.Thread(target=self._run, name="TelemetryExporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, timestamp: float, series: dict, processes: list = None, events: list = None):
+        """
+        @brief Queues one sample (called on the sampling thread, O(1)).
+        @param timestamp Sample time (seconds since epoch).
+        @param series Flat mapping of series name to value (see flatten_packet).
+        @param processes Optional process rows of the same sweep (kept by 'store' only;
+               the list is handed over by reference, not copied).
+        @param events Optional lifecycle events of the same sweep (kept by 'store' only).
+        """
+        with self._cond:
+            if len(self.queue) >= self.queue_size:
+                self.dropped += 1
+                if self.policy == "drop_newest":
+                    return
+                self.queue.popleft()
+            self.queue.append((timestamp, series, processes, events))
+            if len(self.queue) >= self.batch_rows:
+                self._cond.notify()
+
+    def stats(self) -> dict:
+        """
+        @brief Returns the export counters for the GUI.
+        @return {'format', 'path', 'written', 'queued', 'dropped'}.
+        """
+        return {"format": self.fmt, "path": self.path, "written": self.written,
+                "queued": len(self.queue), "dropped": self.dropped}
+
+    def close(self, timeout: float = 5.0):
+        """
+        @brief Writes what is queued, closes the current file and stops the thread.
+        @param timeout Seconds to wait for the writer (it is a daemon thread).
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _run(self):
+        """
+        @brief Writer loop: waits for a full batch (or the flush timeout) and writes it.
+        """
+        while True:
+            with self._cond:
+                if self._running and len(self.queue) < self.batch_rows:
+                    self._cond.wait(self.flush_seconds)
+                batch = list(self.queue)
+                self.queue.clear()
+                running = self._running
+            if batch:
+                try:
+                    self._write(batch)
+                    self.written += len(batch)
+                except Exception as e:
+                    # Lose this batch, start a fresh file on the next one
+                    logging.error(f"Telemetry export failed ({self.path}): {e}")
+                    self.dropped += len(batch)
+                    self._close_file()
+            if not running:
+                self._close_file()
+                if self._store is not None:
+                    self._store.close()
+                return
+
+    def _write(self, batch: list):
+        """
+        @brief Writes one batch, rotating the file when needed.
+        """
+        if self._store is not None:
+            self._store.append(batch)
+            return
+        names = set()
+        for _, series, _, _ in batch:
+            names.update(series)
+        opened = self._file is not None or self._writer is not None
+        if not opened or not names.issubset(self._columns) \
+                or self._rows_in_file >= self.rotate_rows:
+            # Keep the current column order and append new series at the end
+            known = self._columns or []
+            self._open(known + sorted(names.difference(known)))
+
+        if self.fmt == "csv":
+            columns = self._columns
+            self._csv.writerows(
+                [timestamp] + [series.get(name, "") for name in columns]
+                for timestamp, series, _, _ in batch
+            )
+            self._file.flush()
+        else:
+            data = {"timestamp": [timestamp for timestamp, _, _, _ in batch]}
+            for name in self._columns:
+                data[name] = [series.get(name) for _, series, _, _ in batch]
+            # One Parquet row group / one Arrow record batch per call
+            self._writer.write_table(pa.table(data, schema=self._schema))
+        self._rows_in_file += len(batch)
+
+    def _open(self, columns: list):
+        """
+        @brief Closes the current file and starts a new one with 'columns'.
+        """
+        self._close_file()
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.path = os.path.join(self.directory, f"telemetry-{stamp}.{EXPORT_EXTENSIONS[self.fmt]}")
+        suffix = 1
+        while os.path.exists(self.path):
+            suffix += 1
+            self.path = os.path.join(self.directory,
+                                     f"telemetry-{stamp}-{suffix}.{EXPORT_EXTENSIONS[self.fmt]}")
+        self._columns = columns
+        self._rows_in_file = 0
+
+        if self.fmt == "csv":
+            self._file = open(self.path, "w", newline="")
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(["timestamp"] + columns)
+        else:
+            self._schema = pa.schema([("timestamp", pa.float64())]
+                                     + [(name, pa.float64()) for name in columns])
+            if self.fmt == "parquet":
+                self._writer = pq.ParquetWriter(self.path, self._schema)
+            else:
+                self._writer = pa.ipc.new_stream(self.path, self._schema)
+        logging.info(f"Telemetry export: writing {self.path}")
+        self._prune()
+
+    def _close_file(self):
+        """
+        @brief Finalises the current file (Parquet footer, Arrow end-of-stream).
+        """
+        try:
+            if self._store is not None:
+                self._store.close_day()
+            if self._file is not None:
+                self._file.close()
+            if self._writer is not None:
+                self._writer.close()
+        except Exception as e:
+            logging.error(f"Telemetry export: closing {self.path} failed: {e}")
+        self._file = None
+        self._csv = None
+        self._writer = None
+
+    def _prune(self):
+        """
+        @brief Deletes the oldest export files beyond 'keep_files'.
+        """
+        if not self.keep_files:
+            return
+        pattern = os.path.join(self.directory, f"telemetry-*.{EXPORT_EXTENSIONS[self.fmt]}")
+        for path in sorted(glob.glob(pattern), key=os.path.getmtime)[:-self.keep_files]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logging.warning(f"Telemetry export: could not remove {path}: {e}")
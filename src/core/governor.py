@@ -0,0 +1,169 @@
+"""
+@file governor.py
+@brief Adaptive sampling-rate governor holding the collector under a CPU budget.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import time
+from contextlib import contextmanager
+
+
+class SamplingGovernor:
+    """
+    @class SamplingGovernor
+    @brief Chooses the sampling interval (and the sensor set) from measured cost.
+    @details The worker charges the CPU time of each sensor section to the
+             governor, measured with time.thread_time() so only the sampling
+             thread is counted (not the GUI, nor other helper threads).
+             At the end of every cycle the smoothed cycle cost C gives the
+             interval needed to stay within the budget B (fraction of one
+             core): C / B. The interval is raised at once when over budget and
+             lowered gradually (towards 'min_interval') when there is spare
+             capacity, with 25% headroom so it does not hover on the limit.
+             When even 'max_interval' cannot hold the budget, the most
+             expensive enabled sensor from 'sheddable' is dropped; dropped
+             sensors come back (last dropped first) once their remembered
+             cost fits in half of the budget at 'max_interval'. That memory
+             decays while the section is off, so it is retried (and measured
+             afresh) every so often even if nothing else changes. Shedding and
+             restoring wait 'settle' cycles between steps so the smoothed
+             cost can reflect the previous decision.
+    """
+
+    HEADROOM = 1.25   # Target interval = needed interval x HEADROOM
+    RAMP_DOWN = 0.8   # Max interval shrink per cycle when under budget
+    FORGET = 0.98     # Per-cycle decay of a dropped section's remembered cost
+
+    def __init__(self, budget: float, min_interval: float, max_interval: float,
+                 sheddable=(), smoothing: float = 0.3, settle: int = 5):
+        """
+        @param budget Allowed collector CPU time per wall-clock second (0.01 = 1% of a core).
+        @param min_interval Shortest sampling interval in seconds (highest rate).
+        @param max_interval Longest sampling interval in seconds before shedding sensors.
+        @param sheddable Names of sensor sections that may be skipped when over budget.
+        @param smoothing EWMA weight of the newest cycle.
+        @param settle Cycles to wait between two shed/restore steps.
+        """
+        self.budget = budget
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.sheddable = tuple(sheddable)
+        self.smoothing = smoothing
+        self.settle = settle
+
+        self.interval = min_interval
+        self.cost = None            # Smoothed CPU seconds per cycle
+        self.section_cost = {}      # name -> smoothed CPU seconds per cycle
+        self.shed = []              # Dropped sections, in drop order
+        self.cooldown = 0
+        self._cycle = {}
+        self._start = time.thread_time()
+
+    def begin_cycle(self):
+        """
+        @brief Starts measuring a new sampling cycle.
+        """
+        self._cycle = {}
+        self._start = time.thread_time()
+
+    @contextmanager
+    def measure(self, name: str):
+        """
+        @brief Charges the CPU time spent inside the 'with' block to section 'name'.
+        """
+        start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.charge(name, time.thread_time() - start)
+
+    def charge(self, name: str, seconds: float):
+        """
+        @brief Adds CPU time measured elsewhere (e.g. inside a sensor) to a section.
+        """
+        self._cycle[name] = self._cycle.get(name, 0.0) + seconds
+
+    def enabled(self, name: str) -> bool:
+        """
+        @brief Tells whether a section should run this cycle.
+        """
+        return name not in self.shed
+
+    def end_cycle(self) -> float:
+        """
+        @brief Folds the cycle's cost into the estimates and picks the next interval.
+        @return The interval in seconds until the next cycle should start.
+        """
+        spent = time.thread_time() - self._start
+        self.cost = spent if self.cost is None else self._smooth(self.cost, spent)
+        for name, seconds in self._cycle.items():
+            previous = self.section_cost.get(name)
+            self.section_cost[name] = seconds if previous is None else self._smooth(previous, seconds)
+
+        if self.cooldown > 0:
+            self.cooldown -= 1
+        for name in self.shed:
+            self.section_cost[name] *= self.FORGET
+
+        needed = self.cost / self.budget
+        if needed > self.max_interval:
+            self._shed_one()
+        elif self.shed and self.cooldown == 0:
+            restored = self.shed[-1]
+            extra = self.section_cost.get(restored, 0.0)
+            if (self.cost + extra) / self.budget <= self.max_interval / 2:
+                self.shed.pop()
+                self.cooldown = self.settle
+
+        target = min(self.max_interval, max(self.min_interval, needed * self.HEADROOM))
+        if target >= self.interval:
+            self.interval = target
+        else:
+            self.interval = max(target, self.interval * self.RAMP_DOWN)
+        return self.interval
+
+    def _shed_one(self):
+        """
+        @brief Drops the most expensive enabled sheddable section.
+        """
+        if self.cooldown > 0:
+            return
+        candidates = [name for name in self.sheddable
+                      if name not in self.shed and self.section_cost.get(name, 0.0) > 0.0]
+        if not candidates:
+            return
+        victim = max(candidates, key=lambda name: self.section_cost[name])
+        self.shed.append(victim)
+        # The victim no longer runs: discount it now rather than waiting for the EWMA
+        self.cost = max(0.0, self.cost - self.section_cost[victim])
+        self.cooldown = self.settle
+
+    def _smooth(self, previous: float, value: float) -> float:
+        """
+        @brief Exponentially weighted moving average step.
+        """
+        return previous + self.smoothing * (value - previous)
+
+    def status(self) -> dict:
+        """
+        @brief Summarises the governor state for the GUI.
+        @return A dictionary containing:
+            - 'interval' (float): Current sampling interval in seconds.
+            - 'rate' (float): Current sampling rate in Hz.
+            - 'budget' (float): Allowed CPU fraction of one core (0.01 = 1%).
+            - 'usage' (float): Smoothed collector CPU fraction at the current interval.
+            - 'cycle_ms' (float): Smoothed CPU milliseconds per cycle.
+            - 'sections' (dict): Smoothed CPU milliseconds per sensor section.
+            - 'shed' (list): Sensor sections currently skipped.
+        """
+        cost = self.cost or 0.0
+        return {
+            "interval": self.interval,
+            "rate": 1.0 / self.interval,
+            "budget": self.budget,
+            "usage": cost / self.interval,
+            "cycle_ms": cost * 1000.0,
+            "sections": {name: seconds * 1000.0 for name, seconds in self.section_cost.items()},
+            "shed": list(self.shed),
+        }
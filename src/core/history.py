@@ -0,0 +1,137 @@
+"""
+@file history.py
+@brief Columnar ring buffer holding recent telemetry series.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import numpy as np
+
+
+def flatten_packet(packet: dict) -> dict:
+    """
+    @brief Extracts the numeric dashboard series from a telemetry packet.
+    @param packet The telemetry packet emitted by GlobalWorker.
+    @return A flat mapping such as {'cpu.usage': 12.5, 'cpu.core0': 9.0,
+            'disk.sda.read': 0.25, 'net.eth0.down': 3.1, ...}.
+    """
+    series = {}
+
+    cpu = packet.get("cpu", {})
+    if "usage" in cpu:
+        series["cpu.usage"] = cpu["usage"]
+    for index, value in enumerate(cpu.get("per_core", [])):
+        series[f"cpu.core{index}"] = value
+
+    ram = packet.get("ram", {})
+    if "percent" in ram:
+        series["ram.percent"] = ram["percent"]
+
+    disk = packet.get("disk", {})
+    for field in ("read", "write"):
+        if field in disk:
+            series[f"disk.{field}"] = disk[field]
+    for name, rates in disk.get("devices", {}).items():
+        series[f"disk.{name}.read"] = rates["read"]
+        series[f"disk.{name}.write"] = rates["write"]
+
+    net = packet.get("net", {})
+    for field in ("down", "up"):
+        if field in net:
+            series[f"net.{field}"] = net[field]
+    for name, rates in net.get("interfaces", {}).items():
+        series[f"net.{name}.down"] = rates["down"]
+        series[f"net.{name}.up"] = rates["up"]
+
+    for node in packet.get("numa", {}).get("nodes", []):
+        series[f"numa.node{node['node']}.percent"] = node["percent"]
+        series[f"numa.node{node['node']}.miss"] = node["numa_miss"]
+
+    hardware = packet.get("hardware", {})
+    if hardware.get("max_temp") is not None:
+        series["hardware.max_temp"] = hardware["max_temp"]
+    if hardware.get("power"):
+        series["hardware.power"] = hardware["total_power"]
+
+    sched = packet.get("sched", {})
+    if "wait" in sched:
+        series["sched.wait"] = sched["wait"]
+
+    activity = packet.get("activity", {})
+    for field in ("ctxt", "forks", "pgfault", "pgmajfault", "pswpin", "pswpout", "pgscan"):
+        if field in activity:
+            series[f"activity.{field}"] = activity[field]
+
+    return series
+
+
+class MetricHistory:
+    """
+    @class MetricHistory
+    @brief Fixed-capacity (metrics x samples) float matrix with a shared clock.
+    @details Every series occupies one row of a single numpy matrix so that
+             consumers (e.g. the anomaly detector) can reduce across all
+             metrics with one vectorized call. Series that appear later
+             (hot-plugged disks, new interfaces) get a new row back-filled
+             with NaN; series missing from a sample are recorded as NaN.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        @brief Allocates the ring buffer.
+        @param capacity Number of samples retained per series.
+        """
+        self.capacity = capacity
+        self.names = []
+        self.index = {}
+        self.values = np.full((0, capacity), np.nan)
+        self.timestamps = np.full(capacity, np.nan)
+        self.cursor = 0   # Next column to write
+        self.count = 0    # Number of valid columns
+
+    def _add_series(self, name: str):
+        """
+        @brief Appends a row for a new series, growing the matrix geometrically.
+        """
+        row = len(self.names)
+        if row >= self.values.shape[0]:
+            grown = np.full((max(8, row * 2), self.capacity), np.nan)
+            grown[:row] = self.values[:row]
+            self.values = grown
+        self.names.append(name)
+        self.index[name] = row
+        return row
+
+    def record(self, timestamp: float, sample: dict):
+        """
+        @brief Writes one column of samples.
+        @param timestamp Sample time (seconds since epoch).
+        @param sample Mapping of series name to value.
+        """
+        column = self.cursor
+        self.values[:, column] = np.nan
+        for name, value in sample.items():
+            row = self.index.get(name)
+            if row is None:
+                row = self._add_series(name)
+            self.values[row, column] = value
+        self.timestamps[column] = timestamp
+
+        self.cursor = (column + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def window(self, length: int = None):
+        """
+        @brief Returns the most recent samples in chronological order.
+        @param length Number of columns requested (defaults to all valid samples).
+        @return A (series x length) array; rows follow the order of self.names.
+        """
+        length = self.count if length is None else min(length, self.count)
+        rows = len(self.names)
+        start = (self.cursor - length) % self.capacity
+        if start + length <= self.capacity:
+            return self.values[:rows, start:start + length]
+        # The window wraps around the ring: stitch the two slices together
+        head = self.values[:rows, start:]
+        tail = self.values[:rows, :self.cursor]
+        return np.concatenate((head, tail), axis=1)
@@ -0,0 +1,172 @@
+"""
+@file procfs.py
+@brief Low-level /proc reader: openat() relative to directory fds, one reused buffer.
+@project Linux Health Monitor Pro
+@dependencies numpy
+"""
+
+import os
+import threading
+import numpy as np
+
+# Indices into the fields of a stat line after the ')' that closes comm
+# (0 is the state, i.e. field 3 of proc(5); utime is field 14 -> index 11)
+STAT_STATE = 0
+STAT_PPID = 1
+STAT_UTIME = 11
+STAT_STIME = 12
+STAT_NUM_THREADS = 17
+STAT_STARTTIME = 19
+STAT_VSIZE = 20
+STAT_RSS = 21
+
+FILE_FLAGS = os.O_RDONLY | os.O_CLOEXEC
+DIR_FLAGS = os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC
+
+# Initial read buffer; grown (and kept) when a file does not fit
+BUFFER_BYTES = 1 << 16
+
+_local = threading.local()
+
+
+def procfs() -> "ProcFS":
+    """
+    @brief Returns the calling thread's shared reader (created on first use).
+    @details Sensors and samplers running on the same producer thread share
+             one /proc descriptor and one buffer; each thread gets its own.
+    """
+    reader = getattr(_local, "reader", None)
+    if reader is None:
+        reader = _local.reader = ProcFS()
+    return reader
+
+
+def split_stat(raw: bytes):
+    """
+    @brief Splits a stat line into (comm, fields) without decoding it.
+    @note comm is enclosed in parentheses and may contain spaces or ')', so
+          the line is split on the last ')'. fields[STAT_STATE] is the state.
+    """
+    head, _, tail = raw.rpartition(b")")
+    return head.partition(b"(")[2], tail.split()
+
+
+class ProcFS:
+    """
+    @class ProcFS
+    @brief Reads procfs files relative to directory descriptors into one reused buffer.
+    @details /proc is opened once as a directory fd; every file is then
+             opened with openat() relative to it (or to a per-process
+             directory fd from open_dir(), e.g. '<pid>/task' for a thread
+             walk), so the kernel only resolves the last one or two path
+             components instead of the whole '/proc/<pid>/...' path. A
+             process directory fd also stays bound to that process: once it
+             exits, reads through it fail even if the PID is reused.
+             Every read lands in the same preallocated buffer with readv();
+             callers get one bytes copy, which is split at byte level (no
+             str decoding). stat_batch() parses numeric fields of many stat
+             files straight into a reused int64 array.
+             Not thread-safe: use procfs() to get the current thread's reader.
+    """
+
+    def __init__(self, root: str = "/proc", buffer_bytes: int = BUFFER_BYTES):
+        """
+        @param root procfs mount point.
+        @param buffer_bytes Initial read buffer size.
+        """
+        self.root = os.open(root, DIR_FLAGS)
+        self.buffer = bytearray(buffer_bytes)
+        self.values = np.empty((0, 0), dtype=np.int64)   # Reused by stat_batch()
+
+    def pids(self) -> list:
+        """
+        @brief Lists the numeric entries of /proc (as strings, like os.listdir).
+        """
+        return [entry for entry in os.listdir(self.root) if entry.isdigit()]
+
+    def open_dir(self, relative: str, dir_fd: int = None) -> int:
+        """
+        @brief Opens a directory (e.g. '1234' or '1234/task') for relative reads.
+        @return A directory fd; the caller closes it with os.close().
+        @throws OSError FileNotFoundError if the process is gone.
+        """
+        return os.open(relative, DIR_FLAGS, dir_fd=self.root if dir_fd is None else dir_fd)
+
+    def listdir(self, relative: str = None, dir_fd: int = None) -> list:
+        """
+        @brief Lists a directory given relative to 'dir_fd' (or /proc).
+        """
+        if relative is None:
+            return os.listdir(self.root if dir_fd is None else dir_fd)
+        fd = self.open_dir(relative, dir_fd)
+        try:
+            return os.listdir(fd)
+        finally:
+            os.close(fd)
+
+    def read(self, relative: str, dir_fd: int = None) -> bytes:
+        """
+        @brief Reads a whole file.
+        @param relative Path relative to 'dir_fd' (or /proc), e.g. '1234/stat'.
+        @param dir_fd Directory fd from open_dir(); None for /proc.
+        @return The file content.
+        @throws OSError FileNotFoundError/ProcessLookupError if the process is gone.
+        """
+        fd = os.open(relative, FILE_FLAGS, dir_fd=self.root if dir_fd is None else dir_fd)
+        try:
+            size = os.readv(fd, [self.buffer])
+            while size == len(self.buffer):
+                # Larger than the buffer: grow it for good and read the rest
+                self.buffer.extend(bytes(len(self.buffer)))
+                with memoryview(self.buffer) as view:
+                    count = os.readv(fd, [view[size:]])
+                if not count:
+                    break
+                size += count
+        finally:
+            os.close(fd)
+        with memoryview(self.buffer) as view:
+            return view[:size].tobytes()
+
+    def stat(self, relative: str, dir_fd: int = None):
+        """
+        @brief Reads and splits a stat file.
+        @return (comm, fields) as bytes (see split_stat).
+        """
+        return split_stat(self.read(relative, dir_fd))
+
+    def stat_batch(self, entries, columns, dir_fd: int = None, names: list = None) -> np.ndarray:
+        """
+        @brief Reads '<entry>/stat' for many processes (or threads) in one pass.
+        @param entries PIDs or TIDs (str or int), relative to 'dir_fd' (or /proc).
+        @param columns stat field indices (STAT_*) to extract; STAT_STATE is
+               stored as the state letter's byte value (ord('R') ...).
+        @param dir_fd Directory fd, e.g. open_dir('1234/task') for threads.
+        @param names Optional list that receives each entry's comm (bytes, None if unreadable).
+        @return An int64 view of shape (len(entries), len(columns)) into a
+                reused array, valid until the next call. Rows of entries that
+                vanished or could not be parsed are -1.
+        """
+        count, width = len(entries), len(columns)
+        if self.values.shape[0] < count or self.values.shape[1] != width:
+            self.values = np.empty((max(count, 2 * self.values.shape[0]), width), dtype=np.int64)
+        out = self.values[:count]
+        base = self.root if dir_fd is None else dir_fd
+        for row, entry in enumerate(entries):
+            try:
+                comm, fields = split_stat(self.read(f"{entry}/stat", base))
+                for position, column in enumerate(columns):
+                    field = fields[column]
+                    out[row, position] = field[0] if column == STAT_STATE else int(field)
+            except (OSError, ValueError, IndexError):
+                out[row] = -1
+                comm = None
+            if names is not None:
+                names.append(comm)
+        return out
+
+    def close(self):
+        """
+        @brief Closes the /proc descriptor.
+        """
+        os.close(self.root)
@@ -0,0 +1,197 @@
+"""
+@file pyramid.py
+@brief Multi-resolution min/max pyramid for long-range time-series display.
+@project Linux Health Monitor Pro
+@dependencies numpy
+"""
+
+import numpy as np
+
+# Slots allocated up front (raw samples); arrays double from here up to the capacity
+INITIAL_SLOTS = 4096
+
+
+def _grown(array: np.ndarray, used: int, limit: int) -> np.ndarray:
+    """
+    @brief Returns a copy of 'array' with its last axis doubled (at most 'limit').
+    """
+    grown = np.zeros(array.shape[:-1] + (min(limit, 2 * array.shape[-1]),), dtype=array.dtype)
+    grown[..., :used] = array[..., :used]
+    return grown
+
+
+class _Level:
+    """
+    @class _Level
+    @brief One resolution level: completed buckets plus the bucket being filled.
+    """
+
+    def __init__(self, rows: int, slots: int, size: int):
+        """
+        @param rows Number of parallel series.
+        @param slots Maximum number of completed buckets retained.
+        @param size Raw samples per bucket.
+        """
+        self.size = size
+        self.slots = slots
+        allocated = min(slots, INITIAL_SLOTS // size + 1)
+        self.times = np.zeros(allocated)
+        self.mins = np.zeros((rows, allocated), dtype=np.float32)
+        self.maxs = np.zeros((rows, allocated), dtype=np.float32)
+        self.n = 0
+
+        # Pending (partially filled) bucket
+        self.p_time = 0.0
+        self.p_min = np.zeros(rows, dtype=np.float32)
+        self.p_max = np.zeros(rows, dtype=np.float32)
+        self.p_count = 0
+
+    def add(self, t: float, values: np.ndarray):
+        """
+        @brief Folds one raw sample into the pending bucket (O(rows)).
+        @note fmin/fmax ignore NaN so sparse rows (e.g. anomaly marks) survive.
+        """
+        if self.p_count == 0:
+            self.p_time = t
+            self.p_min[:] = values
+            self.p_max[:] = values
+        else:
+            np.fmin(self.p_min, values, out=self.p_min)
+            np.fmax(self.p_max, values, out=self.p_max)
+        self.p_count += 1
+
+        if self.p_count == self.size and self.n < self.slots:
+            if self.n == self.times.size:
+                self.times = _grown(self.times, self.n, self.slots)
+                self.mins = _grown(self.mins, self.n, self.slots)
+                self.maxs = _grown(self.maxs, self.n, self.slots)
+            self.times[self.n] = self.p_time
+            self.mins[:, self.n] = self.p_min
+            self.maxs[:, self.n] = self.p_max
+            self.n += 1
+            self.p_count = 0
+
+    def drop_before(self, cutoff: float):
+        """
+        @brief Discards completed buckets that end before 'cutoff'.
+        @note The bucket straddling 'cutoff' is kept, so a decimated view
+              still reaches back to the oldest raw sample.
+        """
+        count = max(0, int(np.searchsorted(self.times[:self.n], cutoff, side="right")) - 1)
+        if count:
+            keep = self.n - count
+            self.times[:keep] = self.times[count:self.n]
+            self.mins[:, :keep] = self.mins[:, count:self.n]
+            self.maxs[:, :keep] = self.maxs[:, count:self.n]
+            self.n = keep
+
+
+class MinMaxPyramid:
+    """
+    @class MinMaxPyramid
+    @brief Stores raw samples plus min/max summaries at factor^k decimation.
+    @details Appending costs O(levels x rows): every level folds the sample into
+             its pending bucket and commits it when full, so no level is ever
+             rebuilt. A query picks the finest level whose bucket count in the
+             requested range fits the pixel budget, so redraw cost tracks the
+             plot width rather than the time span (a week of 1s samples is
+             served from ~600 buckets instead of 604,800 points).
+             When the raw level is full, the oldest half is discarded.
+             Arrays start at INITIAL_SLOTS and double as samples arrive, so
+             a plot only holds the memory of what it has recorded; the
+             full 'capacity' is reached after running for that long.
+    """
+
+    def __init__(self, rows: int, capacity: int, factor: int = 4):
+        """
+        @param rows Number of parallel series sharing the time axis.
+        @param capacity Raw samples retained (e.g. 604800 for a week at 1Hz).
+        @param factor Decimation factor between consecutive levels.
+        """
+        self.rows = rows
+        self.capacity = capacity
+        allocated = min(capacity, INITIAL_SLOTS)
+        self.times = np.zeros(allocated)
+        self.values = np.zeros((rows, allocated), dtype=np.float32)
+        self.n = 0
+
+        self.levels = []
+        size = factor
+        while size < capacity:
+            self.levels.append(_Level(rows, capacity // size + 1, size))
+            size *= factor
+
+    def append(self, t: float, values):
+        """
+        @brief Appends one sample for every row.
+        @param t Sample timestamp; must be non-decreasing.
+        @param values Sequence of 'rows' floats (NaN allowed).
+        """
+        if self.n == self.capacity:
+            self._trim(self.capacity // 2)
+        elif self.n == self.times.size:
+            self.times = _grown(self.times, self.n, self.capacity)
+            self.values = _grown(self.values, self.n, self.capacity)
+
+        sample = np.asarray(values, dtype=np.float32)
+        self.times[self.n] = t
+        self.values[:, self.n] = sample
+        self.n += 1
+        for level in self.levels:
+            level.add(t, sample)
+
+    def _trim(self, count: int):
+        """
+        @brief Discards the 'count' oldest raw samples and the buckets they fed.
+        """
+        keep = self.n - count
+        self.times[:keep] = self.times[count:self.n]
+        self.values[:, :keep] = self.values[:, count:self.n]
+        self.n = keep
+        cutoff = self.times[0]
+        for level in self.levels:
+            level.drop_before(cutoff)
+
+    def span(self):
+        """
+        @brief Returns (first, last) timestamps held, or None when empty.
+        """
+        if self.n == 0:
+            return None
+        return self.times[0], self.times[self.n - 1]
+
+    def query(self, t0: float, t1: float, pixels: int):
+        """
+        @brief Returns display-ready points covering [t0, t1].
+        @param pixels Approximate number of horizontal pixels available.
+        @return (x, y) where y has shape (rows, len(x)). Decimated levels emit
+                each bucket as a (min, max) pair so spikes stay visible.
+        """
+        pixels = max(1, int(pixels))
+
+        # Raw samples, when few enough fall inside the range
+        lo = max(0, int(np.searchsorted(self.times[:self.n], t0)) - 1)
+        hi = min(self.n, int(np.searchsorted(self.times[:self.n], t1, side="right")) + 1)
+        if hi - lo <= pixels or not self.levels:
+            return self.times[lo:hi], self.values[:, lo:hi]
+
+        for index, level in enumerate(self.levels):
+            times = level.times[:level.n]
+            lo = max(0, int(np.searchsorted(times, t0)) - 1)
+            hi = min(level.n, int(np.searchsorted(times, t1, side="right")) + 1)
+            if hi - lo <= pixels or index == len(self.levels) - 1:
+                break
+
+        x = times[lo:hi]
+        mins = level.mins[:, lo:hi]
+        maxs = level.maxs[:, lo:hi]
+        if level.p_count and level.p_time <= t1:
+            x = np.append(x, level.p_time)
+            mins = np.hstack((mins, level.p_min[:, None]))
+            maxs = np.hstack((maxs, level.p_max[:, None]))
+
+        # Interleave (min, max) per bucket on a duplicated time axis
+        y = np.empty((self.rows, 2 * x.size), dtype=np.float32)
+        y[:, 0::2] = mins
+        y[:, 1::2] = maxs
+        return np.repeat(x, 2), y
@@ -0,0 +1,511 @@
+"""
+@file query.py
+@brief Time-range aggregations over the column store (Python API and CLI).
+@project Linux Health Monitor Pro
+@dependencies numpy
+
+Usage:
+    python -m src.core.query series --from today
+    python -m src.core.query agg disk.write --from 02:00 --to 03:00 --func p99 mean max
+    python -m src.core.query agg cpu.usage --from=-6h --func mean p95 --step 1h
+    python -m src.core.query top --by cpu --from yesterday --to today -k 10
+"""
+
+import os
+import re
+import sys
+import math
+import time
+import argparse
+import datetime
+import numpy as np
+from src.core.store import STORE_TIERS, DAY_FORMAT, EVENT_COLUMNS, NO_NAME, series_file
+from src.core.event_log import EVENT_KINDS
+from src.config import STORE_DIRECTORY
+from src.core.settings import active_layers
+
+# Aggregates answerable from tier buckets (min/max/sum/count) alone
+TIER_FUNCS = {"min", "max", "mean", "count"}
+
+# Longest gap counted when integrating a series over time (seconds)
+MAX_GAP = 10.0
+
+
+class HistoryQuery:
+    """
+    @class HistoryQuery
+    @brief Read-only queries over a ColumnStore directory.
+    @details Columns are opened with np.memmap, located with searchsorted on
+             the (sorted) time column and reduced with vectorized numpy calls;
+             nothing is read outside the requested range. Supported functions:
+             'min', 'max', 'mean', 'count', 'pNN' (percentile, e.g. 'p99'),
+             'total' (time integral, e.g. MB from MB/s) and 'rate' (change
+             per second between the first and last sample).
+             When every requested function is in TIER_FUNCS, whole buckets
+             of the coarsest fitting tier are used and only the ragged edges
+             of the range are read at full resolution.
+    """
+
+    def __init__(self, directory: str = STORE_DIRECTORY):
+        """
+        @param directory Store root written by ColumnStore.
+        """
+        if not directory:
+            raise ValueError("No history store configured (STORE_DIRECTORY)")
+        self.directory = os.path.expanduser(directory)
+        self._names = None
+
+    # --- Column access -------------------------------------------------
+
+    def _days(self, start: float, end: float) -> list:
+        """
+        @brief Day partitions overlapping [start, end).
+        @note The day holding 'end' is included even when 'end' is its midnight;
+              its rows are then simply outside the searched range.
+        """
+        first = datetime.date.fromtimestamp(start)
+        last = datetime.date.fromtimestamp(max(start, end))
+        days = []
+        while first <= last:
+            path = os.path.join(self.directory, first.strftime(DAY_FORMAT))
+            if os.path.isdir(path):
+                days.append(path)
+            first += datetime.timedelta(days=1)
+        return days
+
+    @staticmethod
+    def _map(path: str, dtype, width: int = 1):
+        """
+        @brief Memory-maps a column (empty array when missing or empty).
+        @note A torn trailing row (writer killed mid-append) is left out.
+        """
+        itemsize = np.dtype(dtype).itemsize
+        if not os.path.exists(path) or os.path.getsize(path) < itemsize * width:
+            return np.empty((0, width) if width > 1 else 0, dtype=dtype)
+        column = np.memmap(path, dtype=dtype, mode="r", shape=(os.path.getsize(path) // itemsize,))
+        if width > 1:
+            column = column[:len(column) // width * width].reshape(-1, width)
+        return column
+
+    def _slice(self, day: str, table: str, start: float, end: float):
+        """
+        @brief Row range of a table's time column that falls in [start, end).
+        @return (times slice, lo, hi).
+        """
+        times = self._map(os.path.join(day, table, "time.f8") if table else
+                          os.path.join(day, "time.f8"), np.float64)
+        lo = int(np.searchsorted(times, start, side="left"))
+        hi = int(np.searchsorted(times, end, side="left"))
+        return times[lo:hi], lo, hi
+
+    def raw(self, name: str, start: float, end: float):
+        """
+        @brief Full-resolution samples of one series.
+        @return (timestamps, values) as float64 arrays, NaN where absent.
+        """
+        all_times, all_values = [], []
+        for day in self._days(start, end):
+            times, lo, hi = self._slice(day, "", start, end)
+            values = self._map(os.path.join(day, "s", series_file(name) + ".f4"), np.float32)
+            chunk = np.full(hi - lo, np.nan)
+            available = max(0, min(hi, len(values)) - lo)
+            chunk[:available] = values[lo:lo + available]
+            all_times.append(np.asarray(times))
+            all_values.append(chunk)
+        if not all_times:
+            return np.empty(0), np.empty(0)
+        return np.concatenate(all_times), np.concatenate(all_values)
+
+    def _tier(self, name: str, size: int, start: float, end: float):
+        """
+        @brief Tier buckets of one series whose start lies in [start, end).
+        @return (bucket starts, records[n, 4]) with records (min, max, sum, count).
+        """
+        all_times, all_records = [], []
+        for day in self._days(start, end):
+            times, lo, hi = self._slice(day, f"t{size}", start, end)
+            records = self._map(os.path.join(day, f"t{size}", series_file(name) + ".f4"),
+                                np.float32, width=4)
+            chunk = np.tile(np.array([np.nan, np.nan, 0.0, 0.0]), (hi - lo, 1))
+            available = max(0, min(hi, len(records)) - lo)
+            chunk[:available] = records[lo:lo + available]
+            all_times.append(np.asarray(times))
+            all_records.append(chunk)
+        if not all_times:
+            return np.empty(0), np.empty((0, 4))
+        return np.concatenate(all_times), np.concatenate(all_records)
+
+    def series(self, start: float, end: float) -> list:
+        """
+        @brief Names of the series stored in the days overlapping the range.
+        """
+        names = set()
+        for day in self._days(start, end):
+            names.update(entry[:-len(".f4")] for entry in os.listdir(os.path.join(day, "s")))
+        return sorted(names)
+
+    # --- Aggregations ----------------------------------------------------
+
+    def aggregate(self, name: str, start: float, end: float, funcs=("min", "max", "mean"),
+                  step: float = None):
+        """
+        @brief Aggregates one series over [start, end).
+        @param name Series name ('disk.write', 'cpu.usage', ...).
+        @param start Range start (seconds since epoch).
+        @param end Range end (seconds since epoch, exclusive).
+        @param funcs Function names (see class details).
+        @param step Optional bucket width in seconds for a time series of results.
+        @return {func: value} or, with 'step', a list of {'time', func: value, ...}.
+        """
+        funcs = list(funcs)
+        for func in funcs:
+            if func not in TIER_FUNCS and func not in ("total", "rate") \
+                    and not re.fullmatch(r"p\d+(\.\d+)?", func):
+                raise ValueError(f"Unknown aggregate '{func}'")
+
+        if step is None:
+            if set(funcs) <= TIER_FUNCS:
+                return self._from_tiers(name, start, end, funcs)
+            times, values = self.raw(name, start, end)
+            return self._reduce(times, values, funcs)
+
+        edges = np.arange(start, end, step)
+        if set(funcs) <= TIER_FUNCS:
+            size = self._fitting_tier(step, start)
+            if size and (end - start) % step == 0 and end <= self._tier_end(size):
+                return self._bucketed_tiers(name, edges, end, size, funcs)
+        times, values = self.raw(name, start, end)
+        bounds = np.searchsorted(times, np.append(edges, end))
+        return [dict(time=float(edge), **self._reduce(times[lo:hi], values[lo:hi], funcs))
+                for edge, lo, hi in zip(edges, bounds[:-1], bounds[1:])]
+
+    def _reduce(self, times: np.ndarray, values: np.ndarray, funcs: list) -> dict:
+        """
+        @brief Computes the requested functions over full-resolution samples.
+        """
+        valid = ~np.isnan(values)
+        present = values[valid]
+        result = {}
+        for func in funcs:
+            if func == "count":
+                result[func] = int(present.size)
+            elif not present.size:
+                result[func] = None
+            elif func == "min":
+                result[func] = float(present.min())
+            elif func == "max":
+                result[func] = float(present.max())
+            elif func == "mean":
+                result[func] = float(present.mean())
+            elif func == "total":
+                # Trapezoid integral; gaps longer than MAX_GAP (collector off) count as zero
+                t, v = times[valid], present
+                dt = np.diff(t)
+                keep = dt <= MAX_GAP
+                result[func] = float(np.sum((v[1:] + v[:-1])[keep] * dt[keep]) / 2)
+            elif func == "rate":
+                t = times[valid]
+                span = t[-1] - t[0]
+                result[func] = float((present[-1] - present[0]) / span) if span > 0 else None
+            else:
+                result[func] = float(np.percentile(present, float(func[1:])))
+        return result
+
+    def _tier_end(self, size: int) -> float:
+        """
+        @brief End of the newest tier bucket already written (0 if none).
+        """
+        days = sorted(entry for entry in os.listdir(self.directory)
+                      if os.path.isdir(os.path.join(self.directory, entry)))
+        for day in reversed(days):
+            times = self._map(os.path.join(self.directory, day, f"t{size}", "time.f8"), np.float64)
+            if len(times):
+                return float(times[-1]) + size
+        return 0.0
+
+    @staticmethod
+    def _fitting_tier(span: float, start: float) -> int:
+        """
+        @brief Coarsest tier whose buckets tile a window of 'span' seconds from 'start'.
+        """
+        for size in sorted(STORE_TIERS, reverse=True):
+            if span >= size and span % size == 0 and start % size == 0:
+                return size
+        return 0
+
+    @staticmethod
+    def _combine(records: np.ndarray) -> np.ndarray:
+        """
+        @brief Merges tier records into one (min, max, sum, count).
+        """
+        if not len(records):
+            return np.array([np.nan, np.nan, 0.0, 0.0])
+        with np.errstate(all="ignore"):
+            return np.array([np.nanmin(records[:, 0]) if np.any(records[:, 3]) else np.nan,
+                             np.nanmax(records[:, 1]) if np.any(records[:, 3]) else np.nan,
+                             records[:, 2].sum(), records[:, 3].sum()])
+
+    @staticmethod
+    def _finish(record: np.ndarray, funcs: list) -> dict:
+        """
+        @brief Turns a (min, max, sum, count) record into function results.
+        """
+        low, high, total, count = record
+        result = {}
+        for func in funcs:
+            if func == "count":
+                result[func] = int(count)
+            elif not count:
+                result[func] = None
+            elif func == "min":
+                result[func] = float(low)
+            elif func == "max":
+                result[func] = float(high)
+            else:
+                result[func] = float(total / count)
+        return result
+
+    def _from_tiers(self, name: str, start: float, end: float, funcs: list) -> dict:
+        """
+        @brief min/max/mean/count from whole tier buckets plus raw ragged edges.
+        """
+        parts = []
+        inner = None
+        for size in sorted(STORE_TIERS, reverse=True):
+            inner_lo = math.ceil(start / size) * size
+            # Buckets still being accumulated by the writer are not on disk yet
+            inner_hi = min(math.floor(end / size) * size, self._tier_end(size))
+            if inner_hi - inner_lo >= size:
+                _, records = self._tier(name, size, inner_lo, inner_hi)
+                parts.append(self._combine(records))
+                inner = (inner_lo, inner_hi)
+                break
+        # Edges (or the whole range when no tier fits) at full resolution
+        edges = ((start, end),) if inner is None else ((start, inner[0]), (inner[1], end))
+        for edge_start, edge_end in edges:
+            if edge_end > edge_start:
+                _, values = self.raw(name, edge_start, edge_end)
+                present = values[~np.isnan(values)]
+                if present.size:
+                    parts.append(np.array([present.min(), present.max(), present.sum(), present.size]))
+        return self._finish(self._combine(np.array(parts)) if parts else
+                            np.array([np.nan, np.nan, 0.0, 0.0]), funcs)
+
+    def _bucketed_tiers(self, name: str, edges: np.ndarray, end: float, size: int, funcs: list) -> list:
+        """
+        @brief Per-step results, each folded from the tier buckets it covers.
+        """
+        times, records = self._tier(name, size, edges[0], end)
+        bounds = np.searchsorted(times, edges)
+        results = []
+        for index, edge in enumerate(edges):
+            hi = bounds[index + 1] if index + 1 < len(bounds) else len(times)
+            results.append(dict(time=float(edge),
+                                **self._finish(self._combine(records[bounds[index]:hi]), funcs)))
+        return results
+
+    # --- Processes -------------------------------------------------------
+
+    def process_names(self, size: int = 0) -> list:
+        """
+        @brief The process name dictionary (index = stored id).
+        @param size Ids needed; the file is re-read if the cached copy is shorter.
+        """
+        if self._names is None or len(self._names) < size:
+            path = os.path.join(self.directory, "names.txt")
+            names = []
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as handle:
+                    for line in handle:
+                        names.append(line.rstrip("\n"))
+            self._names = names
+        return self._names
+
+    def top_processes(self, start: float, end: float, by: str = "cpu", func: str = "mean",
+                      k: int = 10) -> list:
+        """
+        @brief Top-K process names over a range, grouped by name.
+        @param by 'cpu' (%) or 'ram' (RSS MB).
+        @param func 'mean' (over the samples where the name was recorded),
+               'max', or 'total' (CPU-seconds for 'cpu', MB-seconds for 'ram').
+        @param k Number of names returned.
+        @return List of {'name', 'value', 'samples'} sorted by value, descending.
+        @note Only the busiest processes of each sample are stored (see ColumnStore).
+        """
+        if by not in ("cpu", "ram") or func not in ("mean", "max", "total"):
+            raise ValueError("by must be 'cpu' or 'ram', func 'mean', 'max' or 'total'")
+        ids, values, times = [], [], []
+        for day in self._days(start, end):
+            day_times, lo, hi = self._slice(day, "p", start, end)
+            ids.append(self._map(os.path.join(day, "p", "name.u4"), np.uint32)[lo:hi])
+            values.append(self._map(os.path.join(day, "p", f"{by}.f4"), np.float32)[lo:hi])
+            times.append(np.asarray(day_times))
+        if not ids or not sum(len(chunk) for chunk in ids):
+            return []
+        ids = np.concatenate(ids).astype(np.int64)
+        values = np.concatenate(values).astype(np.float64)
+        times = np.concatenate(times)
+
+        counts = np.bincount(ids)
+        if func == "max":
+            totals = np.full(len(counts), -np.inf)
+            np.maximum.at(totals, ids, values)
+        elif func == "total":
+            # Weight each row by its sample's interval (rows of one sample share a timestamp)
+            # (each sample lasts until the next one; the last gets the median interval)
+            stamps, inverse = np.unique(times, return_inverse=True)
+            gaps = np.diff(stamps)
+            dt = np.minimum(np.append(gaps, np.median(gaps) if gaps.size else 1.0), MAX_GAP)
+            weights = values * dt[inverse]
+            totals = np.bincount(ids, weights=weights / 100.0 if by == "cpu" else weights)
+        else:
+            with np.errstate(invalid="ignore"):
+                totals = np.bincount(ids, weights=values) / counts
+
+        present = np.flatnonzero(counts)
+        k = min(k, len(present))
+        best = present[np.argpartition(-totals[present], k - 1)[:k]]
+        best = best[np.argsort(-totals[best])]
+        names = self.process_names()
+        return [{"name": names[i] if i < len(names) else f"#{i}",
+                 "value": float(totals[i]), "samples": int(counts[i])} for i in best]
+
+
+    def events(self, start: float, end: float) -> list:
+        """
+        @brief Process lifecycle events recorded in [start, end), oldest first.
+        @return Event dictionaries as ProcessEventLog.record() built them
+                ('time', 'kind', 'pid', 'key' and the details the event had).
+        """
+        events = []
+        for day in self._days(start, end):
+            times, lo, hi = self._slice(day, "e", start, end)
+            if hi == lo:
+                continue
+            columns = {field: self._map(os.path.join(day, "e", f"{field}.{dtype}"), dtype)[lo:hi]
+                       for field, dtype in EVENT_COLUMNS}
+            ids = np.concatenate([columns["name"], columns["old_name"]])
+            ids = ids[ids != NO_NAME]
+            names = self.process_names(int(ids.max()) + 1 if ids.size else 0)
+            for row, timestamp in enumerate(times):
+                pid = int(columns["pid"][row])
+                event = {"time": float(timestamp), "kind": EVENT_KINDS[columns["kind"][row]],
+                         "pid": pid, "key": (pid, float(columns["created"][row])),
+                         "name": names[columns["name"][row]]}
+                old_name = columns["old_name"][row]
+                if old_name != NO_NAME:
+                    event["old_name"] = names[old_name]
+                for field in ("cpu", "ram", "old_cpu", "old_ram"):
+                    value = float(columns[field][row])
+                    if value == value:
+                        event[field] = value
+                events.append(event)
+        return events
+
+
+# --- CLI -------------------------------------------------------------------
+
+def parse_time(text: str, now: float = None) -> float:
+    """
+    @brief Parses a CLI time: 'now', 'today', 'yesterday', 'HH:MM[:SS]' (today),
+           'YYYY-MM-DD[ HH:MM[:SS]]', relative '-90s'/'-15m'/'-2h'/'-1d', or epoch seconds.
+    """
+    now = time.time() if now is None else now
+    text = text.strip()
+    midnight = datetime.datetime.combine(datetime.date.fromtimestamp(now), datetime.time())
+    if text == "now":
+        return now
+    if text == "today":
+        return midnight.timestamp()
+    if text == "yesterday":
+        return (midnight - datetime.timedelta(days=1)).timestamp()
+    match = re.fullmatch(r"-(\d+(?:\.\d+)?)([smhd])", text)
+    if match:
+        return now - float(match.group(1)) * {"s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+    if re.fullmatch(r"\d{1,2}:\d{2}(:\d{2})?", text):
+        parts = [int(part) for part in text.split(":")] + [0]
+        return midnight.replace(hour=parts[0], minute=parts[1], second=parts[2]).timestamp()
+    try:
+        return datetime.datetime.fromisoformat(text).timestamp()
+    except ValueError:
+        return float(text)
+
+
+def parse_duration(text: str) -> float:
+    """
+    @brief Parses a step such as '60s', '15m', '1h' or '1d' (plain numbers are seconds).
+    """
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smhd]?)", text.strip())
+    if not match:
+        raise ValueError(f"Bad duration '{text}'")
+    return float(match.group(1)) * {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+
+
+def _format(value) -> str:
+    """
+    @brief Formats one aggregate for the CLI table.
+    """
+    if value is None:
+        return "—"
+    return str(value) if isinstance(value, int) else f"{value:.3f}"
+
+
+def main(argv=None):
+    """
+    @brief Command-line entry point.
+    """
+    parser = argparse.ArgumentParser(description="Query the Linux Health Monitor Pro history store")
+    parser.add_argument("--store", default=STORE_DIRECTORY, help="store directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_range(sub):
+        sub.add_argument("--from", dest="start", default="-1h", help="range start (default -1h; write relative times as --from=-2h)")
+        sub.add_argument("--to", dest="end", default="now", help="range end (default now)")
+
+    listing = commands.add_parser("series", help="list stored series")
+    add_range(listing)
+
+    agg = commands.add_parser("agg", help="aggregate one series")
+    agg.add_argument("name")
+    agg.add_argument("--func", nargs="+", default=["min", "mean", "max", "p99"])
+    agg.add_argument("--step", help="bucket width, e.g. 15m or 1h")
+    add_range(agg)
+
+    top = commands.add_parser("top", help="top processes grouped by name")
+    top.add_argument("--by", choices=("cpu", "ram"), default="cpu")
+    top.add_argument("--func", choices=("mean", "max", "total"), default="mean")
+    top.add_argument("-k", type=int, default=10)
+    add_range(top)
+
+    args = parser.parse_args(argv)
+    query = HistoryQuery(args.store)
+    start, end = parse_time(args.start), parse_time(args.end)
+    started = time.perf_counter()
+
+    if args.command == "series":
+        for name in query.series(start, end):
+            print(name)
+    elif args.command == "agg":
+        step = parse_duration(args.step) if args.step else None
+        result = query.aggregate(args.name, start, end, args.func, step)
+        rows = result if step else [dict(time=start, **result)]
+        print("time".ljust(20) + "".join(func.rjust(12) for func in args.func))
+        for row in rows:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(row["time"]))
+            print(stamp.ljust(20) + "".join(_format(row[func]).rjust(12) for func in args.func))
+    else:
+        unit = {"cpu": "%", "ram": "MB"}[args.by]
+        if args.func == "total":
+            unit = "CPU s" if args.by == "cpu" else "MB·s"
+        for rank, row in enumerate(query.top_processes(start, end, args.by, args.func, args.k), 1):
+            print(f"{rank:>3}. {row['name']:<32} {row['value']:>12.2f} {unit}  ({row['samples']} samples)")
+
+    print(f"({(time.perf_counter() - started) * 1000:.1f} ms)", file=sys.stderr)
+    if active_layers():
+        # Overrides (e.g. STORE_DIRECTORY) came from these files; LINUXHEALTH_CONFIG= skips them
+        print(f"(config: {', '.join(active_layers())})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
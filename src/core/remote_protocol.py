@@ -0,0 +1,191 @@
+"""
+@file remote_protocol.py
+@brief Compact delta-encoded wire format between collectors and the GUI.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import json
+import math
+import socket
+import struct
+
+PROTOCOL_VERSION = 1
+
+# Frame header: type (1 byte) + payload length (4 bytes, network order)
+HEADER = struct.Struct("!BI")
+
+HELLO = ord("H")      # JSON {'host', 'version'}
+NAMES = ord("N")      # New series names, '\n'-separated, appended to the dictionary
+KEYFRAME = ord("K")   # Absolute timestamp (double) + every value
+DELTA = ord("D")      # Timestamp delta (ms, uint32) + changed values only
+
+KEY_HEAD = struct.Struct("!dH")
+DELTA_HEAD = struct.Struct("!IH")
+ENTRY = struct.Struct("!Hf")   # Series index + float32 value
+FLOAT32 = struct.Struct("!f")
+
+
+def parse_address(text: str):
+    """
+    @brief Parses a collector address.
+    @param text 'unix:/path/to.sock', 'tcp:host:port' or 'host:port'.
+    @return (socket family, address) suitable for socket.connect()/bind().
+    """
+    if text.startswith("unix:"):
+        return socket.AF_UNIX, text[len("unix:"):]
+    if text.startswith("tcp:"):
+        text = text[len("tcp:"):]
+    host, _, port = text.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Bad collector address '{text}' (use unix:/path or host:port)")
+    return socket.AF_INET, (host, int(port))
+
+
+def frame(kind: int, payload: bytes) -> bytes:
+    """
+    @brief Prefixes a payload with its frame header.
+    """
+    return HEADER.pack(kind, len(payload)) + payload
+
+
+def _as_float32(value) -> float:
+    """
+    @brief Rounds a value to what the wire can carry, so change detection matches the decoder.
+    """
+    try:
+        return FLOAT32.unpack(FLOAT32.pack(value))[0]
+    except (struct.error, TypeError, OverflowError):
+        return math.nan
+
+
+class FrameEncoder:
+    """
+    @class FrameEncoder
+    @brief Turns flat series samples into a shared stream of delta frames.
+    @details Series names are sent once and referred to by a 2-byte index.
+             A sample only carries the values whose float32 representation
+             changed since the previous sample; a series that disappears is
+             sent once as NaN. The encoder state is what every connected
+             client has reconstructed, so one encoded frame serves all of
+             them, and a new client is brought up to date with snapshot().
+    """
+
+    def __init__(self, host: str):
+        """
+        @param host Host name announced in the HELLO frame.
+        """
+        self.host = host
+        self.names = []
+        self.index = {}
+        self.values = []        # float32-rounded last value per index (NaN: absent)
+        self.timestamp = None
+
+    def encode(self, timestamp: float, series: dict) -> bytes:
+        """
+        @brief Encodes one sample.
+        @param timestamp Sample time (seconds since epoch).
+        @param series Flat mapping of series name to numeric value.
+        @return The NAMES (if needed) and KEYFRAME/DELTA frames, concatenated.
+        """
+        out = []
+        new_names = [name for name in series if name not in self.index]
+        if new_names:
+            for name in new_names:
+                self.index[name] = len(self.names)
+                self.names.append(name)
+                self.values.append(math.nan)
+            out.append(frame(NAMES, "\n".join(new_names).encode()))
+
+        changed = []
+        present = set()
+        for name, value in series.items():
+            position = self.index[name]
+            present.add(position)
+            value = _as_float32(value)
+            previous = self.values[position]
+            if value != previous and not (math.isnan(value) and math.isnan(previous)):
+                self.values[position] = value
+                changed.append(ENTRY.pack(position, value))
+        for position, previous in enumerate(self.values):
+            if position not in present and not math.isnan(previous):
+                self.values[position] = math.nan
+                changed.append(ENTRY.pack(position, math.nan))
+
+        if self.timestamp is None:
+            out.append(frame(KEYFRAME, KEY_HEAD.pack(timestamp, len(changed)) + b"".join(changed)))
+        else:
+            delta_ms = max(0, int(round((timestamp - self.timestamp) * 1000)))
+            out.append(frame(DELTA, DELTA_HEAD.pack(delta_ms, len(changed)) + b"".join(changed)))
+            # Track the timestamp the decoder will reconstruct (no drift from rounding)
+            timestamp = self.timestamp + delta_ms / 1000.0
+        self.timestamp = timestamp
+        return b"".join(out)
+
+    def snapshot(self) -> bytes:
+        """
+        @brief Returns the frames that bring a new client to the current state.
+        """
+        out = [frame(HELLO, json.dumps({"host": self.host, "version": PROTOCOL_VERSION}).encode())]
+        if self.names:
+            out.append(frame(NAMES, "\n".join(self.names).encode()))
+        if self.timestamp is not None:
+            entries = [ENTRY.pack(position, value) for position, value in enumerate(self.values)
+                       if not math.isnan(value)]
+            out.append(frame(KEYFRAME, KEY_HEAD.pack(self.timestamp, len(entries)) + b"".join(entries)))
+        return b"".join(out)
+
+
+class FrameDecoder:
+    """
+    @class FrameDecoder
+    @brief Reassembles frames from a byte stream and rebuilds the samples.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.host = None
+        self.names = []
+        self.values = {}        # index -> value
+        self.timestamp = None
+
+    def feed(self, data: bytes) -> list:
+        """
+        @brief Consumes received bytes.
+        @param data Bytes read from the socket (any split is fine).
+        @return A list of (timestamp, {name: value}) samples completed by these bytes.
+        @throws ValueError On an unknown frame type (the stream is out of sync).
+        """
+        self.buffer += data
+        samples = []
+        while len(self.buffer) >= HEADER.size:
+            kind, length = HEADER.unpack_from(self.buffer)
+            end = HEADER.size + length
+            if len(self.buffer) < end:
+                break
+            payload = bytes(self.buffer[HEADER.size:end])
+            del self.buffer[:end]
+
+            if kind == HELLO:
+                self.host = json.loads(payload).get("host")
+            elif kind == NAMES:
+                self.names.extend(payload.decode().split("\n"))
+            elif kind in (KEYFRAME, DELTA):
+                if kind == KEYFRAME:
+                    self.timestamp, count = KEY_HEAD.unpack_from(payload)
+                    self.values = {}
+                    offset = KEY_HEAD.size
+                else:
+                    delta_ms, count = DELTA_HEAD.unpack_from(payload)
+                    self.timestamp += delta_ms / 1000.0
+                    offset = DELTA_HEAD.size
+                for position, value in ENTRY.iter_unpack(payload[offset:offset + count * ENTRY.size]):
+                    if math.isnan(value):
+                        self.values.pop(position, None)
+                    else:
+                        self.values[position] = value
+                samples.append((self.timestamp,
+                                {self.names[position]: value for position, value in self.values.items()}))
+            else:
+                raise ValueError(f"Unknown frame type {kind}")
+        return samples
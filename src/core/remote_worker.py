@@ -0,0 +1,161 @@
+"""
+@file remote_worker.py
+@brief Background client reading several collector streams for the Hosts tab.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+import time
+import socket
+import logging
+import selectors
+from PyQt6.QtCore import QThread, pyqtSignal
+from src.core.remote_protocol import FrameDecoder, parse_address
+from src.config import REMOTE_RECONNECT_SECONDS
+
+
+class RemoteConnection:
+    """
+    @class RemoteConnection
+    @brief State of one collector link: socket, decoder and byte counters.
+    """
+
+    def __init__(self, address: str):
+        """
+        @param address Collector address ('unix:/path' or 'host:port').
+        """
+        self.address = address
+        self.sock = None
+        self.decoder = None
+        self.next_attempt = 0.0
+        self.received = 0          # Bytes since the last rate update
+        self.rate = 0.0            # Bytes per second
+        self.rate_since = time.monotonic()
+
+    @property
+    def name(self) -> str:
+        """
+        @brief Host name announced by the collector (the address until it has).
+        """
+        if self.decoder is not None and self.decoder.host:
+            return self.decoder.host
+        return self.address
+
+
+class RemoteWorker(QThread):
+    """
+    @class RemoteWorker
+    @brief Multiplexes every collector socket on one thread with a selector.
+    @details Each decoded sample is emitted as one packet; a lost link is
+             reported once and retried every REMOTE_RECONNECT_SECONDS, and
+             the collector re-sends its full state on reconnection.
+    """
+
+    # @param dict {'address', 'host', 'connected', 'timestamp', 'series', 'bandwidth'}
+    data_received = pyqtSignal(dict)
+
+    def __init__(self, addresses):
+        """
+        @param addresses Iterable of collector addresses.
+        """
+        super().__init__()
+        self.connections = [RemoteConnection(address) for address in addresses]
+        self.selector = selectors.DefaultSelector()
+        self._is_running = True
+
+    def run(self):
+        """
+        @brief Connect/read loop.
+        """
+        while self._is_running:
+            now = time.monotonic()
+            for connection in self.connections:
+                if connection.sock is None and now >= connection.next_attempt:
+                    self._connect(connection)
+
+            if not self.selector.get_map():
+                self.msleep(250)
+                continue
+            for key, _ in self.selector.select(timeout=0.25):
+                self._read(key.data)
+
+    def _connect(self, connection: RemoteConnection):
+        """
+        @brief Opens a link (blocking connect with a short timeout).
+        """
+        try:
+            family, target = parse_address(connection.address)
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.settimeout(2.0)
+            sock.connect(target)
+            sock.setblocking(False)
+        except (OSError, ValueError) as e:
+            connection.next_attempt = time.monotonic() + REMOTE_RECONNECT_SECONDS
+            logging.debug(f"Collector {connection.address} unreachable: {e}")
+            return
+        connection.sock = sock
+        connection.decoder = FrameDecoder()
+        connection.received = 0
+        connection.rate_since = time.monotonic()
+        self.selector.register(sock, selectors.EVENT_READ, connection)
+        logging.info(f"Connected to collector {connection.address}")
+
+    def _read(self, connection: RemoteConnection):
+        """
+        @brief Drains a readable socket and emits the completed samples.
+        """
+        try:
+            data = connection.sock.recv(65536)
+            if not data:
+                raise ConnectionError("closed by collector")
+            samples = connection.decoder.feed(data)
+        except (BlockingIOError, InterruptedError):
+            return
+        except (OSError, ValueError) as e:
+            self._disconnect(connection, e)
+            return
+
+        connection.received += len(data)
+        now = time.monotonic()
+        if now - connection.rate_since >= 5.0:
+            connection.rate = connection.received / (now - connection.rate_since)
+            connection.received = 0
+            connection.rate_since = now
+
+        for timestamp, series in samples:
+            self.data_received.emit({
+                "address": connection.address,
+                "host": connection.name,
+                "connected": True,
+                "timestamp": timestamp,
+                "series": series,
+                "bandwidth": connection.rate,
+            })
+
+    def _disconnect(self, connection: RemoteConnection, reason):
+        """
+        @brief Closes a broken link, reports it and schedules a reconnection.
+        """
+        logging.warning(f"Collector {connection.address} disconnected: {reason}")
+        self.selector.unregister(connection.sock)
+        connection.sock.close()
+        connection.sock = None
+        connection.next_attempt = time.monotonic() + REMOTE_RECONNECT_SECONDS
+        self.data_received.emit({
+            "address": connection.address,
+            "host": connection.name,
+            "connected": False,
+            "timestamp": time.time(),
+            "series": {},
+            "bandwidth": 0.0,
+        })
+
+    def stop(self):
+        """
+        @brief Gracefully terminates the client thread and closes every link.
+        """
+        self._is_running = False
+        self.wait()
+        for connection in self.connections:
+            if connection.sock is not None:
+                connection.sock.close()
@@ -0,0 +1,124 @@
+"""
+@file render_scheduler.py
+@brief Frame-paced, coalescing dispatcher between producer signals and widgets.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+import sys
+import time
+import logging
+from PyQt6.QtCore import QObject, QTimer
+
+# Flushed once per frame; looked up lazily so pyqtgraph only loads with the first graph
+HISTORY_PLOT_MODULE = "src.components.common.history_plot"
+
+
+class RenderScheduler(QObject):
+    """
+    @class RenderScheduler
+    @brief Applies producer payloads to widgets at most once per frame.
+    @details Producers (GlobalWorker, SpawnWorker, ThreadWorker) submit
+             payloads on named channels instead of calling widgets directly.
+             The first submission after an idle period schedules a frame no
+             earlier than 1/max_fps after the previous one; further payloads
+             arriving before it are coalesced. On each frame:
+             - 'every' handlers receive each pending payload in order. They
+               are meant for cheap ingestion (history appends, event lists)
+               and run whether or not their widget is visible;
+             - 'latest' handlers receive only the newest payload, and only if
+               their widget is visible. Otherwise they are marked stale and
+               rendered on the first frame after the widget is shown;
+             - dirty HistoryPlots of visible graphs are redrawn once.
+             Intermediate states are dropped, never queued.
+    """
+
+    EVERY = "every"
+    LATEST = "latest"
+
+    def __init__(self, max_fps: float, parent=None):
+        """
+        @param max_fps Upper bound on frames per second.
+        """
+        super().__init__(parent)
+        self.interval = 1.0 / max_fps
+        self.handlers = {}    # channel -> list of [mode, handler, widget, stale]
+        self.pending = {}     # channel -> payloads received since the last frame
+        self.latest = {}      # channel -> newest payload ever received
+        self.last_frame = 0.0
+        self.frames = 0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._frame)
+
+    def register(self, channel: str, handler, mode: str = LATEST, widget=None):
+        """
+        @brief Subscribes a handler to a channel.
+        @param channel Channel name ('telemetry', 'spawns', 'threads', ...).
+        @param handler Callable receiving one payload.
+        @param mode RenderScheduler.EVERY or RenderScheduler.LATEST.
+        @param widget Widget whose visibility gates a LATEST handler (None: always run).
+        """
+        entry = [mode, handler, widget, False]
+        self.handlers.setdefault(channel, []).append(entry)
+        if mode == self.LATEST and channel in self.latest:
+            # Late subscriber (deferred tab): render the current state on the next frame
+            entry[3] = True
+            self.request_frame()
+
+    def submit(self, channel: str, payload):
+        """
+        @brief Queues a payload and makes sure a frame is scheduled.
+        """
+        self.pending.setdefault(channel, []).append(payload)
+        self.latest[channel] = payload
+        self.request_frame()
+
+    def request_frame(self, *args):
+        """
+        @brief Schedules a frame (no-op if one is already scheduled).
+        @details Also connected to tab changes so stale views refresh on show.
+        """
+        if self.timer.isActive():
+            return
+        wait = self.last_frame + self.interval - time.monotonic()
+        self.timer.start(max(0, int(wait * 1000)))
+
+    def _frame(self):
+        """
+        @brief Runs one batched update.
+        """
+        self.last_frame = time.monotonic()
+        self.frames += 1
+        pending, self.pending = self.pending, {}
+
+        for channel, entries in self.handlers.items():
+            payloads = pending.get(channel, [])
+            for entry in entries:
+                mode, handler, widget, stale = entry
+                if mode == self.EVERY:
+                    for payload in payloads:
+                        self._call(handler, payload)
+                    continue
+                if not (payloads or stale):
+                    continue
+                if widget is not None and not widget.isVisible():
+                    entry[3] = True
+                    continue
+                entry[3] = False
+                self._call(handler, self.latest[channel])
+
+        history_plot = sys.modules.get(HISTORY_PLOT_MODULE)
+        if history_plot is not None:
+            history_plot.HistoryPlot.flush()
+
+    @staticmethod
+    def _call(handler, payload):
+        """
+        @brief Isolates handler failures so one widget cannot stall the frame.
+        """
+        try:
+            handler(payload)
+        except Exception as e:
+            logging.error(f"UI Update Distribution Error in {getattr(handler, '__name__', handler)}: {e}")
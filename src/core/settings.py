@@ -0,0 +1,271 @@
+"""
+@file settings.py
+@brief Layered TOML overrides of the src/config.py defaults.
+@project Linux Health Monitor Pro
+@license MIT
+
+Layers, lowest precedence first (later files override earlier ones):
+    src/config.py                          built-in defaults
+    /etc/linuxhealth/config.toml           host-wide
+    ~/.config/linuxhealth/config.toml      per user ($XDG_CONFIG_HOME is honoured)
+    $LINUXHEALTH_CONFIG                    explicit file, e.g. for one session
+
+Setting LINUXHEALTH_CONFIG to an empty string disables every layer, so the
+built-in defaults apply (tests and benchmarks run this way). A layer whose
+values fail validation (see validate()) is rejected as a whole with a logged
+error; on a live reload the file's previous valid content is kept instead.
+
+Keys are the names of the config.py constants (case-insensitive), e.g.:
+    max_processes = 40
+    governor_min_interval = 2.0
+    disabled_sensors = ["interrupts"]
+    disk_devices = ["nvme*", "!*p[0-9]*"]
+
+    [sensor_intervals]
+    hardware = 5
+"""
+
+import os
+import copy
+import fnmatch
+import logging
+import tomllib
+
+SYSTEM_LAYER = "/etc/linuxhealth/config.toml"
+LAYER_ENV = "LINUXHEALTH_CONFIG"
+
+# Settings the running application picks up on reload; any other change needs a restart
+LIVE_SETTINGS = frozenset({
+    "MAX_PROCESSES", "PROCESS_TREE_CHILD_LIMIT", "LIVE_WINDOW_SECONDS",
+    "THREAD_SAMPLING_INTERVAL_MS", "RENDER_MAX_FPS",
+    "PSS_REFRESH_BUDGET", "PSS_REFRESH_INTERVAL",
+    "SOCKET_SCAN_BUDGET", "SOCKET_SCAN_INTERVAL",
+    "NUMA_RESIDENCY_BUDGET", "NUMA_RESIDENCY_INTERVAL",
+    "ANOMALY_WINDOW", "ANOMALY_THRESHOLD", "ANOMALY_MIN_SCALE",
+    "GOVERNOR_CPU_BUDGET", "GOVERNOR_MIN_INTERVAL", "GOVERNOR_MAX_INTERVAL",
+    "GOVERNOR_SHEDDABLE", "SENSOR_INTERVALS", "DISABLED_SENSORS",
+    "DISK_DEVICES", "NET_INTERFACES",
+})
+
+# Numeric settings that must be strictly positive (any other number must be >= 0)
+POSITIVE_SETTINGS = frozenset({
+    "MAX_PROCESSES", "HISTORY_CAPACITY", "ANOMALY_WINDOW", "ANOMALY_THRESHOLD",
+    "ANOMALY_SEASONAL_PERIOD", "ANOMALY_SEASONAL_BINS",
+    "BURST_MIN_RATE", "BURST_MAX_RATE", "BURST_MAX_SECONDS",
+    "LIVE_WINDOW_SECONDS", "HISTORY_RETENTION_SAMPLES", "THREAD_SAMPLING_INTERVAL_MS",
+    "PSS_REFRESH_INTERVAL", "SPAWN_SCAN_HZ", "SPAWN_TRACK_SECONDS", "SPAWN_LOG_SIZE",
+    "PROCESS_EVENT_LOG_SIZE", "PROCESS_TREE_CHILD_LIMIT", "SOCKET_SCAN_INTERVAL",
+    "NUMA_RESIDENCY_INTERVAL", "RENDER_MAX_FPS",
+    "GOVERNOR_CPU_BUDGET", "GOVERNOR_MIN_INTERVAL", "GOVERNOR_MAX_INTERVAL",
+    "EXPORT_BATCH_ROWS", "EXPORT_FLUSH_SECONDS", "EXPORT_ROTATE_ROWS", "EXPORT_QUEUE_SIZE",
+    "REMOTE_RECONNECT_SECONDS", "REMOTE_CLIENT_BUFFER_BYTES",
+})
+
+# (lower, upper) pairs that must stay ordered
+ORDERED_SETTINGS = (
+    ("GOVERNOR_MIN_INTERVAL", "GOVERNOR_MAX_INTERVAL"),
+    ("BURST_MIN_RATE", "BURST_MAX_RATE"),
+)
+
+# Settings restricted to a few values
+SETTING_CHOICES = {
+    "ANOMALY_METHOD": ("mad", "zscore"),
+    "EXPORT_FORMAT": (None, "csv", "parquet", "arrow"),
+    "EXPORT_BACKPRESSURE": ("drop_oldest", "drop_newest"),
+}
+
+# Built-in values, captured by apply_layers() before any override
+_defaults = {}
+
+# Last valid content per file, kept while a file is mid-edit, broken or rejected
+_last_good = {}
+
+# Files that contributed to the latest read_layers()
+_active = []
+
+
+def layer_paths() -> list:
+    """
+    @brief Returns the override files in precedence order (existing or not).
+    @return [] when LINUXHEALTH_CONFIG is set but empty (layering disabled).
+    """
+    explicit = os.environ.get(LAYER_ENV)
+    if explicit == "":
+        return []
+    user_root = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    paths = [SYSTEM_LAYER, os.path.join(user_root, "linuxhealth", "config.toml")]
+    if explicit:
+        paths.append(os.path.abspath(os.path.expanduser(explicit)))
+    return paths
+
+
+def _coerce(name: str, value, default):
+    """
+    @brief Checks an override against the type of its built-in value.
+    @return The value converted to the default's type (int -> float, list -> tuple).
+    @throws ValueError If the types are incompatible.
+    """
+    if default is None:
+        return value
+    if isinstance(default, bool) or isinstance(value, bool):
+        if isinstance(default, bool) and isinstance(value, bool):
+            return value
+    elif isinstance(default, int):
+        if isinstance(value, int):
+            return value
+    elif isinstance(default, float):
+        if isinstance(value, (int, float)):
+            return float(value)
+    elif isinstance(default, (list, tuple)):
+        if isinstance(value, list):
+            return type(default)(value)
+    elif isinstance(default, type(value)):
+        return value
+    raise ValueError(f"{name} expects {type(default).__name__}, got {type(value).__name__}")
+
+
+def validate(values: dict) -> list:
+    """
+    @brief Checks a complete set of settings for values the application cannot run with.
+    @param values {NAME: value} for every setting.
+    @return Human-readable problems ([] if valid).
+    """
+    problems = []
+    for name, value in values.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        if name in POSITIVE_SETTINGS and not value > 0:
+            problems.append(f"{name} must be positive, got {value}")
+        elif value < 0:
+            problems.append(f"{name} must not be negative, got {value}")
+    for section, seconds in values.get("SENSOR_INTERVALS", {}).items():
+        if isinstance(seconds, bool) or not isinstance(seconds, (int, float)) or seconds < 0:
+            problems.append(f"SENSOR_INTERVALS.{section} must be a number of seconds >= 0")
+    for lower, upper in ORDERED_SETTINGS:
+        if lower in values and upper in values and values[lower] > values[upper]:
+            problems.append(f"{lower} ({values[lower]}) exceeds {upper} ({values[upper]})")
+    for name, choices in SETTING_CHOICES.items():
+        if name in values and values[name] not in choices:
+            problems.append(f"{name} must be one of {', '.join(map(str, choices))}")
+    return problems
+
+
+def _read_layer(path: str):
+    """
+    @brief Parses one override file.
+    @return Its table, the last valid one if it no longer parses, or None if absent.
+    """
+    try:
+        with open(path, "rb") as handle:
+            layer = tomllib.load(handle)
+    except FileNotFoundError:
+        _last_good.pop(path, None)
+        return None
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        logging.error(f"Config file {path} unreadable, keeping its previous values: {e}")
+        return _last_good.get(path)
+    return layer
+
+
+def _merge(values: dict, path: str, layer: dict, defaults: dict) -> dict:
+    """
+    @brief Overlays one parsed layer on the values merged so far.
+    @return The new merged values.
+    @throws ValueError If the result does not pass validate().
+    """
+    merged = dict(values)
+    for key, value in layer.items():
+        name = key.upper()
+        if name not in defaults:
+            logging.warning(f"{path}: unknown setting '{key}' ignored")
+            continue
+        try:
+            value = _coerce(name, value, defaults[name])
+        except ValueError as e:
+            logging.error(f"{path}: {e}")
+            continue
+        if isinstance(value, dict):
+            value = dict(merged.get(name, defaults[name]), **value)
+        merged[name] = value
+    problems = validate(dict(defaults, **merged))
+    if problems:
+        raise ValueError("; ".join(problems))
+    return merged
+
+
+def read_layers(defaults: dict) -> dict:
+    """
+    @brief Merges every override file.
+    @param defaults Built-in values (validate names and types).
+    @return {NAME: value} for each overridden setting. Tables (e.g.
+            SENSOR_INTERVALS) are merged key by key across layers.
+    """
+    values = {}
+    _active.clear()
+    for path in layer_paths():
+        layer = _read_layer(path)
+        if not layer:
+            continue
+        try:
+            values = _merge(values, path, layer, defaults)
+            _last_good[path] = layer
+        except ValueError as e:
+            previous = _last_good.get(path)
+            logging.error(f"Config file {path} rejected ({e}); "
+                          + ("keeping its previous values" if previous else "ignoring it"))
+            if previous is None or previous is layer:
+                continue
+            try:
+                values = _merge(values, path, previous, defaults)
+            except ValueError:
+                continue
+        _active.append(path)
+    return values
+
+
+def apply_layers(namespace: dict):
+    """
+    @brief Overlays the override files on a module namespace.
+    @details Called once at the end of src/config.py, so every module that
+             imports a constant already sees the layered value.
+    @param namespace The globals() of src/config.py.
+    """
+    _defaults.update({name: copy.deepcopy(value) for name, value in namespace.items()
+                      if name.isupper()})
+    namespace.update(read_layers(_defaults))
+
+
+def active_layers() -> list:
+    """
+    @brief Override files applied by the latest read, lowest precedence first.
+    """
+    return list(_active)
+
+
+def layered_values() -> dict:
+    """
+    @brief Re-reads the layers over the built-in values.
+    @return {NAME: value} for every setting of src/config.py.
+    """
+    values = copy.deepcopy(_defaults)
+    values.update(read_layers(_defaults))
+    return values
+
+
+def device_selected(name: str, patterns) -> bool:
+    """
+    @brief Tests a disk or interface name against a filter list.
+    @param patterns fnmatch patterns; a leading '!' excludes. An empty list
+           selects everything; a list of exclusions only selects the rest.
+    @return True if the last matching pattern includes the name.
+    """
+    if not patterns:
+        return True
+    selected = all(pattern.startswith("!") for pattern in patterns)
+    for pattern in patterns:
+        if pattern.startswith("!"):
+            if fnmatch.fnmatchcase(name, pattern[1:]):
+                selected = False
+        elif fnmatch.fnmatchcase(name, pattern):
+            selected = True
+    return selected
@@ -0,0 +1,118 @@
+"""
+@file settings_watcher.py
+@brief inotify-driven hot reload of the layered configuration.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+import os
+import logging
+from PyQt6.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+from src import config
+from src.core.settings import layer_paths, layered_values, LIVE_SETTINGS
+
+# Editors save in several steps (truncate, write, rename): coalesce them into one reload
+RELOAD_DELAY_MS = 250
+
+
+class SettingsWatcher(QObject):
+    """
+    @class SettingsWatcher
+    @brief Re-reads the override files when they change and publishes the differences.
+    @details QFileSystemWatcher is backed by inotify on Linux, so nothing
+             polls: each existing layer file is watched, plus the existing
+             parent directory of every layer, which catches files that are
+             created, deleted or replaced by an editor's atomic rename (that
+             drops the file watch; it is re-armed after each reload). A
+             directory event only schedules a reload when one of the layer
+             files in it was created, removed or rewritten. On a change the src.config attributes are updated and 'changed'
+             carries only the settings whose value moved. Removing a key from
+             a file restores the value of the layer below it.
+    """
+
+    # @param dict {NAME: new value}
+    changed = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        """
+        @param parent Owning QObject.
+        """
+        super().__init__(parent)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._schedule)
+        self.watcher.directoryChanged.connect(self._directory_changed)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(RELOAD_DELAY_MS)
+        self.timer.timeout.connect(self.reload)
+        # Layer path -> stat signature at the last (re)load
+        self.signatures = self._signatures()
+        self._watch()
+
+    def _watch(self):
+        """
+        @brief (Re)arms the file and directory watches.
+        """
+        files, directories = set(self.watcher.files()), set(self.watcher.directories())
+        for path in layer_paths():
+            if os.path.isfile(path) and path not in files:
+                self.watcher.addPath(path)
+            directory = os.path.dirname(path)
+            if os.path.isdir(directory) and directory not in directories:
+                self.watcher.addPath(directory)
+                directories.add(directory)
+
+    @staticmethod
+    def _signatures() -> dict:
+        """
+        @brief Identifies the current version of every layer file.
+        @return {path: (inode, mtime_ns, size), or None when the file is missing}.
+        """
+        signatures = {}
+        for path in layer_paths():
+            try:
+                st = os.stat(path)
+                signatures[path] = (st.st_ino, st.st_mtime_ns, st.st_size)
+            except OSError:
+                signatures[path] = None
+        return signatures
+
+    def _directory_changed(self, directory: str):
+        """
+        @brief Schedules a reload only if a layer file in 'directory' changed.
+        @details directoryChanged does not name the entry that moved, so the
+                 layer files of that directory are compared with their last
+                 loaded signatures; unrelated writes are ignored.
+        """
+        current = self._signatures()
+        if any(signature != self.signatures.get(path)
+               for path, signature in current.items()
+               if os.path.dirname(path) == directory):
+            self._schedule()
+
+    def _schedule(self, *args):
+        """
+        @brief Debounces change notifications.
+        """
+        self.timer.start()
+
+    def reload(self) -> dict:
+        """
+        @brief Re-reads every layer and applies what changed.
+        @return The changed settings (also emitted through 'changed').
+        """
+        # Taken before reading, so a write during the read triggers another reload
+        self.signatures = self._signatures()
+        changes = {name: value for name, value in layered_values().items()
+                   if getattr(config, name, None) != value}
+        for name, value in changes.items():
+            setattr(config, name, value)
+        self._watch()
+        if not changes:
+            return changes
+        logging.info(f"Config reloaded: {', '.join(sorted(changes))}")
+        restart = sorted(set(changes) - LIVE_SETTINGS)
+        if restart:
+            logging.warning(f"Config: restart needed for {', '.join(restart)}")
+        self.changed.emit(changes)
+        return changes
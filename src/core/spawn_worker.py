@@ -0,0 +1,60 @@
+"""
+@file spawn_worker.py
+@brief Background high-frequency PID scanner for short-lived processes.
+@project Linux Health Monitor Pro
+@dependencies PyQt6
+"""
+
+import time
+import logging
+from PyQt6.QtCore import QThread, pyqtSignal
+from src.components.processes.spawn.spawn_sensor import SpawnSensor
+from src.config import (SPAWN_SCAN_HZ, SPAWN_TRACK_SECONDS, SPAWN_TRACK_LIMIT,
+                        SPAWN_LOG_SIZE)
+
+class SpawnWorker(QThread):
+    """
+    @class SpawnWorker
+    @brief Runs SpawnSensor.scan at SPAWN_SCAN_HZ and reports once per second.
+    @details The scan loop stays on this thread; the GUI only receives a
+             1Hz summary with rates and the events collected in between.
+    """
+
+    # @param dict Summary from SpawnSensor.summary
+    data_received = pyqtSignal(dict)
+
+    def __init__(self):
+        super().__init__()
+        self.sensor = SpawnSensor(SPAWN_TRACK_SECONDS, SPAWN_TRACK_LIMIT, SPAWN_LOG_SIZE)
+        self._is_running = True
+
+    def run(self):
+        """
+        @brief Scan loop on a fixed deadline grid.
+        """
+        period = 1.0 / SPAWN_SCAN_HZ
+        next_scan = time.monotonic()
+        next_report = next_scan + 1.0
+        while self._is_running:
+            try:
+                self.sensor.scan()
+                if time.monotonic() >= next_report:
+                    next_report += 1.0
+                    self.data_received.emit(self.sensor.summary())
+            except Exception as e:
+                logging.warning(f"Spawn scanner failed: {e}")
+
+            next_scan += period
+            delay = next_scan - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (e.g. system stall): resynchronise instead of bursting
+                next_scan = time.monotonic()
+
+    def stop(self):
+        """
+        @brief Gracefully terminates the scanner thread.
+        """
+        self._is_running = False
+        self.wait()
@@ -0,0 +1,396 @@
+"""
+@file store.py
+@brief Day-partitioned, memory-mappable column store for long-term telemetry.
+@project Linux Health Monitor Pro
+@dependencies numpy
+"""
+
+import os
+import math
+import time
+import heapq
+import shutil
+import logging
+import numpy as np
+from src.core.event_log import EVENT_KINDS
+
+# Downsampled tiers (bucket size in seconds); each bucket holds min, max, sum, count
+STORE_TIERS = (60, 3600)
+
+# Tier record layout (float32 x 4 per bucket)
+TIER_FIELDS = ("min", "max", "sum", "count")
+
+DAY_FORMAT = "%Y-%m-%d"
+
+# Lifecycle event columns (name, dtype); NaN / NO_NAME mark a detail the event lacks
+EVENT_COLUMNS = (("kind", "u1"), ("pid", "u4"), ("created", "f8"), ("name", "u4"),
+                 ("old_name", "u4"), ("cpu", "f4"), ("ram", "f4"),
+                 ("old_cpu", "f4"), ("old_ram", "f4"))
+NO_NAME = 0xFFFFFFFF
+
+
+def day_of(timestamp: float) -> str:
+    """
+    @brief Returns the (local) day partition name of a timestamp.
+    """
+    return time.strftime(DAY_FORMAT, time.localtime(timestamp))
+
+
+def series_file(name: str) -> str:
+    """
+    @brief Maps a series name to a file name ('/' cannot appear in one).
+    """
+    return name.replace("/", "_")
+
+
+class ColumnStore:
+    """
+    @class ColumnStore
+    @brief Appends samples to raw columns, tier columns, a process table and an event table.
+    @details Layout under 'directory':
+                 names.txt                  process name dictionary (line = id)
+                 YYYY-MM-DD/time.f8         sample timestamps (float64)
+                 YYYY-MM-DD/s/<series>.f4   raw values (float32, NaN = absent)
+                 YYYY-MM-DD/t<size>/time.f8 bucket starts of each tier
+                 YYYY-MM-DD/t<size>/<series>.f4  (min, max, sum, count) per bucket
+                 YYYY-MM-DD/p/{time.f8, name.u4, cpu.f4, ram.f4}  process rows
+                 YYYY-MM-DD/e/{time.f8, kind.u1, pid.u4, ...}  lifecycle events
+                                            (see EVENT_COLUMNS)
+             Every column of a table has one entry per row of its time.f8,
+             which is written last and so acts as the commit marker: on
+             reopening, columns are padded or truncated to it. A series that
+             appears mid-day is back-filled with NaN. Tier buckets are
+             combinable (min of mins, sum of sums...), so a partial bucket
+             flushed at shutdown and its continuation after a restart simply
+             add up at query time. Time columns must stay sorted for the
+             readers' binary searches, so samples older than the last one
+             written (a backward wall-clock step) are dropped and counted
+             in 'rejected' until the clock catches up. Only the
+             'process_rows' busiest processes
+             by CPU and by RSS are kept per sample; every lifecycle event
+             (start, exit, rename, change) is kept. Days older than
+             'retention_days' are deleted when a new day starts.
+             Used from a single writer thread (see TelemetryExporter).
+    """
+
+    def __init__(self, directory: str, process_rows: int = 10, retention_days: int = 14):
+        """
+        @param directory Store root ('~' is expanded, created if missing).
+        @param process_rows Processes kept per sample for each of CPU and RSS.
+        @param retention_days Day partitions kept (0 keeps all).
+        """
+        self.directory = os.path.expanduser(directory)
+        self.process_rows = process_rows
+        self.retention_days = retention_days
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.name_ids = {}
+        self.names_path = os.path.join(self.directory, "names.txt")
+        if os.path.exists(self.names_path):
+            with open(self.names_path, encoding="utf-8") as handle:
+                for line in handle:
+                    self.name_ids.setdefault(line.rstrip("\n"), len(self.name_ids))
+        self.names_file = open(self.names_path, "a", encoding="utf-8")
+
+        self.day = None
+        self.day_path = None
+        self.rows = 0
+        self.columns = {}       # series -> open raw file
+        self.tiers = {}         # size -> {'start', 'rows', 'files', 'acc'}
+        self.proc_files = None
+        self.event_files = None
+        self.last_time = self._last_committed()
+        self.rejected = 0          # Samples dropped for being older than 'last_time'
+        self._behind = False
+
+    def append(self, batch: list):
+        """
+        @brief Writes a batch of samples.
+        @param batch List of (timestamp, series, processes, events); 'processes'
+               and 'events' (ProcessEventLog records) may be None.
+        """
+        # Split at day boundaries so each chunk lands in one partition
+        chunk = []
+        for item in batch:
+            if item[0] < self.last_time:
+                if not self._behind:
+                    logging.warning(f"History store: clock stepped back "
+                                    f"{self.last_time - item[0]:.1f} s, dropping samples until it catches up")
+                    self._behind = True
+                self.rejected += 1
+                continue
+            self._behind = False
+            self.last_time = item[0]
+            day = day_of(item[0])
+            if day != self.day:
+                self._write(chunk)
+                chunk = []
+                self._open_day(day)
+            chunk.append(item)
+        self._write(chunk)
+
+    def _write(self, chunk: list):
+        """
+        @brief Appends rows that all belong to the current day.
+        """
+        if not chunk:
+            return
+        times = np.array([item[0] for item in chunk], dtype=np.float64)
+        names = set()
+        for _, series, _, _ in chunk:
+            names.update(series)
+        for name in names:
+            if name not in self.columns:
+                self.columns[name] = self._open_column(os.path.join("s", series_file(name) + ".f4"),
+                                                       self.rows, 4, np.float32(np.nan).tobytes())
+        for name, handle in self.columns.items():
+            column = np.array([series.get(name, np.nan) for _, series, _, _ in chunk], dtype=np.float32)
+            handle.write(column.tobytes())
+        for size in STORE_TIERS:
+            self._accumulate(size, times, chunk)
+        self._write_processes(chunk)
+        self._write_events(chunk)
+
+        # Commit: the time column is written last
+        for handle in self.columns.values():
+            handle.flush()
+        self.time_file.write(times.tobytes())
+        self.time_file.flush()
+        self.rows += len(chunk)
+
+    def _accumulate(self, size: int, times: np.ndarray, chunk: list):
+        """
+        @brief Folds rows into the current bucket of a tier, flushing full buckets.
+        """
+        tier = self.tiers[size]
+        for timestamp, (_, series, _, _) in zip(times, chunk):
+            start = math.floor(timestamp / size) * size
+            if tier["start"] is not None and start != tier["start"]:
+                self._flush_bucket(size)
+            tier["start"] = start
+            acc = tier["acc"]
+            for name, value in series.items():
+                if value is None or value != value:
+                    continue
+                entry = acc.get(name)
+                if entry is None:
+                    acc[name] = [value, value, value, 1]
+                else:
+                    if value < entry[0]:
+                        entry[0] = value
+                    if value > entry[1]:
+                        entry[1] = value
+                    entry[2] += value
+                    entry[3] += 1
+
+    def _flush_bucket(self, size: int):
+        """
+        @brief Writes the current bucket of a tier (every known series gets a record).
+        """
+        tier = self.tiers[size]
+        if tier["start"] is None:
+            return
+        empty = np.array([np.nan, np.nan, 0.0, 0.0], dtype=np.float32).tobytes()
+        files = tier["files"]
+        for name in tier["acc"]:
+            if name not in files:
+                files[name] = self._open_column(
+                    os.path.join(f"t{size}", series_file(name) + ".f4"), tier["rows"], 16, empty)
+        for name, handle in files.items():
+            entry = tier["acc"].get(name)
+            handle.write(empty if entry is None else np.array(entry, dtype=np.float32).tobytes())
+            handle.flush()
+        tier["time"].write(np.float64(tier["start"]).tobytes())
+        tier["time"].flush()
+        tier["rows"] += 1
+        tier["start"] = None
+        tier["acc"] = {}
+
+    def _write_processes(self, chunk: list):
+        """
+        @brief Appends the busiest processes (by CPU and by RSS) of each sample.
+        """
+        times, ids, cpus, rams = [], [], [], []
+        for timestamp, _, processes, _ in chunk:
+            if not processes:
+                continue
+            keep = {id(row): row for row in heapq.nlargest(self.process_rows, processes,
+                                                            key=lambda row: row["cpu"])}
+            for row in heapq.nlargest(self.process_rows, processes, key=lambda row: row["ram"]):
+                keep[id(row)] = row
+            for row in keep.values():
+                times.append(timestamp)
+                ids.append(self._name_id(row["name"]))
+                cpus.append(row["cpu"])
+                rams.append(row["ram"])
+        if not times:
+            return
+        files = self.proc_files
+        files["name"].write(np.array(ids, dtype=np.uint32).tobytes())
+        files["cpu"].write(np.array(cpus, dtype=np.float32).tobytes())
+        files["ram"].write(np.array(rams, dtype=np.float32).tobytes())
+        for handle in files.values():
+            handle.flush()
+        self.names_file.flush()
+        files["time"].write(np.array(times, dtype=np.float64).tobytes())
+        files["time"].flush()
+
+    def _write_events(self, chunk: list):
+        """
+        @brief Appends the lifecycle events recorded with each sample.
+        """
+        events = [event for _, _, _, recorded in chunk if recorded for event in recorded]
+        if not events:
+            return
+        values = {field: [] for field, _ in EVENT_COLUMNS}
+        for event in events:
+            values["kind"].append(EVENT_KINDS.index(event["kind"]))
+            values["pid"].append(event["pid"])
+            values["created"].append(event["key"][1])
+            values["name"].append(self._name_id(event.get("name", "")))
+            old_name = event.get("old_name")
+            values["old_name"].append(NO_NAME if old_name is None else self._name_id(old_name))
+            for field in ("cpu", "ram", "old_cpu", "old_ram"):
+                values[field].append(event.get(field, np.nan))
+        files = self.event_files
+        for field, dtype in EVENT_COLUMNS:
+            files[field].write(np.array(values[field], dtype=dtype).tobytes())
+            files[field].flush()
+        self.names_file.flush()
+        files["time"].write(np.array([event["time"] for event in events], dtype=np.float64).tobytes())
+        files["time"].flush()
+
+    def _name_id(self, name: str) -> int:
+        """
+        @brief Returns the dictionary id of a process name, adding it if new.
+        """
+        ident = self.name_ids.get(name)
+        if ident is None:
+            ident = len(self.name_ids)
+            self.name_ids[name] = ident
+            self.names_file.write(name.replace("\n", " ") + "\n")
+        return ident
+
+    def _open_day(self, day: str):
+        """
+        @brief Switches to a day partition (resuming it if it exists).
+        """
+        self.close_day()
+        self.day = day
+        self.day_path = os.path.join(self.directory, day)
+        for sub in ["s", "p", "e"] + [f"t{size}" for size in STORE_TIERS]:
+            os.makedirs(os.path.join(self.day_path, sub), exist_ok=True)
+
+        self.time_file, self.rows = self._open_table("time.f8")
+        self.columns = {}
+        for entry in os.listdir(os.path.join(self.day_path, "s")):
+            name = entry[:-len(".f4")]
+            self.columns[name] = self._open_column(os.path.join("s", entry), self.rows, 4,
+                                                   np.float32(np.nan).tobytes())
+
+        self.tiers = {}
+        for size in STORE_TIERS:
+            handle, rows = self._open_table(os.path.join(f"t{size}", "time.f8"))
+            empty = np.array([np.nan, np.nan, 0.0, 0.0], dtype=np.float32).tobytes()
+            files = {}
+            for entry in os.listdir(os.path.join(self.day_path, f"t{size}")):
+                if entry != "time.f8":
+                    files[entry[:-len(".f4")]] = self._open_column(
+                        os.path.join(f"t{size}", entry), rows, 16, empty)
+            self.tiers[size] = {"time": handle, "rows": rows, "files": files,
+                                "start": None, "acc": {}}
+
+        time_handle, proc_rows = self._open_table(os.path.join("p", "time.f8"))
+        self.proc_files = {"time": time_handle}
+        for field, width in (("name", 4), ("cpu", 4), ("ram", 4)):
+            self.proc_files[field] = self._open_column(
+                os.path.join("p", f"{field}.{'u4' if field == 'name' else 'f4'}"),
+                proc_rows, width, bytes(width))
+
+        time_handle, event_rows = self._open_table(os.path.join("e", "time.f8"))
+        self.event_files = {"time": time_handle}
+        for field, dtype in EVENT_COLUMNS:
+            width = np.dtype(dtype).itemsize
+            self.event_files[field] = self._open_column(
+                os.path.join("e", f"{field}.{dtype}"), event_rows, width, bytes(width))
+        self._prune()
+
+    def _last_committed(self) -> float:
+        """
+        @brief Newest timestamp already in the store (-inf when empty).
+        """
+        days = sorted(entry for entry in os.listdir(self.directory)
+                      if len(entry) == 10 and os.path.isdir(os.path.join(self.directory, entry)))
+        for day in reversed(days):
+            path = os.path.join(self.directory, day, "time.f8")
+            rows = os.path.getsize(path) // 8 if os.path.exists(path) else 0
+            if rows:
+                with open(path, "rb") as handle:
+                    handle.seek((rows - 1) * 8)
+                    return float(np.frombuffer(handle.read(8), dtype=np.float64)[0])
+        return -math.inf
+
+    def _open_table(self, relative: str):
+        """
+        @brief Opens a time column for appending.
+        @return (file handle, committed row count).
+        """
+        path = os.path.join(self.day_path, relative)
+        rows = os.path.getsize(path) // 8 if os.path.exists(path) else 0
+        handle = open(path, "ab")
+        handle.truncate(rows * 8)   # Drop a torn trailing write
+        return handle, rows
+
+    def _open_column(self, relative: str, rows: int, width: int, filler: bytes):
+        """
+        @brief Opens a data column and aligns it with its table's committed rows.
+        @param relative Path inside the day partition.
+        @param rows Committed rows of the table.
+        @param width Bytes per row.
+        @param filler Bytes of one 'absent' row used for back-filling.
+        """
+        path = os.path.join(self.day_path, relative)
+        handle = open(path, "ab")
+        size = handle.tell()
+        if size > rows * width:
+            handle.truncate(rows * width)
+        elif size < rows * width:
+            handle.write(filler * (rows - size // width))
+        return handle
+
+    def close_day(self):
+        """
+        @brief Flushes the open tier buckets and closes the day's files.
+        """
+        if self.day is None:
+            return
+        for size in STORE_TIERS:
+            self._flush_bucket(size)
+        handles = [self.time_file] + list(self.columns.values()) + list(self.proc_files.values()) \
+            + list(self.event_files.values())
+        for tier in self.tiers.values():
+            handles += [tier["time"]] + list(tier["files"].values())
+        for handle in handles:
+            handle.close()
+        self.day = None
+        self.columns = {}
+        self.tiers = {}
+
+    def close(self):
+        """
+        @brief Closes the store (partial tier buckets are written).
+        """
+        self.close_day()
+        self.names_file.close()
+
+    def _prune(self):
+        """
+        @brief Deletes day partitions older than the retention window.
+        """
+        if not self.retention_days:
+            return
+        cutoff = day_of(time.time() - self.retention_days * 86400)
+        for entry in sorted(os.listdir(self.directory)):
+            if len(entry) == 10 and entry < cutoff and os.path.isdir(os.path.join(self.directory, entry)):
+                logging.info(f"History store: removing expired day {entry}")
+                shutil.rmtree(os.path.join(self.directory, entry), ignore_errors=True)
@@ -5,14 +5,71 @@
 @dependencies PyQt6, psutil
 """
 
+import time
 import logging
+import importlib
+import threading
 from PyQt6.QtCore import QThread, pyqtSignal
 from src.components.cpu.cpu_sensor import CPUSensor
 from src.components.ram.ram_sensor import RAMSensor
 from src.components.disk.disk_sensor import DiskSensor
 from src.components.network.network_sensor import NetworkSensor
-from src.components.processes.kernel.kernel_sensor import KernelSensor
-from src.components.processes.user.process_sensor import ProcessSensor
+from src.core.alerts import AlertEngine
+from src.core.history import MetricHistory, flatten_packet
+from src.core.anomaly import AnomalyDetector
+from src.core.governor import SamplingGovernor
+from src.config import (ALERT_RULES, ALERT_LOG_PATH, ALERT_SOCKET_PATH,
+                        HISTORY_CAPACITY, ANOMALY_WINDOW, ANOMALY_METHOD,
+                        ANOMALY_THRESHOLD, ANOMALY_MIN_SCALE,
+                        ANOMALY_SEASONAL_PERIOD, ANOMALY_SEASONAL_BINS,
+                        PROCESS_TREE_CHILD_LIMIT, GOVERNOR_CPU_BUDGET,
+                        GOVERNOR_MIN_INTERVAL, GOVERNOR_MAX_INTERVAL,
+                        GOVERNOR_SHEDDABLE, EXPORT_FORMAT, EXPORT_DIRECTORY,
+                        EXPORT_BATCH_ROWS, EXPORT_FLUSH_SECONDS,
+                        EXPORT_ROTATE_ROWS, EXPORT_KEEP_FILES,
+                        EXPORT_QUEUE_SIZE, EXPORT_BACKPRESSURE,
+                        STORE_DIRECTORY, STORE_PROCESS_ROWS,
+                        STORE_RETENTION_DAYS, SENSOR_INTERVALS,
+                        DISABLED_SENSORS)
+
+# Sensors imported and built on the worker thread rather than in __init__ (GUI thread)
+LAZY_SENSORS = {
+    "user_processes": ("src.components.processes.user.process_sensor", "ProcessSensor"),
+    "activity": ("src.components.activity.activity_sensor", "ActivitySensor"),
+    "hardware": ("src.components.hardware.hardware_sensor", "HardwareSensor"),
+    "numa": ("src.components.numa.numa_sensor", "NumaSensor"),
+    "kernel": ("src.components.processes.kernel.kernel_sensor", "KernelSensor"),
+    "interrupts": ("src.components.interrupts.interrupt_sensor", "InterruptSensor"),
+}
+
+# Built before the first cycle; the others only feed a deferred tab and wait until it is shown
+STARTUP_SENSORS = ("user_processes", "activity", "hardware", "numa")
+
+# Floor on the inter-cycle sleep, even when a cycle overran its interval
+MIN_SLEEP_MS = 50
+
+# Reloadable settings (see src/core/settings.py) -> (object path from the worker, attribute)
+SETTING_TARGETS = {
+    "MAX_PROCESSES": ("user_processes", "limit"),
+    "PSS_REFRESH_BUDGET": ("user_processes.pss", "budget"),
+    "PSS_REFRESH_INTERVAL": ("user_processes.pss", "interval"),
+    "SOCKET_SCAN_BUDGET": ("user_processes.sockets", "budget"),
+    "SOCKET_SCAN_INTERVAL": ("user_processes.sockets", "interval"),
+    "NUMA_RESIDENCY_BUDGET": ("user_processes.residency", "budget"),
+    "NUMA_RESIDENCY_INTERVAL": ("user_processes.residency", "interval"),
+    "ANOMALY_WINDOW": ("anomalies", "window"),
+    "ANOMALY_THRESHOLD": ("anomalies", "threshold"),
+    "ANOMALY_MIN_SCALE": ("anomalies", "min_scale"),
+    "GOVERNOR_CPU_BUDGET": ("governor", "budget"),
+    "GOVERNOR_MIN_INTERVAL": ("governor", "min_interval"),
+    "GOVERNOR_MAX_INTERVAL": ("governor", "max_interval"),
+    "GOVERNOR_SHEDDABLE": ("governor", "sheddable"),
+    "DISK_DEVICES": ("disk", "devices"),
+    "NET_INTERFACES": ("net", "interfaces"),
+    "PROCESS_TREE_CHILD_LIMIT": ("", "tree_child_limit"),
+    "SENSOR_INTERVALS": ("", "sensor_intervals"),
+    "DISABLED_SENSORS": ("", "disabled_sensors"),
+}
 
 class GlobalWorker(QThread):
     """
@@ -23,7 +80,7 @@ class GlobalWorker(QThread):
              sub-sensors into a unified telemetry packet.
     """
 
-    # Signal emitted every sampling interval (1Hz)
+    # Signal emitted every sampling interval (1Hz nominal, see SamplingGovernor)
     # @param dict A telemetry packet containing 'cpu', 'ram', 'net', and 'kernel' keys.
     data_received = pyqtSignal(dict)
 
@@ -36,45 +93,221 @@ class GlobalWorker(QThread):
         self.ram = RAMSensor()
         self.disk = DiskSensor()
         self.net = NetworkSensor()
-        self.kernel = KernelSensor()
-        self.user_processes = ProcessSensor()
+        # Built on the worker thread before the first cycle or on demand (see LAZY_SENSORS)
+        self.kernel = None
+        self.user_processes = None
+        self.interrupts = None
+        self.activity = None
+        self.hardware = None
+        self.numa = None
+        self.pending_sensors = set(STARTUP_SENSORS)
+
+        # Rule engine evaluated against every packet on this thread
+        self.alerts = AlertEngine(ALERT_RULES, ALERT_LOG_PATH, ALERT_SOCKET_PATH)
+
+        # Metric history and vectorized anomaly scoring over it
+        self.history = MetricHistory(HISTORY_CAPACITY)
+        self.anomalies = AnomalyDetector(
+            self.history,
+            window=ANOMALY_WINDOW,
+            threshold=ANOMALY_THRESHOLD,
+            method=ANOMALY_METHOD,
+            min_scale=ANOMALY_MIN_SCALE,
+            period=ANOMALY_SEASONAL_PERIOD,
+            bins=ANOMALY_SEASONAL_BINS
+        )
+
+        # Sampling interval and sensor set held under the collector CPU budget
+        self.governor = SamplingGovernor(
+            GOVERNOR_CPU_BUDGET,
+            GOVERNOR_MIN_INTERVAL,
+            GOVERNOR_MAX_INTERVAL,
+            GOVERNOR_SHEDDABLE
+        )
+
+        # Optional streaming export of the dashboard series
+        self.exporter = None
+        if EXPORT_FORMAT:
+            try:
+                from src.core.exporter import TelemetryExporter
+                self.exporter = TelemetryExporter(
+                    EXPORT_DIRECTORY,
+                    fmt=EXPORT_FORMAT,
+                    batch_rows=EXPORT_BATCH_ROWS,
+                    flush_seconds=EXPORT_FLUSH_SECONDS,
+                    rotate_rows=EXPORT_ROTATE_ROWS,
+                    keep_files=EXPORT_KEEP_FILES,
+                    queue_size=EXPORT_QUEUE_SIZE,
+                    policy=EXPORT_BACKPRESSURE
+                )
+            except Exception as e:
+                logging.error(f"Telemetry export disabled: {e}")
+
+        # Optional long-term column store for historical queries (src/core/query.py)
+        self.store = None
+        self.event_archive = None
+        if STORE_DIRECTORY:
+            try:
+                from src.core.exporter import TelemetryExporter
+                from src.core.query import HistoryQuery
+                self.store = TelemetryExporter(
+                    STORE_DIRECTORY,
+                    fmt="store",
+                    batch_rows=EXPORT_BATCH_ROWS,
+                    flush_seconds=EXPORT_FLUSH_SECONDS,
+                    queue_size=EXPORT_QUEUE_SIZE,
+                    policy=EXPORT_BACKPRESSURE,
+                    process_rows=STORE_PROCESS_ROWS,
+                    retention_days=STORE_RETENTION_DAYS
+                )
+                # Lifecycle diffs reaching past the in-memory log are read back from it
+                self.event_archive = HistoryQuery(STORE_DIRECTORY)
+            except Exception as e:
+                logging.error(f"History store disabled: {e}")
+
+        # Per-section read intervals and switches (SENSOR_INTERVALS, DISABLED_SENSORS)
+        self.tree_child_limit = PROCESS_TREE_CHILD_LIMIT
+        self.sensor_intervals = dict(SENSOR_INTERVALS)
+        self.disabled_sensors = set(DISABLED_SENSORS)
+        self.last_read = {}       # section -> monotonic time of its last read
+        self.last_results = {}    # section -> result reused until it is due again
+        self.pending_settings = {}
+        self._settings_lock = threading.Lock()   # apply_settings() runs on the GUI thread
 
         # Operational flag to control loop lifecycle
         self._is_running = True
 
         self.process_sort_mode = "cpu"
+        self.expanded_processes = set()
+        self.process_filter = ""
 
     def run(self):
         """
         @brief Execution loop for the background thread.
-        @details Samples hardware every 1000ms. Implements error isolation 
+        @details Samples hardware once per governor interval (1s nominal). Implements error isolation 
                  to ensure one failing sensor doesn't crash the entire worker.
+                 The CPU time of each section is charged to the governor, which
+                 may stretch the interval or skip sheddable sensors.
+                 Reloaded settings are applied between cycles.
         """
+        governor = self.governor
         while self._is_running:
+            started = time.monotonic()
+            self._build_pending_sensors()
+            self._apply_pending_settings()
+            governor.begin_cycle()
             try:
                 # Construct the unified telemetry packet
-                telemetry_packet = {
-                    "cpu": self.cpu.fetch_data(),
-                    "ram": self.ram.fetch_data(),
-                    "disk": self.disk.fetch_data(),
-                    "net": self.net.fetch_data(),
-                    "user_processes": [],
-                    "kernel": [] 
-                }
+                with governor.measure("core"):
+                    telemetry_packet = {
+                        "timestamp": time.time(),
+                        "cpu": self.cpu.fetch_data(),
+                        "ram": self.ram.fetch_data(),
+                        "disk": self.disk.fetch_data(),
+                        "net": self.net.fetch_data(),
+                        "activity": {},
+                        "user_processes": [],
+                        "process_events": [],
+                        "process_tree": {},
+                        "process_matches": 0,
+                        "sockets": {},
+                        "sched": {},
+                        "kernel": {},
+                        "interrupts": {},
+                        "hardware": {},
+                        "numa": {}
+                    }
+
+                # Kernel activity counters
+                if self.activity is not None:
+                    telemetry_packet["activity"] = self._read("activity", self.activity.fetch_data)
                 
                 # Fetch User Processes
+                if self.user_processes is not None:
+                    try:
+                        with governor.measure("processes"):
+                            self.user_processes.details = (governor.enabled("process_details")
+                                                           and "process_details" not in self.disabled_sensors)
+                            telemetry_packet["user_processes"] = self.user_processes.fetch_data(
+                                sort_by=self.process_sort_mode,
+                                query=self.process_filter
+                            )
+                            telemetry_packet["process_matches"] = self.user_processes.match_count
+                            telemetry_packet["sockets"] = self.user_processes.sockets.summary
+                            telemetry_packet["sched"] = self.user_processes.sched.cpu_summary()
+                            telemetry_packet["process_events"] = self.user_processes.last_events
+                            telemetry_packet["process_tree"] = self.user_processes.tree_snapshot(
+                                self.expanded_processes, self.tree_child_limit
+                            )
+                        if self.user_processes.details:
+                            governor.charge("process_details", self.user_processes.detail_seconds)
+                    except Exception as e:
+                        logging.warning(f"User process sampling failed: {e}")
+
+                # Fetch Kernel Threads
+                if self.kernel is not None:
+                    try:
+                        telemetry_packet["kernel"] = self._read("kernel", self.kernel.fetch_data)
+                    except Exception as e:
+                        logging.warning(f"Kernel sensor sampling failed: {e}")
+
+                # Fetch IRQ / softirq rate matrices
+                if self.interrupts is not None:
+                    try:
+                        telemetry_packet["interrupts"] = self._read("interrupts", self.interrupts.fetch_data)
+                    except Exception as e:
+                        logging.warning(f"Interrupt sensor sampling failed: {e}")
+
+                # Read temperatures, fans and power from the pre-opened inputs
+                if self.hardware is not None:
+                    try:
+                        telemetry_packet["hardware"] = self._read("hardware", self.hardware.fetch_data)
+                    except Exception as e:
+                        logging.warning(f"Hardware sensor sampling failed: {e}")
+
+                # Per-node memory/locality, with per-core CPU grouped by node
+                if self.numa is not None:
+                    try:
+                        telemetry_packet["numa"] = self._read(
+                            "numa", lambda: self.numa.fetch_data(telemetry_packet["cpu"].get("per_core"))
+                        )
+                    except Exception as e:
+                        logging.warning(f"NUMA sensor sampling failed: {e}")
+
+                # Evaluate alert rules incrementally against this sample
                 try:
-                    telemetry_packet["user_processes"] = self.user_processes.fetch_data(
-                        sort_by=self.process_sort_mode
-                    )
+                    with governor.measure("alerts"):
+                        telemetry_packet["alerts"] = self.alerts.evaluate(telemetry_packet)
                 except Exception as e:
-                    logging.warning(f"User process sampling failed: {e}")
+                    logging.warning(f"Alert evaluation failed: {e}")
 
-                # Fetch Kernel Threads
+                # Record the hardware series and score the new sample
+                now = telemetry_packet["timestamp"]
+                series = None
                 try:
-                    telemetry_packet["kernel"] = self.kernel.fetch_data()
+                    with governor.measure("anomalies"):
+                        series = flatten_packet(telemetry_packet)
+                        self.history.record(now, series)
+                        telemetry_packet["anomalies"] = self.anomalies.evaluate(now)
                 except Exception as e:
-                    logging.warning(f"Kernel sensor sampling failed: {e}")
+                    logging.warning(f"Anomaly detection failed: {e}")
+
+                # Hand the same series to the export writer threads (O(1), never blocks)
+                if series is not None:
+                    try:
+                        if self.exporter is not None:
+                            self.exporter.submit(now, series)
+                            telemetry_packet["export"] = self.exporter.stats()
+                        if self.store is not None:
+                            sweep = self.user_processes.sweep if self.user_processes is not None else None
+                            self.store.submit(now, series, sweep,
+                                              telemetry_packet["process_events"])
+                    except Exception as e:
+                        logging.warning(f"Telemetry export hand-off failed: {e}")
+
+                # Pick the next interval from this cycle's cost and report it
+                governor.end_cycle()
+                telemetry_packet["governor"] = governor.status()
 
                 # Dispatch data to the UI thread via Signal/Slot mechanism
                 self.data_received.emit(telemetry_packet)
@@ -82,19 +315,111 @@ class GlobalWorker(QThread):
             except Exception as e:
                 logging.error(f"Critical Worker Loop Error: {e}")
                 
-            # Throttle sampling to 1Hz (1000ms) to maintain low CPU overhead
-            self.msleep(1000)
+            # Sleep out the rest of the governed interval (1s nominal)
+            remaining = governor.interval - (time.monotonic() - started)
+            self.msleep(max(MIN_SLEEP_MS, int(remaining * 1000)))
     
+    def _read(self, name: str, fetch):
+        """
+        @brief Runs one optional sensor section under the governor.
+        @param name Section name (as in GOVERNOR_SHEDDABLE).
+        @param fetch Callable returning the section's data.
+        @return Fresh data; the previous result while SENSOR_INTERVALS says the
+                section is not due; {} if it is disabled or shed.
+        """
+        if name in self.disabled_sensors or not self.governor.enabled(name):
+            self.last_results.pop(name, None)
+            return {}
+        now = time.monotonic()
+        interval = self.sensor_intervals.get(name)
+        if interval and name in self.last_results and now - self.last_read[name] < interval:
+            return self.last_results[name]
+        with self.governor.measure(name):
+            result = fetch()
+        self.last_read[name] = now
+        self.last_results[name] = result
+        return result
+
+    def apply_settings(self, changes: dict):
+        """
+        @brief Queues reloaded settings; they are applied before the next cycle.
+        @param changes {NAME: value} from SettingsWatcher.changed (unknown names are ignored).
+        """
+        with self._settings_lock:
+            self.pending_settings.update(changes)
+
+    def _apply_pending_settings(self):
+        """
+        @brief Pushes queued settings into the sensors, samplers, detector and governor.
+        """
+        with self._settings_lock:
+            changes, self.pending_settings = self.pending_settings, {}
+        for name, value in changes.items():
+            if name not in SETTING_TARGETS:
+                continue
+            path, attribute = SETTING_TARGETS[name]
+            target = self
+            for part in filter(None, path.split(".")):
+                target = getattr(target, part)
+            if target is None:
+                logging.warning(f"Worker: {name} not applied ({path} is not available)")
+                continue
+            if attribute == "disabled_sensors":
+                value = set(value)
+            setattr(target, attribute, value)
+            logging.info(f"Worker: {name} = {value!r}")
+
+    def enable_sensor(self, name: str):
+        """
+        @brief Requests a deferred sensor; it is built on the worker thread before the next tick.
+        @param name A key of LAZY_SENSORS ('kernel' or 'interrupts').
+        """
+        self.pending_sensors.add(name)
+
+    def _build_pending_sensors(self):
+        """
+        @brief Imports and constructs the startup sensors and those requested through enable_sensor().
+        """
+        for name in list(self.pending_sensors):
+            self.pending_sensors.discard(name)
+            if getattr(self, name) is not None:
+                continue
+            module, class_name = LAZY_SENSORS[name]
+            try:
+                setattr(self, name, getattr(importlib.import_module(module), class_name)())
+            except Exception as e:
+                logging.error(f"Failed to build {class_name}: {e}")
+                continue
+            if name == "user_processes" and self.event_archive is not None:
+                self.user_processes.event_log.archive = self.event_archive
+
     def set_process_sort_mode(self, mode: str):
         """
         @brief Updates the sorting criteria for the next sampling cycle.
-        @param mode 'cpu' or 'ram'
+        @param mode 'cpu', 'ram', 'fds' or 'wait'
         """
         self.process_sort_mode = mode
         
+    def set_process_filter(self, query: str):
+        """
+        @brief Restricts the process list to entries matching 'query'.
+        @param query Search terms (name, command line, user or PID prefix); '' clears.
+        """
+        self.process_filter = query
+
+    def set_expanded_processes(self, keys):
+        """
+        @brief Sets which tree nodes need their children in the next packets.
+        @param keys Set of (pid, create_time) keys expanded in the tree view.
+        """
+        self.expanded_processes = set(keys)
+
     def stop(self):
         """
         @brief Gracefully terminates the worker thread.
         """
         self._is_running = False
-        self.wait() # Block until thread actually exits
\ No newline at end of file
+        self.wait() # Block until thread actually exits
+        for writer in (self.exporter, self.store):
+            if writer is not None:
+                writer.close()
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""
+@file alerts_tab.py
+@brief UI container for the alerting engine output.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from src.components.alerts.alert_widget import AlertWidget
+
+class AlertsTab(QWidget):
+    """
+    @class AlertsTab
+    @brief A tabbed view dedicated to firing alerts and their history.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the tab and embeds the alert view.
+        """
+        super().__init__()
+        layout = QVBoxLayout(self)
+
+        self.alert_view = AlertWidget()
+        layout.addWidget(self.alert_view)
+
+    def update_ui(self, data: dict):
+        """
+        @brief Receives and delegates the alert state.
+        @param data Dictionary with 'active' and 'events' lists from the GlobalWorker.
+        """
+        if isinstance(data, dict):
+            self.alert_view.update_display(data)
@@ -6,10 +6,7 @@
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea
-from src.components.cpu.cpu_widget import CPUWidget
-from src.components.ram.ram_widget import RAMWidget
-from src.components.disk.disk_widget import DiskWidget
-from src.components.network.network_widget import NetworkWidget
+from PyQt6.QtCore import QTimer, pyqtSignal
 
 class DashboardTab(QWidget):
     """
@@ -17,14 +14,27 @@ class DashboardTab(QWidget):
     @brief Aggregates and manages hardware-specific visualization widgets.
     @details Implements a scrollable layout to host multiple telemetry 
              graphs, ensuring the UI is scalable for future sensor expansions.
+             Panels below the fold (kernel activity, hardware, burst capture)
+             are built right after the first paint rather than before it.
     """
 
+    # Emitted once the below-the-fold panels exist (burst_w can be wired then)
+    panels_ready = pyqtSignal()
+
     def __init__(self):
         """
         @brief Initializes the tab layout and child widgets.
         @details Sets up a QScrollArea to contain the CPU, RAM, Disk and Network 
-                 instrumentation panels.
+                 instrumentation panels; the remaining panels follow the
+                 first paint.
         """
+        # Imported here so pyqtgraph is only loaded once the first graph is built
+        from src.components.cpu.cpu_widget import CPUWidget
+        from src.components.ram.ram_widget import RAMWidget
+        from src.components.disk.disk_widget import DiskWidget
+        from src.components.network.network_widget import NetworkWidget
+        from src.components.numa.numa_widget import NumaWidget
+
         super().__init__()
         layout = QVBoxLayout(self)
         
@@ -40,46 +50,138 @@ class DashboardTab(QWidget):
         # Instantiate instrumentation widgets
         self.cpu_w = CPUWidget()
         self.ram_w = RAMWidget()
+        self.numa_w = NumaWidget()
         self.disk_w = DiskWidget()
         self.net_w = NetworkWidget()
+        self.activity_w = None
+        self.hardware_w = None
+        self.burst_w = None
         
         # Add widgets to the internal vertical layout
         self.content_layout.addWidget(self.cpu_w)
         self.content_layout.addWidget(self.ram_w)
+        self.content_layout.addWidget(self.numa_w)
         self.content_layout.addWidget(self.disk_w)
         self.content_layout.addWidget(self.net_w)
         
         # Finalize scroll area setup
         scroll.setWidget(content)
         layout.addWidget(scroll)
+        self._panels_scheduled = False
+
+    def paintEvent(self, event):
+        """
+        @brief Schedules the below-the-fold panels once the first frame is painted.
+        """
+        super().paintEvent(event)
+        if not self._panels_scheduled:
+            self._panels_scheduled = True
+            QTimer.singleShot(0, self.build_panels)
+
+    def build_panels(self):
+        """
+        @brief Imports and builds the panels below the fold (after the first paint).
+        """
+        if self.burst_w is not None:
+            return
+        from src.components.activity.activity_widget import ActivityWidget
+        from src.components.hardware.hardware_widget import HardwareWidget
+        from src.components.burst.burst_widget import BurstWidget
+
+        self.activity_w = ActivityWidget()
+        self.hardware_w = HardwareWidget()
+        self.burst_w = BurstWidget()
+        self.content_layout.addWidget(self.activity_w)
+        self.content_layout.addWidget(self.hardware_w)
+        self.content_layout.addWidget(self.burst_w)
+        self.panels_ready.emit()
+
+    def record(self, data: dict):
+        """
+        @brief Appends one telemetry packet to every history graph.
+        @param data Unified dictionary containing nested sensor readings.
+        @details Runs for every packet (graphs need each sample), visible or
+                 not; drawing is deferred to the RenderScheduler's flush.
+        """
+        # Anomaly flags keyed by series name (e.g. 'cpu.core3', 'disk.sda.write')
+        anomalies = data.get('anomalies', {})
+        timestamp = data.get('timestamp')
+
+        self.cpu_w.record(
+            data['cpu']['usage'],
+            self._flagged(anomalies, 'cpu', 'usage') or self._flagged(anomalies, 'cpu', 'core'),
+            timestamp
+        )
+        self.ram_w.record(data['ram']['percent'], self._flagged(anomalies, 'ram', 'percent'), timestamp)
+        if data.get('numa'):
+            self.numa_w.record(data['numa'], timestamp)
+        self.disk_w.record(
+            data['disk']['read'],
+            data['disk']['write'],
+            self._flagged(anomalies, 'disk', 'read'),
+            self._flagged(anomalies, 'disk', 'write'),
+            timestamp
+        )
+        self.net_w.record(
+            data['net']['down'],
+            data['net']['up'],
+            self._flagged(anomalies, 'net', 'down'),
+            self._flagged(anomalies, 'net', 'up'),
+            timestamp
+        )
+        if self.activity_w is not None and data.get('activity'):
+            self.activity_w.record(data['activity'], timestamp)
+        if self.hardware_w is not None and data.get('hardware'):
+            self.hardware_w.record(data['hardware'], timestamp)
 
     def update_ui(self, data: dict):
         """
-        @brief Propagates telemetry data to individual hardware widgets.
+        @brief Propagates the newest telemetry packet to the widgets' text labels.
         @param data Unified dictionary containing nested sensor readings.
-        @details Maps the incoming telemetry packet keys to the corresponding 
-                 widget display methods.
+        @details Only called for the newest packet of a frame while the tab is
+                 visible; the graphs are fed separately by record().
         """
         # Distribute CPU metrics
-        self.cpu_w.update_display(
-            data['cpu']['usage'], 
-            data['cpu']['speed']
-        )
-        
+        self.cpu_w.update_labels(data['cpu']['usage'], data['cpu']['speed'])
+
         # Distribute RAM metrics
-        self.ram_w.update_display(
-            data['ram']['percent'], 
-            data['ram']['used'], 
-            data['ram']['total']
-        )
-        
-        # Distribute Disk metrics
-        self.disk_w.update_display(
-            data['disk']['read'], 
-            data['disk']['write'], 
+        self.ram_w.update_labels(
+            data['ram']['used'],
+            data['ram']['total'],
+            data['ram']['percent'],
+            data['ram'].get('breakdown')
         )
-        # Distribute Network metrics
-        self.net_w.update_display(
-            data['net']['down'], 
-            data['net']['up']
-        )
\ No newline at end of file
+
+        # Distribute per-node memory and CPU
+        if data.get('numa'):
+            self.numa_w.update_labels(data['numa'])
+
+        # Distribute Disk and Network metrics
+        self.disk_w.update_labels(data['disk']['read'], data['disk']['write'])
+        self.net_w.update_labels(data['net']['down'], data['net']['up'])
+
+        # Distribute kernel activity counters
+        if self.activity_w is not None and data.get('activity'):
+            self.activity_w.update_labels(data['activity'])
+
+        # Distribute temperatures, fans and power
+        if self.hardware_w is not None and data.get('hardware'):
+            self.hardware_w.update_labels(data['hardware'])
+
+    @staticmethod
+    def _flagged(anomalies: dict, section: str, field: str) -> bool:
+        """
+        @brief Tells whether an aggregate curve or any of its sub-series is anomalous.
+        @param anomalies Mapping of flagged series names to scores.
+        @param section Packet section ('cpu', 'ram', 'disk', 'net').
+        @param field Aggregate field name, or 'core' for per-core CPU series.
+        @details Per-device series ('disk.sda.write') and per-core series
+                 ('cpu.core3') are folded onto the aggregate curve they belong to.
+        """
+        for name in anomalies:
+            parts = name.split('.')
+            if parts[0] != section:
+                continue
+            if parts[-1] == field or (field == 'core' and parts[-1].startswith('core')):
+                return True
+        return False
\ No newline at end of file
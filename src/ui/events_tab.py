@@ -0,0 +1,59 @@
+"""
+@file events_tab.py
+@brief UI container for process lifecycle events.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTabWidget
+from PyQt6.QtCore import pyqtSignal
+from src.components.processes.spawn.spawn_widget import SpawnWidget
+from src.components.processes.lifecycle.lifecycle_widget import LifecycleWidget
+
+class EventsTab(QWidget):
+    """
+    @class EventsTab
+    @brief A tabbed view dedicated to process births, exits and spawn rates.
+    @details Hosts the high-rate spawn scanner view and the 1Hz lifecycle log
+             with its time-range diff query.
+    """
+
+    # Forwarded from the lifecycle view: (t0, t1) in seconds since epoch
+    diff_requested = pyqtSignal(float, float)
+
+    def __init__(self):
+        """
+        @brief Initializes the tab and embeds the spawn and lifecycle views.
+        """
+        super().__init__()
+        layout = QVBoxLayout(self)
+
+        self.views = QTabWidget()
+        self.spawn_view = SpawnWidget()
+        self.lifecycle_view = LifecycleWidget()
+        self.lifecycle_view.diff_requested.connect(self.diff_requested)
+        self.views.addTab(self.spawn_view, "Spawns")
+        self.views.addTab(self.lifecycle_view, "Lifecycle && Diff")
+        layout.addWidget(self.views)
+
+    def update_spawns(self, data: dict):
+        """
+        @brief Receives and delegates a spawn scanner summary.
+        @param data Summary dictionary from the SpawnWorker.
+        """
+        if isinstance(data, dict):
+            self.spawn_view.update_display(data)
+
+    def update_lifecycle(self, events: list):
+        """
+        @brief Receives and delegates the lifecycle events of one sweep.
+        @param events List of event dictionaries from the GlobalWorker.
+        """
+        if isinstance(events, list):
+            self.lifecycle_view.update_display(events)
+
+    def show_diff(self, diff: dict):
+        """
+        @brief Displays the result of a lifecycle diff query.
+        """
+        self.lifecycle_view.show_diff(diff)
@@ -0,0 +1,71 @@
+"""
+@file hosts_tab.py
+@brief UI container aggregating several remote collectors side by side.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSplitter, QTabWidget
+from PyQt6.QtCore import Qt
+from src.components.remote.host_grid import HostGridWidget
+from src.components.remote.host_dashboard import HostDashboard
+
+class HostsTab(QWidget):
+    """
+    @class HostsTab
+    @brief Summary grid of every collector above per-host dashboards.
+    @details Host dashboards are created when a collector first reports and
+             keep ingesting samples while hidden, like the local Dashboard.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the grid and the (initially empty) per-host tabs.
+        """
+        super().__init__()
+        layout = QVBoxLayout(self)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        self.grid = HostGridWidget()
+        self.host_tabs = QTabWidget()
+        splitter.addWidget(self.grid)
+        splitter.addWidget(self.host_tabs)
+        splitter.setSizes([200, 600])
+        layout.addWidget(splitter)
+
+        self.dashboards = {}   # address -> HostDashboard
+        self.grid.host_selected.connect(self.show_host)
+
+    def update_host(self, packet: dict):
+        """
+        @brief Receives one packet from the RemoteWorker.
+        @param packet {'address', 'host', 'connected', 'timestamp', 'series', 'bandwidth'}.
+        """
+        address = packet["address"]
+        if not packet["connected"]:
+            self.grid.update_host(packet)
+            self.grid.mark_offline(address)
+            return
+        self.grid.update_host(packet)
+
+        dashboard = self.dashboards.get(address)
+        if dashboard is None:
+            dashboard = HostDashboard()
+            self.dashboards[address] = dashboard
+            index = self.host_tabs.addTab(dashboard, packet["host"])
+            self.host_tabs.setTabToolTip(index, address)
+        dashboard.update_display(packet["timestamp"], packet["series"])
+
+    def refresh_status(self):
+        """
+        @brief Ages the live/stale markers (called on every frame).
+        """
+        self.grid.refresh_status()
+
+    def show_host(self, address: str):
+        """
+        @brief Brings a host's dashboard to the front.
+        """
+        dashboard = self.dashboards.get(address)
+        if dashboard is not None:
+            self.host_tabs.setCurrentWidget(dashboard)
@@ -0,0 +1,33 @@
+"""
+@file interrupts_tab.py
+@brief UI container for interrupt distribution monitoring.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from src.components.interrupts.interrupt_widget import InterruptWidget
+
+class InterruptsTab(QWidget):
+    """
+    @class InterruptsTab
+    @brief A tabbed view dedicated to per-CPU IRQ and softirq heatmaps.
+    """
+
+    def __init__(self):
+        """
+        @brief Initializes the tab and embeds the heatmap view.
+        """
+        super().__init__()
+        layout = QVBoxLayout(self)
+
+        self.interrupt_view = InterruptWidget()
+        layout.addWidget(self.interrupt_view)
+
+    def update_ui(self, data: dict):
+        """
+        @brief Receives and delegates interrupt rate matrices.
+        @param data {'irq': {...}, 'softirq': {...}} from the GlobalWorker.
+        """
+        if isinstance(data, dict):
+            self.interrupt_view.update_display(data)
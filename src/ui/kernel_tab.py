@@ -27,13 +27,13 @@ class KernelTab(QWidget):
         self.kernel_view = KernelWidget()
         layout.addWidget(self.kernel_view)
 
-    def update_ui(self, data: list):
+    def update_ui(self, data: dict):
         """
         @brief Receives and delegates kernel thread data.
-        @param data List of thread dictionaries from the GlobalWorker.
+        @param data Kernel thread groups ('count', 'cpu', 'groups') from the GlobalWorker.
         @details Implementation passes the data directly to the child view 
                  to maintain strict separation of concerns.
         """
         # Ensure data is valid before attempting a display update
-        if isinstance(data, list):
+        if isinstance(data, dict):
             self.kernel_view.update_display(data)
\ No newline at end of file
@@ -4,8 +4,11 @@
 @project Linux Health Monitor Pro
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+                             QTabWidget, QLineEdit)
 from src.components.processes.user.process_widget import ProcessWidget
+from src.components.processes.tree.tree_widget import ProcessTreeWidget
+from src.components.processes.threads.thread_widget import ThreadWidget
 
 class ProcessTab(QWidget):
     """
@@ -27,22 +30,53 @@ class ProcessTab(QWidget):
         
         self.btn_sort_cpu = QPushButton("Highest CPU")
         self.btn_sort_ram = QPushButton("Highest RAM")
+        self.btn_sort_fds = QPushButton("Highest FDs")
+        self.btn_sort_wait = QPushButton("Most Waiting")
+        self.sort_buttons = {"cpu": self.btn_sort_cpu, "ram": self.btn_sort_ram,
+                             "fds": self.btn_sort_fds, "wait": self.btn_sort_wait}
         
         # Style the buttons to look professional
         btn_style = "padding: 5px 15px; background-color: #2c3e50; color: white; border-radius: 4px;"
-        self.btn_sort_cpu.setStyleSheet(btn_style)
-        self.btn_sort_ram.setStyleSheet(btn_style)
+        for button in self.sort_buttons.values():
+            button.setStyleSheet(btn_style)
 
         self.toolbar.addWidget(self.status_label)
-        self.toolbar.addWidget(self.btn_sort_cpu)
-        self.toolbar.addWidget(self.btn_sort_ram)
+        for button in self.sort_buttons.values():
+            self.toolbar.addWidget(button)
         self.toolbar.addStretch() # Pushes buttons to the left
+
+        # Live search (name, command line, user or PID prefix), applied before sorting
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Filter: name, cmdline, user or PID...")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.setMinimumWidth(260)
+        self.match_label = QLabel("")
+        self.toolbar.addWidget(self.search_box)
+        self.toolbar.addWidget(self.match_label)
         
         self.layout.addLayout(self.toolbar)
 
-        # --- The Process Table ---
+        # System-wide socket summary (TCP states from /proc/net/tcp{,6})
+        self.socket_label = QLabel("Sockets: Loading...")
+        self.socket_label.setStyleSheet("font-family: 'Monospace'; color: #95A5A6;")
+        self.layout.addWidget(self.socket_label)
+
+        # Run-queue pressure per CPU (from /proc/schedstat deltas)
+        self.sched_label = QLabel("Run-queue wait: n/a")
+        self.sched_label.setStyleSheet("font-family: 'Monospace'; color: #95A5A6;")
+        self.layout.addWidget(self.sched_label)
+
+        # --- The Process Table and the ppid Tree ---
+        self.views = QTabWidget()
         self.process_widget = ProcessWidget()
-        self.layout.addWidget(self.process_widget)
+        self.tree_widget = ProcessTreeWidget()
+        self.views.addTab(self.process_widget, "Top Consumers")
+        self.views.addTab(self.tree_widget, "Tree")
+        self.layout.addWidget(self.views, stretch=3)
+
+        # --- Thread Drill-down (fed by the ThreadWorker for the selected PID) ---
+        self.thread_widget = ThreadWidget()
+        self.layout.addWidget(self.thread_widget, stretch=2)
         
         # State tracking: Default sort
         self.current_sort = "cpu"
@@ -50,6 +84,8 @@ class ProcessTab(QWidget):
         # Connect button signals
         self.btn_sort_cpu.clicked.connect(lambda: self.set_sorting("cpu"))
         self.btn_sort_ram.clicked.connect(lambda: self.set_sorting("ram"))
+        self.btn_sort_fds.clicked.connect(lambda: self.set_sorting("fds"))
+        self.btn_sort_wait.clicked.connect(lambda: self.set_sorting("wait"))
 
     def set_sorting(self, sort_type: str):
         """
@@ -57,15 +93,54 @@ class ProcessTab(QWidget):
         """
         self.current_sort = sort_type
         # Update button colors to show which is active
-        if sort_type == "cpu":
-            self.btn_sort_cpu.setStyleSheet("background-color: #3498db; color: white; border-radius: 4px;")
-            self.btn_sort_ram.setStyleSheet("background-color: #2c3e50; color: white; border-radius: 4px;")
-        else:
-            self.btn_sort_ram.setStyleSheet("background-color: #3498db; color: white; border-radius: 4px;")
-            self.btn_sort_cpu.setStyleSheet("background-color: #2c3e50; color: white; border-radius: 4px;")
+        for mode, button in self.sort_buttons.items():
+            colour = "#3498db" if mode == sort_type else "#2c3e50"
+            button.setStyleSheet(f"background-color: {colour}; color: white; border-radius: 4px;")
 
-    def update_ui(self, process_data: list):
+    def update_ui(self, process_data: list, matches: int = None):
         """
         @brief Passes the telemetry packet to the child table widget.
+        @param matches Number of processes matching the active filter, if any.
+        """
+        self.process_widget.update_display(process_data)
+        if self.search_box.text().strip() and matches is not None:
+            self.match_label.setText(f"{matches} match{'es' if matches != 1 else ''}")
+        else:
+            self.match_label.setText("")
+
+    def update_sockets(self, data: dict):
+        """
+        @brief Shows the system-wide socket totals and TCP state histogram.
+        """
+        if not data:
+            return
+        states = " ".join(f"{state} {count}" for state, count in data['tcp_states'].items())
+        self.socket_label.setText(
+            f"Sockets: TCP {data['tcp']} [{states or '-'}] | UDP {data['udp']} | Unix {data['unix']}"
+        )
+
+    def update_sched(self, data: dict):
+        """
+        @brief Shows total and worst per-CPU run-queue wait.
+        """
+        if not data or not data.get('cpus'):
+            return
+        worst = max(data['cpus'], key=lambda c: c['wait'])
+        self.sched_label.setText(
+            f"Run-queue wait: {data['wait']:.1f} ms/s total | "
+            f"worst CPU{worst['cpu']} {worst['wait']:.1f} ms/s "
+            f"(running {worst['run']:.0f} ms/s, {worst['slices']:.0f} slices/s)"
+        )
+
+    def update_tree(self, tree_data: dict):
+        """
+        @brief Passes the tree snapshot to the tree view.
+        """
+        if isinstance(tree_data, dict):
+            self.tree_widget.update_display(tree_data)
+
+    def update_threads(self, thread_data: dict):
+        """
+        @brief Passes a drill-down sample to the thread table.
         """
-        self.process_widget.update_display(process_data)
\ No newline at end of file
+        self.thread_widget.update_display(thread_data)
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""
+@file conftest.py
+@brief Test session setup: run against the built-in config defaults.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+
+# Must happen before anything imports src.config (see src/core/settings.py)
+os.environ["LINUXHEALTH_CONFIG"] = ""
@@ -0,0 +1,151 @@
+"""
+@file test_alerts.py
+@brief AlertRule state machine: hold time, hysteresis, EWMA/rate warm-up and metric paths.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import pytest
+from src.core.alerts import AlertRule, AlertEngine, compile_metric
+
+
+def cpu(value: float) -> dict:
+    return {"cpu": {"usage": value}}
+
+
+def run(rule: AlertRule, values, start: float = 0.0, step: float = 1.0) -> list:
+    """
+    @brief Feeds one CPU value per 'step' seconds.
+    @return The transition (or None) produced by each sample.
+    """
+    return [rule.evaluate(cpu(value), start + i * step) for i, value in enumerate(values)]
+
+
+def test_fires_after_hold_time():
+    rule = AlertRule({"name": "hot", "metric": "cpu.usage", "value": 90, "for": 3})
+    transitions = run(rule, [95, 95, 95, 95, 95])
+    # Condition true from t=0; fires once it has held for 3 s, and only once
+    assert transitions == [None, None, None, "firing", None]
+    assert rule.fired_at == 3.0
+
+
+def test_hold_restarts_when_condition_breaks():
+    rule = AlertRule({"name": "hot", "metric": "cpu.usage", "value": 90, "for": 2})
+    assert run(rule, [95, 95, 50, 95, 95, 95]) == [None, None, None, None, None, "firing"]
+
+
+def test_hysteresis_band_keeps_alert_firing():
+    rule = AlertRule({"name": "hot", "metric": "cpu.usage", "value": 90, "clear": 80})
+    transitions = run(rule, [95, 89, 85, 80.5, 80, 85, 91])
+    # Inside the 80..90 band the alert stays up; it resolves at 80 and re-fires above 90
+    assert transitions == ["firing", None, None, None, "resolved", None, "firing"]
+
+
+def test_below_rule_uses_mirrored_hysteresis():
+    rule = AlertRule({"name": "idle", "metric": "cpu.usage", "op": "<", "value": 10, "clear": 20})
+    assert run(rule, [5, 15, 19.9, 20, 9]) == ["firing", None, None, "resolved", "firing"]
+
+
+def test_inclusive_operator_at_threshold_does_not_flap():
+    rule = AlertRule({"name": "hot", "metric": "cpu.usage", "op": ">=", "value": 90})
+    assert run(rule, [90, 90, 90, 89.9]) == ["firing", None, None, "resolved"]
+
+
+@pytest.mark.parametrize("op, value, clear", [(">", 90, 95), (">=", 90, 91), ("<", 10, 5), ("<=", 10, 9)])
+def test_clear_level_on_firing_side_is_rejected(op, value, clear):
+    with pytest.raises(ValueError):
+        AlertRule({"name": "bad", "metric": "cpu.usage", "op": op, "value": value, "clear": clear})
+
+
+@pytest.mark.parametrize("spec", [
+    {"name": "bad", "metric": "cpu.usage", "op": "==", "value": 1},
+    {"name": "bad", "metric": "cpu.usage", "kind": "median", "value": 1},
+    {"name": "bad", "metric": "cpu.usage.per.core", "value": 1},
+])
+def test_invalid_rules_are_rejected(spec):
+    with pytest.raises(ValueError):
+        AlertRule(spec)
+
+
+def test_ewma_smooths_spikes_and_warms_up_on_first_sample():
+    rule = AlertRule({"name": "ram", "metric": "cpu.usage", "kind": "ewma", "alpha": 0.5,
+                      "value": 90, "clear": 85})
+    # The first sample seeds the average; a single spike is halved
+    assert run(rule, [50, 100]) == [None, None]
+    assert rule.signal == pytest.approx(75.0)
+    expected = 75.0
+    transitions = []
+    for i in range(6):
+        expected += 0.5 * (100 - expected)
+        transitions.append(rule.evaluate(cpu(100), 2.0 + i))
+        assert rule.signal == pytest.approx(expected)
+    assert transitions == [None, "firing", None, None, None, None]   # 87.5, then 93.75 > 90
+    # Seeded at a high value, the average fires at once
+    seeded = AlertRule({"name": "ram", "metric": "cpu.usage", "kind": "ewma", "value": 90})
+    assert seeded.evaluate(cpu(99), 0.0) == "firing"
+
+
+def test_rate_needs_two_samples_and_positive_time_step():
+    rule = AlertRule({"name": "ramp", "metric": "cpu.usage", "kind": "rate", "value": 10, "clear": 0})
+    assert rule.evaluate(cpu(0), 0.0) is None
+    assert rule.signal is None
+    # Same timestamp again: no rate can be derived
+    assert rule.evaluate(cpu(50), 0.0) is None
+    assert rule.signal is None
+    assert rule.evaluate(cpu(80), 2.0) == "firing"   # (80 - 50) / 2 s
+    assert rule.signal == pytest.approx(15.0)
+    assert rule.evaluate(cpu(90), 4.0) is None         # 5 /s: inside the band
+    assert rule.evaluate(cpu(90), 5.0) == "resolved"   # 0 /s
+
+
+def test_missing_metric_leaves_state_untouched():
+    rule = AlertRule({"name": "hot", "metric": "cpu.usage", "value": 90, "for": 2})
+    assert rule.evaluate(cpu(95), 0.0) is None
+    # Samples without the metric neither break nor advance the pending hold
+    assert rule.evaluate({}, 1.0) is None
+    assert rule.evaluate({"cpu": {}}, 1.5) is None
+    assert rule.evaluate({"cpu": {"usage": None}}, 1.8) is None
+    assert rule.evaluate(cpu(95), 2.0) == "firing"
+    assert rule.evaluate({}, 3.0) is None
+    assert rule.firing
+
+
+def test_rate_skips_missing_samples():
+    rule = AlertRule({"name": "ramp", "metric": "cpu.usage", "kind": "rate", "value": 100})
+    rule.evaluate(cpu(0), 0.0)
+    rule.evaluate({}, 1.0)
+    rule.evaluate(cpu(40), 4.0)
+    assert rule.signal == pytest.approx(10.0)
+
+
+def test_list_reducers():
+    packet = {"user_processes": [{"pid": 1, "cpu": 5.0, "ram": 10.0},
+                                 {"pid": 2, "cpu": 97.5, "ram": 1.0},
+                                 {"pid": 3, "ram": 4.0}]}
+    assert compile_metric("user_processes.max.cpu")(packet) == 97.5
+    assert compile_metric("user_processes.min.cpu")(packet) == 5.0
+    assert compile_metric("user_processes.sum.ram")(packet) == 15.0
+    assert compile_metric("user_processes.max.cpu")({"user_processes": []}) is None
+    assert compile_metric("user_processes.max.fds")(packet) is None
+    rule = AlertRule({"name": "runaway", "metric": "user_processes.max.cpu", "value": 95, "clear": 80})
+    assert rule.evaluate(packet, 0.0) == "firing"
+    assert rule.evaluate({"user_processes": [{"cpu": 70.0}]}, 1.0) == "resolved"
+
+
+def test_engine_reports_transitions_and_active_alerts():
+    engine = AlertEngine([
+        {"name": "hot", "metric": "cpu.usage", "value": 90, "clear": 80, "severity": "critical"},
+        {"name": "bad", "metric": "cpu.usage", "value": 90, "clear": 95},
+        {"name": "missing key", "metric": "cpu.usage"},
+    ])
+    assert [rule.name for rule in engine.rules] == ["hot"]
+
+    state = engine.evaluate({"timestamp": 10.0, "cpu": {"usage": 95.0}})
+    assert [(e["name"], e["state"], e["severity"]) for e in state["events"]] == [("hot", "firing", "critical")]
+    assert state["active"][0]["condition"] == "cpu.usage > 90"
+    state = engine.evaluate({"timestamp": 11.0, "cpu": {"usage": 85.0}})
+    assert state["events"] == []
+    assert state["active"][0]["time"] == 10.0
+    state = engine.evaluate({"timestamp": 12.0, "cpu": {"usage": 70.0}})
+    assert [e["state"] for e in state["events"]] == ["resolved"]
+    assert state["active"] == []
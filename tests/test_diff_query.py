@@ -0,0 +1,86 @@
+"""
+@file test_diff_query.py
+@brief DiffQuery runs diffs off the calling thread and delivers only the newest result.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import threading
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtWidgets import QApplication
+from src.core.diff_query import DiffQuery
+
+
+class SlowLog:
+    """
+    @brief Stands in for ProcessEventLog; diff() blocks until released.
+    """
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.threads = []
+
+    def diff(self, t0: float, t1: float) -> dict:
+        self.threads.append(threading.get_ident())
+        self.release.wait(5)
+        if t0 < 0:
+            raise OSError("archive unreadable")
+        return {"range": (t0, t1)}
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def query(app):
+    query = DiffQuery()
+    results = []
+    query.result_ready.connect(results.append)
+    yield query, results
+    query.stop()
+
+
+def settle(query):
+    query.pool.waitForDone(5000)
+    # Results are queued to this thread: deliver them
+    QCoreApplication.processEvents()
+
+
+def test_runs_off_the_calling_thread(query):
+    query, results = query
+    log = SlowLog()
+    query.request(log, 1.0, 2.0)
+    # The caller is not blocked while the query waits on the "disk"
+    assert results == []
+    log.release.set()
+    settle(query)
+    assert results == [{"range": (1.0, 2.0)}]
+    assert log.threads and log.threads[0] != threading.get_ident()
+
+
+def test_superseded_requests_are_dropped(query):
+    query, results = query
+    log = SlowLog()
+    for i in range(4):
+        query.request(log, float(i), 10.0)
+    log.release.set()
+    settle(query)
+    assert results == [{"range": (3.0, 10.0)}]
+
+
+def test_failed_query_emits_nothing(query):
+    query, results = query
+    log = SlowLog()
+    log.release.set()
+    query.request(log, -1.0, 1.0)
+    settle(query)
+    assert results == []
+    query.request(log, 0.0, 1.0)
+    settle(query)
+    assert results == [{"range": (0.0, 1.0)}]
@@ -0,0 +1,139 @@
+"""
+@file test_event_log.py
+@brief ProcessEventLog diffs: bisect ranges, compaction and the store-backed archive.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import time
+import pytest
+from src.core.event_log import ProcessEventLog
+from src.core.store import ColumnStore
+from src.core.query import HistoryQuery
+
+# One minute before local midnight, so the events span two day partitions
+BASE = time.mktime((2026, 10, 19, 23, 59, 0, 0, 0, -1))
+SECONDS = 120
+INIT = (1, BASE - 1000.0)
+
+
+def generate():
+    """
+    @brief Yields (time, [(kind, key, details)]) for one synthetic sweep per second.
+    @details Values are exact in float32, so events read back from the store compare equal.
+    """
+    alive = {}
+    for second in range(SECONDS):
+        now = BASE + second
+        events = []
+        key = (100 + second, now)
+        alive[key] = f"job{second}"
+        events.append(("start", key, {"name": alive[key], "cpu": (second % 7) * 0.5,
+                                      "ram": float(second)}))
+        if second % 2 == 0 and second >= 3:
+            gone = (100 + second - 3, now - 3)
+            if gone in alive:
+                events.append(("exit", gone, {"name": alive.pop(gone), "cpu": 0.0, "ram": 1.0}))
+        if second % 5 == 0 and second >= 5:
+            renamed = (100 + second - 5, now - 5)
+            if renamed in alive:
+                old, alive[renamed] = alive[renamed], f"job{second - 5}-exec"
+                events.append(("rename", renamed, {"name": alive[renamed], "old_name": old}))
+        if second % 4 == 0:
+            events.append(("change", INIT, {"name": "init" if second < 50 else "systemd",
+                                            "cpu": second * 0.25, "ram": 8.0,
+                                            "old_cpu": 0.0, "old_ram": 8.0}))
+        yield now, events
+
+
+def fill(logs, store=None):
+    """
+    @brief Records the synthetic events in every log (and the store, per sweep).
+    """
+    for now, events in generate():
+        recorded = []
+        for log in logs:
+            recorded = [log.record(now, kind, key, **details) for kind, key, details in events]
+        if store is not None:
+            store.append([(now, {}, None, recorded)])
+
+
+RANGES = [(BASE + t0, BASE + t1)
+          for t0 in (-5, 0, 0.5, 3, 10, 37, 59.5, 60, 90, 118)
+          for t1 in (0, 1, 4, 30.5, 59, 60, 61, 100, 119, 130) if t1 >= t0]
+
+
+@pytest.fixture
+def logs(tmp_path):
+    """
+    @brief (reference log that never compacts, small archived log, small log without archive).
+    """
+    store = ColumnStore(str(tmp_path), retention_days=0)
+    reference = ProcessEventLog(10 ** 6)
+    archived = ProcessEventLog(40, archive=HistoryQuery(str(tmp_path)))
+    plain = ProcessEventLog(40)
+    fill([reference, archived, plain], store)
+    store.close()
+    assert archived.compacted_until > BASE + 60
+    return reference, archived, plain
+
+
+def test_store_round_trip(logs, tmp_path):
+    reference, _, _ = logs
+    stored = HistoryQuery(str(tmp_path)).events(BASE - 10, BASE + SECONDS)
+    assert stored == reference.events
+    assert sorted(entry for entry in tmp_path.iterdir() if entry.is_dir()) \
+        == [tmp_path / "2026-10-19", tmp_path / "2026-10-20"]
+
+
+def test_compaction_bounds_memory(logs):
+    _, archived, plain = logs
+    assert len(archived.events) <= 40
+    assert archived.times == sorted(archived.times)
+    assert plain.since(plain.compacted_until) == archived.since(archived.compacted_until)
+
+
+@pytest.mark.parametrize("t0, t1", RANGES)
+def test_archived_diff_matches_uncompacted(logs, t0, t1):
+    reference, archived, _ = logs
+    assert archived.diff(t0, t1) == reference.diff(t0, t1)
+
+
+@pytest.mark.parametrize("t0, t1", RANGES)
+def test_plain_diff_is_exact_after_compacted_span(logs, t0, t1):
+    reference, _, plain = logs
+    result = plain.diff(t0, t1)
+    if t0 >= plain.compacted_until:
+        assert result == reference.diff(t0, t1)
+    else:
+        assert result["exact"] is False
+
+
+def test_diff_after_restart_reads_the_store(logs, tmp_path):
+    reference, _, _ = logs
+    restarted = ProcessEventLog(40, archive=HistoryQuery(str(tmp_path)))
+    for t0, t1 in RANGES:
+        assert restarted.diff(t0, t1) == reference.diff(t0, t1)
+    # New events after the restart come from memory, older ones from the store
+    restarted.record(BASE + 200, "exit", INIT, name="systemd", cpu=0.0, ram=8.0)
+    result = restarted.diff(BASE - 5, BASE + 200)
+    assert [event["key"] for event in result["exited"]] == [INIT]
+    assert len(result["started"]) == len(reference.diff(BASE - 5, BASE + 200)["started"])
+
+
+def test_diff_categories():
+    log = ProcessEventLog(100)
+    log.record(10.0, "start", (5, 9.5), name="a", cpu=1.0, ram=1.0)
+    log.record(11.0, "rename", (6, 1.0), name="b2", old_name="b")
+    log.record(12.0, "exit", (7, 1.0), name="c", cpu=0.0, ram=1.0)
+    log.record(13.0, "start", (8, 13.0), name="d", cpu=0.0, ram=1.0)
+    log.record(14.0, "exit", (8, 13.0), name="d", cpu=0.0, ram=1.0)
+    log.record(15.0, "change", (6, 1.0), name="b2", cpu=90.0, ram=1.0, old_cpu=1.0, old_ram=1.0)
+    result = log.diff(9.0, 15.0)
+    assert [e["pid"] for e in result["started"]] == [5]
+    assert [e["pid"] for e in result["exited"]] == [7]
+    assert [e["pid"] for e in result["transient"]] == [8]
+    assert [(e["old_name"], e["name"]) for e in result["renamed"]] == [("b", "b2")]
+    assert [e["pid"] for e in result["changed"]] == [6]
+    # t0 is exclusive, t1 inclusive
+    assert log.diff(10.0, 12.0)["exited"] and not log.diff(10.0, 12.0)["started"]
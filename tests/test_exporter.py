@@ -0,0 +1,130 @@
+"""
+@file test_exporter.py
+@brief TelemetryExporter rotation, backpressure and schema changes (CSV; Parquet/Arrow with pyarrow).
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+import csv
+import glob
+import time
+import pytest
+from src.core.exporter import TelemetryExporter
+
+
+def drain(exporter: TelemetryExporter, rows: int, timeout: float = 5.0):
+    """
+    @brief Waits until the writer thread has written 'rows' samples.
+    """
+    deadline = time.monotonic() + timeout
+    while exporter.written < rows:
+        assert time.monotonic() < deadline, f"writer stuck at {exporter.written}/{rows}"
+        time.sleep(0.005)
+
+
+def read_files(directory, extension: str = "csv") -> list:
+    """
+    @brief Returns [(header, rows)] of every export file, oldest first.
+    """
+    files = []
+    for path in sorted(glob.glob(os.path.join(directory, f"telemetry-*.{extension}")),
+                       key=lambda path: (os.path.getmtime(path), path)):
+        with open(path, newline="") as handle:
+            reader = list(csv.reader(handle))
+        files.append((reader[0], reader[1:]))
+    return files
+
+
+def test_rotation_by_rows(tmp_path):
+    exporter = TelemetryExporter(str(tmp_path), batch_rows=5, rotate_rows=10, keep_files=0)
+    for i in range(25):
+        exporter.submit(float(i), {"cpu.usage": float(i)})
+        drain(exporter, i + 1 - (i + 1) % 5)
+    exporter.close()
+    files = read_files(tmp_path)
+    assert [len(rows) for _, rows in files] == [10, 10, 5]
+    assert all(header == ["timestamp", "cpu.usage"] for header, _ in files)
+    stamps = [float(row[0]) for _, rows in files for row in rows]
+    assert stamps == [float(i) for i in range(25)]
+    assert exporter.written == 25 and exporter.dropped == 0
+
+
+def test_keep_files_prunes_oldest(tmp_path):
+    exporter = TelemetryExporter(str(tmp_path), batch_rows=1, rotate_rows=1, keep_files=3)
+    for i in range(8):
+        exporter.submit(float(i), {"x": float(i)})
+        drain(exporter, i + 1)
+    exporter.close()
+    assert len(glob.glob(str(tmp_path / "telemetry-*.csv"))) == 3
+    assert exporter.written == 8
+
+
+@pytest.mark.parametrize("policy, kept", [("drop_oldest", list(range(3, 8))),
+                                          ("drop_newest", list(range(5)))])
+def test_backpressure_policies(tmp_path, policy, kept):
+    # The writer only wakes on a full batch or after flush_seconds: neither happens here
+    exporter = TelemetryExporter(str(tmp_path), batch_rows=1000, flush_seconds=60,
+                                 queue_size=5, policy=policy)
+    for i in range(8):
+        exporter.submit(float(i), {"x": float(i)})
+    stats = exporter.stats()
+    assert stats["queued"] == 5 and stats["dropped"] == 3 and stats["written"] == 0
+    exporter.close()
+    (_, rows), = read_files(tmp_path)
+    assert [int(float(row[0])) for row in rows] == kept
+    assert exporter.written == 5
+
+
+def test_schema_change_starts_new_file(tmp_path):
+    exporter = TelemetryExporter(str(tmp_path), batch_rows=1, rotate_rows=100, keep_files=0)
+    batches = [{"cpu.usage": 1.0, "disk.sda.read": 0.5},
+               {"cpu.usage": 2.0, "disk.sda.read": 0.6},
+               {"cpu.usage": 3.0, "disk.sda.read": 0.7, "disk.sdb.read": 9.0},   # hot-plugged
+               {"cpu.usage": 4.0}]                                              # subset: same file
+    for i, series in enumerate(batches):
+        exporter.submit(float(i), series)
+        drain(exporter, i + 1)
+    exporter.close()
+    files = read_files(tmp_path)
+    assert [header for header, _ in files] == [
+        ["timestamp", "cpu.usage", "disk.sda.read"],
+        # Known columns keep their position, new ones are appended
+        ["timestamp", "cpu.usage", "disk.sda.read", "disk.sdb.read"],
+    ]
+    assert [len(rows) for _, rows in files] == [2, 2]
+    assert files[1][1] == [["2.0", "3.0", "0.7", "9.0"], ["3.0", "4.0", "", ""]]
+
+
+def test_flush_timeout_writes_partial_batch(tmp_path):
+    exporter = TelemetryExporter(str(tmp_path), batch_rows=1000, flush_seconds=0.05)
+    exporter.submit(1.0, {"x": 1.0})
+    drain(exporter, 1)
+    exporter.close()
+    assert exporter.stats()["queued"] == 0
+
+
+def test_rejects_unknown_settings(tmp_path):
+    with pytest.raises(ValueError):
+        TelemetryExporter(str(tmp_path), fmt="xml")
+    with pytest.raises(ValueError):
+        TelemetryExporter(str(tmp_path), policy="block")
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_columnar_schema_change(tmp_path, fmt):
+    pa = pytest.importorskip("pyarrow")
+    exporter = TelemetryExporter(str(tmp_path), fmt=fmt, batch_rows=1, keep_files=0)
+    for i, series in enumerate([{"a": 1.0}, {"a": 2.0, "b": 3.0}]):
+        exporter.submit(float(i), series)
+        drain(exporter, i + 1)
+    exporter.close()
+    paths = sorted(glob.glob(str(tmp_path / "telemetry-*")), key=os.path.getmtime)
+    assert len(paths) == 2
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(paths[1])
+    else:
+        table = pa.ipc.open_stream(paths[1]).read_all()
+    assert table.column_names == ["timestamp", "a", "b"]
+    assert table.column("b").to_pylist() == [3.0]
@@ -0,0 +1,150 @@
+"""
+@file test_governor.py
+@brief SamplingGovernor interval and shedding decisions driven by charged section costs.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import pytest
+from src.core import governor as governor_module
+from src.core.governor import SamplingGovernor
+
+BUDGET = 0.01          # 1% of a core
+MIN_INTERVAL = 0.5
+MAX_INTERVAL = 5.0     # -> at most 0.05 CPU seconds per cycle
+SETTLE = 2
+
+
+class FakeClock:
+    """
+    @brief Stands in for time.thread_time(); advanced by whatever a cycle charges.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(governor_module.time, "thread_time", fake)
+    return fake
+
+
+@pytest.fixture
+def governor(clock):
+    """
+    @brief Governor with smoothing 1.0, so each cycle's cost is taken as is.
+    """
+    return SamplingGovernor(BUDGET, MIN_INTERVAL, MAX_INTERVAL,
+                            sheddable=("smart", "gpu"), smoothing=1.0, settle=SETTLE)
+
+
+def cycle(governor: SamplingGovernor, clock: FakeClock, costs: dict) -> float:
+    """
+    @brief Runs one sampling cycle, charging only the sections the governor keeps enabled.
+    @return The interval chosen for the next cycle.
+    """
+    governor.begin_cycle()
+    for name, seconds in costs.items():
+        if governor.enabled(name):
+            governor.charge(name, seconds)
+            clock.now += seconds
+    return governor.end_cycle()
+
+
+def test_interval_rises_at_once_with_headroom(governor, clock):
+    assert cycle(governor, clock, {"base": 0.001}) == MIN_INTERVAL
+    # 10 ms per cycle at 1% needs 1 s; the 25% headroom gives 1.25 s straight away
+    assert cycle(governor, clock, {"base": 0.01}) == pytest.approx(1.25)
+    assert governor.status()["usage"] == pytest.approx(0.01 / 1.25)
+
+
+def test_interval_ramps_down_gradually(governor, clock):
+    assert cycle(governor, clock, {"base": 0.04}) == MAX_INTERVAL
+    intervals = [cycle(governor, clock, {"base": 0.001}) for _ in range(12)]
+    previous = MAX_INTERVAL
+    for interval in intervals:
+        assert interval >= previous * SamplingGovernor.RAMP_DOWN - 1e-12
+        assert interval <= previous
+        previous = interval
+    assert intervals[0] == pytest.approx(MAX_INTERVAL * SamplingGovernor.RAMP_DOWN)
+    assert intervals[-1] == MIN_INTERVAL
+
+
+def test_sheds_most_expensive_sheddable_section(governor, clock):
+    costs = {"base": 0.01, "smart": 0.03, "gpu": 0.05}
+    assert cycle(governor, clock, costs) == MAX_INTERVAL
+    assert governor.shed == ["gpu"]
+    assert not governor.enabled("gpu")
+    assert governor.enabled("smart")
+    # The victim's cost is discounted at once rather than through the EWMA
+    assert governor.cost == pytest.approx(0.04)
+    # The remaining 40 ms fit under max_interval: nothing more is dropped
+    for _ in range(5):
+        cycle(governor, clock, costs)
+    assert governor.shed == ["gpu"]
+
+
+def test_cooldown_spaces_consecutive_sheds(governor, clock):
+    costs = {"base": 0.01, "smart": 0.06, "gpu": 0.07}
+    cycle(governor, clock, costs)
+    assert governor.shed == ["gpu"]
+    assert governor.cooldown == SETTLE
+    # Still over budget without gpu, but the next drop waits out the cooldown
+    for _ in range(SETTLE - 1):
+        cycle(governor, clock, costs)
+        assert governor.shed == ["gpu"]
+    cycle(governor, clock, costs)
+    assert governor.shed == ["gpu", "smart"]
+    assert governor.interval == MAX_INTERVAL
+
+
+def test_non_sheddable_cost_is_not_dropped(governor, clock):
+    for _ in range(5):
+        assert cycle(governor, clock, {"base": 0.2, "smart": 0.0}) == MAX_INTERVAL
+    assert governor.shed == []
+
+
+def test_restore_waits_for_remembered_cost_to_decay(governor, clock):
+    cycle(governor, clock, {"base": 0.01, "smart": 0.01, "gpu": 0.05})
+    assert governor.shed == ["gpu"]
+    quiet = {"base": 0.001, "smart": 0.001, "gpu": 0.05}
+    # Restoring needs (cost + remembered gpu cost) within half the budget at
+    # max_interval: 0.05 * FORGET^k must fall to about 0.023 s
+    restored_after = None
+    for count in range(1, 80):
+        cycle(governor, clock, quiet)
+        if not governor.shed:
+            restored_after = count
+            break
+    assert restored_after is not None
+    assert 30 < restored_after < 45
+    assert governor.enabled("gpu")
+    assert governor.cooldown == SETTLE
+    # Measured afresh and still too expensive: dropped again once the cooldown ends
+    for _ in range(SETTLE + 1):
+        cycle(governor, clock, {"base": 0.01, "smart": 0.01, "gpu": 0.05})
+    assert governor.shed == ["gpu"]
+
+
+def test_restores_last_dropped_first(governor, clock):
+    governor.shed = ["gpu", "smart"]
+    governor.section_cost = {"gpu": 0.001, "smart": 0.001}
+    cycle(governor, clock, {"base": 0.001, "smart": 0.001, "gpu": 0.001})
+    assert governor.shed == ["gpu"]
+    for _ in range(SETTLE):
+        cycle(governor, clock, {"base": 0.001, "smart": 0.001, "gpu": 0.001})
+    assert governor.shed == []
+
+
+def test_status_reports_sections_in_milliseconds(governor, clock):
+    cycle(governor, clock, {"base": 0.002, "smart": 0.003})
+    status = governor.status()
+    assert status["cycle_ms"] == pytest.approx(5.0)
+    assert status["sections"] == pytest.approx({"base": 2.0, "smart": 3.0})
+    assert status["rate"] == pytest.approx(1.0 / status["interval"])
+    assert status["shed"] == []
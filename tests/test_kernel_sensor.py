@@ -0,0 +1,96 @@
+"""
+@file test_kernel_sensor.py
+@brief KernelSensor classification over a fake /proc, including PID reuse between ticks.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import pytest
+from src.core.procfs import ProcFS
+from src.components.processes.kernel import kernel_sensor
+from src.components.processes.kernel.kernel_sensor import KernelSensor
+
+
+def stat_line(pid: int, comm: str, ppid: int, starttime: int, state: str = "S", ticks: int = 0) -> str:
+    """
+    @brief Builds a proc(5) stat line; fields after comm start at the state.
+    """
+    fields = [state, str(ppid)] + ["0"] * 9 + [str(ticks), "0"] + ["0"] * 6 + [str(starttime), "0", "0"]
+    return f"{pid} ({comm}) " + " ".join(fields) + "\n"
+
+
+class FakeProc:
+    """
+    @brief A directory laid out like /proc with one stat file per PID.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def spawn(self, pid: int, comm: str, ppid: int, starttime: int, **kwargs):
+        directory = self.root / str(pid)
+        directory.mkdir(exist_ok=True)
+        (directory / "stat").write_text(stat_line(pid, comm, ppid, starttime, **kwargs))
+
+    def exit(self, pid: int):
+        directory = self.root / str(pid)
+        (directory / "stat").unlink()
+        directory.rmdir()
+
+
+@pytest.fixture
+def proc(tmp_path, monkeypatch):
+    fake = FakeProc(tmp_path)
+    fake.spawn(1, "systemd", 0, 10)
+    fake.spawn(2, "kthreadd", 0, 10)
+    fake.spawn(15, "ksoftirqd/0", 2, 12)
+    reader = ProcFS(str(tmp_path))
+    monkeypatch.setattr(kernel_sensor, "procfs", lambda: reader)
+    yield fake
+    reader.close()
+
+
+def threads(data: dict) -> dict:
+    return {thread["pid"]: thread["name"] for group in data["groups"] for thread in group["threads"]}
+
+
+def test_classifies_kthreadd_children(proc):
+    proc.spawn(100, "bash", 1, 50)
+    data = KernelSensor().fetch_data()
+    assert threads(data) == {2: "kthreadd", 15: "ksoftirqd/0"}
+    assert data["count"] == 2
+
+
+def test_reused_pid_is_reclassified(proc):
+    sensor = KernelSensor()
+    proc.spawn(100, "bash", 1, 50)
+    assert 100 not in threads(sensor.fetch_data())
+    # Between two ticks the user process exits and a kworker gets its PID
+    proc.exit(100)
+    proc.spawn(100, "kworker/0:1", 2, 80)
+    assert threads(sensor.fetch_data())[100] == "kworker/0:1"
+    # And the other way round
+    proc.exit(100)
+    proc.spawn(100, "python3", 1, 90)
+    data = sensor.fetch_data()
+    assert 100 not in threads(data)
+    assert data["count"] == 2
+
+
+def test_cached_name_survives_comm_with_spaces_and_parens(proc):
+    proc.spawn(40, "irq/45-nvme0 q1)", 2, 20, state="R")
+    sensor = KernelSensor()
+    sensor.fetch_data()
+    data = sensor.fetch_data()
+    group = next(group for group in data["groups"] if group["family"] == "irq")
+    assert group["threads"] == [{"pid": 40, "name": "irq/45-nvme0 q1)", "status": "running", "cpu": 0.0}]
+
+
+def test_exited_pids_are_forgotten(proc):
+    sensor = KernelSensor()
+    proc.spawn(100, "bash", 1, 50)
+    sensor.fetch_data()
+    assert "100" in sensor.identity
+    proc.exit(100)
+    sensor.fetch_data()
+    assert "100" not in sensor.identity
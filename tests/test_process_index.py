@@ -0,0 +1,140 @@
+"""
+@file test_process_index.py
+@brief ProcessIndex searches against a naive substring filter over the same processes.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import random
+import pytest
+from src.components.processes.user.process_index import ProcessIndex, CMDLINE_INDEX_CHARS
+
+NAMES = ["python3", "bash", "sshd", "postgres", "nginx", "kworker/0:1", "Xorg", "chrome",
+         "systemd-journald", "vim", "make", "cc1plus", "node", "java", "redis-server"]
+ARGS = ["--port 5432", "-c config.yaml", "/usr/lib/chromium --type=renderer", "worker.py 12",
+        "-D /var/lib/postgres/data", "", "--enable-features=VaapiVideoDecoder", "index.js"]
+USERS = ["root", "alice", "postgres", "www-data", "bob"]
+
+
+def naive(processes: dict, query: str) -> set:
+    """
+    @brief Reference search: every term is a substring of the document or a PID prefix.
+    """
+    terms = query.lower().split()
+    if not terms:
+        return set()
+    result = set()
+    for key, (name, cmdline, user) in processes.items():
+        document = "\n".join((name, cmdline[:CMDLINE_INDEX_CHARS], user)).lower()
+        if all(term in document or (term.isdigit() and str(key[0]).startswith(term))
+               for term in terms):
+            result.add(key)
+    return result
+
+
+def queries(processes: dict, rng: random.Random) -> list:
+    """
+    @brief Substrings of live documents (1-8 chars), PID prefixes, multi-term and misses.
+    """
+    result = ["", "   ", "zzzz", "qq", "x", "1", "12", "123", "99999", "py ali", "ROOT", "post data"]
+    documents = ["\n".join(fields).lower() for fields in processes.values()]
+    pids = [str(key[0]) for key in processes]
+    for _ in range(150):
+        document = rng.choice(documents)
+        size = rng.randint(1, 8)
+        start = rng.randrange(max(1, len(document) - size))
+        term = document[start:start + size].split("\n")[0].strip()
+        if term:
+            result.append(term)
+    for _ in range(40):
+        pid = rng.choice(pids)
+        result.append(pid[:rng.randint(1, len(pid))])
+    for _ in range(40):
+        result.append(" ".join(rng.sample(result[12:], 2)))
+    return result
+
+
+def random_process(rng: random.Random):
+    """
+    @brief Returns (name, cmdline, user) from the vocabularies.
+    """
+    name = rng.choice(NAMES)
+    return name, f"/usr/bin/{name} {rng.choice(ARGS)}".strip(), rng.choice(USERS)
+
+
+def check(index: ProcessIndex, processes: dict, rng: random.Random):
+    """
+    @brief Asserts the index answers every query exactly like the naive filter.
+    """
+    assert len(index) == len(processes)
+    for query in queries(processes, rng):
+        assert index.search(query) == naive(processes, query), query
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_naive_filter_through_churn(seed):
+    rng = random.Random(seed)
+    index = ProcessIndex()
+    processes = {}
+    pids = rng.sample(range(1, 40000), 400)
+    for pid in pids[:250]:
+        key = (pid, float(rng.randint(0, 10 ** 6)))
+        processes[key] = random_process(rng)
+        index.add(key, *processes[key])
+    check(index, processes, rng)
+
+    for _ in range(3):
+        keys = list(processes)
+        # Renames (exec): the document is replaced, old trigrams must not match any more
+        for key in rng.sample(keys, 40):
+            processes[key] = random_process(rng)
+            index.add(key, *processes[key])
+        # Exits
+        for key in rng.sample(keys, 40):
+            del processes[key]
+            index.remove(key)
+        # Starts, some reusing the PID of an exited process under a new create_time
+        for pid in rng.sample(pids, 40):
+            key = (pid, float(rng.randint(10 ** 6, 2 * 10 ** 6)))
+            processes[key] = random_process(rng)
+            index.add(key, *processes[key])
+        check(index, processes, rng)
+
+    # Nothing left behind once every process is gone
+    for key in list(processes):
+        index.remove(key)
+    assert not index.docs and not index.grams and not index.pids
+
+
+def test_rename_and_indexed_name():
+    index = ProcessIndex()
+    index.add((10, 1.0), "bash", "/bin/bash --login", "alice")
+    assert index.indexed_name((10, 1.0)) == "bash"
+    assert index.search("login") == {(10, 1.0)}
+    index.add((10, 1.0), "python3", "python3 train.py", "alice")
+    assert index.indexed_name((10, 1.0)) == "python3"
+    assert index.search("login") == set()
+    assert index.search("train ALICE") == {(10, 1.0)}
+    index.remove((10, 1.0))
+    index.remove((10, 1.0))
+    assert index.indexed_name((10, 1.0)) is None
+
+
+def test_pid_prefix_and_short_terms():
+    index = ProcessIndex()
+    index.add((1234, 1.0), "sshd", "sshd: alice", "root")
+    index.add((12, 1.0), "init", "/sbin/init", "root")
+    index.add((2123, 1.0), "agent-12", "agent", "bob")
+    assert index.search("12") == {(1234, 1.0), (12, 1.0), (2123, 1.0)}   # PID prefix or text
+    assert index.search("123") == {(1234, 1.0)}
+    assert index.search("21") == {(2123, 1.0)}
+    assert index.search("in") == {(12, 1.0)}
+    assert index.search("12 root") == {(1234, 1.0), (12, 1.0)}
+
+
+def test_long_cmdline_is_truncated():
+    index = ProcessIndex()
+    cmdline = "java " + "x" * CMDLINE_INDEX_CHARS + " needle"
+    index.add((5, 1.0), "java", cmdline, "root")
+    assert index.search("needle") == set()
+    assert index.search("java") == {(5, 1.0)}
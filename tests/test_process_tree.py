@@ -0,0 +1,154 @@
+"""
+@file test_process_tree.py
+@brief ProcessTree subtree totals against a full recompute after every mutation.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import pytest
+from src.components.processes.tree.process_tree import ProcessTree
+
+
+def recompute(tree: ProcessTree) -> dict:
+    """
+    @brief Rebuilds every subtree total from the nodes' own metrics and parent links.
+    @return {key: [cpu, ram, io, count]}.
+    """
+    totals = {key: list(node["own"]) + [1] for key, node in tree.nodes.items()}
+    for node in tree.nodes.values():
+        own = list(node["own"]) + [1]
+        parent = node["parent"]
+        while parent is not None:
+            for i in range(4):
+                totals[parent][i] += own[i]
+            parent = tree.nodes[parent]["parent"]
+    return totals
+
+
+def check(tree: ProcessTree):
+    """
+    @brief Asserts the incremental totals, the links and the root set are consistent.
+    """
+    expected = recompute(tree)
+    for key, node in tree.nodes.items():
+        assert node["total"] == pytest.approx(expected[key]), key
+        parent = node["parent"]
+        if parent is None:
+            assert key in tree.roots
+        else:
+            assert key in tree.nodes[parent]["children"]
+            assert tree.nodes[parent]["pid"] == node["ppid"]
+        for child in node["children"]:
+            assert tree.nodes[child]["parent"] == key
+    assert tree.roots == {key for key, node in tree.nodes.items() if node["parent"] is None}
+
+
+@pytest.fixture
+def tree():
+    """
+    @brief init(1) -> sshd(10) -> bash(20) -> {vim(30), make(31) -> cc(40)}.
+    """
+    tree = ProcessTree()
+    tree.update((1, 0.0), 0, "init", 0.5, 10.0, 0.0)
+    tree.update((10, 1.0), 1, "sshd", 1.0, 20.0, 0.1)
+    tree.update((20, 2.0), 10, "bash", 2.0, 30.0, 0.2)
+    tree.update((30, 3.0), 20, "vim", 3.0, 40.0, 0.3)
+    tree.update((31, 3.0), 20, "make", 4.0, 50.0, 0.4)
+    tree.update((40, 4.0), 31, "cc", 50.0, 200.0, 1.5)
+    check(tree)
+    return tree
+
+
+def test_totals_of_built_tree(tree):
+    root = tree.nodes[(1, 0.0)]
+    assert root["total"] == pytest.approx([60.5, 350.0, 2.5, 6])
+    assert tree.roots == {(1, 0.0)}
+
+
+def test_metric_change_propagates_to_ancestors(tree):
+    tree.update((40, 4.0), 31, "cc", 10.0, 250.0, 0.0)
+    check(tree)
+    assert tree.nodes[(20, 2.0)]["total"][0] == pytest.approx(19.0)
+
+
+def test_out_of_order_children_are_adopted():
+    tree = ProcessTree()
+    tree.update((40, 4.0), 31, "cc", 5.0, 1.0, 0.0)
+    assert tree.orphans == {31: {(40, 4.0)}}
+    tree.update((31, 3.0), 20, "make", 1.0, 1.0, 0.0)
+    assert tree.orphans == {20: {(31, 3.0)}}
+    check(tree)
+    tree.update((20, 2.0), 1, "bash", 1.0, 1.0, 0.0)
+    tree.update((1, 0.0), 0, "init", 0.0, 1.0, 0.0)
+    check(tree)
+    assert tree.roots == {(1, 0.0)}
+    assert tree.nodes[(1, 0.0)]["total"][3] == 4
+    assert not tree.orphans
+
+
+def test_reparent_moves_subtree(tree):
+    # make is adopted by init (a subreaper) while its child keeps running
+    tree.update((31, 3.0), 1, "make", 4.0, 50.0, 0.4)
+    check(tree)
+    assert tree.nodes[(20, 2.0)]["total"][3] == 2
+    assert (31, 3.0) in tree.nodes[(1, 0.0)]["children"]
+
+
+def test_reparent_to_unknown_parent_waits_as_orphan(tree):
+    tree.update((31, 3.0), 99, "make", 4.0, 50.0, 0.4)
+    check(tree)
+    assert (31, 3.0) in tree.roots
+    assert tree.orphans[99] == {(31, 3.0)}
+    tree.update((99, 9.0), 1, "reaper", 0.0, 1.0, 0.0)
+    check(tree)
+    assert tree.nodes[(31, 3.0)]["parent"] == (99, 9.0)
+    assert tree.nodes[(1, 0.0)]["total"][3] == 7
+
+
+def test_exit_orphans_children_then_reparent(tree):
+    tree.remove((31, 3.0))
+    check(tree)
+    assert (40, 4.0) in tree.roots
+    assert tree.nodes[(20, 2.0)]["total"][3] == 2
+    # Next sweep reports the reparenting to init
+    tree.update((40, 4.0), 1, "cc", 50.0, 200.0, 1.5)
+    check(tree)
+    assert tree.nodes[(1, 0.0)]["total"][3] == 5
+
+
+def test_exit_of_leaf_and_unknown_key(tree):
+    tree.remove((30, 3.0))
+    tree.remove((12345, 0.0))
+    check(tree)
+    assert len(tree) == 5
+
+
+def test_pid_reuse_keeps_processes_apart(tree):
+    tree.remove((31, 3.0))
+    tree.update((40, 4.0), 1, "cc", 50.0, 200.0, 1.5)
+    # A new process gets PID 31: it must not inherit make's children or totals
+    tree.update((31, 8.0), 20, "python", 7.0, 70.0, 0.0)
+    check(tree)
+    assert tree.by_pid[31] == (31, 8.0)
+    assert tree.nodes[(31, 8.0)]["total"] == pytest.approx([7.0, 70.0, 0.0, 1])
+    assert tree.nodes[(40, 4.0)]["parent"] == (1, 0.0)
+
+
+def test_pid_reuse_before_old_exit_is_swept(tree):
+    # The sweep sees the new PID-31 process before removing the old one
+    tree.update((31, 8.0), 20, "python", 7.0, 70.0, 0.0)
+    tree.remove((31, 3.0))
+    check(tree)
+    assert tree.by_pid[31] == (31, 8.0)
+    assert (40, 4.0) in tree.roots
+    tree.remove((31, 8.0))
+    check(tree)
+    assert 31 not in tree.by_pid
+
+
+def test_rows_fold_tail(tree):
+    rows = tree.children_rows((20, 2.0), limit=1)
+    assert [row["name"] for row in rows] == ["make", "... 1 more"]
+    assert rows[0]["total_cpu"] == pytest.approx(54.0)
+    assert rows[1]["count"] == 1
+    assert tree.children_rows((12345, 0.0), 10) == []
@@ -0,0 +1,156 @@
+"""
+@file test_procfs.py
+@brief ProcFS reads, stat parsing and stat_batch() over a fake /proc and the real one.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+import pytest
+from src.core.procfs import (ProcFS, split_stat, STAT_STATE, STAT_PPID, STAT_UTIME,
+                             STAT_STIME, STAT_STARTTIME, STAT_RSS)
+
+COLUMNS = (STAT_STATE, STAT_PPID, STAT_UTIME, STAT_STIME, STAT_STARTTIME, STAT_RSS)
+
+
+def stat_line(pid: int, comm: str, ppid: int = 1, utime: int = 0, stime: int = 0,
+              starttime: int = 0, rss: int = 0, state: str = "S") -> bytes:
+    """
+    @brief Builds a proc(5) stat line (fields after comm start at the state).
+    """
+    fields = ([state, str(ppid)] + ["0"] * 9 + [str(utime), str(stime)] + ["0"] * 6
+              + [str(starttime), "0", str(rss), "0"])
+    return f"{pid} ({comm}) {' '.join(fields)}\n".encode()
+
+
+@pytest.fixture
+def proc(tmp_path):
+    """
+    @brief A directory laid out like /proc, and a reader on it.
+    """
+    def spawn(pid, comm, **kwargs):
+        (tmp_path / str(pid)).mkdir()
+        (tmp_path / str(pid) / "stat").write_bytes(stat_line(pid, comm, **kwargs))
+
+    spawn(1, "systemd", ppid=0, utime=5, stime=7, starttime=1, rss=100)
+    spawn(42, "my prog", utime=11, stime=12, starttime=300, rss=2048, state="R")
+    spawn(43, "a) b (c))", ppid=42, starttime=301)
+    spawn(44, ")", ppid=42, starttime=302, state="Z")
+    spawn(45, "", starttime=303)
+    (tmp_path / "self").mkdir()
+    reader = ProcFS(str(tmp_path), buffer_bytes=16)
+    yield tmp_path, reader
+    reader.close()
+
+
+@pytest.mark.parametrize("comm", ["bash", "my prog", "a) b (c))", ")", "(", "", "x ) 1 2 3"])
+def test_split_stat_handles_any_comm(comm):
+    name, fields = split_stat(stat_line(7, comm, ppid=3, starttime=99))
+    assert name == comm.encode()
+    assert fields[STAT_STATE] == b"S"
+    assert int(fields[STAT_PPID]) == 3
+    assert int(fields[STAT_STARTTIME]) == 99
+
+
+def test_pids_lists_numeric_entries_only(proc):
+    _, reader = proc
+    assert sorted(reader.pids(), key=int) == ["1", "42", "43", "44", "45"]
+
+
+def test_read_grows_buffer_for_large_files(proc):
+    root, reader = proc
+    big = bytes(range(256)) * 300
+    (root / "42" / "maps").write_bytes(big)
+    assert reader.read("42/maps") == big
+    assert len(reader.buffer) >= len(big)
+    # The grown buffer is kept and still serves small files
+    assert reader.read("1/stat") == stat_line(1, "systemd", ppid=0, utime=5, stime=7, starttime=1, rss=100)
+
+
+def test_stat_parses_comm_with_spaces_and_parens(proc):
+    _, reader = proc
+    comm, fields = reader.stat("43/stat")
+    assert comm == b"a) b (c))"
+    assert int(fields[STAT_PPID]) == 42
+    comm, fields = reader.stat("44/stat")
+    assert comm == b")"
+    assert fields[STAT_STATE] == b"Z"
+
+
+def test_stat_batch_rows_and_names(proc):
+    _, reader = proc
+    names = []
+    values = reader.stat_batch(["1", 42, "43", "44", "45"], COLUMNS, names=names)
+    assert names == [b"systemd", b"my prog", b"a) b (c))", b")", b""]
+    assert values.shape == (5, len(COLUMNS))
+    assert values[1].tolist() == [ord("R"), 1, 11, 12, 300, 2048]
+    assert values[2, 1] == 42
+    assert values[3, 0] == ord("Z")
+
+
+def test_stat_batch_pid_gone_mid_batch(proc):
+    root, reader = proc
+    # 42 exits between the listing and the batch; 99 never existed
+    (root / "42" / "stat").unlink()
+    (root / "42").rmdir()
+    names = []
+    values = reader.stat_batch(["1", "42", "99", "43"], COLUMNS, names=names)
+    assert names == [b"systemd", None, None, b"a) b (c))"]
+    assert (values[1] == -1).all() and (values[2] == -1).all()
+    assert values[0, 4] == 1 and values[3, 4] == 301
+
+
+def test_stat_batch_malformed_line(proc):
+    root, reader = proc
+    (root / "45" / "stat").write_bytes(b"45 (short) S 1 2\n")
+    (root / "46").mkdir()
+    (root / "46" / "stat").write_bytes(b"46 (bad) S x 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0\n")
+    names = []
+    values = reader.stat_batch(["45", "46", "1"], COLUMNS, names=names)
+    assert names == [None, None, b"systemd"]
+    assert (values[:2] == -1).all()
+    assert values[2, 2] == 5
+
+
+def test_stat_batch_reuses_its_array(proc):
+    _, reader = proc
+    first = reader.stat_batch(["1", "42"], COLUMNS)
+    second = reader.stat_batch(["43"], COLUMNS)
+    assert second.base is first.base
+    # A wider column set gets a fresh array
+    wider = reader.stat_batch(["1"], COLUMNS + (STAT_STATE,))
+    assert wider.shape == (1, len(COLUMNS) + 1)
+
+
+def test_dir_fd_relative_reads(proc):
+    root, reader = proc
+    task = root / "42" / "task"
+    (task / "42").mkdir(parents=True)
+    (task / "42" / "stat").write_bytes(stat_line(42, "main thread", utime=3))
+    (task / "50").mkdir()
+    (task / "50" / "stat").write_bytes(stat_line(50, "worker 1", utime=4))
+    fd = reader.open_dir("42/task")
+    try:
+        tids = sorted(os.listdir(fd), key=int)
+        names = []
+        values = reader.stat_batch(tids, (STAT_UTIME,), dir_fd=fd, names=names)
+        assert names == [b"main thread", b"worker 1"]
+        assert values[:, 0].tolist() == [3, 4]
+        assert sorted(reader.listdir(dir_fd=fd)) == ["42", "50"]
+    finally:
+        os.close(fd)
+    with pytest.raises(FileNotFoundError):
+        reader.open_dir("99")
+
+
+def test_real_proc_self():
+    reader = ProcFS()
+    try:
+        pid = str(os.getpid())
+        names = []
+        values = reader.stat_batch([pid], (STAT_PPID,), names=names)
+        assert values[0, 0] == os.getppid()
+        assert names[0]
+        assert pid in reader.pids()
+    finally:
+        reader.close()
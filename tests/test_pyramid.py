@@ -0,0 +1,121 @@
+"""
+@file test_pyramid.py
+@brief MinMaxPyramid queries against brute-force min/max envelopes of the raw samples.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import numpy as np
+import pytest
+from src.core.pyramid import MinMaxPyramid, INITIAL_SLOTS
+
+ROWS = 3
+
+
+def feed(capacity: int, count: int, seed: int = 0):
+    """
+    @brief Appends 'count' 1 Hz samples (t = index); row 2 is sparse (mostly NaN).
+    @return (pyramid, every appended sample as an array of shape (ROWS, count)).
+    """
+    rng = np.random.default_rng(seed)
+    data = rng.normal(50, 20, size=(ROWS, count)).astype(np.float32)
+    data[1] = np.cumsum(rng.normal(0, 1, count)).astype(np.float32)
+    data[2, rng.random(count) > 0.02] = np.nan
+    data[0, rng.integers(0, count, 20)] = 1000.0    # Single-sample spikes
+    pyramid = MinMaxPyramid(ROWS, capacity)
+    for t in range(count):
+        pyramid.append(float(t), data[:, t])
+    return pyramid, data
+
+
+def envelope(data: np.ndarray, start: int, end: int):
+    """
+    @brief Brute-force (min, max) per row over samples [start, end), ignoring NaN.
+    """
+    chunk = data[:, start:end]
+    return np.fmin.reduce(chunk, axis=1), np.fmax.reduce(chunk, axis=1)
+
+
+def check_query(pyramid: MinMaxPyramid, data: np.ndarray, t0: float, t1: float, pixels: int):
+    """
+    @brief Checks one query: raw points verbatim, or every bucket against brute force.
+    """
+    x, y = pyramid.query(t0, t1, pixels)
+    assert y.shape == (ROWS, x.size)
+    first, last = pyramid.span()
+    newest = int(last) + 1
+    if x.size == 0:
+        return
+    if np.all(np.diff(x) > 0):
+        # Raw samples (t = index)
+        assert x.size <= pixels + 2
+        np.testing.assert_array_equal(y, data[:, x.astype(int)])
+        return
+
+    # Decimated: (min, max) pairs on a duplicated time axis
+    starts = x[0::2].astype(int)
+    assert np.array_equal(x[0::2], x[1::2])
+    assert len(starts) <= pixels + 3
+    size = int(np.diff(starts).min()) if len(starts) > 1 else newest - starts[0]
+    for index, start in enumerate(starts):
+        end = starts[index + 1] if index + 1 < len(starts) else min(start + size, newest)
+        low, high = envelope(data, start, end)
+        np.testing.assert_array_equal(y[:, 2 * index], low)
+        np.testing.assert_array_equal(y[:, 2 * index + 1], high)
+    # The buckets cover the requested (retained) range
+    assert starts[0] <= max(t0, first)
+    assert min(starts[-1] + size, newest) >= min(t1, last)
+
+
+@pytest.mark.parametrize("capacity, count", [(100_000, 50_000), (8_000, 21_000)])
+def test_queries_match_brute_force(capacity, count):
+    pyramid, data = feed(capacity, count)
+    first, last = pyramid.span()
+    if count > capacity:
+        assert first > 0 and pyramid.n <= capacity    # Oldest samples were trimmed
+    spans = [(first, last), (last - 60, last), (first + 1234.5, last - 987.25),
+             (last - 5000, last + 100), (first - 100, first + 3000)]
+    for t0, t1 in spans:
+        for pixels in (50, 300, 1000):
+            check_query(pyramid, data, t0, t1, pixels)
+
+
+def test_spikes_survive_decimation():
+    pyramid, data = feed(100_000, 50_000, seed=3)
+    x, y = pyramid.query(0, 50_000, 100)
+    assert y[0].max() == data[0].max() == 1000.0
+    assert np.nanmin(y[1]) == data[1].min()
+    assert np.nanmax(y[2]) == np.nanmax(data[2])
+
+
+def test_storage_grows_with_samples():
+    pyramid = MinMaxPyramid(1, 7 * 86400)
+    assert pyramid.times.size == INITIAL_SLOTS
+    assert all(level.times.size <= INITIAL_SLOTS // level.size + 1 for level in pyramid.levels)
+    for t in range(3 * INITIAL_SLOTS):
+        pyramid.append(float(t), [t])
+    assert pyramid.times.size == 4 * INITIAL_SLOTS
+    assert pyramid.levels[0].n == 3 * INITIAL_SLOTS // 4
+    x, y = pyramid.query(0, 3 * INITIAL_SLOTS, 20_000)
+    np.testing.assert_array_equal(x, np.arange(3 * INITIAL_SLOTS))
+
+
+def test_capacity_is_a_hard_limit():
+    pyramid = MinMaxPyramid(1, 10_000)
+    for t in range(25_000):
+        pyramid.append(float(t), [t])
+        assert pyramid.n <= 10_000
+    assert pyramid.times.size == 10_000
+    for level in pyramid.levels:
+        assert level.times.size <= level.slots
+    assert pyramid.span()[1] == 24_999.0
+
+
+def test_empty_and_single_sample():
+    pyramid = MinMaxPyramid(2, 1000)
+    assert pyramid.span() is None
+    x, y = pyramid.query(0, 10, 100)
+    assert x.size == 0 and y.shape == (2, 0)
+    pyramid.append(5.0, [1.0, np.nan])
+    x, y = pyramid.query(0, 10, 100)
+    assert list(x) == [5.0] and y[0, 0] == 1.0 and np.isnan(y[1, 0])
@@ -0,0 +1,147 @@
+"""
+@file test_remote_protocol.py
+@brief FrameEncoder/FrameDecoder round trips, including frames split across feed() calls.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import math
+import random
+import socket
+import pytest
+from src.core.remote_protocol import (FrameEncoder, FrameDecoder, HEADER, DELTA, DELTA_HEAD,
+                                      ENTRY, frame, parse_address)
+
+T0 = 1_700_000_000.25
+
+# (timestamp, series): values are exact in float32 so they compare equal after decoding
+SAMPLES = [
+    (T0, {"cpu": 12.5, "ram": 40.0}),
+    (T0 + 1.0, {"cpu": 12.5, "ram": 41.0}),                       # One change
+    (T0 + 2.0, {"cpu": 13.0, "ram": 41.0, "gpu": 3.0}),           # Series added
+    (T0 + 3.0, {"cpu": 13.0, "gpu": 3.0}),                        # Series removed
+    (T0 + 4.0, {"cpu": 13.0, "gpu": 3.0}),                        # Nothing changed
+    (T0 + 5.5, {"cpu": 1.0, "ram": 0.0, "gpu": 3.0, "disk": 7.0}),  # Removed series returns
+]
+
+
+def encode_all(encoder: FrameEncoder, samples) -> list:
+    """
+    @return The encoded bytes of each sample.
+    """
+    return [encoder.encode(timestamp, series) for timestamp, series in samples]
+
+
+def assert_samples(decoded, expected):
+    assert len(decoded) == len(expected)
+    for (timestamp, series), (want_ts, want_series) in zip(decoded, expected):
+        assert timestamp == pytest.approx(want_ts, abs=1e-6)
+        assert series == want_series
+
+
+def test_round_trip_keyframe_deltas_add_remove():
+    encoder = FrameEncoder("alpha")
+    stream = encoder.snapshot() + b"".join(encode_all(encoder, SAMPLES))
+    decoder = FrameDecoder()
+    assert_samples(decoder.feed(stream), SAMPLES)
+    assert decoder.host == "alpha"
+    assert decoder.buffer == bytearray()
+
+
+def test_delta_carries_only_changes():
+    chunks = encode_all(FrameEncoder("alpha"), SAMPLES)
+    # Sample 1 changes ram only; sample 3 sends ram as NaN; sample 4 sends nothing
+    for position, count in ((1, 1), (3, 1), (4, 0)):
+        kind, length = HEADER.unpack_from(chunks[position])
+        assert kind == DELTA
+        assert length == DELTA_HEAD.size + count * ENTRY.size
+    removal = chunks[3][HEADER.size + DELTA_HEAD.size:]
+    index, value = ENTRY.unpack(removal)
+    assert index == 1 and math.isnan(value)
+
+
+def test_byte_by_byte_feed_matches_whole_feed():
+    encoder = FrameEncoder("alpha")
+    stream = encoder.snapshot() + b"".join(encode_all(encoder, SAMPLES))
+    decoder = FrameDecoder()
+    decoded = []
+    for position in range(len(stream)):
+        decoded.extend(decoder.feed(stream[position:position + 1]))
+    assert_samples(decoded, SAMPLES)
+    assert decoder.host == "alpha"
+
+
+def test_random_splits_match_whole_feed():
+    encoder = FrameEncoder("alpha")
+    stream = encoder.snapshot() + b"".join(encode_all(encoder, SAMPLES))
+    rng = random.Random(7)
+    for _ in range(50):
+        cuts = sorted(rng.sample(range(1, len(stream)), rng.randint(1, 12)))
+        decoder = FrameDecoder()
+        decoded = []
+        for start, end in zip([0] + cuts, cuts + [len(stream)]):
+            decoded.extend(decoder.feed(stream[start:end]))
+        assert_samples(decoded, SAMPLES)
+
+
+def test_partial_header_and_payload_wait_for_more_bytes():
+    chunk = FrameEncoder("alpha").encode(T0, {"cpu": 1.0})
+    decoder = FrameDecoder()
+    names_end = HEADER.size + HEADER.unpack_from(chunk)[1]
+    assert decoder.feed(chunk[:HEADER.size - 1]) == []
+    assert decoder.feed(chunk[HEADER.size - 1:names_end + HEADER.size + 3]) == []
+    assert decoder.names == ["cpu"]
+    assert_samples(decoder.feed(chunk[names_end + HEADER.size + 3:]), [(T0, {"cpu": 1.0})])
+
+
+def test_snapshot_brings_late_client_up_to_date():
+    encoder = FrameEncoder("alpha")
+    early = FrameDecoder()
+    for chunk in encode_all(encoder, SAMPLES[:4]):
+        early.feed(chunk)
+    late = FrameDecoder()
+    (timestamp, series), = late.feed(encoder.snapshot())
+    assert timestamp == pytest.approx(SAMPLES[3][0])
+    assert series == SAMPLES[3][1]
+    # Both clients decode the same shared frames from here on
+    for chunk, expected in zip(encode_all(encoder, SAMPLES[4:]), SAMPLES[4:]):
+        assert_samples(late.feed(chunk), [expected])
+        assert_samples(early.feed(chunk), [expected])
+
+
+def test_values_are_rounded_to_float32():
+    encoder = FrameEncoder("alpha")
+    decoder = FrameDecoder()
+    (_, series), = decoder.feed(encoder.encode(T0, {"cpu": 0.1}))
+    assert series["cpu"] == pytest.approx(0.1, rel=1e-7)
+    # A change below float32 resolution is not sent
+    chunk = encoder.encode(T0 + 1, {"cpu": 0.1 + 1e-12})
+    assert HEADER.unpack_from(chunk)[1] == DELTA_HEAD.size
+
+
+def test_non_numeric_value_is_absent():
+    decoder = FrameDecoder()
+    (_, series), = decoder.feed(FrameEncoder("alpha").encode(T0, {"cpu": 1.0, "bad": None}))
+    assert series == {"cpu": 1.0}
+
+
+def test_delta_timestamps_do_not_drift():
+    encoder = FrameEncoder("alpha")
+    decoder = FrameDecoder()
+    for step in range(1000):
+        timestamp = T0 + step * 0.3333
+        (decoded, _), = decoder.feed(encoder.encode(timestamp, {"cpu": float(step % 7)}))
+        assert decoded == pytest.approx(timestamp, abs=1e-3)
+
+
+def test_unknown_frame_type_raises():
+    with pytest.raises(ValueError):
+        FrameDecoder().feed(frame(ord("Z"), b"xx"))
+
+
+def test_parse_address():
+    assert parse_address("unix:/run/lh.sock") == (socket.AF_UNIX, "/run/lh.sock")
+    assert parse_address("tcp:10.0.0.1:7000") == (socket.AF_INET, ("10.0.0.1", 7000))
+    assert parse_address("host:7000") == (socket.AF_INET, ("host", 7000))
+    with pytest.raises(ValueError):
+        parse_address("host")
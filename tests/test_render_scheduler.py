@@ -0,0 +1,136 @@
+"""
+@file test_render_scheduler.py
+@brief RenderScheduler coalescing, ordering, visibility gating and frame pacing.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtWidgets import QApplication, QWidget
+from src.core.render_scheduler import RenderScheduler
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def scheduler(app):
+    scheduler = RenderScheduler(max_fps=20)
+    yield scheduler
+    scheduler.timer.stop()
+
+
+@pytest.fixture
+def widget(app):
+    widget = QWidget()
+    widget.show()
+    yield widget
+    widget.close()
+
+
+def test_latest_drops_intermediate_payloads(scheduler):
+    seen = []
+    scheduler.register("telemetry", seen.append, RenderScheduler.LATEST)
+    for payload in (1, 2, 3):
+        scheduler.submit("telemetry", payload)
+    scheduler._frame()
+    assert seen == [3]
+    # Nothing new: the next frame does not repeat it
+    scheduler._frame()
+    assert seen == [3]
+
+
+def test_every_keeps_all_payloads_in_order(scheduler):
+    seen = []
+    scheduler.register("spawns", seen.append, RenderScheduler.EVERY)
+    for payload in range(5):
+        scheduler.submit("spawns", payload)
+    scheduler._frame()
+    scheduler.submit("spawns", 5)
+    scheduler._frame()
+    scheduler._frame()
+    assert seen == [0, 1, 2, 3, 4, 5]
+
+
+def test_channels_are_independent(scheduler):
+    telemetry, threads = [], []
+    scheduler.register("telemetry", telemetry.append, RenderScheduler.LATEST)
+    scheduler.register("threads", threads.append, RenderScheduler.LATEST)
+    scheduler.submit("threads", "t1")
+    scheduler._frame()
+    assert telemetry == [] and threads == ["t1"]
+
+
+def test_hidden_widget_is_marked_stale_then_refreshed_on_show(scheduler, widget):
+    seen = []
+    scheduler.register("telemetry", seen.append, RenderScheduler.LATEST, widget)
+    widget.hide()
+    scheduler.submit("telemetry", 1)
+    scheduler.submit("telemetry", 2)
+    scheduler._frame()
+    assert seen == []
+    scheduler.submit("telemetry", 3)
+    scheduler._frame()
+    assert seen == []
+
+    # Shown again: the next frame renders the newest payload, even without a new one
+    widget.show()
+    scheduler._frame()
+    assert seen == [3]
+    scheduler._frame()
+    assert seen == [3]
+
+
+def test_every_runs_while_hidden(scheduler, widget):
+    seen = []
+    scheduler.register("telemetry", seen.append, RenderScheduler.EVERY, widget)
+    widget.hide()
+    scheduler.submit("telemetry", 1)
+    scheduler.submit("telemetry", 2)
+    scheduler._frame()
+    assert seen == [1, 2]
+
+
+def test_late_subscriber_gets_current_state(scheduler):
+    scheduler.submit("telemetry", "old")
+    scheduler._frame()
+    seen = []
+    scheduler.register("telemetry", seen.append, RenderScheduler.LATEST)
+    assert scheduler.timer.isActive()
+    scheduler._frame()
+    assert seen == ["old"]
+
+
+def test_failing_handler_does_not_stall_the_frame(scheduler):
+    seen = []
+
+    def broken(payload):
+        raise RuntimeError("boom")
+
+    scheduler.register("telemetry", broken, RenderScheduler.EVERY)
+    scheduler.register("telemetry", seen.append, RenderScheduler.LATEST)
+    scheduler.submit("telemetry", 1)
+    scheduler._frame()
+    assert seen == [1]
+
+
+def test_frames_are_paced_and_coalesced(scheduler):
+    scheduler._frame()
+    scheduler.submit("telemetry", 1)
+    assert scheduler.timer.isActive()
+    # Within 1/max_fps of the previous frame: waits out the rest of the interval
+    assert 0 < scheduler.timer.interval() <= 50
+    scheduler.submit("telemetry", 2)
+    assert scheduler.timer.isActive()
+    assert scheduler.pending["telemetry"] == [1, 2]
+    frames = scheduler.frames
+    scheduler.timer.stop()
+    scheduler.last_frame -= 1.0
+    scheduler.request_frame()
+    assert scheduler.timer.interval() == 0
+    assert scheduler.frames == frames
@@ -0,0 +1,204 @@
+"""
+@file test_settings.py
+@brief Layered config: type coercion, layer precedence, validation and the opt-out.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+import logging
+import pytest
+import src.config   # Captures the built-in defaults (no layers, see conftest.py)
+from src.core import settings
+from src.core.settings import (_coerce, read_layers, layer_paths, active_layers,
+                               layered_values, validate, device_selected)
+
+DEFAULTS = settings._defaults
+
+
+@pytest.fixture
+def layers(tmp_path, monkeypatch):
+    """
+    @brief Points the three layers at temporary files; returns a writer for them.
+    """
+    paths = {"system": tmp_path / "etc.toml",
+             "user": tmp_path / "home" / "linuxhealth" / "config.toml",
+             "explicit": tmp_path / "session.toml"}
+    monkeypatch.setattr(settings, "SYSTEM_LAYER", str(paths["system"]))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("LINUXHEALTH_CONFIG", str(paths["explicit"]))
+    monkeypatch.setattr(settings, "_last_good", {})
+    monkeypatch.setattr(settings, "_active", [])
+
+    def write(layer: str, text: str):
+        paths[layer].parent.mkdir(parents=True, exist_ok=True)
+        paths[layer].write_text(text)
+        return str(paths[layer])
+    write.paths = paths
+    return write
+
+
+def test_defaults_are_valid():
+    assert validate(DEFAULTS) == []
+    assert DEFAULTS["MAX_PROCESSES"] == 20   # The test session runs without layers
+
+
+@pytest.mark.parametrize("value, default, expected", [
+    (3, 1.0, 3.0),                 # int widens to float
+    (2.5, 1.0, 2.5),
+    (40, 20, 40),
+    (True, False, True),
+    (["a", "b"], ("x",), ("a", "b")),  # TOML arrays become the default's sequence type
+    (["sd?"], [], ["sd?"]),
+    ("zscore", "mad", "zscore"),
+    ({"hardware": 5}, {}, {"hardware": 5}),
+    ("/tmp/store", None, "/tmp/store"),  # None defaults accept anything
+])
+def test_coerce_accepts(value, default, expected):
+    result = _coerce("NAME", value, default)
+    assert result == expected and type(result) is type(expected)
+
+
+@pytest.mark.parametrize("value, default", [
+    (2.5, 20),        # no silent truncation
+    (1, True),        # bools are not ints here
+    (True, 1),
+    (True, 1.0),
+    ("5", 5),
+    (5, "mad"),
+    ("a", ["a"]),
+    ([1], {}),
+])
+def test_coerce_rejects(value, default):
+    with pytest.raises(ValueError):
+        _coerce("NAME", value, default)
+
+
+def test_precedence_and_table_merge(layers):
+    system = layers("system", "max_processes = 30\ngovernor_min_interval = 2\n"
+                              "[sensor_intervals]\nhardware = 10\nnuma = 4\n")
+    user = layers("user", "MAX_PROCESSES = 40\n[sensor_intervals]\nkernel = 2\n")
+    explicit = layers("explicit", "max_processes = 50\n[sensor_intervals]\nhardware = 5\n")
+    assert layer_paths() == [system, user, explicit]
+    values = read_layers(DEFAULTS)
+    assert values == {"MAX_PROCESSES": 50, "GOVERNOR_MIN_INTERVAL": 2.0,
+                      "SENSOR_INTERVALS": {"hardware": 5, "numa": 4, "kernel": 2}}
+    assert active_layers() == [system, user, explicit]
+    merged = layered_values()
+    assert merged["MAX_PROCESSES"] == 50 and merged["RENDER_MAX_FPS"] == DEFAULTS["RENDER_MAX_FPS"]
+
+
+def test_unknown_and_mistyped_keys_are_skipped(layers, caplog):
+    layers("user", "max_processes = 40\nno_such_setting = 1\nrender_max_fps = \"fast\"\n")
+    with caplog.at_level(logging.WARNING):
+        assert read_layers(DEFAULTS) == {"MAX_PROCESSES": 40}
+    assert "no_such_setting" in caplog.text and "RENDER_MAX_FPS expects int" in caplog.text
+
+
+@pytest.mark.parametrize("text", [
+    "governor_min_interval = 10.0\nmax_processes = 40\n",   # min above the default max
+    "governor_cpu_budget = 0\nmax_processes = 40\n",
+    "render_max_fps = -5\nmax_processes = 40\n",
+    "export_keep_files = -1\nmax_processes = 40\n",
+    "anomaly_method = \"median\"\nmax_processes = 40\n",
+    "max_processes = 40\n[sensor_intervals]\nhardware = -1\n",
+])
+def test_invalid_layer_is_rejected_whole(layers, caplog, text):
+    layers("system", "live_window_seconds = 120\n")
+    path = layers("user", text)
+    with caplog.at_level(logging.ERROR):
+        assert read_layers(DEFAULTS) == {"LIVE_WINDOW_SECONDS": 120}
+    assert f"{path} rejected" in caplog.text
+    assert active_layers() == [str(layers.paths["system"])]
+
+
+def test_ordering_is_checked_across_layers(layers):
+    layers("system", "governor_max_interval = 3.0\n")
+    layers("user", "governor_min_interval = 4.0\n")
+    assert read_layers(DEFAULTS) == {"GOVERNOR_MAX_INTERVAL": 3.0}
+    layers("user", "governor_min_interval = 4.0\ngovernor_max_interval = 8.0\n")
+    assert read_layers(DEFAULTS) == {"GOVERNOR_MIN_INTERVAL": 4.0, "GOVERNOR_MAX_INTERVAL": 8.0}
+
+
+def test_reload_keeps_last_valid_content(layers, caplog):
+    layers("user", "max_processes = 40\n")
+    assert read_layers(DEFAULTS) == {"MAX_PROCESSES": 40}
+    # Semantically invalid edit: the previous content stays in force
+    layers("user", "max_processes = 0\n")
+    with caplog.at_level(logging.ERROR):
+        assert read_layers(DEFAULTS) == {"MAX_PROCESSES": 40}
+    assert "keeping its previous values" in caplog.text
+    # Half-written file that does not parse
+    layers("user", "max_processes = [\n")
+    assert read_layers(DEFAULTS) == {"MAX_PROCESSES": 40}
+    # Deleting the file drops its values
+    layers.paths["user"].unlink()
+    assert read_layers(DEFAULTS) == {}
+
+
+def test_empty_env_disables_layering(layers, monkeypatch):
+    layers("system", "max_processes = 30\n")
+    layers("user", "max_processes = 40\n")
+    monkeypatch.setenv("LINUXHEALTH_CONFIG", "")
+    assert layer_paths() == []
+    assert read_layers(DEFAULTS) == {}
+    assert active_layers() == []
+    monkeypatch.delenv("LINUXHEALTH_CONFIG")
+    assert read_layers(DEFAULTS) == {"MAX_PROCESSES": 40}
+
+
+@pytest.mark.parametrize("name, patterns, selected", [
+    ("sda", [], True),
+    ("sda", ["sd?"], True),
+    ("nvme0n1", ["sd?"], False),
+    ("lo", ["!lo", "!veth*"], False),
+    ("eth0", ["!lo", "!veth*"], True),
+    ("nvme0n1p1", ["nvme*", "!*p[0-9]*"], False),
+    ("nvme0n1", ["nvme*", "!*p[0-9]*"], True),
+])
+def test_device_selected(name, patterns, selected):
+    assert device_selected(name, patterns) is selected
+
+
+@pytest.fixture
+def watcher(layers):
+    """
+    @brief A SettingsWatcher on the temporary layers (reload timer not left running).
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    from src.core.settings_watcher import SettingsWatcher
+    app = QApplication.instance() or QApplication([])
+    layers("explicit", "")
+    watcher = SettingsWatcher()
+    yield watcher
+    watcher.timer.stop()
+    watcher.deleteLater()
+
+
+def test_watcher_watches_layer_parent_directories_only(layers, watcher):
+    root = str(layers.paths["explicit"].parent)
+    # The user layer's directory does not exist: no fallback to an ancestor
+    assert watcher.watcher.directories() == [root]
+    assert watcher.watcher.files() == [str(layers.paths["explicit"])]
+
+
+def test_watcher_ignores_unrelated_directory_entries(layers, watcher):
+    root = str(layers.paths["explicit"].parent)
+    (layers.paths["explicit"].parent / "notes.txt").write_text("unrelated\n")
+    watcher._directory_changed(root)
+    assert not watcher.timer.isActive()
+
+    # A layer file created in the same directory is picked up
+    layers("system", "max_processes = 30\n")
+    watcher._directory_changed(root)
+    assert watcher.timer.isActive()
+    watcher.timer.stop()
+
+    # As is one replaced or rewritten since the last load
+    watcher.signatures = watcher._signatures()
+    watcher._directory_changed(root)
+    assert not watcher.timer.isActive()
+    layers("explicit", "max_processes = 25\n")
+    watcher._directory_changed(root)
+    assert watcher.timer.isActive()
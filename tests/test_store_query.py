@@ -0,0 +1,212 @@
+"""
+@file test_store_query.py
+@brief ColumnStore + HistoryQuery against brute-force numpy over the written samples.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import os
+import time
+import numpy as np
+import pytest
+from src.core.store import ColumnStore
+from src.core.query import HistoryQuery
+
+# 22:00 local to 01:00 the next day: three hours, two day partitions
+BASE = time.mktime((2026, 10, 19, 22, 0, 0, 0, 0, -1))
+MIDNIGHT = BASE + 7200
+SECONDS = 3 * 3600
+LATE_SERIES = 5000   # 'b' appears this many seconds in
+
+
+def samples(start: float, count: int, seed: int = 1) -> list:
+    """
+    @brief Builds one-second samples; values are float32-exact so they round-trip unchanged.
+    """
+    rng = np.random.default_rng(seed)
+    values = rng.uniform(0, 100, size=(count, 2)).astype(np.float32)
+    batch = []
+    for i in range(count):
+        series = {"a": float(values[i, 0])}
+        if start + i >= BASE + LATE_SERIES:
+            series["b"] = float(values[i, 1])
+        processes = None
+        if i % 10 == 0:
+            processes = [{"name": f"proc{(i // 10 + j) % 7}", "cpu": float(j * 2 + i % 3),
+                          "ram": float(10 * j)} for j in range(5)]
+        batch.append((start + i, series, processes, None))
+    return batch
+
+
+def write(directory, batch, chunk: int = 600):
+    """
+    @brief Appends a batch in writer-sized chunks and closes the store.
+    """
+    store = ColumnStore(str(directory), retention_days=0)
+    for i in range(0, len(batch), chunk):
+        store.append(batch[i:i + chunk])
+    store.close()
+    return store
+
+
+def brute(batch, name: str, start: float, end: float) -> np.ndarray:
+    """
+    @brief Values of a series with start <= time < end.
+    """
+    return np.array([series[name] for t, series, _, _ in batch
+                     if start <= t < end and name in series])
+
+
+@pytest.fixture(scope="module")
+def history(tmp_path_factory):
+    """
+    @brief (query, written samples) over a store spanning midnight.
+    """
+    directory = tmp_path_factory.mktemp("store")
+    batch = samples(BASE, SECONDS)
+    write(directory, batch)
+    return HistoryQuery(str(directory)), batch
+
+
+RANGES = [
+    (BASE, BASE + SECONDS),                    # everything, across midnight
+    (BASE, BASE + 3600),                       # one aligned hour
+    (BASE + 1800.5, BASE + 9000 - 77),         # ragged on both sides
+    (MIDNIGHT - 90, MIDNIGHT + 30),            # minutes around midnight
+    (BASE + 61, BASE + 119),                   # inside one minute bucket
+    (BASE + LATE_SERIES - 100, BASE + LATE_SERIES + 3700),
+]
+
+
+def test_partitions(history):
+    query, _ = history
+    days = sorted(os.listdir(query.directory))
+    assert days == ["2026-10-19", "2026-10-20", "names.txt"]
+    assert query.series(BASE, BASE + SECONDS) == ["a", "b"]
+
+
+def test_raw_round_trip(history):
+    query, batch = history
+    times, values = query.raw("a", BASE, BASE + SECONDS)
+    assert np.array_equal(times, [t for t, _, _, _ in batch])
+    assert np.array_equal(values, brute(batch, "a", BASE, BASE + SECONDS))
+    # A series that starts mid-day is NaN before its first sample
+    times, values = query.raw("b", BASE, BASE + SECONDS)
+    assert np.isnan(values[:LATE_SERIES]).all()
+    assert np.array_equal(values[LATE_SERIES:], brute(batch, "b", BASE, BASE + SECONDS))
+
+
+@pytest.mark.parametrize("start, end", RANGES)
+def test_percentiles(history, start, end):
+    query, batch = history
+    expected = brute(batch, "b", start, end)
+    result = query.aggregate("b", start, end, ["p50", "p99", "p0", "p100", "count"])
+    assert result["count"] == expected.size
+    if not expected.size:
+        assert result["p99"] is None
+        return
+    for func in ("p50", "p99", "p0", "p100"):
+        assert result[func] == pytest.approx(np.percentile(expected, float(func[1:])))
+
+
+@pytest.mark.parametrize("name", ["a", "b"])
+@pytest.mark.parametrize("start, end", RANGES)
+def test_tiers_match_raw(history, name, start, end):
+    query, batch = history
+    expected = brute(batch, name, start, end)
+    result = query.aggregate(name, start, end, ["min", "max", "mean", "count"])
+    assert result["count"] == expected.size
+    if expected.size:
+        assert result["min"] == expected.min()
+        assert result["max"] == expected.max()
+        assert result["mean"] == pytest.approx(expected.mean(), rel=1e-5)
+
+
+@pytest.mark.parametrize("step", [60, 900, 3600])
+def test_stepped_tiers_match_raw(history, step):
+    query, batch = history
+    rows = query.aggregate("a", BASE, BASE + SECONDS, ["min", "max", "mean", "count"], step=step)
+    assert len(rows) == SECONDS // step
+    for row in rows:
+        expected = brute(batch, "a", row["time"], row["time"] + step)
+        assert row["count"] == expected.size
+        assert row["min"] == expected.min() and row["max"] == expected.max()
+        assert row["mean"] == pytest.approx(expected.mean(), rel=1e-5)
+    # Non-tier functions take the raw path with the same buckets
+    raw_rows = query.aggregate("a", BASE, BASE + SECONDS, ["max", "p50"], step=step)
+    assert [row["max"] for row in raw_rows] == [row["max"] for row in rows]
+
+
+def test_top_processes_across_midnight(history):
+    query, batch = history
+    start, end = MIDNIGHT - 1800, MIDNIGHT + 1800
+    totals, counts = {}, {}
+    for t, _, processes, _ in batch:
+        if start <= t < end and processes:
+            for row in processes:
+                totals[row["name"]] = totals.get(row["name"], 0.0) + row["cpu"]
+                counts[row["name"]] = counts.get(row["name"], 0) + 1
+    top = query.top_processes(start, end, by="cpu", func="mean", k=3)
+    expected = sorted(totals, key=lambda name: -totals[name] / counts[name])[:3]
+    assert [row["name"] for row in top] == expected
+    for row in top:
+        assert row["samples"] == counts[row["name"]]
+        assert row["value"] == pytest.approx(totals[row["name"]] / counts[row["name"]])
+
+
+def test_restart_realigns_torn_columns(tmp_path):
+    first = samples(MIDNIGHT + 3600, 100)
+    write(tmp_path, first)
+    day = tmp_path / "2026-10-20"
+    # Crash mid-append: half a timestamp, an uncommitted value of 'a', 'b' short by 5 rows
+    with open(day / "time.f8", "ab") as handle:
+        handle.write(b"\x00" * 4)
+    with open(day / "s" / "a.f4", "ab") as handle:
+        handle.write(np.float32([1, 2, 3]).tobytes())
+    os.truncate(day / "s" / "b.f4", 95 * 4)
+
+    # Readers ignore the torn row before the writer restarts
+    query = HistoryQuery(str(tmp_path))
+    times, values = query.raw("a", MIDNIGHT, MIDNIGHT + 86400)
+    assert len(times) == 100
+
+    second = samples(MIDNIGHT + 3700, 50, seed=2)
+    write(tmp_path, second)
+    assert os.path.getsize(day / "time.f8") == 150 * 8
+    assert os.path.getsize(day / "s" / "a.f4") == 150 * 4
+    assert os.path.getsize(day / "s" / "b.f4") == 150 * 4
+
+    batch = first + second
+    times, values = query.raw("a", MIDNIGHT, MIDNIGHT + 86400)
+    assert np.array_equal(times, [t for t, _, _, _ in batch])
+    assert np.array_equal(values, brute(batch, "a", MIDNIGHT, MIDNIGHT + 86400))
+    _, values = query.raw("b", MIDNIGHT, MIDNIGHT + 86400)
+    expected = np.array([series["b"] for _, series, _, _ in batch])
+    assert np.isnan(values[95:100]).all()
+    assert np.array_equal(np.delete(values, range(95, 100)), np.delete(expected, range(95, 100)))
+    # The bucket split by the restart adds up at query time
+    result = query.aggregate("a", MIDNIGHT + 3600, MIDNIGHT + 3780, ["count", "min", "max"])
+    assert result["count"] == 150
+
+
+def test_backward_clock_step_is_dropped(tmp_path):
+    store = ColumnStore(str(tmp_path), retention_days=0)
+    store.append(samples(BASE, 100))
+    store.append(samples(BASE + 50, 100))     # Clock stepped back 49 s
+    assert store.rejected == 49
+    store.close()
+
+    # After a restart the newest committed time still bounds what is accepted
+    store = ColumnStore(str(tmp_path), retention_days=0)
+    assert store.last_time == BASE + 149
+    store.append(samples(BASE + 140, 20))
+    assert store.rejected == 9
+    store.close()
+
+    query = HistoryQuery(str(tmp_path))
+    times, values = query.raw("a", BASE, BASE + 3600)
+    assert len(times) == 100 + 51 + 11
+    assert np.all(np.diff(times) >= 0)
+    expected = values[~np.isnan(values)]
+    result = query.aggregate("a", BASE, BASE + 3600, ["min", "max", "count"])
+    assert result == {"min": expected.min(), "max": expected.max(), "count": expected.size}
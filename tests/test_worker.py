@@ -0,0 +1,78 @@
+"""
+@file test_worker.py
+@brief GlobalWorker hand-off of reloaded settings from the GUI thread.
+@project Linux Health Monitor Pro
+@license MIT
+"""
+
+import sys
+import threading
+import pytest
+from src.core import worker as worker_module
+from src.core.worker import GlobalWorker
+
+
+class Recorder:
+    """
+    @brief Setting target that logs every assignment made by _apply_pending_settings().
+    """
+
+    def __init__(self):
+        object.__setattr__(self, "applied", [])
+
+    def __setattr__(self, name, value):
+        self.applied.append((name, value))
+
+
+@pytest.fixture(scope="module")
+def worker():
+    worker = GlobalWorker()
+    worker._build_pending_sensors()   # Normally done on the worker thread before the first cycle
+    return worker
+
+
+def test_back_to_back_reloads_both_reach_the_worker(worker):
+    worker.apply_settings({"MAX_PROCESSES": 40, "ANOMALY_THRESHOLD": 5.0})
+    worker.apply_settings({"MAX_PROCESSES": 60, "PROCESS_TREE_CHILD_LIMIT": 7})
+    worker._apply_pending_settings()
+    assert worker.user_processes.limit == 60
+    assert worker.anomalies.threshold == 5.0
+    assert worker.tree_child_limit == 7
+    assert worker.pending_settings == {}
+
+
+def test_reload_after_a_drain_is_kept_for_the_next_cycle(worker):
+    worker.apply_settings({"MAX_PROCESSES": 30})
+    worker._apply_pending_settings()
+    worker.apply_settings({"DISABLED_SENSORS": ["numa"]})
+    assert worker.user_processes.limit == 30
+    worker._apply_pending_settings()
+    assert worker.disabled_sensors == {"numa"}
+    worker.apply_settings({"DISABLED_SENSORS": []})
+    worker._apply_pending_settings()
+
+
+def test_concurrent_reloads_are_applied_exactly_once(worker, monkeypatch):
+    count = 2000
+    recorder = Recorder()
+    worker.recorder = recorder
+    monkeypatch.setattr(worker_module, "SETTING_TARGETS",
+                        {f"S{i}": ("recorder", f"s{i}") for i in range(count)})
+
+    def gui():
+        for i in range(count):
+            worker.apply_settings({f"S{i}": i})
+
+    # Switch threads as often as possible so the two sides interleave
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        thread = threading.Thread(target=gui)
+        thread.start()
+        while thread.is_alive():
+            worker._apply_pending_settings()
+        thread.join()
+    finally:
+        sys.setswitchinterval(switch)
+    worker._apply_pending_settings()
+    assert sorted(recorder.applied, key=lambda item: item[1]) == [(f"s{i}", i) for i in range(count)]